@@ -0,0 +1,88 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Size and time of the binary tree format against pickle.
+
+    PYTHONPATH=src python -m benchmarks.binary_tree [--size 1M]
+"""
+
+import argparse
+import pickle
+import tempfile
+import time
+from pathlib import Path
+
+from biz.dfch.ste100parser import BinaryTree, GrammarType, Pipeline
+from biz.dfch.ste100parser.binary_tree import dump, dumps
+from biz.dfch.ste100parser.transformer import TokenConverter
+
+from .synthetic import generate, parse_size
+
+__all__ = [
+    "main",
+]
+
+
+def _time(func) -> tuple[float, object]:
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def main() -> None:
+    """Prints size, write and read time of every format."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=parse_size, default="1M")
+    args = parser.parse_args()
+
+    text = generate(args.size)
+    tree = Pipeline(GrammarType.CONTAINER_LALR).invoke(text)
+    tokens = TokenConverter().invoke(tree)
+
+    print(f"{len(text)} characters")
+
+    results = []
+    seconds, data = _time(lambda: pickle.dumps(tree))
+    read, _ = _time(lambda: pickle.loads(data))
+    results.append(("pickle Tree", len(data), seconds, read))
+
+    seconds, data = _time(lambda: pickle.dumps(tokens))
+    read, _ = _time(lambda: pickle.loads(data))
+    results.append(("pickle tuples", len(data), seconds, read))
+
+    seconds, data = _time(lambda: dumps(tree))
+    read, _ = _time(lambda: BinaryTree(data).to_tree())
+    results.append(("binary", len(data), seconds, read))
+
+    for name, size, write, read in results:
+        print(f"{name:14} {size / 2**20:8.2f} MiB  write {write * 1000:8.1f} "
+              f"ms  read {read * 1000:8.1f} ms")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "tree.bin"
+        dump(tree, path)
+
+        def first_item():
+            with BinaryTree.load(path) as loaded:
+                return loaded.root.children[0].to_tree()
+
+        seconds, _ = _time(first_item)
+        print(f"mmap and read the first item: {seconds * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Time and peak memory of ChunkedParser against Parser on a large document.
+
+    PYTHONPATH=src python -m benchmarks.chunked_parser [--copies N] [--jobs N]
+"""
+
+import argparse
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from biz.dfch.ste100parser import ChunkedParser, GrammarType, Parser
+
+__all__ = [
+    "main",
+]
+
+_TEST_DATA = (
+    Path(__file__).parent.parent / "tests" / "test_data" /
+    "complex_heading_proc_cite_para_list.md"
+)
+
+
+def _measure(func, value) -> tuple[float, int]:
+    """Returns the time in seconds and the peak memory in bytes."""
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    func(value)
+    seconds = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return seconds, peak
+
+
+def main() -> None:
+    """Prints time and peak memory of the whole and the chunked parse."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--copies", type=int, default=50)
+    parser.add_argument("--jobs", type=int, default=2)
+    parser.add_argument("--grammar", default="CONTAINER_LALR")
+    args = parser.parse_args()
+
+    grammar = GrammarType[args.grammar]
+    text = "\n\n".join(
+        [_TEST_DATA.read_text(encoding="utf-8").strip("\n")] * args.copies)
+
+    print(f"grammar    {grammar.name}, {len(text)} chars")
+
+    _print("whole", _measure(Parser(grammar).invoke, text))
+    _print("chunked", _measure(ChunkedParser(grammar).invoke, text))
+
+    # The peak memory of the worker processes is not traced.
+    with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+        sut = ChunkedParser(grammar, executor=executor)
+        _print(f"chunked -j {args.jobs}", _measure(sut.invoke, text))
+
+
+def _print(name: str, result: tuple[float, int]) -> None:
+    seconds, peak = result
+    print(f"  {name:12} {seconds * 1000:9.1f} ms {peak / 2**20:8.2f} MiB")
+
+
+if __name__ == "__main__":
+    main()
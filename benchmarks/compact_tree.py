@@ -0,0 +1,112 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Memory of the transformed tree as lark Tree and as compact nodes.
+
+    PYTHONPATH=src python -m benchmarks.compact_tree [--copies N]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+from lark import Tree
+
+from biz.dfch.ste100parser import GrammarType, Pipeline
+from biz.dfch.ste100parser.compact_tree import (
+    CompactLeaf,
+    CompactNode,
+    to_compact,
+    to_tree,
+)
+
+__all__ = [
+    "main",
+]
+
+_TEST_DATA = (
+    Path(__file__).parent.parent / "tests" / "test_data" /
+    "complex_heading_proc_cite_para_list.md"
+)
+
+
+def _get_size(root) -> int:
+    """
+    Returns the bytes of all objects of the tree. Shared objects count once.
+    """
+
+    result = 0
+    seen: set[int] = set()
+    stack = [root]
+    while stack:
+        value = stack.pop()
+        if id(value) in seen:
+            continue
+        seen.add(id(value))
+        result += sys.getsizeof(value)
+
+        if isinstance(value, Tree):
+            stack.append(value.data)
+            stack.append(value.children)
+            if value._meta is not None:  # pylint: disable=W0212
+                stack.append(value._meta)  # pylint: disable=W0212
+        elif isinstance(value, CompactNode):
+            stack.append(value.span)
+            stack.append(value.children)
+        elif isinstance(value, CompactLeaf):
+            stack.append(value.span)
+            stack.append(value.value)
+        elif isinstance(value, list):
+            stack.extend(value)
+        elif isinstance(value, dict):
+            stack.extend(value.values())
+        elif not isinstance(value, str) and hasattr(value, "__dict__"):
+            stack.append(value.__dict__)
+
+    return result
+
+
+def main() -> None:
+    """Prints the bytes per source character of both representations."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--copies", type=int, default=50)
+    args = parser.parse_args()
+
+    text = _TEST_DATA.read_text(encoding="utf-8") * args.copies
+    tree = Pipeline(GrammarType.CONTAINER_LALR).invoke(text)
+
+    start = time.perf_counter()
+    compact = to_compact(tree)
+    seconds_to = time.perf_counter() - start
+
+    start = time.perf_counter()
+    back = to_tree(compact, text)
+    seconds_from = time.perf_counter() - start
+    assert back == tree
+
+    print(f"{len(text)} characters")
+    for name, value in (("lark", tree), ("compact", compact)):
+        size = _get_size(value)
+        print(f"{name:8} {size / 2**20:7.2f} MiB "
+              f"{size / len(text):7.1f} bytes/char")
+    print(f"to_compact {seconds_to * 1000:7.1f} ms, "
+          f"to_tree {seconds_from * 1000:7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Lookup time and memory of the Dictionary over a large word list.
+
+    PYTHONPATH=src python -m benchmarks.dictionary [--words N] [--size N]
+"""
+
+import argparse
+import random
+import time
+
+from biz.dfch.ste100parser.dictionary import Dictionary
+
+__all__ = [
+    "main",
+]
+
+
+def _get_entries(size: int, rnd: random.Random) -> list[str]:
+    """Returns random words and some abbreviations."""
+
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    result = {
+        "".join(rnd.choice(letters) for _ in range(rnd.randint(2, 12)))
+        for _ in range(size)
+    }
+
+    return sorted(result) + ["e.g.", "i.e.", "approx.", "etc."]
+
+
+def _get_words(entries: list[str], count: int, rnd: random.Random):
+    """Returns the words to look up: hits, case, dots, hyphens, misses."""
+
+    result = []
+    for _ in range(count):
+        word = rnd.choice(entries)
+        kind = rnd.randrange(5)
+        if 1 == kind:
+            word = word.capitalize()
+        elif 2 == kind:
+            word = f"{word}."
+        elif 3 == kind:
+            word = f"{word}-{rnd.choice(entries)}"
+        elif 4 == kind:
+            word = f"{word}q"
+        result.append(word)
+
+    return result
+
+
+def main() -> None:
+    """Prints the time per lookup and the memory of the dictionary."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--words", type=int, default=1_000_000)
+    parser.add_argument("--size", type=int, default=100_000)
+    args = parser.parse_args()
+
+    rnd = random.Random(0)
+    entries = _get_entries(args.size, rnd)
+    words = _get_words(entries, args.words, rnd)
+
+    for name, sut in (
+        ("package", Dictionary.get_default()),
+        ("synthetic", Dictionary(entries)),
+    ):
+        info = sut.get_info()
+
+        start = time.perf_counter()
+        found = sum(1 for word in words if sut.contains(word))
+        seconds = time.perf_counter() - start
+
+        print(f"{name:10} {info.words:7} words {info.abbreviations:3} "
+              f"abbreviations {info.size / 2**20:7.2f} MiB  "
+              f"{seconds / len(words) * 1e9:6.0f} ns/lookup "
+              f"({found} of {len(words)} found)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Time of an edit with IncrementalParser against a full Pipeline run.
+
+    PYTHONPATH=src python -m benchmarks.incremental_parser [--copies N]
+"""
+
+import argparse
+import statistics
+import time
+from pathlib import Path
+
+from biz.dfch.ste100parser import GrammarType, IncrementalParser, Pipeline
+from biz.dfch.ste100parser import TextEdit
+
+__all__ = [
+    "main",
+]
+
+_TEST_DATA = (
+    Path(__file__).parent.parent / "tests" / "test_data" /
+    "complex_heading_proc_cite_para_list.md"
+)
+
+
+def main() -> None:
+    """Prints the median time of a full run and of an edit."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--copies", type=int, default=50)
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--grammar", default="CONTAINER_LALR")
+    args = parser.parse_args()
+
+    grammar = GrammarType[args.grammar]
+    text = "\n\n".join(
+        [_TEST_DATA.read_text(encoding="utf-8").strip("\n")] * args.copies)
+
+    print(f"grammar    {grammar.name}, {len(text)} chars, "
+          f"{args.runs} runs (median)")
+
+    pipeline = Pipeline(grammar)
+    times = []
+    for _ in range(args.runs):
+        start = time.perf_counter()
+        pipeline.invoke(text)
+        times.append(time.perf_counter() - start)
+    _print("full", times)
+
+    sut = IncrementalParser(grammar)
+    sut.invoke(text)
+
+    # An edit at the start moves all other chunks, at the end none.
+    for name, find in (
+        ("edit start", str.index),
+        ("edit end", str.rindex),
+    ):
+        pos = find(sut.text, "para3.")
+        times = []
+        for _ in range(args.runs):
+            start = time.perf_counter()
+            sut.edit(TextEdit(pos, pos, "x"))
+            times.append(time.perf_counter() - start)
+        _print(name, times)
+
+
+def _print(name: str, times: list[float]) -> None:
+    print(f"  {name:12} {statistics.median(times) * 1000:9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
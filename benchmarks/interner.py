@@ -0,0 +1,163 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Memory of the trees of a corpus with and without an Interner.
+
+    PYTHONPATH=src python -m benchmarks.interner [--documents 50]
+        [--size 5K] [--grammar CONTAINER_LALR] [--output results.json]
+
+Every document of the corpus starts with the same preamble (a heading,
+safety instructions and a note) and continues with a synthetic document
+of `--size` characters from `benchmarks.synthetic`. The benchmark keeps
+the trees of all documents and measures the memory that they retain.
+"""
+
+import argparse
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from biz.dfch.ste100parser import GrammarType, Pipeline
+from biz.dfch.ste100parser.interner import Interner, InternerInfo
+
+from .synthetic import generate, parse_size
+
+__all__ = [
+    "CorpusResult",
+    "get_corpus",
+    "main",
+    "run",
+]
+
+_PREAMBLE = (
+    "# Maintenance manual\n"
+    "\n"
+    "Read all of the instructions before you start the work.\n"
+    "\n"
+    "WARNING: Disconnect the electrical power before you open the panel.\n"
+    "\n"
+    "CAUTION: Do not use sharp tools on the seal.\n"
+    "\n"
+    "NOTE: Keep the used parts for the inspection.\n"
+    "\n"
+)
+
+
+@dataclass(frozen=True)
+class CorpusResult:
+    """Memory and time of the trees of a corpus."""
+
+    interner: bool
+    documents: int
+    characters: int
+    seconds: float
+    retained_bytes: int
+    info: InternerInfo | None = None
+
+
+def get_corpus(documents: int, size: int, seed: int = 0) -> list[str]:
+    """Returns the documents of the corpus."""
+
+    assert 0 < documents, documents
+
+    return [
+        _PREAMBLE + generate(size, seed + index)
+        for index in range(documents)
+    ]
+
+
+def run(
+    grammar: GrammarType,
+    corpus: list[str],
+    interner: bool,
+) -> CorpusResult:
+    """Parses the corpus and measures the memory of all trees."""
+
+    sut = Interner() if interner else None
+    pipeline = Pipeline(grammar, interner=sut)
+    # The grammar and the lexer are not part of the measurement.
+    pipeline.invoke(generate(100))
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        current, _ = tracemalloc.get_traced_memory()
+        start = time.perf_counter()
+        trees = [pipeline.invoke(text) for text in corpus]
+        seconds = time.perf_counter() - start
+        gc.collect()
+        retained = tracemalloc.get_traced_memory()[0] - current
+    finally:
+        tracemalloc.stop()
+
+    assert len(corpus) == len(trees)
+
+    return CorpusResult(
+        interner, len(corpus), sum(len(text) for text in corpus), seconds,
+        retained, sut.info() if sut is not None else None)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Prints the memory with and without an Interner."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--documents", type=int, default=50)
+    parser.add_argument(
+        "--size", type=parse_size, default="5K",
+        help="Size of the synthetic part of a document, for example 5K.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--grammar", default=GrammarType.CONTAINER_LALR.name,
+        choices=[GrammarType.CONTAINER.name, GrammarType.CONTAINER_LALR.name])
+    parser.add_argument("--output", type=Path, default=None)
+    args = parser.parse_args(argv)
+
+    corpus = get_corpus(args.documents, args.size, args.seed)
+    grammar = GrammarType[args.grammar]
+
+    results = [run(grammar, corpus, False), run(grammar, corpus, True)]
+
+    print(f"grammar    {args.grammar}, {results[0].documents} documents, "
+          f"{results[0].characters} chars")
+    for item in results:
+        name = "interner" if item.interner else "default"
+        print(f"{name:10} {item.seconds * 1000:10.1f} ms  retained "
+              f"{item.retained_bytes / 2**20:8.2f} MiB "
+              f"({item.retained_bytes / item.characters:6.1f} bytes/char)")
+
+    saved = results[0].retained_bytes - results[1].retained_bytes
+    info = results[1].info
+    print(f"saved      {saved / 2**20:8.2f} MiB "
+          f"({saved / results[0].retained_bytes:.1%}), "
+          f"{info.string_hits} shared strings ({info.strings} distinct), "
+          f"{info.tree_hits} shared containers")
+
+    if args.output is not None:
+        args.output.write_text(json.dumps({
+            "grammar": args.grammar,
+            "results": [asdict(item) for item in results],
+            "saved_bytes": saved,
+        }, indent=2) + "\n", encoding="utf-8")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
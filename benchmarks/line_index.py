@@ -0,0 +1,79 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Memory of the transformed tree with eager and with lazy positions.
+
+    PYTHONPATH=src python -m benchmarks.line_index [--copies N]
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+from pathlib import Path
+
+from biz.dfch.ste100parser import GrammarType, Pipeline
+
+__all__ = [
+    "main",
+]
+
+_TEST_DATA = (
+    Path(__file__).parent.parent / "tests" / "test_data" /
+    "complex_heading_proc_cite_para_list.md"
+)
+
+
+def _measure(pipeline: Pipeline, text: str) -> tuple[float, int, int]:
+    """Returns the time, the memory of the result and the peak memory."""
+
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = pipeline.invoke(text)
+    seconds = time.perf_counter() - start
+    gc.collect()
+    size, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+
+    return seconds, size, peak
+
+
+def main() -> None:
+    """Prints time and memory of both ways."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--copies", type=int, default=100)
+    args = parser.parse_args()
+
+    text = _TEST_DATA.read_text(encoding="utf-8") * args.copies
+
+    print(f"{len(text)} characters")
+    for name, lazy_positions in (("eager", False), ("lazy", True)):
+        pipeline = Pipeline(
+            GrammarType.CONTAINER_LALR, lazy_positions=lazy_positions)
+        pipeline.invoke(text)
+
+        seconds, size, peak = _measure(pipeline, text)
+        print(f"{name:6} {seconds * 1000:8.1f} ms  "
+              f"result {size / 2**20:7.2f} MiB "
+              f"({size / len(text):6.1f} bytes/char)  "
+              f"peak {peak / 2**20:7.2f} MiB")
+
+
+if __name__ == "__main__":
+    main()
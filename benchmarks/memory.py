@@ -0,0 +1,240 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Peak and retained memory and the top allocation sites per stage.
+
+    PYTHONPATH=src python -m benchmarks.memory [--size 20K | --file PATH]
+        [--grammar CONTAINER_LALR] [--top N] [--budget BYTES_PER_CHAR]
+        [--output results.json]
+
+The stages run one after the other under tracemalloc: `parse`
+(Parser.invoke), `container` (ContainerTransformer), `text`
+(TextTransformer) and `converter` (TokenConverter). For every stage:
+
+  * peak: the highest memory during the stage on top of the memory before
+    the stage.
+  * retained: the memory after the stage (with its result) on top of the
+    memory before the stage.
+  * the source lines that allocated most of the retained memory.
+
+With `--budget`, the exit code is 1, if the peak of a stage is higher than
+the budget in bytes per character of the input.
+"""
+
+import argparse
+import gc
+import json
+import sys
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable
+
+from biz.dfch.ste100parser import GrammarType, Parser
+from biz.dfch.ste100parser.line_index import LineIndex
+from biz.dfch.ste100parser.transformer import (
+    ContainerTransformer,
+    TextTransformer,
+    TokenConverter,
+)
+
+from .synthetic import generate, parse_size
+
+__all__ = [
+    "StageMemory",
+    "main",
+    "profile",
+]
+
+# Allocations of tracemalloc itself, of this module and of the import
+# system are not part of a stage.
+_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, __file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+@dataclass(frozen=True)
+class StageMemory:
+    """Memory of one stage."""
+
+    stage: str
+    characters: int
+    peak_bytes: int
+    retained_bytes: int
+    # "file:line" and the retained bytes of the top allocation sites.
+    sites: list[tuple[str, int]] = field(default_factory=list)
+
+    @property
+    def peak_per_character(self) -> float:
+        return self.peak_bytes / self.characters if self.characters else 0.0
+
+    @property
+    def retained_per_character(self) -> float:
+        return (
+            self.retained_bytes / self.characters if self.characters else 0.0)
+
+
+def _get_sites(
+    before: tracemalloc.Snapshot,
+    after: tracemalloc.Snapshot,
+    top: int,
+) -> list[tuple[str, int]]:
+    stats = after.filter_traces(_FILTERS).compare_to(
+        before.filter_traces(_FILTERS), "lineno")
+
+    result = []
+    for item in stats[:top]:
+        frame = item.traceback[0]
+        result.append((f"{frame.filename}:{frame.lineno}", item.size_diff))
+
+    return result
+
+
+def _run_stage(
+    stage: str,
+    characters: int,
+    top: int,
+    func: Callable[[], Any],
+) -> tuple[StageMemory, Any]:
+    """Runs `func` under tracemalloc. Returns the memory and the result."""
+
+    gc.collect()
+    before = tracemalloc.take_snapshot() if 0 < top else None
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+
+    result = func()
+
+    _, peak = tracemalloc.get_traced_memory()
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    sites = (
+        _get_sites(before, tracemalloc.take_snapshot(), top)
+        if before is not None else []
+    )
+
+    return StageMemory(
+        stage, characters, peak - current, retained - current, sites), result
+
+
+def profile(
+    grammar: GrammarType,
+    text: str,
+    top: int = 5,
+) -> list[StageMemory]:
+    """Returns the memory of every stage for the text."""
+
+    assert 0 <= top, top
+
+    # The grammar is loaded and the lexer is used before, so that they are
+    # not part of a stage.
+    parser = Parser(grammar)
+    TextTransformer().transform(
+        ContainerTransformer().transform(parser.invoke(generate(100))))
+
+    container = ContainerTransformer()
+    container.line_index = LineIndex(text)
+
+    result = []
+    tracemalloc.start()
+    try:
+        memory, parse_tree = _run_stage(
+            "parse", len(text), top, lambda: parser.invoke(text))
+        result.append(memory)
+
+        memory, pass1 = _run_stage(
+            "container", len(text), top,
+            lambda: container.transform(parse_tree))
+        result.append(memory)
+
+        memory, tree = _run_stage(
+            "text", len(text), top,
+            lambda: TextTransformer().transform(pass1))
+        result.append(memory)
+
+        memory, _ = _run_stage(
+            "converter", len(text), top,
+            lambda: TokenConverter().invoke(tree))
+        result.append(memory)
+    finally:
+        tracemalloc.stop()
+
+    return result
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Prints the memory of every stage and checks the budget."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument(
+        "--size", type=parse_size, default="20K",
+        help="Size of the synthetic document, for example 10K or 1M.")
+    source.add_argument("--file", type=Path, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--grammar", default=GrammarType.CONTAINER_LALR.name,
+        choices=[GrammarType.CONTAINER.name, GrammarType.CONTAINER_LALR.name])
+    parser.add_argument(
+        "--top", type=int, default=5,
+        help="Number of allocation sites per stage (0: none).")
+    parser.add_argument(
+        "--budget", type=float, default=None,
+        help="Maximum peak memory of a stage in bytes per character.")
+    parser.add_argument("--output", type=Path, default=None)
+    args = parser.parse_args(argv)
+
+    text = (
+        args.file.read_text(encoding="utf-8") if args.file is not None
+        else generate(args.size, args.seed)
+    )
+
+    results = profile(GrammarType[args.grammar], text, args.top)
+
+    print(f"grammar    {args.grammar}, {len(text)} chars")
+    for item in results:
+        print(f"{item.stage:10} peak {item.peak_bytes / 2**20:8.2f} MiB "
+              f"({item.peak_per_character:7.1f} bytes/char)  "
+              f"retained {item.retained_bytes / 2**20:8.2f} MiB "
+              f"({item.retained_per_character:7.1f} bytes/char)")
+        for site, size in item.sites:
+            print(f"    {size / 2**10:10.1f} KiB  {site}")
+
+    if args.output is not None:
+        args.output.write_text(json.dumps({
+            "grammar": args.grammar,
+            "characters": len(text),
+            "stages": [asdict(item) for item in results],
+        }, indent=2) + "\n", encoding="utf-8")
+
+    if args.budget is None:
+        return 0
+
+    failed = [
+        item for item in results if item.peak_per_character > args.budget]
+    for item in failed:
+        print(f"BUDGET {item.stage}: {item.peak_per_character:.1f} "
+              f"bytes/char > {args.budget:.1f}", file=sys.stderr)
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
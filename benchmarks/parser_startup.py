@@ -0,0 +1,89 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Startup of the parser: compile, on-disk cache (cold, warm), generated module.
+
+Every measurement runs in a new process, so the process-wide cache of the
+Parser class does not hide the compilation.
+
+    PYTHONPATH=src python -m benchmarks.parser_startup [--runs N]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+__all__ = [
+    "main",
+]
+
+_SCRIPT = """
+import sys, time
+start = time.perf_counter()
+from biz.dfch.ste100parser import GrammarType, Parser
+from biz.dfch.ste100parser.grammar.standalone_grammar import StandaloneGrammar
+if "1" != sys.argv[3]:
+    StandaloneGrammar.load = classmethod(lambda *_: None)
+Parser(GrammarType[sys.argv[1]], cache_dir=sys.argv[2] or None)
+print(time.perf_counter() - start)
+"""
+
+
+def _measure(grammar: str, cache_dir: str, generated: bool = False) -> float:
+    result = subprocess.run(
+        [
+            sys.executable, "-c", _SCRIPT, grammar, cache_dir,
+            str(int(generated)),
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+        env=os.environ.copy(),
+    )
+
+    return float(result.stdout.strip())
+
+
+def main() -> None:
+    """Prints the median startup time of each way to get the parser."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--grammar", default="CONTAINER_LALR")
+    args = parser.parse_args()
+
+    uncached, cold, warm, generated = [], [], [], []
+    for _ in range(args.runs):
+        uncached.append(_measure(args.grammar, ""))
+        generated.append(_measure(args.grammar, "", generated=True))
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cold.append(_measure(args.grammar, cache_dir))
+            warm.append(_measure(args.grammar, cache_dir))
+
+    print(f"grammar   {args.grammar} ({args.runs} runs, median)")
+    for name, values in (
+            ("compile", uncached),
+            ("cold", cold),
+            ("warm", warm),
+            ("generated", generated)):
+        print(f"{name:9} {statistics.median(values) * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
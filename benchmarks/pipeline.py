@@ -0,0 +1,113 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Time and peak memory of Pipeline against Parser, ContainerTransformer and
+TextTransformer on a large document.
+
+    PYTHONPATH=src python -m benchmarks.pipeline [--copies N] [--runs N]
+"""
+
+import argparse
+import statistics
+import time
+import tracemalloc
+from pathlib import Path
+
+from biz.dfch.ste100parser import GrammarType, Parser, Pipeline
+from biz.dfch.ste100parser.transformer import ContainerTransformer
+from biz.dfch.ste100parser.transformer import PipelineTransformer
+from biz.dfch.ste100parser.transformer import TextTransformer
+
+__all__ = [
+    "main",
+]
+
+_TEST_DATA = (
+    Path(__file__).parent.parent / "tests" / "test_data" /
+    "complex_heading_proc_cite_para_list.md"
+)
+
+
+def _three_step(parser: Parser, text: str):
+    initial = parser.invoke(text)
+    pass1 = ContainerTransformer().transform(initial)
+    return TextTransformer().transform(pass1)
+
+
+def _measure(funcs: dict, value, runs: int) -> dict:
+    """Returns the median time in seconds and the peak memory in bytes."""
+
+    times: dict = {name: [] for name in funcs}
+    for _ in range(runs):
+        # Alternate the functions, so that both see the same conditions.
+        for name, func in funcs.items():
+            start = time.perf_counter()
+            func(value)
+            times[name].append(time.perf_counter() - start)
+
+    result = {}
+    for name, func in funcs.items():
+        tracemalloc.start()
+        func(value)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        result[name] = (statistics.median(times[name]), peak)
+
+    return result
+
+
+def main() -> None:
+    """Prints time and peak memory of both ways."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--copies", type=int, default=50)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--grammar", default="CONTAINER_LALR")
+    args = parser.parse_args()
+
+    grammar = GrammarType[args.grammar]
+    text = "\n".join(
+        [_TEST_DATA.read_text(encoding="utf-8")] * args.copies)
+
+    lark_parser = Parser(grammar)
+    pipeline = Pipeline(grammar)
+
+    print(f"grammar    {grammar.name}, {len(text)} chars, "
+          f"{args.runs} runs (median)")
+
+    print("parse and transform:")
+    results = _measure({
+        "three-step": lambda value: _three_step(lark_parser, value),
+        "pipeline": pipeline.invoke,
+    }, text, args.runs)
+    _print(results)
+
+    print("transform only:")
+    results = _measure({
+        "three-step": lambda tree: TextTransformer().transform(
+            ContainerTransformer().transform(tree)),
+        "pipeline": PipelineTransformer().transform,
+    }, lark_parser.invoke(text), args.runs)
+    _print(results)
+
+
+def _print(results: dict) -> None:
+    for name, (seconds, peak) in results.items():
+        print(f"  {name:10} {seconds * 1000:8.1f} ms {peak / 2**20:8.2f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,299 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Throughput and peak memory per grammar and stage over the input size.
+
+    PYTHONPATH=src python -m benchmarks.scaling [--sizes 1K 10K 1M]
+        [--grammar CONTAINER_LALR] [--runs N] [--output results.json]
+        [--baseline benchmarks/baseline/scaling.json] [--tolerance 0.25]
+
+The documents come from `benchmarks.synthetic`. The stages are `parse`
+(lexer and parser), `container` (ContainerTransformer), `text`
+(TextTransformer) and `pipeline` (Pipeline, both transformers in one
+pass). The time is the median of the runs, the peak memory is the memory
+that a stage allocates on top of its input.
+
+With `--baseline`, a stage is a regression, if its throughput is lower or
+its peak memory is higher than in the baseline by more than the tolerance.
+Then, the exit code is 1. To create a baseline, use `--output`.
+"""
+
+import argparse
+import gc
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import lark
+
+from biz.dfch.ste100parser import GrammarType, Parser, Pipeline
+from biz.dfch.ste100parser.line_index import LineIndex
+from biz.dfch.ste100parser.transformer import (
+    ContainerTransformer,
+    TextTransformer,
+)
+
+from .synthetic import generate, parse_size
+
+__all__ = [
+    "StageResult",
+    "compare",
+    "main",
+    "run",
+]
+
+# Version of the result file.
+_VERSION = 1
+
+_STAGES = ("parse", "container", "text", "pipeline")
+
+_GRAMMARS = (GrammarType.CONTAINER_LALR, GrammarType.CONTAINER)
+
+
+@dataclass(frozen=True)
+class StageResult:
+    """Time and memory of one stage for one grammar and size."""
+
+    grammar: str
+    # Requested size of the document.
+    size: int
+    stage: str
+    characters: int
+    seconds: float
+    peak_bytes: int
+
+    @property
+    def key(self) -> tuple[str, int, str]:
+        """Identifies the same measurement in another result file."""
+
+        return self.grammar, self.size, self.stage
+
+    @property
+    def characters_per_second(self) -> float:
+        return self.characters / self.seconds if 0 < self.seconds else 0.0
+
+
+def _run_stages(
+    parser: Parser,
+    pipeline: Pipeline,
+    text: str,
+) -> dict[str, float]:
+    """Returns the time of every stage in seconds."""
+
+    result = {}
+
+    start = time.perf_counter()
+    parse_tree = parser.invoke(text)
+    result["parse"] = time.perf_counter() - start
+
+    container = ContainerTransformer()
+    container.line_index = LineIndex(text)
+    start = time.perf_counter()
+    pass1 = container.transform(parse_tree)
+    result["container"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    TextTransformer().transform(pass1)
+    result["text"] = time.perf_counter() - start
+
+    del parse_tree, pass1
+    start = time.perf_counter()
+    pipeline.invoke(text)
+    result["pipeline"] = time.perf_counter() - start
+
+    return result
+
+
+def _measure_memory(
+    parser: Parser,
+    pipeline: Pipeline,
+    text: str,
+) -> dict[str, int]:
+    """Returns the peak memory of every stage on top of its input."""
+
+    result = {}
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        parse_tree = parser.invoke(text)
+        result["parse"] = tracemalloc.get_traced_memory()[1] - current
+
+        container = ContainerTransformer()
+        container.line_index = LineIndex(text)
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        pass1 = container.transform(parse_tree)
+        result["container"] = tracemalloc.get_traced_memory()[1] - current
+
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        TextTransformer().transform(pass1)
+        result["text"] = tracemalloc.get_traced_memory()[1] - current
+
+        del parse_tree, pass1
+        gc.collect()
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        pipeline.invoke(text)
+        result["pipeline"] = tracemalloc.get_traced_memory()[1] - current
+    finally:
+        tracemalloc.stop()
+
+    return result
+
+
+def run(
+    grammar: GrammarType,
+    size: int,
+    runs: int = 3,
+    seed: int = 0,
+) -> list[StageResult]:
+    """Measures all stages for one grammar and document size."""
+
+    assert 0 < runs, runs
+
+    text = generate(size, seed)
+    parser = Parser(grammar)
+    pipeline = Pipeline(grammar)
+
+    # The grammar is loaded and the lexer is used before, so that they are
+    # not part of the first measured size.
+    _run_stages(parser, pipeline, generate(100, seed))
+
+    times: dict[str, list[float]] = {stage: [] for stage in _STAGES}
+    for _ in range(runs):
+        for stage, seconds in _run_stages(parser, pipeline, text).items():
+            times[stage].append(seconds)
+
+    memory = _measure_memory(parser, pipeline, text)
+
+    return [
+        StageResult(
+            grammar.name, size, stage, len(text),
+            statistics.median(times[stage]), memory[stage])
+        for stage in _STAGES
+    ]
+
+
+def compare(
+    results: list[StageResult],
+    baseline: list[StageResult],
+    tolerance: float,
+) -> list[str]:
+    """Returns a message for every regression against the baseline."""
+
+    assert 0 <= tolerance, tolerance
+
+    expected = {item.key: item for item in baseline}
+
+    messages = []
+    for item in results:
+        old = expected.get(item.key)
+        if old is None:
+            continue
+
+        name = f"{item.grammar} {item.size} {item.stage}"
+        if (item.characters_per_second <
+                old.characters_per_second * (1 - tolerance)):
+            messages.append(
+                f"{name}: {item.characters_per_second / 1000:.1f} kchars/s "
+                f"(baseline {old.characters_per_second / 1000:.1f})")
+        if item.peak_bytes > old.peak_bytes * (1 + tolerance):
+            messages.append(
+                f"{name}: peak {item.peak_bytes / 2**20:.2f} MiB "
+                f"(baseline {old.peak_bytes / 2**20:.2f})")
+
+    return messages
+
+
+def _load(path: Path) -> list[StageResult]:
+    data = json.loads(path.read_text(encoding="utf-8"))
+    assert _VERSION == data["version"], data["version"]
+
+    return [StageResult(**item) for item in data["results"]]
+
+
+def _save(path: Path, results: list[StageResult], seed: int) -> None:
+    data = {
+        "version": _VERSION,
+        "python": platform.python_version(),
+        "lark": lark.__version__,
+        "machine": platform.machine(),
+        "seed": seed,
+        "results": [asdict(item) for item in results],
+    }
+    path.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Prints the results and compares them with the baseline."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--sizes", nargs="+", type=parse_size,
+        default=[1000, 10_000, 100_000, 1_000_000],
+        help="Document sizes, for example 1K, 10K or 100M.")
+    parser.add_argument(
+        "--grammar", nargs="+", choices=[item.name for item in _GRAMMARS],
+        default=[item.name for item in _GRAMMARS])
+    parser.add_argument(
+        "--earley-max-size", type=parse_size, default="1K",
+        help="The Earley parser is not linear. Larger sizes are skipped.")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, default=None)
+    parser.add_argument("--baseline", type=Path, default=None)
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    args = parser.parse_args(argv)
+
+    results: list[StageResult] = []
+    for name in args.grammar:
+        grammar = GrammarType[name]
+        for size in args.sizes:
+            if (GrammarType.CONTAINER == grammar and
+                    size > args.earley_max_size):
+                continue
+
+            for item in run(grammar, size, args.runs, args.seed):
+                results.append(item)
+                print(f"{item.grammar:14} {item.size:>10} {item.stage:9} "
+                      f"{item.seconds * 1000:10.1f} ms "
+                      f"{item.characters_per_second / 1000:8.1f} kchars/s "
+                      f"peak {item.peak_bytes / 2**20:8.2f} MiB", flush=True)
+
+    if args.output is not None:
+        _save(args.output, results, args.seed)
+
+    if args.baseline is None:
+        return 0
+
+    messages = compare(results, _load(args.baseline), args.tolerance)
+    for message in messages:
+        print(f"REGRESSION {message}", file=sys.stderr)
+
+    return 1 if messages else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
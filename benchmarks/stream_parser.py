@@ -0,0 +1,92 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Time and peak memory of StreamParser against Pipeline on a large file.
+
+    PYTHONPATH=src python -m benchmarks.stream_parser [--copies N]
+"""
+
+import argparse
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from biz.dfch.ste100parser import GrammarType, Pipeline, StreamParser
+
+__all__ = [
+    "main",
+]
+
+_TEST_DATA = (
+    Path(__file__).parent.parent / "tests" / "test_data" /
+    "complex_heading_proc_cite_para_list.md"
+)
+
+
+def _whole(pipeline: Pipeline, path: Path) -> int:
+    tree = pipeline.invoke(path.read_text(encoding="utf-8"))
+    return len(tree.children)
+
+
+def _stream(parser: StreamParser, path: Path) -> int:
+    # Only counts the items, so that they are not kept in memory.
+    with path.open(encoding="utf-8") as f:
+        return sum(1 for _ in parser.iter_items(f))
+
+
+def _measure(func, *args) -> tuple[float, int, int]:
+    """Returns the time in seconds, the peak memory and the result."""
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func(*args)
+    seconds = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return seconds, peak, result
+
+
+def main() -> None:
+    """Prints time and peak memory of both ways."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--copies", type=int, default=50)
+    parser.add_argument("--grammar", default="CONTAINER_LALR")
+    args = parser.parse_args()
+
+    grammar = GrammarType[args.grammar]
+    text = "\n\n".join(
+        [_TEST_DATA.read_text(encoding="utf-8").strip("\n")] * args.copies)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "document.md"
+        path.write_text(text, encoding="utf-8")
+
+        print(f"grammar    {grammar.name}, {len(text)} chars")
+
+        for name, func, value in (
+            ("pipeline", _whole, Pipeline(grammar)),
+            ("stream", _stream, StreamParser(grammar)),
+        ):
+            seconds, peak, items = _measure(func, value, path)
+            print(f"  {name:10} {seconds * 1000:9.1f} ms "
+                  f"{peak / 2**20:8.2f} MiB {items:6} items")
+
+
+if __name__ == "__main__":
+    main()
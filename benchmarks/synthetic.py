@@ -0,0 +1,198 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Deterministic synthetic STE100 Markdown documents.
+
+    PYTHONPATH=src python -m benchmarks.synthetic [--size 10K] [--seed N]
+"""
+
+import argparse
+import random
+
+__all__ = [
+    "generate",
+    "parse_size",
+]
+
+_WORDS = (
+    "the", "a", "valve", "pump", "filter", "panel", "cover", "bolt", "seal",
+    "engine", "wheel", "brake", "door", "cable", "switch", "tool", "unit",
+    "is", "are", "has", "can", "must", "make", "sure", "that", "not", "all",
+    "open", "close", "remove", "install", "examine", "replace", "clean",
+    "tighten", "connect", "disconnect", "do", "this", "procedure", "step",
+    "left", "right", "upper", "lower", "main", "hydraulic", "fuel", "oil",
+    "pressure", "temperature", "when", "if", "then", "before", "after",
+    "with", "on", "in", "to", "from", "of", "and", "or",
+)
+
+_LIST_MARKERS = ("a", "b", "c", "d", "e", "f")
+
+
+def parse_size(value: str) -> int:
+    """Returns the number of characters of a size like `1K` or `100M`."""
+
+    value = value.strip().upper()
+    factor = 1
+    for suffix, suffix_factor in (("K", 1000), ("M", 1000**2)):
+        if value.endswith(suffix):
+            value = value[:-1]
+            factor = suffix_factor
+            break
+
+    result = int(float(value) * factor)
+    assert 0 < result, value
+
+    return result
+
+
+class _Generator:
+    """Creates the blocks of a document from one random generator."""
+
+    _random: random.Random
+
+    def __init__(self, seed: int):
+        self._random = random.Random(seed)
+
+    def words(self, low: int, high: int) -> str:
+        return " ".join(
+            self._random.choice(_WORDS)
+            for _ in range(self._random.randint(low, high)))
+
+    def inline(self, depth: int = 0) -> str:
+        """A word sequence with an optional formatter, quote or paren."""
+
+        value = self._random.random()
+        words = self.words(1, 4)
+        if 0.55 > value:
+            return words
+        if 0.65 > value:
+            return f"*{words}*"
+        if 0.72 > value:
+            return f"_{words}_"
+        if 0.77 > value:
+            # A paren cannot contain code.
+            if 0 < depth:
+                return words
+            return f"`{words}`"
+        if 0.84 > value:
+            return f"\"{words}\""
+        if 2 <= depth:
+            return f"({words})"
+
+        return f"({words} {self.inline(depth + 1)})"
+
+    def sentence(self) -> str:
+        # A sentence starts with a word.
+        parts = [self.words(1, 3).capitalize()]
+        parts.extend(
+            self.inline() for _ in range(self._random.randint(0, 3)))
+
+        return " ".join(parts) + "."
+
+    def heading(self) -> str:
+        level = self._random.randint(1, 4)
+        return f"{'#' * level} {self.words(2, 5).capitalize()}\n"
+
+    def paragraph(self) -> str:
+        lines = [
+            " ".join(
+                self.sentence() for _ in range(self._random.randint(1, 3)))
+            for _ in range(self._random.randint(1, 3))
+        ]
+        if 0.3 > self._random.random():
+            lines[-1] = lines[-1][:-1] + ":"
+            lines.extend(self.list_items("  "))
+
+        return "\n".join(lines) + "\n"
+
+    def list_items(self, indent: str) -> list[str]:
+        count = self._random.randint(2, len(_LIST_MARKERS))
+        return [
+            f"{indent}{marker} {self.words(2, 6).capitalize()}."
+            for marker in _LIST_MARKERS[:count]
+        ]
+
+    def procedure(self) -> str:
+        lines = []
+        for index in range(1, self._random.randint(2, 8) + 1):
+            value = self._random.random()
+            if 0.2 > value:
+                lines.append(
+                    f"{index}. {self.words(2, 6).capitalize()}:")
+                lines.extend(self.list_items("   "))
+                continue
+
+            lines.append(f"{index}. {self.sentence()}")
+            if 0.3 > value:
+                kind = self._random.choice(("NOTE", "WARNING", "CAUTION"))
+                lines.append(f"{kind}: {self.sentence()}")
+
+        return "\n".join(lines) + "\n"
+
+    def cite(self) -> str:
+        return "\n".join(
+            f"> {self.sentence()}"
+            for _ in range(self._random.randint(1, 3))) + "\n"
+
+    def block(self) -> str:
+        value = self._random.random()
+        if 0.15 > value:
+            return self.heading()
+        if 0.6 > value:
+            return self.paragraph()
+        if 0.9 > value:
+            return self.procedure()
+
+        return self.cite()
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Returns a document with at least `size` characters. The same size and
+    seed always return the same document.
+
+    The document has headings, paragraphs with vertical lists, procedures
+    with nested lists, NOTE, WARNING and CAUTION, cites, nested parentheses,
+    quotes and the formatters bold, emphasis and code.
+    """
+
+    assert 0 < size, size
+
+    generator = _Generator(seed)
+
+    blocks = []
+    length = 0
+    while length < size:
+        block = generator.block()
+        blocks.append(block)
+        length += len(block) + 1
+
+    return "\n".join(blocks)
+
+
+def main() -> None:
+    """Prints a document."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=parse_size, default="10K")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(generate(args.size, args.seed), end="")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Time of TokenConverter against the recursive conversion on large trees.
+
+    PYTHONPATH=src python -m benchmarks.token_converter [--nodes N]
+"""
+
+import argparse
+import statistics
+import sys
+import time
+
+from lark import Tree
+
+from biz.dfch.ste100parser import Token
+from biz.dfch.ste100parser.transformer import TokenConverter
+
+__all__ = [
+    "main",
+]
+
+
+def _recursive(node):
+    """The conversion before the explicit stack."""
+
+    if not isinstance(node, Tree):
+        return str(node)
+
+    return (Token[node.data], [_recursive(child) for child in node.children])
+
+
+def _get_wide_tree(nodes: int) -> Tree:
+    """Sentences of 10 words. Every word is a tree and a string."""
+
+    sentences = []
+    for _ in range(nodes // 21):
+        sentences.append(Tree(Token.sentence.name, [
+            Tree(Token.WORD.name, ["valve"]) for _ in range(10)]))
+
+    return Tree(Token.paragraph.name, sentences)
+
+
+def _get_deep_tree(depth: int) -> Tree:
+    result = Tree(Token.WORD.name, ["valve"])
+    for _ in range(depth):
+        result = Tree(Token.paren.name, [result])
+
+    return Tree(Token.paragraph.name, [result])
+
+
+def _measure(func, value, runs: int) -> float:
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func(value)
+        times.append(time.perf_counter() - start)
+
+    return statistics.median(times)
+
+
+def main() -> None:
+    """Prints the median time of both conversions."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--nodes", type=int, default=1_000_000)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    converter = TokenConverter()
+    trees = (
+        ("wide", _get_wide_tree(args.nodes)),
+        # The recursive conversion needs 2 frames per level.
+        ("deep", _get_deep_tree(sys.getrecursionlimit() // 2 - 50)),
+    )
+    for name, tree in trees:
+        nodes = sum(
+            1 + sum(not isinstance(child, Tree) for child in node.children)
+            for node in tree.iter_subtrees())
+        recursive = _measure(_recursive, tree, args.runs)
+        iterative = _measure(converter.invoke, tree, args.runs)
+        formatting = _measure(
+            converter.format, converter.invoke(tree), args.runs)
+        print(f"{name:5} {nodes:>9} nodes  recursive {recursive * 1000:8.1f} "
+              f"ms  iterative {iterative * 1000:8.1f} ms  "
+              f"format {formatting * 1000:8.1f} ms")
+
+    depth = 100 * sys.getrecursionlimit()
+    seconds = _measure(converter.invoke, _get_deep_tree(depth), 1)
+    print(f"depth {depth}: iterative {seconds * 1000:.1f} ms "
+          f"(the recursive conversion fails)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Time of the `start` rules of ContainerTransformer over many top-level nodes.
+
+    PYTHONPATH=src python -m benchmarks.tree_rewriter [--nodes N] [--runs N]
+"""
+
+import argparse
+import random
+import time
+
+from lark import Tree
+from lark.tree import Meta
+
+from biz.dfch.ste100parser.transformer.container_transformer_rules import (
+    ContainerTransformerRules,
+)
+from biz.dfch.ste100parser.transformer.tree_rewriter import TreeRewriter
+
+__all__ = [
+    "main",
+]
+
+
+def _rewrite_naive(children: list, rules: list) -> None:
+    """Tries every rule at every position and splices the list in place."""
+
+    i = 0
+    while i < len(children):
+        for pattern, replacer, do_again in rules:
+            segment = children[i:i + len(pattern)]
+            if len(segment) == len(pattern) and all(
+                isinstance(node, Tree) and token.name == node.data
+                for node, token in zip(segment, pattern)
+            ):
+                new_segment = replacer(*segment)
+                if not isinstance(new_segment, list):
+                    new_segment = [new_segment]
+                children[i:i + len(pattern)] = new_segment
+                if not do_again:
+                    i += 1
+                break
+        else:
+            i += 1
+
+
+def _get_children(count: int, rnd: random.Random) -> list:
+    """Returns top-level items with the line breaks between them."""
+
+    items = ["heading", "paragraph", "paragraph", "proc_item", "cite"]
+
+    result = []
+    for i in range(count):
+        meta = Meta()
+        meta.line = i + 1
+        meta.column = 1
+        meta.start_pos = i
+        meta.end_pos = i + 1
+
+        name = "NEWLINE" if i % 3 else rnd.choice(items)
+        result.append(Tree(name, [], meta=meta))
+
+    return result
+
+
+def main() -> None:
+    """Prints the time of the naive and the compiled rewriter."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--nodes", type=int, default=30_000)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    children = _get_children(args.nodes, random.Random(0))
+
+    results = {}
+    for name, rewrite in (
+        ("naive", _rewrite_naive),
+        ("compiled", TreeRewriter().invoke),
+    ):
+        best = float("inf")
+        for _ in range(args.runs):
+            # The rules of every call have new replacers, as in the
+            # transformer.
+            rules = ContainerTransformerRules().get_rules_start()
+            value = list(children)
+
+            start = time.perf_counter()
+            rewrite(value, rules)
+            best = min(best, time.perf_counter() - start)
+
+        results[name] = [(node.data, node.meta.start_pos) for node in value]
+        print(f"{name:8} {len(children):7} nodes -> {len(value):7} nodes  "
+              f"{best * 1000:8.1f} ms")
+
+    assert results["naive"] == results["compiled"]
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Time of Parser.validate and of a full parse for valid and invalid texts.
+
+    PYTHONPATH=src python -m benchmarks.validation [--size 10K]
+        [--repeat 5] [--grammar CONTAINER_LALR] [--output results.json]
+
+The valid text is a synthetic document of `--size` characters from
+`benchmarks.synthetic`. The invalid text is the same document with an
+unclosed parenthesis in its last paragraph, so both parsers read almost
+the whole text before the error. The full parse is the former
+`Parser.is_valid`: `Parser.invoke` with tree construction and position
+propagation.
+"""
+
+import argparse
+import json
+import sys
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from biz.dfch.ste100parser import GrammarType, Parser
+
+from .synthetic import generate, parse_size
+
+__all__ = [
+    "ValidationTiming",
+    "get_invalid",
+    "main",
+    "run",
+]
+
+
+@dataclass(frozen=True)
+class ValidationTiming:
+    """Best time of a full parse and of `validate` for a text."""
+
+    name: str
+    valid: bool
+    characters: int
+    parse_seconds: float
+    validate_seconds: float
+
+    @property
+    def speedup(self) -> float:
+        """How many times faster `validate` is than the full parse."""
+
+        return self.parse_seconds / self.validate_seconds
+
+
+def get_invalid(text: str) -> str:
+    """Returns the text with an unclosed parenthesis at the end."""
+
+    return text.rstrip("\n") + " (open\n"
+
+
+def _parse(parser: Parser, text: str) -> bool:
+    try:
+        parser.invoke(text)
+        return True
+    except Exception:  # pylint: disable=W0718
+        return False
+
+
+def _get_best(function, parser: Parser, text: str, repeat: int) -> float:
+    result = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(parser, text)
+        result = min(result, time.perf_counter() - start)
+
+    return result
+
+
+def run(
+    grammar: GrammarType,
+    name: str,
+    text: str,
+    repeat: int,
+) -> ValidationTiming:
+    """Measures both paths on the text."""
+
+    assert 0 < repeat, repeat
+
+    parser = Parser(grammar)
+    valid = parser.validate(text).valid
+    assert valid == _parse(parser, text), name
+
+    return ValidationTiming(
+        name=name,
+        valid=valid,
+        characters=len(text),
+        parse_seconds=_get_best(_parse, parser, text, repeat),
+        validate_seconds=_get_best(
+            lambda p, t: p.validate(t).valid, parser, text, repeat),
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Prints the time of both paths for a valid and an invalid text."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--size", type=parse_size, default="10K",
+        help="Size of the synthetic document, for example 10K.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--grammar", default=GrammarType.CONTAINER_LALR.name,
+        choices=[GrammarType.CONTAINER.name, GrammarType.CONTAINER_LALR.name])
+    parser.add_argument("--output", type=Path, default=None)
+    args = parser.parse_args(argv)
+
+    grammar = GrammarType[args.grammar]
+    text = generate(args.size, args.seed)
+
+    results = [
+        run(grammar, "valid", text, args.repeat),
+        run(grammar, "invalid", get_invalid(text), args.repeat),
+    ]
+
+    print(f"grammar    {args.grammar}, {len(text)} chars, "
+          f"best of {args.repeat}")
+    for item in results:
+        print(f"{item.name:10} parse {item.parse_seconds * 1000:10.1f} ms  "
+              f"validate {item.validate_seconds * 1000:10.1f} ms  "
+              f"speedup {item.speedup:5.2f}x")
+
+    if args.output is not None:
+        args.output.write_text(json.dumps({
+            "grammar": args.grammar,
+            "results": [
+                {**asdict(item), "speedup": item.speedup}
+                for item in results
+            ],
+        }, indent=2) + "\n", encoding="utf-8")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
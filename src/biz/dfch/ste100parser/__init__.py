@@ -15,16 +15,44 @@
 
 """biz.dfch.ste100parser package root"""
 
+from .async_parser import AsyncParser
+from .batch import BatchParser, BatchResult
+from .binary_tree import BinaryTree
 from .char import Char
+from .chunked_parser import ChunkedParser
+from .compact_tree import CompactLeaf, CompactNode
+from .dictionary import Dictionary
 from .grammar import GrammarType
-from .parser import Parser
+from .incremental_parser import IncrementalParser, TextEdit
+from .interner import Interner
+from .parser import Parser, ValidationResult
+from .pipeline import Pipeline
+from .result_cache import ResultCache
+from .stats import PipelineStats
+from .stream_parser import StreamParser
 from .token import Token
 from .transformer import ContainerTransformer
 
 __all__ = [
+    "AsyncParser",
+    "BatchParser",
+    "BatchResult",
+    "BinaryTree",
     "Char",
+    "ChunkedParser",
+    "CompactLeaf",
+    "CompactNode",
     "ContainerTransformer",
+    "Dictionary",
     "GrammarType",
+    "IncrementalParser",
+    "Interner",
     "Parser",
+    "Pipeline",
+    "PipelineStats",
+    "ResultCache",
+    "StreamParser",
+    "TextEdit",
     "Token",
+    "ValidationResult",
 ]
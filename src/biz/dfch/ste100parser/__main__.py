@@ -15,11 +15,508 @@
 
 """__main__"""
 
+import argparse
+import base64
+import glob
+import json
+import os
+import sys
+import time
+from dataclasses import replace
+from pathlib import Path
+from typing import Iterator, TextIO
 
-def main():
+from .batch import BatchParser, BatchResult
+from .binary_tree import BinaryTree
+from .daemon import (
+    Address,
+    ParseClient,
+    ParseServer,
+    get_default_address,
+    parse_address,
+)
+from .grammar.grammar_type import GrammarType
+from .serializer import DictSerializer
+from .stats import PipelineStats
+from .stream_parser import StreamParser
+
+# Source name of the standard input.
+_STDIN = "-"
+
+_FORMATS = ("tree", "json", "none")
+
+# Files per request to the daemon.
+_DAEMON_BATCH_SIZE = 32
+
+
+def _get_paths(values: list[str], pattern: str) -> list[Path]:
+    """
+    Returns the files of the arguments in their order. A directory adds all
+    files that match the pattern (recursive), a glob adds the files that
+    match the glob. Other values are returned as they are, so that a
+    missing file is reported as an error. A file is only returned once.
+    """
+
+    result: list[Path] = []
+    for value in values:
+        path = Path(value)
+        if path.is_dir():
+            result.extend(sorted(
+                item for item in path.rglob(pattern) if item.is_file()))
+        elif glob.has_magic(value):
+            result.extend(sorted(
+                Path(item) for item in glob.glob(value, recursive=True)
+                if Path(item).is_file()))
+        else:
+            result.append(path)
+
+    return list(dict.fromkeys(result))
+
+
+def _print_result(
+    result: BatchResult,
+    output_format: str,
+    timing: bool,
+    out: TextIO,
+) -> None:
+    """Prints one result as a JSON line or as a status line (and tree)."""
+
+    if "json" == output_format:
+        value = {
+            "source": result.source,
+            "ok": result.ok,
+            "seconds": result.seconds,
+        }
+        if result.ok:
+            value["tree"] = DictSerializer().invoke(result.tree)
+        else:
+            value["error"] = result.error
+        if result.stats is not None:
+            value["stats"] = result.stats.to_dict()
+        print(json.dumps(value, ensure_ascii=False), file=out)
+        return
+
+    status = "OK" if result.ok else "ERROR"
+    suffix = f" ({result.seconds * 1000:.1f} ms)" if timing else ""
+    print(f"{result.source}: {status}{suffix}", file=out)
+
+    if not result.ok:
+        for line in result.error.splitlines():
+            print(f"  {line}", file=out)
+        return
+
+    if result.stats is not None:
+        print(result.stats.format(), file=out)
+    if "tree" == output_format:
+        print(result.tree.pretty(), file=out)
+
+
+def _get_daemon_chunk(
+    client: ParseClient,
+    paths: list[Path],
+    offset: int,
+    grammar: GrammarType,
+    output_format: str,
+) -> list[BatchResult]:
+    """
+    Parses the files in the daemon with one batch. Raises OSError,
+    RuntimeError, ValueError, KeyError or TypeError, if the daemon fails or
+    its reply is not valid.
+    """
+
+    calls = []
+    results: list[BatchResult | None] = []
+    texts = []
+    for index, path in enumerate(paths, offset):
+        try:
+            text = path.read_text(encoding="utf-8")
+        except Exception as ex:  # pylint: disable=W0718
+            results.append(BatchResult(
+                index, str(path), error=f"{type(ex).__name__}: {ex}"))
+            continue
+
+        results.append(None)
+        texts.append(text)
+        # Without a tree, the daemon only validates the text.
+        calls.append(
+            ("validate", {"text": text, "grammar": grammar.name})
+            if "none" == output_format else
+            ("parse", {
+                "text": text, "grammar": grammar.name, "format": "binary"}))
+
+    values = client.call_batch(calls)
+    if len(calls) != len(values):
+        raise ValueError(
+            f"The daemon returned {len(values)} results for "
+            f"{len(calls)} calls.")
+
+    values = iter(values)
+    texts = iter(texts)
+    for i, path in enumerate(paths):
+        if results[i] is not None:
+            continue
+
+        value = next(values)
+        text = next(texts)
+        if not value["ok"]:
+            results[i] = BatchResult(
+                offset + i, str(path), error=value["error"],
+                seconds=value["seconds"])
+            continue
+
+        tree = (
+            BinaryTree(base64.b64decode(value["tree"])).to_tree(text=text)
+            if "none" != output_format else None)
+        results[i] = BatchResult(
+            offset + i, str(path), tree=tree, seconds=value["seconds"])
+
+    return results
+
+
+def _iter_daemon_results(
+    paths: list[Path],
+    grammar: GrammarType,
+    output_format: str,
+    address: Address,
+    batch: BatchParser,
+) -> Iterator[BatchResult]:
+    """
+    Parses the files in the daemon, _DAEMON_BATCH_SIZE files per request,
+    and yields the results as they arrive. If no daemon runs at the address
+    or if it fails, the remaining files are parsed with `batch`.
+    """
+
+    offset = 0
+    try:
+        with ParseClient(address) as client:
+            while offset < len(paths):
+                chunk = paths[offset:offset + _DAEMON_BATCH_SIZE]
+                results = _get_daemon_chunk(
+                    client, chunk, offset, grammar, output_format)
+                yield from results
+                offset += len(chunk)
+        return
+    except OSError as ex:
+        message = (
+            f"No daemon at {address}" if 0 == offset and
+            isinstance(ex, (FileNotFoundError, ConnectionRefusedError))
+            else f"The daemon at {address} failed ({type(ex).__name__}: "
+            f"{ex})")
+    except (RuntimeError, ValueError, KeyError, TypeError) as ex:
+        message = (
+            f"The daemon at {address} failed ({type(ex).__name__}: {ex})")
+
+    print(f"{message}, parsing in this process.", file=sys.stderr)
+    for result in batch.iter_results(paths[offset:]):
+        yield replace(result, index=offset + result.index)
+
+
+def _parse_files(
+    paths: list[Path],
+    grammar: GrammarType,
+    jobs: int | None,
+    output_format: str,
+    timing: bool,
+    stats: bool,
+    cache_dir: Path | None = None,
+    address: Address | None = None,
+) -> int:
+    """
+    Parses the files in parallel and prints one result per file. With an
+    `address`, the files are parsed in the daemon, if it runs.
+    """
+
+    total = PipelineStats()
+    start = time.perf_counter()
+
+    batch = BatchParser(
+        grammar, max_workers=jobs, stats=stats, cache_dir=cache_dir)
+    results = (
+        _iter_daemon_results(paths, grammar, output_format, address, batch)
+        if address is not None else batch.iter_results(paths))
+
+    failed = 0
+    for result in results:
+        _print_result(result, output_format, timing, sys.stdout)
+        if not result.ok:
+            failed += 1
+        elif stats:
+            total.merge(result.stats)
+
+    seconds = time.perf_counter() - start
+    print(f"{len(paths) - failed} OK, {failed} failed"
+          f"{f' in {seconds * 1000:.1f} ms' if timing else ''}.",
+          file=sys.stderr)
+    if stats:
+        print(total.format(), file=sys.stderr)
+
+    return 1 if failed else 0
+
+
+def _discard_stdout() -> None:
+    """
+    Sends the rest of the output to the null device after the reader closed
+    the pipe (for example `| head`), so that the flush at exit does not fail
+    again.
+    """
+
+    try:
+        fileno = sys.stdout.fileno()
+    except (AttributeError, OSError, ValueError):
+        return
+
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull, fileno)
+    os.close(devnull)
+
+
+def _parse_stdin(
+    grammar: GrammarType,
+    output_format: str,
+    timing: bool,
+) -> int:
+    """
+    Parses the standard input. With a CONTAINER grammar, every top-level
+    item is printed as soon as it is complete.
+    """
+
+    start = time.perf_counter()
+
+    if grammar not in (GrammarType.CONTAINER, GrammarType.CONTAINER_LALR):
+        # The other grammars parse a single value without a line end.
+        text = sys.stdin.read().rstrip("\r\n")
+        result = BatchParser(grammar, max_workers=1).invoke([text])
+        try:
+            _print_result(
+                replace(result[0], source="<stdin>"),
+                output_format, timing, sys.stdout)
+        except BrokenPipeError:
+            _discard_stdout()
+            return 1
+        return 0 if result[0].ok else 1
+
+    count = 0
+    items = StreamParser(grammar).iter_items(sys.stdin)
+    try:
+        while True:
+            try:
+                item = next(items, None)
+            except Exception as ex:  # pylint: disable=W0718
+                _print_result(
+                    BatchResult(
+                        count, "<stdin>", error=f"{type(ex).__name__}: {ex}",
+                        seconds=time.perf_counter() - start),
+                    output_format, timing, sys.stdout)
+                return 1
+            if item is None:
+                break
+
+            if "json" == output_format:
+                print(json.dumps({
+                    "source": "<stdin>",
+                    "index": count,
+                    "tree": DictSerializer().invoke(item),
+                }, ensure_ascii=False))
+            elif "tree" == output_format:
+                print(item.pretty(), end="")
+            count += 1
+            sys.stdout.flush()
+    except BrokenPipeError:
+        _discard_stdout()
+        return 1
+
+    seconds = time.perf_counter() - start
+    print(f"<stdin>: {count} items"
+          f"{f' in {seconds * 1000:.1f} ms' if timing else ''}.",
+          file=sys.stderr)
+
+    return 0
+
+
+def _parse(args: argparse.Namespace) -> int:
+    """Parses files, directories, globs or the standard input."""
+
+    grammar = GrammarType[args.grammar]
+    values = args.paths if args.paths else [_STDIN]
+
+    if [_STDIN] == values:
+        return _parse_stdin(grammar, args.format, args.timing)
+
+    paths = _get_paths(values, args.pattern)
+    if not paths:
+        print("No files found.", file=sys.stderr)
+        return 1
+
+    return _parse_files(
+        paths, grammar, args.jobs, args.format, args.timing, args.stats,
+        args.cache_dir, args.address if args.daemon else None)
+
+
+def _check_parse_arguments(
+    command: argparse.ArgumentParser,
+    args: argparse.Namespace,
+) -> None:
+    """Exits with a usage error for options that the input does not use."""
+
+    values = args.paths if args.paths else [_STDIN]
+    if [_STDIN] == values:
+        options = [
+            name for name, value in (
+                ("--stats", args.stats),
+                ("--jobs", args.jobs is not None),
+                ("--cache-dir", args.cache_dir is not None),
+                ("--daemon", args.daemon),
+            ) if value
+        ]
+        if options:
+            command.error(
+                f"{', '.join(options)} cannot be used with the standard "
+                "input.")
+    elif _STDIN in values:
+        command.error("'-' must be the only input.")
+
+
+def _batch(args: argparse.Namespace) -> int:
+    """Parses all files and prints one line per file."""
+
+    return _parse_files(
+        [Path(path) for path in args.paths],
+        GrammarType[args.grammar],
+        args.jobs,
+        "tree" if args.tree else "none",
+        False,
+        args.stats,
+        args.cache_dir,
+        args.address if args.daemon else None,
+    )
+
+
+def _daemon(args: argparse.Namespace) -> int:
+    """Runs the daemon until it is stopped or stops a running daemon."""
+
+    if args.stop:
+        try:
+            with ParseClient(args.address) as client:
+                client.call("shutdown")
+        except OSError:
+            print(f"No daemon at {args.address}.", file=sys.stderr)
+            return 1
+        return 0
+
+    grammars = tuple(GrammarType[name] for name in args.grammar)
+    try:
+        server = ParseServer(args.address, grammars)
+    except OSError as ex:
+        print(f"{type(ex).__name__}: {ex}", file=sys.stderr)
+        return 1
+
+    with server:
+        print(f"Listening on {server.address}.", file=sys.stderr, flush=True)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+    return 0
+
+
+def _add_common_arguments(command: argparse.ArgumentParser) -> None:
+    command.add_argument(
+        "-j", "--jobs", type=int, default=None,
+        help="Number of worker processes (default: number of CPUs).")
+    command.add_argument(
+        "--stats", action="store_true",
+        help="Print the time per phase and the counters of every file.")
+    command.add_argument(
+        "--cache-dir", type=Path, default=None, metavar="DIR",
+        help="Store the results in DIR and reuse them for unchanged files "
+        "(CONTAINER and CONTAINER_LALR only).")
+    command.add_argument(
+        "--daemon", action="store_true",
+        help="Parse the files in the running daemon. Without a daemon, the "
+        "files are parsed in this process.")
+    _add_address_argument(command)
+
+
+def _add_address_argument(command: argparse.ArgumentParser) -> None:
+    command.add_argument(
+        "--address", type=parse_address, default=None,
+        help="Unix socket path or HOST:PORT of the daemon (default: "
+        "$STE100PARSER_DAEMON or a socket in a private directory of the "
+        "user).")
+
+
+def main(argv: list[str] | None = None) -> int:
     """main function."""
-    print("ste100parser")
+
+    parser = argparse.ArgumentParser(prog="ste100-parser")
+    commands = parser.add_subparsers(dest="command")
+
+    parse = commands.add_parser(
+        "parse", help="Parse and transform files, directories, globs or "
+        "the standard input.")
+    parse.add_argument(
+        "paths", nargs="*", metavar="PATH",
+        help="File, directory or glob. Without a PATH or with '-', the "
+        "standard input is parsed.")
+    parse.add_argument(
+        "-g", "--grammar", default=GrammarType.CONTAINER_LALR.name,
+        choices=[item.name for item in GrammarType],
+        help="Only CONTAINER and CONTAINER_LALR run the transformers.")
+    parse.add_argument(
+        "-f", "--format", default="tree", choices=_FORMATS,
+        help="tree: status line and indented tree, json: one JSON object "
+        "per line, none: status line only.")
+    parse.add_argument(
+        "--pattern", default="*.md",
+        help="Files of a directory (default: *.md).")
+    parse.add_argument(
+        "-t", "--timing", action="store_true",
+        help="Print the time of every file and the total time.")
+    _add_common_arguments(parse)
+
+    batch = commands.add_parser(
+        "batch", help="Parse and transform many files in parallel.")
+    batch.add_argument("paths", nargs="+", metavar="PATH")
+    batch.add_argument(
+        "--grammar", default=GrammarType.CONTAINER.name,
+        choices=[GrammarType.CONTAINER.name, GrammarType.CONTAINER_LALR.name])
+    batch.add_argument(
+        "--tree", action="store_true", help="Print the transformed tree.")
+    _add_common_arguments(batch)
+
+    daemon = commands.add_parser(
+        "daemon", help="Serve JSON-RPC requests with warm parsers.")
+    daemon.add_argument(
+        "-g", "--grammar", nargs="+",
+        default=[GrammarType.CONTAINER_LALR.name],
+        choices=[item.name for item in GrammarType],
+        help="Grammars to load at the start (others are loaded on use).")
+    daemon.add_argument(
+        "--stop", action="store_true", help="Stop the running daemon.")
+    _add_address_argument(daemon)
+
+    args = parser.parse_args(argv)
+
+    if args.command is not None and args.address is None:
+        args.address = get_default_address()
+
+    if getattr(args, "daemon", False) and (args.stats or args.cache_dir):
+        parser.error("--daemon cannot be used with --stats or --cache-dir.")
+
+    if "parse" == args.command:
+        _check_parse_arguments(parse, args)
+        return _parse(args)
+
+    if "batch" == args.command:
+        return _batch(args)
+
+    if "daemon" == args.command:
+        return _daemon(args)
+
+    parser.print_help()
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
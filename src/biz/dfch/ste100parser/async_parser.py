@@ -0,0 +1,218 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""async_parser"""
+
+import asyncio
+import codecs
+import os
+import threading
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import AsyncIterable, AsyncIterator
+
+from lark import Tree
+
+from .grammar.grammar_type import GrammarType
+from .parser import Parser
+from .pipeline import Pipeline
+from .stream_parser import StreamParser
+
+__all__ = [
+    "AsyncParser",
+]
+
+# Grammars with a tree for ContainerTransformer and TextTransformer.
+_TRANSFORMED = (GrammarType.CONTAINER, GrammarType.CONTAINER_LALR)
+
+# The pipelines (or parsers for other grammars) of the current thread. A
+# pipeline is not thread-safe, so every worker thread (or process) has its
+# own.
+_local = threading.local()
+
+
+def _invoke(grammar: GrammarType, text: str) -> Tree:
+    """Parses and transforms the text in the worker thread or process."""
+
+    pipelines = getattr(_local, "pipelines", None)
+    if pipelines is None:
+        pipelines = _local.pipelines = {}
+
+    pipeline = pipelines.get(grammar)
+    if pipeline is None:
+        pipeline = pipelines[grammar] = (
+            Pipeline(grammar) if grammar in _TRANSFORMED else Parser(grammar))
+
+    return pipeline.invoke(text)
+
+
+class AsyncParser:
+    """
+    Parses and transforms texts without blocking the event loop.
+
+    The work runs in the `executor`: a ThreadPoolExecutor, a
+    ProcessPoolExecutor (the result is pickled) or, with None, the default
+    executor of the event loop. Every worker thread or process has its own
+    Pipeline. At most `max_concurrency` calls run at the same time; the
+    others wait in the event loop.
+
+    If the task of a call is cancelled (for example when the client
+    disconnects), a call that waits for a free slot is not run. A parse
+    that already runs in a worker cannot be interrupted; it finishes, the
+    result is discarded and only then its slot is free again.
+
+    For a grammar other than CONTAINER and CONTAINER_LALR, the result is the
+    parse tree. Use an instance in one event loop only.
+    """
+
+    _grammar: GrammarType
+    _executor: Executor | None
+    _max_concurrency: int
+    _semaphore: asyncio.Semaphore
+
+    def __init__(
+        self,
+        grammar: GrammarType = GrammarType.CONTAINER,
+        executor: Executor | None = None,
+        max_concurrency: int | None = None,
+    ):
+        """
+        Default .ctor.
+
+        `max_concurrency` defaults to the number of CPUs.
+        """
+
+        assert isinstance(grammar, GrammarType)
+        assert executor is None or isinstance(executor, Executor)
+        assert max_concurrency is None or 0 < max_concurrency, max_concurrency
+
+        self._grammar = grammar
+        self._executor = executor
+        self._max_concurrency = (
+            max_concurrency if max_concurrency is not None
+            else os.cpu_count() or 1
+        )
+        self._semaphore = asyncio.Semaphore(self._max_concurrency)
+
+    @property
+    def max_concurrency(self) -> int:
+        """The maximum number of calls that run at the same time."""
+
+        return self._max_concurrency
+
+    async def invoke(self, text: str) -> Tree:
+        """Parses and transforms the text in the executor."""
+
+        assert isinstance(text, str)
+
+        await self._semaphore.acquire()
+
+        future = None
+        try:
+            loop = asyncio.get_running_loop()
+            future = loop.run_in_executor(
+                self._executor, _invoke, self._grammar, text)
+            return await asyncio.shield(future)
+        finally:
+            self._release(future)
+
+    def _release(self, future: asyncio.Future | None) -> None:
+        """
+        Releases the slot of a call when its work in the executor is done.
+
+        A cancelled call does not cancel the work (see `asyncio.shield`),
+        so the slot stays taken until the worker is free again.
+        """
+
+        if future is None or future.done():
+            self._semaphore.release()
+            return
+
+        def release(done: asyncio.Future) -> None:
+            # Nobody awaits the result anymore.
+            if not done.cancelled():
+                done.exception()
+            self._semaphore.release()
+
+        future.add_done_callback(release)
+
+    async def invoke_stream(
+        self,
+        stream: AsyncIterable[str | bytes],
+    ) -> Tree:
+        """
+        Reads the whole stream and parses and transforms it. Bytes are
+        decoded as UTF-8.
+        """
+
+        return await self.invoke(await self._read(stream))
+
+    @staticmethod
+    async def _read(stream: AsyncIterable[str | bytes]) -> str:
+        decoder = codecs.getincrementaldecoder("utf-8")()
+
+        parts = []
+        async for value in stream:
+            parts.append(
+                decoder.decode(value) if isinstance(value, bytes) else value)
+        parts.append(decoder.decode(b"", final=True))
+
+        return "".join(parts)
+
+    async def aiter_items(
+        self,
+        stream: AsyncIterable[str | bytes],
+    ) -> AsyncIterator[Tree]:
+        """
+        Yields the top-level items of the stream as soon as they are
+        complete. See StreamParser. Bytes are decoded as UTF-8.
+
+        A StreamParser keeps its state between the chunks, so it runs in
+        the executor only if it is a ThreadPoolExecutor and in the default
+        executor of the event loop otherwise. The stream counts as one call
+        for `max_concurrency`.
+        """
+
+        assert self._grammar in _TRANSFORMED, self._grammar
+
+        executor = (
+            self._executor if isinstance(self._executor, ThreadPoolExecutor)
+            else None
+        )
+        loop = asyncio.get_running_loop()
+        decoder = codecs.getincrementaldecoder("utf-8")()
+
+        await self._semaphore.acquire()
+
+        future = None
+        try:
+            parser = StreamParser(self._grammar)
+
+            async for value in stream:
+                if isinstance(value, bytes):
+                    value = decoder.decode(value)
+                future = loop.run_in_executor(executor, parser.feed, value)
+                items = await asyncio.shield(future)
+                for item in items:
+                    yield item
+
+            value = decoder.decode(b"", final=True)
+            future = loop.run_in_executor(executor, parser.feed, value)
+            items = await asyncio.shield(future)
+            future = loop.run_in_executor(executor, parser.close)
+            items += await asyncio.shield(future)
+            for item in items:
+                yield item
+        finally:
+            self._release(future)
@@ -0,0 +1,307 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""batch"""
+
+import os
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from lark import Tree
+
+from .grammar.grammar_type import GrammarType
+from .parser import Parser
+from .pipeline import Pipeline
+from .result_cache import ResultCache
+from .stats import PipelineStats
+
+__all__ = [
+    "BatchParser",
+    "BatchResult",
+]
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    """The result for one document of a batch."""
+
+    index: int
+    source: str
+    tree: Tree | None = None
+    error: str | None = None
+    # Times and counters of the document, if the batch records them.
+    stats: PipelineStats | None = None
+    # Wall clock time to read, parse and transform the document.
+    seconds: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        """True, if the document was parsed and transformed."""
+
+        return self.error is None
+
+
+# Grammars with a tree for ContainerTransformer and TextTransformer.
+_TRANSFORMED = (GrammarType.CONTAINER, GrammarType.CONTAINER_LALR)
+
+# The pipeline (or the parser for other grammars) of the current worker
+# process. See `_init_worker`.
+_pipeline: Pipeline | Parser | None = None
+# True, if the current worker process records PipelineStats.
+_stats: bool = False
+
+
+def _init_worker(
+    grammar: GrammarType,
+    stats: bool = False,
+    cache_dir: str | None = None,
+) -> None:
+    global _pipeline, _stats  # pylint: disable=W0603
+    if grammar in _TRANSFORMED:
+        cache = (
+            ResultCache(cache_dir=cache_dir) if cache_dir is not None
+            else None)
+        _pipeline = Pipeline(grammar, cache=cache)
+    else:
+        _pipeline = Parser(grammar)
+    _stats = stats
+
+
+def _get_source(index: int, document: str | Path) -> str:
+    if isinstance(document, Path):
+        return str(document)
+
+    return f"<document {index}>"
+
+
+def _get_error(
+    index: int,
+    document: str | Path,
+    ex: Exception,
+) -> BatchResult:
+    return BatchResult(
+        index, _get_source(index, document),
+        error=f"{type(ex).__name__}: {ex}")
+
+
+def _process(index: int, document: str | Path) -> BatchResult:
+    """Parses and transforms one document in the worker process."""
+
+    assert _pipeline is not None
+
+    source = _get_source(index, document)
+    stats = PipelineStats() if _stats else None
+    start = time.perf_counter()
+
+    try:
+        if isinstance(document, Path):
+            if stats is not None:
+                with stats.measure("read"):
+                    document = document.read_text(encoding="utf-8")
+            else:
+                document = document.read_text(encoding="utf-8")
+
+        if isinstance(_pipeline, Pipeline):
+            tree = _pipeline.invoke(document, stats)
+        elif stats is not None:
+            stats.add_input(document)
+            with stats.measure("parse"):
+                tree = _pipeline.invoke(document)
+        else:
+            tree = _pipeline.invoke(document)
+
+        return BatchResult(
+            index, source, tree=tree, stats=stats,
+            seconds=time.perf_counter() - start)
+    except Exception as ex:  # pylint: disable=W0718
+        # One failed document must not abort the batch.
+        return BatchResult(
+            index, source, error=f"{type(ex).__name__}: {ex}",
+            seconds=time.perf_counter() - start)
+
+
+class BatchParser:
+    """
+    Parses and transforms many documents in parallel.
+
+    Every worker process initializes one Pipeline (Parser,
+    ContainerTransformer and TextTransformer) and processes the documents
+    it gets. For a grammar other than CONTAINER and CONTAINER_LALR, the
+    result is the parse tree. A document is either the text (str) or the
+    path to a file (Path). The results have the same order as the
+    documents.
+
+    With `stats`, every successful result has the PipelineStats of its
+    document. With a `cache_dir`, the workers share a ResultCache on disk
+    (CONTAINER and CONTAINER_LALR only).
+
+    At most two documents per worker are submitted at a time, so a long
+    iterator of documents is not read (or held) completely. If a worker
+    process dies (for example killed or out of memory), the pool breaks
+    and all unfinished documents fail with it. These documents are then
+    processed again, one at a time in a new pool; only the document that
+    kills its worker again gets the error.
+    """
+
+    # Documents per worker that are submitted at a time.
+    _IN_FLIGHT_PER_WORKER = 2
+
+    _grammar: GrammarType
+    _max_workers: int | None
+    _mp_context = None
+    _stats: bool
+    _cache_dir: str | None
+
+    def __init__(
+        self,
+        grammar: GrammarType = GrammarType.CONTAINER,
+        max_workers: int | None = None,
+        mp_context=None,
+        stats: bool = False,
+        cache_dir: str | Path | None = None,
+    ):
+        """
+        Default .ctor.
+
+        `max_workers` is the number of processes (default: number of CPUs).
+        With `max_workers=1`, the documents are processed in this process.
+        """
+
+        assert isinstance(grammar, GrammarType)
+        assert max_workers is None or 0 < max_workers, max_workers
+        assert isinstance(stats, bool)
+
+        self._grammar = grammar
+        self._max_workers = max_workers
+        self._mp_context = mp_context
+        self._stats = stats
+        self._cache_dir = str(cache_dir) if cache_dir is not None else None
+
+    def invoke(self, documents: Iterable[str | Path]) -> list[BatchResult]:
+        """Returns the results of all documents in input order."""
+
+        return list(self.iter_results(documents))
+
+    def iter_results(
+        self,
+        documents: Iterable[str | Path],
+    ) -> Iterator[BatchResult]:
+        """Yields the results of all documents in input order."""
+
+        if 1 == self._max_workers:
+            _init_worker(self._grammar, self._stats, self._cache_dir)
+            for index, document in enumerate(documents):
+                yield _process(index, document)
+            return
+
+        workers = self._max_workers or os.cpu_count() or 1
+        limit = self._IN_FLIGHT_PER_WORKER * workers
+
+        items = enumerate(documents)
+        pending: deque[tuple[int, str | Path, Future | None]] = deque()
+        executor = self._get_executor()
+        try:
+            while True:
+                unfinished = None
+                while len(pending) < limit:
+                    item = next(items, None)
+                    if item is None:
+                        break
+                    index, document = item
+                    try:
+                        future = executor.submit(_process, index, document)
+                    except BrokenProcessPool:
+                        # The document is processed with the others below.
+                        pending.append((index, document, None))
+                        unfinished = list(pending)
+                        pending.clear()
+                        break
+                    pending.append((index, document, future))
+
+                if unfinished is None:
+                    if not pending:
+                        return
+
+                    index, document, future = pending.popleft()
+                    try:
+                        yield future.result()
+                        continue
+                    except BrokenProcessPool:
+                        unfinished = [(index, document, future), *pending]
+                        pending.clear()
+                    except Exception as ex:  # pylint: disable=W0718
+                        yield _get_error(index, document, ex)
+                        continue
+
+                # A worker process died and broke the pool. Process the
+                # unfinished documents again, one at a time.
+                executor.shutdown(cancel_futures=True)
+
+                executor = self._get_executor()
+                for index, document, future in unfinished:
+                    if self._is_done(future):
+                        yield future.result()
+                        continue
+
+                    result, executor = self._process_alone(
+                        executor, index, document)
+                    yield result
+        finally:
+            executor.shutdown(cancel_futures=True)
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=self._max_workers,
+            mp_context=self._mp_context,
+            initializer=_init_worker,
+            initargs=(self._grammar, self._stats, self._cache_dir),
+        )
+
+    @staticmethod
+    def _is_done(future: Future | None) -> bool:
+        """True, if the document was processed before the pool broke."""
+
+        return (
+            future is not None and future.done() and not future.cancelled() and
+            future.exception() is None
+        )
+
+    def _process_alone(
+        self,
+        executor: ProcessPoolExecutor,
+        index: int,
+        document: str | Path,
+    ) -> tuple[BatchResult, ProcessPoolExecutor]:
+        """
+        Processes one document without other documents in the pool. If it
+        kills its worker, the result has the error and the pool is
+        replaced.
+        """
+
+        try:
+            result = executor.submit(_process, index, document).result()
+        except BrokenProcessPool as ex:
+            result = _get_error(index, document, ex)
+            executor.shutdown(cancel_futures=True)
+            executor = self._get_executor()
+        except Exception as ex:  # pylint: disable=W0718
+            result = _get_error(index, document, ex)
+
+        return result, executor
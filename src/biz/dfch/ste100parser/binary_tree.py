@@ -0,0 +1,519 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""binary_tree"""
+
+import mmap
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import Iterator
+
+from lark import Token as LarkToken
+from lark import Tree
+from lark.tree import Meta
+
+from .char import Char
+from .line_index import LineIndex
+
+__all__ = [
+    "BinaryNode",
+    "BinaryTree",
+    "dump",
+    "dumps",
+]
+
+# File layout (native byte order, see _FLAG_LITTLE_ENDIAN):
+#
+#   header   magic, version, flags, node count, string count, string bytes
+#   types    array typecode of every column ("b", "h" or "i"), 8 bytes
+#   kind     uint8 per node: _TREE, _LEAF, _STRING, _TOKEN, _CHAR_LEAF or
+#            _CHAR
+#   name     per node: string of Tree.data or Token.type (-1: none)
+#   value    per node: string of a leaf, a str or a Token (-1: none)
+#   parent, first_child, next_sibling
+#            per node: index of the node (-1: none)
+#   start_pos, end_pos
+#            per node: positions (-1: no positions)
+#   offsets  uint32 per string + 1: start of every string in the bytes
+#   strings  UTF-8 bytes of all strings
+#
+# Every column is padded to 4 bytes and uses the smallest signed typecode
+# for its values. The nodes are in pre-order, so the root is node 0. Every
+# distinct string (node names and values) is stored once.
+_MAGIC = b"STEB"
+_VERSION = 2
+_HEADER = struct.Struct("<4sHHIII8s")
+_FLAG_LITTLE_ENDIAN = 1
+
+# A tree with children.
+_TREE = 0
+# A tree with a single string child, for example Tree('WORD', ['valve']).
+# The string is the value of the node.
+_LEAF = 1
+# A string child.
+_STRING = 2
+# A lark Token child.
+_TOKEN = 3
+# A _LEAF with a Char value, for example Tree('NEWLINE', [Char.LF]).
+_CHAR_LEAF = 4
+# A Char child.
+_CHAR = 5
+
+# Kinds of the nodes that are read as BinaryNode.
+_NODES = (_TREE, _LEAF, _CHAR_LEAF)
+
+_NONE = -1
+
+# The int32 arrays of the nodes in file order.
+_COLUMNS = (
+    "name", "value", "parent", "first_child", "next_sibling",
+    "start_pos", "end_pos",
+)
+
+
+def _align(value: int) -> int:
+    return (value + 3) & ~3
+
+
+def _get_typecode(values: array) -> str:
+    """Returns the smallest signed typecode for the values."""
+
+    low = min(values, default=0)
+    high = max(values, default=0)
+    for typecode, bits in (("b", 8), ("h", 16)):
+        if -(1 << (bits - 1)) <= low and high < 1 << (bits - 1):
+            return typecode
+
+    return "i"
+
+
+def _get_span(tree: Tree) -> tuple[int, int]:
+    # The transformers set the positions, but not `Meta.empty`.
+    meta = tree._meta  # pylint: disable=W0212
+    start_pos = getattr(meta, "start_pos", None)
+    end_pos = getattr(meta, "end_pos", None)
+    if start_pos is None or end_pos is None:
+        return _NONE, _NONE
+
+    return start_pos, end_pos
+
+
+def dumps(tree: Tree) -> bytes:
+    """
+    Returns the tree in the binary format.
+
+    The children of a tree can be trees, lark Tokens, strings and Char
+    members (which are read as Char again). Of the metas, only the start
+    and end positions are stored.
+    """
+
+    assert isinstance(tree, Tree)
+
+    strings: dict[str, int] = {}
+    kinds = array("B")
+    columns = {name: array("i") for name in _COLUMNS}
+    names = columns["name"]
+    values = columns["value"]
+    parents = columns["parent"]
+    first_child = columns["first_child"]
+    next_sibling = columns["next_sibling"]
+    starts = columns["start_pos"]
+    ends = columns["end_pos"]
+
+    # The last child of every node, to link the next sibling.
+    last_child: list[int] = []
+
+    stack: list[tuple[object, int]] = [(tree, _NONE)]
+    while stack:
+        node, parent = stack.pop()
+        index = len(kinds)
+
+        if isinstance(node, Tree):
+            children = node.children
+            name = strings.setdefault(node.data, len(strings))
+            start, end = _get_span(node)
+            if (1 == len(children) and isinstance(children[0], str) and
+                    not isinstance(children[0], LarkToken)):
+                kind = _CHAR_LEAF if isinstance(children[0], Char) else _LEAF
+                value = strings.setdefault(str(children[0]), len(strings))
+            else:
+                kind = _TREE
+                value = _NONE
+        elif isinstance(node, LarkToken):
+            kind = _TOKEN
+            name = strings.setdefault(node.type, len(strings))
+            value = strings.setdefault(str(node), len(strings))
+            start, end = (
+                (node.start_pos, node.end_pos)
+                if node.start_pos is not None else (_NONE, _NONE)
+            )
+        else:
+            assert isinstance(node, str), type(node)
+            kind = _CHAR if isinstance(node, Char) else _STRING
+            name = _NONE
+            value = strings.setdefault(str(node), len(strings))
+            start = end = _NONE
+
+        kinds.append(kind)
+        names.append(name)
+        values.append(value)
+        parents.append(parent)
+        first_child.append(_NONE)
+        next_sibling.append(_NONE)
+        starts.append(start)
+        ends.append(end)
+        last_child.append(_NONE)
+
+        if _NONE != parent:
+            previous = last_child[parent]
+            if _NONE == previous:
+                first_child[parent] = index
+            else:
+                next_sibling[previous] = index
+            last_child[parent] = index
+
+        if _TREE == kind:
+            stack.extend((child, index) for child in reversed(node.children))
+
+    encoded = [value.encode("utf-8") for value in strings]
+    offsets = array("I", [0])
+    for value in encoded:
+        offsets.append(offsets[-1] + len(value))
+
+    typecodes = [_get_typecode(columns[name]) for name in _COLUMNS]
+
+    flags = _FLAG_LITTLE_ENDIAN if "little" == sys.byteorder else 0
+    result = [
+        _HEADER.pack(
+            _MAGIC, _VERSION, flags, len(kinds), len(encoded), offsets[-1],
+            "".join(typecodes).encode("ascii")),
+        kinds.tobytes(),
+        bytes(_align(len(kinds)) - len(kinds)),
+    ]
+    for name, typecode in zip(_COLUMNS, typecodes):
+        column = array(typecode, columns[name]).tobytes()
+        result.append(column)
+        result.append(bytes(_align(len(column)) - len(column)))
+    result.append(offsets.tobytes())
+    result.extend(encoded)
+
+    return b"".join(result)
+
+
+def dump(tree: Tree, path: str | Path) -> None:
+    """Writes the tree in the binary format to the file."""
+
+    Path(path).write_bytes(dumps(tree))
+
+
+class BinaryNode:
+    """
+    A node of a BinaryTree. The children and strings are read from the
+    buffer on access.
+    """
+
+    __slots__ = ("_owner", "index")
+
+    _owner: "BinaryTree"
+    # Position of the node in the arrays (pre-order).
+    index: int
+
+    def __init__(self, owner: "BinaryTree", index: int):
+        self._owner = owner
+        self.index = index
+
+    @property
+    def data(self) -> str:
+        """The node name, as `Tree.data`."""
+
+        return self._owner.get_string(self._owner.name[self.index])
+
+    @property
+    def start_pos(self) -> int | None:
+        """Position of the first character or None."""
+
+        result = self._owner.start_pos[self.index]
+        return None if _NONE == result else result
+
+    @property
+    def end_pos(self) -> int | None:
+        """Position after the last character or None."""
+
+        result = self._owner.end_pos[self.index]
+        return None if _NONE == result else result
+
+    @property
+    def parent(self) -> "BinaryNode | None":
+        """The parent node or None for the root."""
+
+        result = self._owner.parent[self.index]
+        return None if _NONE == result else BinaryNode(self._owner, result)
+
+    @property
+    def children(self) -> list:
+        """The child nodes (trees) and values (strings and Tokens)."""
+
+        if self._owner.kind[self.index] in (_LEAF, _CHAR_LEAF):
+            return [self._owner.get_value(self.index)]
+
+        return [
+            self._owner.get_child(child)
+            for child in self._owner.iter_child_indexes(self.index)
+        ]
+
+    def to_tree(
+        self,
+        text: str | None = None,
+        lazy_positions: bool = True,
+    ) -> Tree:
+        """Returns the node and its children as a lark Tree."""
+
+        return self._owner.to_tree(self.index, text, lazy_positions)
+
+    def __eq__(self, other) -> bool:
+        return (
+            isinstance(other, BinaryNode) and
+            self._owner is other._owner and
+            self.index == other.index
+        )
+
+    def __hash__(self) -> int:
+        return hash((id(self._owner), self.index))
+
+    def __repr__(self) -> str:
+        return f"BinaryNode({self.data!r}, {self.index})"
+
+
+class BinaryTree:
+    """
+    Reads a tree in the binary format of `dumps`.
+
+    The buffer can be bytes or a memory map (see `load`). The node arrays
+    are views on the buffer; nodes and strings are created on access.
+    """
+
+    _buffer: object
+    _mmap: mmap.mmap | None
+    _strings: memoryview
+    _offsets: memoryview
+    _cache: list[str | None]
+
+    kind: memoryview
+    name: memoryview
+    value: memoryview
+    parent: memoryview
+    first_child: memoryview
+    next_sibling: memoryview
+    start_pos: memoryview
+    end_pos: memoryview
+
+    def __init__(self, buffer, _mmap: mmap.mmap | None = None):
+        """
+        Reads the tree from bytes or another buffer. Raises ValueError if
+        the header is invalid or the buffer is too small.
+        """
+
+        view = memoryview(buffer)
+        if len(view) < _HEADER.size:
+            raise ValueError("Buffer is too small.")
+
+        (
+            magic, version, flags, nodes, strings, size, typecodes,
+        ) = _HEADER.unpack_from(view)
+        if _MAGIC != magic:
+            raise ValueError(f"Invalid magic: {magic!r}.")
+        if _VERSION != version:
+            raise ValueError(f"Unsupported version: {version}.")
+        if bool(flags & _FLAG_LITTLE_ENDIAN) != ("little" == sys.byteorder):
+            raise ValueError(
+                "Byte order of the file is not the byte order of the machine.")
+        if nodes <= 0:
+            raise ValueError(f"Invalid number of nodes: {nodes}.")
+
+        self._buffer = buffer
+        self._mmap = _mmap
+
+        offset = _HEADER.size
+        self.kind = view[offset:offset + nodes]
+        offset += _align(nodes)
+
+        for name, typecode in zip(_COLUMNS, typecodes.decode("ascii")):
+            end = offset + array(typecode).itemsize * nodes
+            if len(view) < end:
+                raise ValueError("Buffer is too small.")
+            setattr(self, name, view[offset:end].cast(typecode))
+            offset = _align(end)
+
+        end = offset + 4 * (strings + 1)
+        if len(view) < end + size:
+            raise ValueError("Buffer is too small.")
+        self._offsets = view[offset:end].cast("I")
+        self._strings = view[end:end + size]
+
+        self._cache = [None] * strings
+
+    @classmethod
+    def load(cls, path: str | Path) -> "BinaryTree":
+        """Memory-maps the file. Use `close` or `with` to unmap it."""
+
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        return cls(mapped, mapped)
+
+    def close(self) -> None:
+        """Releases the views and unmaps the file."""
+
+        for name in ("kind", "_offsets", "_strings", *_COLUMNS):
+            getattr(self, name).release()
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def __enter__(self) -> "BinaryTree":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        """Number of nodes (trees, Tokens and strings)."""
+
+        return len(self.kind)
+
+    @property
+    def root(self) -> BinaryNode:
+        """The root node."""
+
+        return BinaryNode(self, 0)
+
+    def get_string(self, index: int) -> str:
+        """Returns a string of the string table."""
+
+        result = self._cache[index]
+        if result is None:
+            result = str(
+                self._strings[self._offsets[index]:self._offsets[index + 1]],
+                "utf-8")
+            self._cache[index] = result
+
+        return result
+
+    def get_value(self, index: int) -> str:
+        """Returns the value of a leaf or of a string child (or Char)."""
+
+        result = self.get_string(self.value[index])
+        if self.kind[index] in (_CHAR_LEAF, _CHAR):
+            return Char(result)
+
+        return result
+
+    def iter_child_indexes(self, index: int) -> Iterator[int]:
+        """Yields the indexes of the children of a node."""
+
+        next_sibling = self.next_sibling
+        child = self.first_child[index]
+        while _NONE != child:
+            yield child
+            child = next_sibling[child]
+
+    def get_child(self, index: int) -> "BinaryNode | LarkToken | str":
+        """Returns a node as BinaryNode, lark Token or string."""
+
+        kind = self.kind[index]
+        if kind in _NODES:
+            return BinaryNode(self, index)
+
+        value = self.get_value(index)
+        if _TOKEN != kind:
+            return value
+
+        start = self.start_pos[index]
+        if _NONE == start:
+            return LarkToken(self.get_string(self.name[index]), value)
+
+        return LarkToken(
+            self.get_string(self.name[index]), value,
+            start_pos=start, end_pos=self.end_pos[index])
+
+    def to_tree(
+        self,
+        index: int = 0,
+        text: str | None = None,
+        lazy_positions: bool = True,
+    ) -> Tree:
+        """
+        Returns a node and its children as a lark Tree.
+
+        The metas have the start and end positions. With the source `text`,
+        the metas have the lines and columns, too: with `lazy_positions`,
+        they are computed on first access (see LazyMeta), otherwise now.
+        """
+
+        assert self.kind[index] in _NODES, index
+        assert text is None or isinstance(text, str)
+        assert isinstance(lazy_positions, bool)
+
+        line_index = LineIndex(text) if text is not None else None
+
+        # In pre-order, the subtree ends before the first node with a parent
+        # before `index`. It is converted in reverse order, so that all
+        # children of a node are converted before the node.
+        parent = self.parent
+        end = index + 1
+        while end < len(parent) and index <= parent[end]:
+            end += 1
+
+        converted: dict[int, object] = {}
+        for i in range(end - 1, index - 1, -1):
+            kind = self.kind[i]
+            if kind in (_LEAF, _CHAR_LEAF):
+                children = [self.get_value(i)]
+            elif _TREE == kind:
+                children = [
+                    converted.pop(child)
+                    for child in self.iter_child_indexes(i)
+                ]
+            else:
+                converted[i] = self.get_child(i)
+                continue
+
+            converted[i] = Tree(
+                self.get_string(self.name[i]), children,
+                meta=self._get_meta(i, line_index, lazy_positions))
+
+        return converted[index]
+
+    def _get_meta(
+        self,
+        index: int,
+        line_index: LineIndex | None,
+        lazy: bool,
+    ) -> Meta:
+        start = self.start_pos[index]
+        if _NONE == start:
+            return Meta()
+
+        if line_index is not None:
+            return line_index.get_meta(start, self.end_pos[index], lazy)
+
+        meta = Meta()
+        meta.empty = False
+        meta.start_pos = start
+        meta.end_pos = self.end_pos[index]
+
+        return meta
@@ -0,0 +1,300 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""chunked_parser"""
+
+import re
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from itertools import repeat
+
+from lark import ParseTree, Token as LarkToken, Tree
+from lark.tree import Meta
+
+from .grammar.grammar_type import GrammarType
+from .parser import Parser
+from .token import Token
+
+__all__ = [
+    "Chunk",
+    "ChunkedParser",
+]
+
+
+@dataclass(frozen=True)
+class Chunk:
+    """A part of the text that the parser parses on its own."""
+
+    # Position of the first character in the text.
+    start_pos: int
+    # Line of the first character in the text (1-based).
+    line: int
+    text: str
+
+
+def _get_tokens(tree: ParseTree) -> list[LarkToken]:
+    return list(tree.scan_values(lambda value: isinstance(value, LarkToken)))
+
+
+def _parse_chunk(grammar: GrammarType, text: str) -> tuple[ParseTree, list]:
+    """
+    Parses one chunk. Module level, so that a process pool can use it.
+
+    A pickled lark Token loses its end position. The end positions are
+    returned in a separate list. See `_restore_end_positions`.
+    """
+
+    result = Parser(grammar).invoke(text)
+
+    ends = [
+        (token.end_line, token.end_column, token.end_pos)
+        for token in _get_tokens(result)
+    ]
+
+    return result, ends
+
+
+def _restore_end_positions(tree: ParseTree, ends: list) -> ParseTree:
+    for token, (end_line, end_column, end_pos) in zip(_get_tokens(tree), ends):
+        token.end_line = end_line
+        token.end_column = end_column
+        token.end_pos = end_pos
+
+    return tree
+
+
+class ChunkedParser:
+    """
+    Parses a large text in chunks.
+
+    The top-level items of the container grammar (heading, paragraph, proc,
+    note, cite) are separated by blank lines. The parser splits the text at
+    these blank lines, parses every chunk on its own and joins the trees to
+    one `start` tree. The positions in `meta` and in the tokens are relative
+    to the whole text.
+
+    The parser does not split inside parentheses or code, because both can
+    contain blank lines. If a chunk cannot be parsed, the parser parses the
+    whole text. Then, the error has the positions of the whole text.
+    """
+
+    # A blank line: two or more line breaks.
+    _BLANK_LINES = re.compile(r"(?:\r?\n){2,}")
+
+    # Items that start with their own line break: proc, note, list and
+    # cite. The line break before these items is part of the item and not a
+    # NEWLINE between items. A warning or caution after a blank line is a
+    # paragraph.
+    _ITEM_WITH_LINE_START = re.compile(
+        r"[a-zA-Z0-9]+[.)] |NOTE: |[ \t]+(?:[a-zA-Z0-9]+|\*|-) |> ")
+
+    _NEWLINE = re.compile(r"\r?\n")
+
+    # Characters that change the parenthesis depth or the code state.
+    _SPECIAL = re.compile(r"[`()]")
+
+    _parser: Parser
+    _grammar: GrammarType
+    _executor: Executor | None
+    _min_chunk_size: int
+
+    def __init__(
+        self,
+        grammar: GrammarType = GrammarType.CONTAINER,
+        executor: Executor | None = None,
+        min_chunk_size: int = 0,
+    ):
+        """
+        Default .ctor.
+
+        With an `executor` (for example a ProcessPoolExecutor), the chunks
+        are parsed in parallel. The parser joins consecutive items to chunks
+        with at least `min_chunk_size` characters.
+        """
+
+        assert grammar in (GrammarType.CONTAINER, GrammarType.CONTAINER_LALR)
+        assert isinstance(min_chunk_size, int) and 0 <= min_chunk_size
+
+        self._grammar = grammar
+        self._parser = Parser(grammar)
+        self._executor = executor
+        self._min_chunk_size = min_chunk_size
+
+    def get_chunks(self, text: str) -> list[Chunk]:
+        """Splits the text at the blank lines between top-level items."""
+
+        assert isinstance(text, str)
+
+        result: list[Chunk] = []
+
+        chunk_start = 0
+        chunk_line = 1
+        depth = 0
+        is_code = False
+        scanned = 0
+
+        for match in self._BLANK_LINES.finditer(text):
+            start, end = match.span()
+
+            # Parentheses and code can span blank lines.
+            for char in self._SPECIAL.findall(text, scanned, start):
+                if is_code:
+                    is_code = "`" != char
+                elif "`" == char:
+                    is_code = True
+                elif "(" == char:
+                    depth += 1
+                elif ")" == char and 0 < depth:
+                    depth -= 1
+            scanned = start
+
+            # Blank lines at the start or at the end stay in the chunk.
+            if is_code or depth or 0 == start or len(text) == end:
+                continue
+            if start - chunk_start < self._min_chunk_size:
+                continue
+
+            result.append(Chunk(
+                chunk_start, chunk_line, text[chunk_start:start]))
+
+            # Keep the line break of items with their own line start.
+            next_start = end
+            if self._ITEM_WITH_LINE_START.match(text, end):
+                next_start = end - (2 if "\r" == text[end - 2] else 1)
+
+            chunk_line += text.count("\n", chunk_start, next_start)
+            chunk_start = next_start
+
+        result.append(Chunk(chunk_start, chunk_line, text[chunk_start:]))
+
+        return result
+
+    def invoke(self, text: str) -> ParseTree:
+        """
+        Parses the text. With CONTAINER_LALR, the result is the same as of
+        Parser.invoke. The Earley parser of CONTAINER can resolve an
+        ambiguous line break in a chunk differently than in the whole text;
+        after ContainerTransformer, the trees are the same.
+        """
+
+        assert isinstance(text, str) and text.strip()
+
+        chunks = self.get_chunks(text)
+        if 1 == len(chunks):
+            return self._parser.invoke(text)
+
+        try:
+            if self._executor is None:
+                trees = [self._parser.invoke(chunk.text) for chunk in chunks]
+            else:
+                trees = [
+                    _restore_end_positions(tree, ends)
+                    for tree, ends in self._executor.map(
+                        _parse_chunk,
+                        repeat(self._grammar),
+                        [chunk.text for chunk in chunks],
+                    )
+                ]
+        except Exception:  # pylint: disable=W0718
+            # Raises the error with the positions in the whole text.
+            return self._parser.invoke(text)
+
+        return self._join(text, chunks, trees)
+
+    def _join(
+        self,
+        text: str,
+        chunks: list[Chunk],
+        trees: list[ParseTree],
+    ) -> ParseTree:
+        """Joins the trees of the chunks to one `start` tree."""
+
+        children: list = []
+        previous_end = 0
+        for chunk, tree in zip(chunks, trees):
+            children.extend(self._get_newlines(text, previous_end, chunk))
+
+            self._move(tree, chunk)
+            if Token.start.name == tree.data:
+                children.extend(tree.children)
+            else:
+                children.append(tree)
+
+            previous_end = chunk.start_pos + len(chunk.text)
+
+        first, last = trees[0], trees[-1]
+        meta = Meta()
+        meta.empty = False
+        meta.line = first.meta.line
+        meta.column = first.meta.column
+        meta.start_pos = first.meta.start_pos
+        meta.end_line = last.meta.end_line
+        meta.end_column = last.meta.end_column
+        meta.end_pos = last.meta.end_pos
+
+        return Tree(Token.start.name, children, meta=meta)
+
+    def _get_newlines(
+        self,
+        text: str,
+        previous_end: int,
+        chunk: Chunk,
+    ) -> list[LarkToken]:
+        """Returns NEWLINE tokens for the line breaks between two chunks."""
+
+        result = []
+        line = chunk.line - text.count("\n", previous_end, chunk.start_pos)
+        matches = self._NEWLINE.finditer(text, previous_end, chunk.start_pos)
+        for match in matches:
+            column = match.start() - text.rfind("\n", 0, match.start())
+            result.append(LarkToken(
+                Token.NEWLINE.name,
+                match.group(),
+                start_pos=match.start(),
+                line=line,
+                column=column,
+                end_line=line + 1,
+                end_column=1,
+                end_pos=match.end(),
+            ))
+            line += 1
+
+        return result
+
+    @staticmethod
+    def _move(tree: ParseTree, chunk: Chunk) -> None:
+        """Moves the positions from the chunk to the whole text."""
+
+        # Every chunk starts at column 1, so only lines and positions move.
+        lines = chunk.line - 1
+        pos = chunk.start_pos
+
+        seen: set[int] = set()
+        for node in tree.iter_subtrees():
+            meta = node.meta
+            if id(meta) not in seen and not meta.empty:
+                seen.add(id(meta))
+                meta.line += lines
+                meta.end_line += lines
+                meta.start_pos += pos
+                meta.end_pos += pos
+
+            for child in node.children:
+                if isinstance(child, LarkToken) and id(child) not in seen:
+                    seen.add(id(child))
+                    child.line += lines
+                    child.end_line += lines
+                    child.start_pos += pos
+                    child.end_pos += pos
@@ -0,0 +1,193 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""compact_tree"""
+
+from lark import Tree
+from lark.tree import Meta
+
+from .line_index import LineIndex
+from .token import Token
+
+__all__ = [
+    "CompactLeaf",
+    "CompactNode",
+    "get_code",
+    "get_name",
+    "to_compact",
+    "to_tree",
+]
+
+# Names of the nodes by their code. The codes of Token are fixed; other
+# names get the next free code when they are first seen.
+_NAMES: list[str] = [token.name for token in Token]
+_CODES: dict[str, int] = {name: code for code, name in enumerate(_NAMES)}
+
+# Start and end position in one int: start << _SHIFT | end.
+_SHIFT = 32
+_MASK = (1 << _SHIFT) - 1
+# A node without positions.
+_NO_SPAN = -1
+
+
+def get_code(name: str) -> int:
+    """Returns the code of a node name."""
+
+    result = _CODES.get(name)
+    if result is None:
+        result = len(_NAMES)
+        _NAMES.append(name)
+        _CODES[name] = result
+
+    return result
+
+
+def get_name(code: int) -> str:
+    """Returns the node name of a code."""
+
+    return _NAMES[code]
+
+
+def _get_span(meta: Meta) -> int:
+    start_pos = getattr(meta, "start_pos", None)
+    end_pos = getattr(meta, "end_pos", None)
+    if start_pos is None or end_pos is None:
+        return _NO_SPAN
+
+    assert 0 <= start_pos <= _MASK and 0 <= end_pos <= _MASK, (
+        f"{start_pos}..{end_pos}")
+
+    return start_pos << _SHIFT | end_pos
+
+
+class _CompactBase:
+    """Code and positions of a compact node."""
+
+    __slots__ = ("code", "span")
+
+    code: int
+    # Start and end position, packed. See `start_pos` and `end_pos`.
+    span: int
+
+    @property
+    def data(self) -> str:
+        """The node name, as `Tree.data`."""
+
+        return _NAMES[self.code]
+
+    @property
+    def start_pos(self) -> int | None:
+        """Position of the first character or None."""
+
+        return None if _NO_SPAN == self.span else self.span >> _SHIFT
+
+    @property
+    def end_pos(self) -> int | None:
+        """Position after the last character or None."""
+
+        return None if _NO_SPAN == self.span else self.span & _MASK
+
+
+class CompactNode(_CompactBase):
+    """A node with children."""
+
+    __slots__ = ("children",)
+
+    children: list
+
+    def __init__(self, code: int, span: int, children: list):
+        self.code = code
+        self.span = span
+        self.children = children
+
+    def __repr__(self) -> str:
+        return f"CompactNode({self.data!r}, {self.children!r})"
+
+
+class CompactLeaf(_CompactBase):
+    """A node with a single value, for example a WORD or a WS."""
+
+    __slots__ = ("value",)
+
+    value: object
+
+    def __init__(self, code: int, span: int, value: object):
+        self.code = code
+        self.span = span
+        self.value = value
+
+    def __repr__(self) -> str:
+        return f"CompactLeaf({self.data!r}, {self.value!r})"
+
+
+def to_compact(tree: Tree) -> CompactNode | CompactLeaf:
+    """
+    Converts a transformed tree to compact nodes.
+
+    A tree with a single child that is not a tree (for example
+    `Tree('WORD', ['valve'])`) becomes a CompactLeaf with the child as value.
+    Of the meta, only the start and end positions are kept.
+    """
+
+    assert isinstance(tree, Tree)
+
+    span = _get_span(tree.meta)
+    children = tree.children
+    if 1 == len(children) and not isinstance(children[0], Tree):
+        return CompactLeaf(get_code(tree.data), span, children[0])
+
+    return CompactNode(get_code(tree.data), span, [
+        to_compact(child) if isinstance(child, Tree) else child
+        for child in children
+    ])
+
+
+def to_tree(
+    node: CompactNode | CompactLeaf,
+    text: str | None = None,
+) -> Tree:
+    """
+    Converts compact nodes to a tree.
+
+    The metas have the start and end positions. With the source `text`, the
+    metas have the lines and columns, too.
+    """
+
+    assert isinstance(node, (CompactNode, CompactLeaf))
+    assert text is None or isinstance(text, str)
+
+    index = LineIndex(text) if text is not None else None
+
+    return _to_tree(node, index)
+
+
+def _to_tree(node: CompactNode | CompactLeaf, index: LineIndex | None):
+    meta = Meta()
+    if _NO_SPAN != node.span:
+        meta.start_pos = node.start_pos
+        meta.end_pos = node.end_pos
+        if index is not None:
+            meta.line, meta.column = index.get_line_column(meta.start_pos)
+            meta.end_line, meta.end_column = index.get_line_column(
+                meta.end_pos)
+
+    if isinstance(node, CompactLeaf):
+        return Tree(node.data, [node.value], meta=meta)
+
+    return Tree(node.data, [
+        _to_tree(child, index)
+        if isinstance(child, (CompactNode, CompactLeaf)) else child
+        for child in node.children
+    ], meta=meta)
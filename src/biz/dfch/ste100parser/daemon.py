@@ -0,0 +1,557 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""daemon"""
+
+import base64
+import ipaddress
+import json
+import os
+import socket
+import socketserver
+import stat
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from lark import Tree
+
+from .binary_tree import BinaryTree, dumps
+from .grammar.grammar_type import GrammarType
+from .parser import Parser
+from .pipeline import Pipeline
+from .result_cache import ResultCache
+from .serializer import DictSerializer
+
+__all__ = [
+    "ParseClient",
+    "ParseServer",
+    "get_default_address",
+    "parse_address",
+]
+
+# Overrides the default address of the daemon.
+ENV_ADDRESS = "STE100PARSER_DAEMON"
+
+# Default address without Unix sockets.
+_DEFAULT_TCP = ("127.0.0.1", 7100)
+
+# Seconds that ParseClient waits for the daemon by default.
+_DEFAULT_TIMEOUT = 60.0
+
+# Grammars with a tree for ContainerTransformer and TextTransformer.
+_TRANSFORMED = (GrammarType.CONTAINER, GrammarType.CONTAINER_LALR)
+
+_FORMATS = ("json", "tree", "binary")
+
+# JSON-RPC 2.0 error codes.
+_PARSE_ERROR = -32700
+_INVALID_REQUEST = -32600
+_METHOD_NOT_FOUND = -32601
+_INVALID_PARAMS = -32602
+
+Address = str | tuple[str, int]
+
+
+def _is_loopback(host: str) -> bool:
+    if "localhost" == host.lower():
+        return True
+
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+def parse_address(value: str) -> Address:
+    """
+    Returns the address of a value: `HOST:PORT` or `:PORT` (localhost) is
+    a TCP address, everything else is the path of a Unix socket.
+
+    The daemon has no authentication, so HOST must be a loopback address
+    (for example `localhost` or `127.0.0.1`); other hosts raise ValueError.
+    """
+
+    assert isinstance(value, str) and value, value
+
+    host, separator, port = value.rpartition(":")
+    if separator and port.isdigit() and "/" not in value:
+        host = host or _DEFAULT_TCP[0]
+        if not _is_loopback(host):
+            raise ValueError(
+                f"The host of '{value}' is not a loopback address.")
+        return host, int(port)
+
+    return value
+
+
+def _get_private_dir() -> Path:
+    """
+    Returns $XDG_RUNTIME_DIR or a directory of the user in the temporary
+    directory. Other users cannot create or replace a socket in it.
+    """
+
+    value = os.environ.get("XDG_RUNTIME_DIR")
+    if value:
+        return Path(value)
+
+    result = Path(tempfile.gettempdir()) / f"ste100-parser-{os.getuid()}"
+    try:
+        result.mkdir(mode=0o700)
+    except FileExistsError:
+        pass
+
+    # The temporary directory is shared. Another user could create the
+    # directory first.
+    info = os.lstat(result)
+    if (not stat.S_ISDIR(info.st_mode) or os.getuid() != info.st_uid or
+            info.st_mode & 0o077):
+        raise OSError(f"The directory '{result}' is not private to the user.")
+
+    return result
+
+
+def get_default_address() -> Address:
+    """
+    Returns the address of the environment variable STE100PARSER_DAEMON or
+    a Unix socket in a directory that only the user can access
+    ($XDG_RUNTIME_DIR or a directory with mode 0700 in the temporary
+    directory).
+    """
+
+    value = os.environ.get(ENV_ADDRESS)
+    if value:
+        return parse_address(value)
+
+    if _UnixServer is None or not hasattr(os, "getuid"):
+        return _DEFAULT_TCP
+
+    return str(_get_private_dir() / "ste100-parser.sock")
+
+
+class _InvalidParams(Exception):
+    """A request with invalid parameters."""
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    """Reads one JSON-RPC request (or batch) per line."""
+
+    server: "_UnixServer | _TcpServer"
+
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+
+            response = self.server.owner.handle_line(line)
+            if response is None:
+                continue
+
+            self.wfile.write(response.encode("utf-8") + b"\n")
+            self.wfile.flush()
+
+
+class _TcpServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+    owner: "ParseServer"
+
+
+if hasattr(socketserver, "ThreadingUnixStreamServer"):
+    class _UnixServer(socketserver.ThreadingUnixStreamServer):
+        daemon_threads = True
+        owner: "ParseServer"
+else:  # pragma: no cover
+    _UnixServer = None  # pylint: disable=C0103
+
+
+class ParseServer:
+    """
+    Serves JSON-RPC 2.0 over a Unix socket or a TCP socket (localhost).
+
+    Every request is one line of JSON; a batch is a JSON array of requests.
+    The response is one line, too. The server keeps one Pipeline (or
+    Parser for the other grammars) per grammar, so that the grammars are
+    compiled once. The methods are:
+
+      * `parse`: `text`, `grammar` (default CONTAINER_LALR) and `format`
+        (`json`: see DictSerializer, `tree`: indented text, `binary`:
+        base64 of binary_tree). Returns `ok`, `seconds` and `tree` or
+        `error`.
+      * `validate`: `text` and `grammar`. Returns `ok`, `seconds` and
+        `error`, without a tree.
+      * `ping`: returns the `version` and the loaded `grammars`.
+      * `shutdown`: stops the server after the response.
+
+    A text that cannot be parsed is a result with `ok` false, not a
+    JSON-RPC error.
+    """
+
+    _address: Address
+    _server: "_UnixServer | _TcpServer"
+    _pipelines: dict[GrammarType, tuple[Pipeline | Parser, threading.Lock]]
+    _lock: threading.Lock
+
+    def __init__(
+        self,
+        address: Address | None = None,
+        grammars: tuple[GrammarType, ...] = (GrammarType.CONTAINER_LALR,),
+    ):
+        """
+        Default .ctor. Binds the socket and loads the `grammars`.
+
+        A Unix socket file of a daemon that does not run anymore is
+        replaced. If a daemon runs at the address, OSError is raised.
+        """
+
+        self._address = (
+            address if address is not None else get_default_address())
+        self._pipelines = {}
+        self._lock = threading.Lock()
+
+        for grammar in grammars:
+            self._get_pipeline(grammar)
+
+        if isinstance(self._address, str):
+            assert _UnixServer is not None, "Unix sockets are not supported."
+            self._remove_stale_socket(self._address)
+            # Only the user can connect, also right after `bind`.
+            umask = os.umask(0o177)
+            try:
+                self._server = _UnixServer(self._address, _Handler)
+            finally:
+                os.umask(umask)
+        else:
+            self._server = _TcpServer(self._address, _Handler)
+            self._address = self._server.server_address[:2]
+        self._server.owner = self
+
+    @staticmethod
+    def _remove_stale_socket(path: str) -> None:
+        try:
+            info = os.lstat(path)
+        except FileNotFoundError:
+            return
+
+        if (not stat.S_ISSOCK(info.st_mode) or
+                (hasattr(os, "getuid") and os.getuid() != info.st_uid)):
+            raise OSError(f"'{path}' is not a socket of the user.")
+
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            try:
+                client.connect(path)
+            except OSError:
+                os.unlink(path)
+                return
+
+        raise OSError(f"A daemon is already running at '{path}'.")
+
+    @property
+    def address(self) -> Address:
+        """The path of the Unix socket or the host and port."""
+
+        return self._address
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def serve_forever(self) -> None:
+        """Handles requests until `shutdown` is called."""
+
+        self._server.serve_forever()
+
+    def shutdown(self) -> None:
+        """Stops `serve_forever`. Call it from another thread."""
+
+        self._server.shutdown()
+
+    def close(self) -> None:
+        """Closes the socket and removes the socket file."""
+
+        self._server.server_close()
+        if isinstance(self._address, str) and os.path.exists(self._address):
+            os.unlink(self._address)
+
+    def _get_pipeline(
+        self,
+        grammar: GrammarType,
+    ) -> tuple[Pipeline | Parser, threading.Lock]:
+        with self._lock:
+            result = self._pipelines.get(grammar)
+            if result is None:
+                pipeline = (
+                    Pipeline(grammar) if grammar in _TRANSFORMED
+                    else Parser(grammar))
+                result = self._pipelines[grammar] = (
+                    pipeline, threading.Lock())
+
+        return result
+
+    def handle_line(self, line: bytes | str) -> str | None:
+        """
+        Returns the response to a request or batch line or None, if there
+        is nothing to respond (only notifications).
+        """
+
+        try:
+            value = json.loads(line)
+        except ValueError as ex:
+            return json.dumps(
+                self._get_error(None, _PARSE_ERROR, f"Parse error: {ex}"))
+
+        if isinstance(value, list):
+            if not value:
+                return json.dumps(self._get_error(
+                    None, _INVALID_REQUEST, "Empty batch."))
+            responses = [self.handle_request(item) for item in value]
+            responses = [item for item in responses if item is not None]
+            if not responses:
+                return None
+            return json.dumps(responses, ensure_ascii=False)
+
+        response = self.handle_request(value)
+        if response is None:
+            return None
+
+        return json.dumps(response, ensure_ascii=False)
+
+    @staticmethod
+    def _get_error(request_id, code: int, message: str) -> dict:
+        return {
+            "jsonrpc": "2.0",
+            "id": request_id,
+            "error": {"code": code, "message": message},
+        }
+
+    def handle_request(self, request: Any) -> dict | None:
+        """Returns the response to a request or None for a notification."""
+
+        if (not isinstance(request, dict) or
+                "2.0" != request.get("jsonrpc") or
+                not isinstance(request.get("method"), str)):
+            return self._get_error(
+                request.get("id") if isinstance(request, dict) else None,
+                _INVALID_REQUEST, "Invalid request.")
+
+        request_id = request.get("id")
+        method = getattr(self, f"_rpc_{request['method']}", None)
+        if method is None:
+            result = self._get_error(
+                request_id, _METHOD_NOT_FOUND,
+                f"Method '{request['method']}' not found.")
+        else:
+            params = request.get("params", {})
+            try:
+                if not isinstance(params, dict):
+                    raise _InvalidParams("The params must be an object.")
+                result = {
+                    "jsonrpc": "2.0", "id": request_id,
+                    "result": method(**params),
+                }
+            except (_InvalidParams, TypeError) as ex:
+                result = self._get_error(request_id, _INVALID_PARAMS, str(ex))
+
+        # A request without an id is a notification.
+        return result if "id" in request else None
+
+    @staticmethod
+    def _get_grammar(name: str) -> GrammarType:
+        if not isinstance(name, str) or name not in GrammarType.__members__:
+            raise _InvalidParams(f"Unknown grammar '{name}'.")
+
+        return GrammarType[name]
+
+    def _invoke(self, text: Any, grammar: str) -> tuple[dict, Tree | None]:
+        if not isinstance(text, str):
+            raise _InvalidParams("The text must be a string.")
+
+        pipeline, lock = self._get_pipeline(self._get_grammar(grammar))
+
+        start = time.perf_counter()
+        try:
+            with lock:
+                tree = pipeline.invoke(text)
+        except Exception as ex:  # pylint: disable=W0718
+            return {
+                "ok": False,
+                "seconds": time.perf_counter() - start,
+                "error": f"{type(ex).__name__}: {ex}",
+            }, None
+
+        return {"ok": True, "seconds": time.perf_counter() - start}, tree
+
+    def _rpc_parse(
+        self,
+        text: str,
+        grammar: str = GrammarType.CONTAINER_LALR.name,
+        format: str = "json",  # pylint: disable=W0622
+    ) -> dict:
+        if format not in _FORMATS:
+            raise _InvalidParams(f"Unknown format '{format}'.")
+
+        result, tree = self._invoke(text, grammar)
+        if tree is None:
+            return result
+
+        if "json" == format:
+            result["tree"] = DictSerializer().invoke(tree)
+        elif "tree" == format:
+            result["tree"] = tree.pretty()
+        else:
+            result["tree"] = base64.b64encode(dumps(tree)).decode("ascii")
+
+        return result
+
+    def _rpc_validate(
+        self,
+        text: str,
+        grammar: str = GrammarType.CONTAINER_LALR.name,
+    ) -> dict:
+        result, _ = self._invoke(text, grammar)
+        return result
+
+    def _rpc_ping(self) -> dict:
+        with self._lock:
+            grammars = [item.name for item in self._pipelines]
+
+        return {"version": ResultCache.get_version(), "grammars": grammars}
+
+    def _rpc_shutdown(self) -> dict:
+        # `shutdown` waits for `serve_forever`, so it must not block this
+        # handler thread.
+        threading.Thread(target=self.shutdown, daemon=True).start()
+        return {}
+
+
+class ParseClient:
+    """
+    Sends JSON-RPC requests to a ParseServer over one connection.
+
+    The constructor raises OSError (for example ConnectionRefusedError or
+    FileNotFoundError), if no daemon runs at the address. A JSON-RPC error
+    response raises RuntimeError. If the connection or a response takes
+    longer than `timeout` seconds, TimeoutError (an OSError) is raised.
+    """
+
+    _socket: socket.socket
+    _file: Any
+    _next_id: int
+
+    def __init__(
+        self,
+        address: Address | None = None,
+        timeout: float | None = _DEFAULT_TIMEOUT,
+    ):
+        """Default .ctor. Connects to the daemon."""
+
+        if address is None:
+            address = get_default_address()
+
+        if isinstance(address, str):
+            self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        else:
+            self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        try:
+            self._socket.settimeout(timeout)
+            self._socket.connect(address)
+        except OSError:
+            self._socket.close()
+            raise
+
+        self._file = self._socket.makefile("rwb")
+        self._next_id = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self) -> None:
+        """Closes the connection."""
+
+        self._file.close()
+        self._socket.close()
+
+    def _get_request(self, method: str, params: dict) -> dict:
+        self._next_id += 1
+        return {
+            "jsonrpc": "2.0", "id": self._next_id, "method": method,
+            "params": params,
+        }
+
+    def _send(self, value: Any) -> Any:
+        self._file.write(
+            json.dumps(value, ensure_ascii=False).encode("utf-8") + b"\n")
+        self._file.flush()
+
+        line = self._file.readline()
+        if not line:
+            raise ConnectionError("The daemon closed the connection.")
+
+        return json.loads(line)
+
+    @staticmethod
+    def _get_result(response: dict) -> Any:
+        error = response.get("error")
+        if error is not None:
+            raise RuntimeError(f"{error['code']}: {error['message']}")
+
+        return response["result"]
+
+    def call(self, method: str, **params) -> Any:
+        """Sends one request. Returns its result."""
+
+        return self._get_result(
+            self._send(self._get_request(method, params)))
+
+    def call_batch(self, calls: list[tuple[str, dict]]) -> list:
+        """
+        Sends the (method, params) calls in one batch. Returns the results
+        in the order of the calls.
+        """
+
+        if not calls:
+            return []
+
+        requests = [self._get_request(method, params)
+                    for method, params in calls]
+        responses = {
+            item.get("id"): item for item in self._send(requests)}
+
+        return [self._get_result(responses[item["id"]]) for item in requests]
+
+    def parse_tree(
+        self,
+        text: str,
+        grammar: GrammarType = GrammarType.CONTAINER_LALR,
+    ) -> dict:
+        """
+        Parses the text in the daemon. Returns the result of `parse`, with
+        the lark Tree (with the positions of the text) in `tree`.
+        """
+
+        result = self.call(
+            "parse", text=text, grammar=grammar.name, format="binary")
+        if result["ok"]:
+            result["tree"] = BinaryTree(
+                base64.b64decode(result["tree"])).to_tree(text=text)
+
+        return result
@@ -0,0 +1,165 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""dictionary"""
+
+import hashlib
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable
+
+from ..char import Char
+
+__all__ = [
+    "Dictionary",
+    "DictionaryInfo",
+]
+
+# A plain str is faster than the enum in the lookup.
+_HYPHEN = Char.HYPHEN.value
+
+
+@dataclass(frozen=True)
+class DictionaryInfo:
+    """Size of a dictionary."""
+
+    words: int
+    abbreviations: int
+    # Memory of the lookup structures and the strings in bytes.
+    size: int
+
+
+class Dictionary:
+    """
+    Dictionary of approved words.
+
+    A lookup is a set lookup (O(1) after case folding). An entry with a
+    trailing dot is an abbreviation (for example "e.g."). A word with a
+    trailing dot that is not an abbreviation is not in the dictionary, so
+    that the dot is an end of sentence.
+
+    A hyphenated word (for example "check-valve") is in the dictionary, if
+    the dictionary contains the hyphenated word or every part of it.
+    """
+
+    # The dictionary file of the package.
+    DEFAULT_PATH = Path(__file__).parent / "approved_words.txt"
+
+    COMMENT = "#"
+
+    _default: "Dictionary | None" = None
+
+    # Words after case folding.
+    _words: frozenset[str]
+    # Abbreviations as written and with a capital first letter.
+    _abbreviations: frozenset[str]
+    _abbreviation_count: int
+    _fingerprint: str | None
+
+    def __init__(self, entries: Iterable[str]):
+        """Default .ctor."""
+
+        words = set()
+        abbreviations = set()
+        originals = set()
+        for entry in entries:
+            assert isinstance(entry, str), entry
+
+            value = entry.strip()
+            if not value:
+                continue
+
+            if Char.DOT == value[-1]:
+                originals.add(value)
+                abbreviations.add(value)
+                abbreviations.add(value[0].upper() + value[1:])
+                continue
+
+            words.add(value.casefold())
+
+        self._words = frozenset(words)
+        self._abbreviations = frozenset(abbreviations)
+        self._abbreviation_count = len(originals)
+        self._fingerprint = None
+
+    @classmethod
+    def from_file(cls, path: str | Path) -> "Dictionary":
+        """Loads a file with one entry per line. `#` starts a comment."""
+
+        with open(path, "r", encoding="utf-8") as f:
+            return cls(
+                line for line in f
+                if not line.lstrip().startswith(cls.COMMENT)
+            )
+
+    @classmethod
+    def get_default(cls) -> "Dictionary":
+        """Returns the dictionary of the package. Loads it only once."""
+
+        if cls._default is None:
+            cls._default = cls.from_file(cls.DEFAULT_PATH)
+
+        return cls._default
+
+    def __contains__(self, value: str) -> bool:
+        return self.contains(value)
+
+    def __len__(self) -> int:
+        return len(self._words) + self._abbreviation_count
+
+    def contains(self, value: str) -> bool:
+        """Returns True, if the value is an approved word."""
+
+        if value in self._abbreviations:
+            return True
+
+        key = value.casefold()
+        if key in self._words:
+            return True
+
+        if _HYPHEN not in key:
+            return False
+
+        words = self._words
+        return all(part in words for part in key.split(_HYPHEN))
+
+    @property
+    def fingerprint(self) -> str:
+        """A hash over all entries. Equal dictionaries have the same hash."""
+
+        if self._fingerprint is None:
+            digest = hashlib.sha256()
+            for value in sorted(self._words):
+                digest.update(value.encode("utf-8") + b"\0")
+            digest.update(b"\0")
+            for value in sorted(self._abbreviations):
+                digest.update(value.encode("utf-8") + b"\0")
+            self._fingerprint = digest.hexdigest()
+
+        return self._fingerprint
+
+    def get_info(self) -> DictionaryInfo:
+        """Returns the number of entries and the memory of the dictionary."""
+
+        size = sys.getsizeof(self._words) + sys.getsizeof(self._abbreviations)
+        size += sum(sys.getsizeof(word) for word in self._words)
+        size += sum(sys.getsizeof(word) for word in self._abbreviations)
+
+        return DictionaryInfo(
+            words=len(self._words),
+            abbreviations=self._abbreviation_count,
+            size=size,
+        )
@@ -15,8 +15,10 @@
 
 """grammar module."""
 
+from .grammar_cache import GrammarCache
 from .grammar_type import GrammarType
 
 __all__ = [
+    'GrammarCache',
     'GrammarType',
 ]
@@ -0,0 +1,150 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# pylint: disable=W0212
+
+"""container_lalr_lexer"""
+
+import re
+from copy import copy
+
+from lark import Token as LarkToken
+from lark.exceptions import UnexpectedCharacters, UnexpectedToken
+from lark.lexer import BasicLexer, Lexer, LexerState
+from lark.parsers.lalr_analysis import Shift
+
+__all__ = [
+    "ContainerLalrLexer",
+]
+
+
+class ContainerLalrLexer(Lexer):
+    """
+    Contextual lexer for the LALR variant of the container grammar.
+
+    Lark merges LALR states with the same core. The lookahead set of a
+    merged state contains terminals from all contexts of the state. For
+    example, after a TEXT the lexer accepts NEWLINE (proc_item) and
+    SINGLE_NEWLINE (paragraph), which both match the same line break.
+
+    This lexer selects the terminal with the highest priority that the parser
+    really accepts in its current context. When the parser does not accept a
+    terminal, the lexer tries the other terminals that match the same text.
+    """
+
+    # Lark passes the lexer_state and the parser_state to `lex`.
+    __future_interface__ = 2
+
+    def __init__(self, lexer_conf) -> None:
+        self._conf = lexer_conf
+        self._lexers: dict[frozenset, BasicLexer] = {}
+        self._patterns = {
+            t.name: re.compile(t.pattern.to_regexp(), lexer_conf.g_regex_flags)
+            for t in lexer_conf.terminals
+        }
+        self._root = BasicLexer(lexer_conf)
+
+    def _get_lexer(self, actions: dict) -> BasicLexer:
+        accepts = frozenset(actions.keys())
+
+        result = self._lexers.get(accepts)
+        if result is not None:
+            return result
+
+        conf = copy(self._conf)
+        conf.terminals = [
+            t for t in self._conf.terminals
+            if t.name in accepts or t.name in self._conf.ignore
+        ]
+        conf.skip_validation = True
+
+        result = BasicLexer(conf)
+        self._lexers[accepts] = result
+        return result
+
+    @staticmethod
+    def _accepts(parser_state, token_type: str) -> bool:
+        """Simulates the reductions of the parser on its state stack."""
+
+        states = parser_state.parse_conf.states
+        stack = list(parser_state.state_stack)
+
+        while True:
+            action = states[stack[-1]].get(token_type)
+            if action is None:
+                return False
+
+            kind, rule = action
+            if kind is Shift:
+                return True
+
+            size = len(rule.expansion)
+            if size:
+                del stack[-size:]
+            _, state = states[stack[-1]][rule.origin.name]
+            stack.append(state)
+
+    def _resolve(
+        self,
+        token: LarkToken,
+        lexer: BasicLexer,
+        lexer_state: LexerState,
+        parser_state,
+    ) -> LarkToken:
+
+        if self._accepts(parser_state, token.type):
+            return token
+
+        text = lexer_state.text.text
+        for terminal in lexer.terminals:
+            if terminal.name == token.type:
+                continue
+
+            match = self._patterns[terminal.name].match(text, token.start_pos)
+            if match is None or match.end() != token.end_pos:
+                continue
+
+            if self._accepts(parser_state, terminal.name):
+                return LarkToken.new_borrow_pos(terminal.name, token, token)
+
+        return token
+
+    def lex(self, lexer_state: LexerState, parser_state):
+        states = parser_state.parse_conf.states
+
+        try:
+            while True:
+                lexer = self._get_lexer(states[parser_state.position])
+                token = lexer.next_token(lexer_state, parser_state)
+                token = self._resolve(token, lexer, lexer_state, parser_state)
+                lexer_state.last_token = token
+                yield token
+        except EOFError:
+            pass
+        except UnexpectedCharacters as ex:
+            # Same as the lark ContextualLexer: an UnexpectedCharacters can
+            # mean that the terminal exists, but not in the current context.
+            try:
+                last_token = lexer_state.last_token
+                token = self._root.next_token(lexer_state, parser_state)
+                raise UnexpectedToken(
+                    token,
+                    ex.allowed,
+                    state=parser_state,
+                    token_history=[last_token],
+                    terminals_by_name=self._root.terminals_by_name,
+                ) from ex
+            except UnexpectedCharacters:
+                raise ex  # pylint: disable=W0707
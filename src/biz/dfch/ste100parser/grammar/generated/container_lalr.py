@@ -0,0 +1,7168 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# Generated by biz.dfch.ste100parser.grammar.standalone_grammar.
+# Do not edit. Run `python -m biz.dfch.ste100parser.grammar.generated`
+# after a change to a grammar file.
+
+# pylint: skip-file
+# type: ignore
+
+"""container_lalr"""
+
+from lark import Lark
+
+from biz.dfch.ste100parser.grammar.container_lalr_lexer import ContainerLalrLexer
+
+GRAMMAR = "container_lalr.lark"
+GRAMMAR_KEY = "fd61a0f84db5f9d76d30e0f056f30ab39a46ea6852816d748df7a9b5bc18fb52"
+LARK_VERSION = "1.3.1"
+
+DATA = {'parser': {'lexer_conf': {'terminals': [{'@': 0},
+                                         {'@': 1},
+                                         {'@': 2},
+                                         {'@': 3},
+                                         {'@': 4},
+                                         {'@': 5},
+                                         {'@': 6},
+                                         {'@': 7},
+                                         {'@': 8},
+                                         {'@': 9},
+                                         {'@': 10},
+                                         {'@': 11},
+                                         {'@': 12},
+                                         {'@': 13},
+                                         {'@': 14},
+                                         {'@': 15},
+                                         {'@': 16},
+                                         {'@': 17},
+                                         {'@': 18},
+                                         {'@': 19},
+                                         {'@': 20},
+                                         {'@': 21},
+                                         {'@': 22},
+                                         {'@': 23},
+                                         {'@': 24},
+                                         {'@': 25},
+                                         {'@': 26},
+                                         {'@': 27},
+                                         {'@': 28},
+                                         {'@': 29},
+                                         {'@': 30},
+                                         {'@': 31},
+                                         {'@': 32},
+                                         {'@': 33},
+                                         {'@': 34},
+                                         {'@': 35},
+                                         {'@': 36},
+                                         {'@': 37}],
+                           'ignore': [],
+                           'g_regex_flags': 0,
+                           'use_bytes': False,
+                           'lexer_type': ContainerLalrLexer,
+                           '__type__': 'LexerConf'},
+            'parser_conf': {'rules': [{'@': 38},
+                                      {'@': 39},
+                                      {'@': 40},
+                                      {'@': 41},
+                                      {'@': 42},
+                                      {'@': 43},
+                                      {'@': 44},
+                                      {'@': 45},
+                                      {'@': 46},
+                                      {'@': 47},
+                                      {'@': 48},
+                                      {'@': 49},
+                                      {'@': 50},
+                                      {'@': 51},
+                                      {'@': 52},
+                                      {'@': 53},
+                                      {'@': 54},
+                                      {'@': 55},
+                                      {'@': 56},
+                                      {'@': 57},
+                                      {'@': 58},
+                                      {'@': 59},
+                                      {'@': 60},
+                                      {'@': 61},
+                                      {'@': 62},
+                                      {'@': 63},
+                                      {'@': 64},
+                                      {'@': 65},
+                                      {'@': 66},
+                                      {'@': 67},
+                                      {'@': 68},
+                                      {'@': 69},
+                                      {'@': 70},
+                                      {'@': 71},
+                                      {'@': 72},
+                                      {'@': 73},
+                                      {'@': 74},
+                                      {'@': 75},
+                                      {'@': 76},
+                                      {'@': 77},
+                                      {'@': 78},
+                                      {'@': 79},
+                                      {'@': 80},
+                                      {'@': 81},
+                                      {'@': 82},
+                                      {'@': 83},
+                                      {'@': 84},
+                                      {'@': 85},
+                                      {'@': 86},
+                                      {'@': 87},
+                                      {'@': 88},
+                                      {'@': 89},
+                                      {'@': 90},
+                                      {'@': 91},
+                                      {'@': 92},
+                                      {'@': 93},
+                                      {'@': 94},
+                                      {'@': 95},
+                                      {'@': 96},
+                                      {'@': 97},
+                                      {'@': 98},
+                                      {'@': 99},
+                                      {'@': 100},
+                                      {'@': 101},
+                                      {'@': 102},
+                                      {'@': 103},
+                                      {'@': 104},
+                                      {'@': 105},
+                                      {'@': 106},
+                                      {'@': 107},
+                                      {'@': 108},
+                                      {'@': 109},
+                                      {'@': 110},
+                                      {'@': 111},
+                                      {'@': 112},
+                                      {'@': 113},
+                                      {'@': 114},
+                                      {'@': 115},
+                                      {'@': 116},
+                                      {'@': 117},
+                                      {'@': 118},
+                                      {'@': 119},
+                                      {'@': 120},
+                                      {'@': 121},
+                                      {'@': 122},
+                                      {'@': 123},
+                                      {'@': 124},
+                                      {'@': 125},
+                                      {'@': 126},
+                                      {'@': 127},
+                                      {'@': 128},
+                                      {'@': 129},
+                                      {'@': 130},
+                                      {'@': 131},
+                                      {'@': 132},
+                                      {'@': 133},
+                                      {'@': 134},
+                                      {'@': 135},
+                                      {'@': 136},
+                                      {'@': 137},
+                                      {'@': 138},
+                                      {'@': 139},
+                                      {'@': 140},
+                                      {'@': 141},
+                                      {'@': 142},
+                                      {'@': 143},
+                                      {'@': 144},
+                                      {'@': 145},
+                                      {'@': 146},
+                                      {'@': 147},
+                                      {'@': 148},
+                                      {'@': 149},
+                                      {'@': 150},
+                                      {'@': 151},
+                                      {'@': 152},
+                                      {'@': 153},
+                                      {'@': 154},
+                                      {'@': 155},
+                                      {'@': 156},
+                                      {'@': 157},
+                                      {'@': 158},
+                                      {'@': 159},
+                                      {'@': 160},
+                                      {'@': 161},
+                                      {'@': 162},
+                                      {'@': 163},
+                                      {'@': 164},
+                                      {'@': 165},
+                                      {'@': 166},
+                                      {'@': 167},
+                                      {'@': 168},
+                                      {'@': 169},
+                                      {'@': 170},
+                                      {'@': 171},
+                                      {'@': 172},
+                                      {'@': 173},
+                                      {'@': 174},
+                                      {'@': 175},
+                                      {'@': 176},
+                                      {'@': 177},
+                                      {'@': 178},
+                                      {'@': 179},
+                                      {'@': 180},
+                                      {'@': 181},
+                                      {'@': 182},
+                                      {'@': 183},
+                                      {'@': 184},
+                                      {'@': 185},
+                                      {'@': 186},
+                                      {'@': 187},
+                                      {'@': 188},
+                                      {'@': 189},
+                                      {'@': 190},
+                                      {'@': 191},
+                                      {'@': 192},
+                                      {'@': 193},
+                                      {'@': 194},
+                                      {'@': 195},
+                                      {'@': 196},
+                                      {'@': 197},
+                                      {'@': 198},
+                                      {'@': 199},
+                                      {'@': 200},
+                                      {'@': 201},
+                                      {'@': 202},
+                                      {'@': 203},
+                                      {'@': 204},
+                                      {'@': 205},
+                                      {'@': 206},
+                                      {'@': 207},
+                                      {'@': 208},
+                                      {'@': 209},
+                                      {'@': 210},
+                                      {'@': 211},
+                                      {'@': 212},
+                                      {'@': 213},
+                                      {'@': 214},
+                                      {'@': 215},
+                                      {'@': 216},
+                                      {'@': 217}],
+                            'start': ['start'],
+                            'parser_type': 'lalr',
+                            '__type__': 'ParserConf'},
+            'parser': {'tokens': {0: '$END',
+                                  1: 'WS',
+                                  2: 'PROC_LINE_START',
+                                  3: 'APOSTROPHE',
+                                  4: 'PLURAL_S',
+                                  5: 'TEXT',
+                                  6: 'BACK_TICK',
+                                  7: 'DQUOTE',
+                                  8: 'HEADING_MARKER',
+                                  9: 'NOTE_OR_SAFETY_LINE_START',
+                                  10: 'UNDER_OPEN',
+                                  11: 'BOLD_EMPH_OPEN',
+                                  12: 'MULTIPLY',
+                                  13: 'NEWLINE',
+                                  14: 'CITE_LINE_START_FIRST',
+                                  15: 'STAR_OPEN',
+                                  16: 'PAREN_OPEN',
+                                  17: 'LIST_LINE_START',
+                                  18: 'SQUOTE',
+                                  19: 'YEAR_SHORT',
+                                  20: 'PAREN_CLOSE',
+                                  21: 'SQUOTE_CLOSE',
+                                  22: 'UNDER',
+                                  23: 'STAR',
+                                  24: 'SINGLE_NEWLINE',
+                                  25: 'SAFETY_LINE_START',
+                                  26: 'BOLD_EMPH_CLOSE',
+                                  27: 'UNDER_CLOSE',
+                                  28: 'STAR_CLOSE',
+                                  29: 'quote_containers',
+                                  30: '__list_line_plus_10',
+                                  31: 'paren_sl',
+                                  32: 'bold',
+                                  33: 'dquote',
+                                  34: 'code',
+                                  35: 'squote',
+                                  36: 'format_containers',
+                                  37: 'emph',
+                                  38: 'list_item',
+                                  39: 'bold_emph',
+                                  40: 'common_text',
+                                  41: 'squote_item',
+                                  42: 'char_code',
+                                  43: 'char_paren_close',
+                                  44: 'char_under',
+                                  45: 'char_paren_open',
+                                  46: 'char_single',
+                                  47: 'char_star',
+                                  48: '__dquote_star_1',
+                                  49: 'dquote_item',
+                                  50: 'note_or_safety_first',
+                                  51: 'note_or_safety_next',
+                                  52: 'CODE',
+                                  53: 'paren_item_sl',
+                                  54: 'paren',
+                                  55: '__paren_sl_star_13',
+                                  56: 'proc_delimiter',
+                                  57: 'PROC_DELIMITER',
+                                  58: 'bold_emph_item',
+                                  59: 'warning_marker',
+                                  60: 'WARNING_MARKER',
+                                  61: 'caution_marker',
+                                  62: 'CAUTION_MARKER',
+                                  63: 'SPACE',
+                                  64: '__bold_emph_plus_5',
+                                  65: '__warning_star_8',
+                                  66: 'heading_item',
+                                  67: '__heading_first_line_plus_7',
+                                  68: 'warning',
+                                  69: 'caution',
+                                  70: 'note',
+                                  71: 'proc_item',
+                                  72: 'note_or_safety_instruction',
+                                  73: 'safety_instruction',
+                                  74: 'list_line',
+                                  75: 'paragraph_next_item',
+                                  76: 'paragraph_item',
+                                  77: 'paragraph_first_item',
+                                  78: '__emph_plus_4',
+                                  79: 'emph_item',
+                                  80: 'NOTE_MARKER',
+                                  81: 'note_marker',
+                                  82: 'list_marker_star',
+                                  83: 'list_marker',
+                                  84: 'list_marker_dash',
+                                  85: 'LIST_MARKER_ALPHA_NUM',
+                                  86: 'DASH',
+                                  87: 'bold_item',
+                                  88: 'cite_first_item',
+                                  89: 'COLON',
+                                  90: '__paragraph_star_9',
+                                  91: '__bold_plus_3',
+                                  92: 'proc_marker',
+                                  93: 'PROC_MARKER',
+                                  94: 'paren_item_ml',
+                                  95: '__proc_line_plus_11',
+                                  96: '__paren_star_12',
+                                  97: 'heading_first_line',
+                                  98: 'inline_first',
+                                  99: 'cite_line',
+                                  100: 'paragraph',
+                                  101: '__start_star_0',
+                                  102: 'proc_line',
+                                  103: 'cite',
+                                  104: 'heading',
+                                  105: 'inline_next',
+                                  106: 'start',
+                                  107: '__squote_star_2',
+                                  108: 'heading_marker_suffix',
+                                  109: 'proc_indent_suffix',
+                                  110: 'cite_next_item',
+                                  111: '__cite_line_star_6'},
+                       'states': {0: {0: (1, {'@': 111}),
+                                      1: (1, {'@': 111}),
+                                      2: (1, {'@': 111}),
+                                      3: (1, {'@': 111}),
+                                      4: (1, {'@': 111}),
+                                      5: (1, {'@': 111}),
+                                      6: (1, {'@': 111}),
+                                      7: (1, {'@': 111}),
+                                      8: (1, {'@': 111}),
+                                      9: (1, {'@': 111}),
+                                      10: (1, {'@': 111}),
+                                      11: (1, {'@': 111}),
+                                      12: (1, {'@': 111}),
+                                      13: (1, {'@': 111}),
+                                      14: (1, {'@': 111}),
+                                      15: (1, {'@': 111}),
+                                      16: (1, {'@': 111}),
+                                      17: (1, {'@': 111}),
+                                      18: (1, {'@': 111}),
+                                      19: (1, {'@': 111})},
+                                  1: {0: (1, {'@': 108}),
+                                      1: (1, {'@': 108}),
+                                      2: (1, {'@': 108}),
+                                      3: (1, {'@': 108}),
+                                      4: (1, {'@': 108}),
+                                      5: (1, {'@': 108}),
+                                      6: (1, {'@': 108}),
+                                      7: (1, {'@': 108}),
+                                      8: (1, {'@': 108}),
+                                      9: (1, {'@': 108}),
+                                      10: (1, {'@': 108}),
+                                      11: (1, {'@': 108}),
+                                      12: (1, {'@': 108}),
+                                      13: (1, {'@': 108}),
+                                      14: (1, {'@': 108}),
+                                      15: (1, {'@': 108}),
+                                      16: (1, {'@': 108}),
+                                      17: (1, {'@': 108}),
+                                      18: (1, {'@': 108}),
+                                      19: (1, {'@': 108})},
+                                  2: {},
+                                  3: {20: (1, {'@': 78}),
+                                      1: (1, {'@': 78}),
+                                      10: (1, {'@': 78}),
+                                      11: (1, {'@': 78}),
+                                      3: (1, {'@': 78}),
+                                      12: (1, {'@': 78}),
+                                      4: (1, {'@': 78}),
+                                      21: (1, {'@': 78}),
+                                      5: (1, {'@': 78}),
+                                      22: (1, {'@': 78}),
+                                      6: (1, {'@': 78}),
+                                      23: (1, {'@': 78}),
+                                      7: (1, {'@': 78}),
+                                      15: (1, {'@': 78}),
+                                      16: (1, {'@': 78}),
+                                      19: (1, {'@': 78})},
+                                  4: {0: (1, {'@': 62}),
+                                      1: (1, {'@': 62}),
+                                      10: (1, {'@': 62}),
+                                      2: (1, {'@': 62}),
+                                      24: (1, {'@': 62}),
+                                      11: (1, {'@': 62}),
+                                      18: (1, {'@': 62}),
+                                      3: (1, {'@': 62}),
+                                      4: (1, {'@': 62}),
+                                      12: (1, {'@': 62}),
+                                      13: (1, {'@': 62}),
+                                      5: (1, {'@': 62}),
+                                      6: (1, {'@': 62}),
+                                      25: (1, {'@': 62}),
+                                      14: (1, {'@': 62}),
+                                      7: (1, {'@': 62}),
+                                      15: (1, {'@': 62}),
+                                      16: (1, {'@': 62}),
+                                      8: (1, {'@': 62}),
+                                      9: (1, {'@': 62}),
+                                      17: (1, {'@': 62}),
+                                      19: (1, {'@': 62}),
+                                      20: (1, {'@': 62}),
+                                      21: (1, {'@': 62}),
+                                      22: (1, {'@': 62}),
+                                      23: (1, {'@': 62})},
+                                  5: {0: (1, {'@': 77}),
+                                      1: (1, {'@': 77}),
+                                      10: (1, {'@': 77}),
+                                      2: (1, {'@': 77}),
+                                      24: (1, {'@': 77}),
+                                      11: (1, {'@': 77}),
+                                      18: (1, {'@': 77}),
+                                      3: (1, {'@': 77}),
+                                      4: (1, {'@': 77}),
+                                      12: (1, {'@': 77}),
+                                      13: (1, {'@': 77}),
+                                      5: (1, {'@': 77}),
+                                      6: (1, {'@': 77}),
+                                      25: (1, {'@': 77}),
+                                      14: (1, {'@': 77}),
+                                      7: (1, {'@': 77}),
+                                      15: (1, {'@': 77}),
+                                      16: (1, {'@': 77}),
+                                      8: (1, {'@': 77}),
+                                      9: (1, {'@': 77}),
+                                      17: (1, {'@': 77}),
+                                      19: (1, {'@': 77}),
+                                      20: (1, {'@': 77}),
+                                      22: (1, {'@': 77}),
+                                      23: (1, {'@': 77}),
+                                      26: (1, {'@': 77}),
+                                      27: (1, {'@': 77}),
+                                      28: (1, {'@': 77})},
+                                  6: {0: (1, {'@': 45}),
+                                      10: (1, {'@': 45}),
+                                      2: (1, {'@': 45}),
+                                      11: (1, {'@': 45}),
+                                      3: (1, {'@': 45}),
+                                      12: (1, {'@': 45}),
+                                      9: (1, {'@': 45}),
+                                      4: (1, {'@': 45}),
+                                      13: (1, {'@': 45}),
+                                      5: (1, {'@': 45}),
+                                      6: (1, {'@': 45}),
+                                      14: (1, {'@': 45}),
+                                      7: (1, {'@': 45}),
+                                      15: (1, {'@': 45}),
+                                      16: (1, {'@': 45}),
+                                      8: (1, {'@': 45}),
+                                      18: (1, {'@': 45}),
+                                      17: (1, {'@': 45}),
+                                      19: (1, {'@': 45})},
+                                  7: {20: (1, {'@': 80}),
+                                      1: (1, {'@': 80}),
+                                      10: (1, {'@': 80}),
+                                      11: (1, {'@': 80}),
+                                      3: (1, {'@': 80}),
+                                      12: (1, {'@': 80}),
+                                      4: (1, {'@': 80}),
+                                      21: (1, {'@': 80}),
+                                      5: (1, {'@': 80}),
+                                      22: (1, {'@': 80}),
+                                      6: (1, {'@': 80}),
+                                      23: (1, {'@': 80}),
+                                      7: (1, {'@': 80}),
+                                      15: (1, {'@': 80}),
+                                      16: (1, {'@': 80}),
+                                      19: (1, {'@': 80})},
+                                  8: {29: (0, 44),
+                                      1: (0, 46),
+                                      30: (0, 42),
+                                      31: (0, 121),
+                                      15: (0, 161),
+                                      5: (0, 207),
+                                      32: (0, 4),
+                                      16: (0, 34),
+                                      12: (0, 216),
+                                      7: (0, 15),
+                                      19: (0, 27),
+                                      33: (0, 53),
+                                      3: (0, 56),
+                                      34: (0, 21),
+                                      6: (0, 25),
+                                      35: (0, 118),
+                                      10: (0, 122),
+                                      36: (0, 123),
+                                      37: (0, 158),
+                                      38: (0, 126),
+                                      4: (0, 150),
+                                      18: (0, 195),
+                                      39: (0, 30),
+                                      40: (0, 128),
+                                      11: (0, 67)},
+                                  9: {10: (1, {'@': 179}),
+                                      20: (1, {'@': 179}),
+                                      5: (1, {'@': 179}),
+                                      1: (1, {'@': 179}),
+                                      11: (1, {'@': 179}),
+                                      3: (1, {'@': 179}),
+                                      7: (1, {'@': 179}),
+                                      12: (1, {'@': 179}),
+                                      15: (1, {'@': 179}),
+                                      4: (1, {'@': 179}),
+                                      18: (1, {'@': 179}),
+                                      19: (1, {'@': 179}),
+                                      16: (1, {'@': 179}),
+                                      0: (1, {'@': 179}),
+                                      2: (1, {'@': 179}),
+                                      24: (1, {'@': 179}),
+                                      13: (1, {'@': 179}),
+                                      6: (1, {'@': 179}),
+                                      14: (1, {'@': 179}),
+                                      17: (1, {'@': 179}),
+                                      8: (1, {'@': 179}),
+                                      9: (1, {'@': 179})},
+                                  10: {16: (0, 58),
+                                       21: (0, 166),
+                                       41: (0, 215),
+                                       42: (0, 64),
+                                       15: (0, 161),
+                                       1: (0, 3),
+                                       20: (0, 99),
+                                       32: (0, 4),
+                                       5: (0, 207),
+                                       12: (0, 216),
+                                       22: (0, 130),
+                                       34: (0, 7),
+                                       7: (0, 15),
+                                       19: (0, 27),
+                                       43: (0, 35),
+                                       44: (0, 62),
+                                       3: (0, 56),
+                                       6: (0, 105),
+                                       33: (0, 16),
+                                       10: (0, 122),
+                                       37: (0, 158),
+                                       40: (0, 17),
+                                       4: (0, 150),
+                                       45: (0, 131),
+                                       46: (0, 18),
+                                       39: (0, 30),
+                                       36: (0, 20),
+                                       11: (0, 67),
+                                       23: (0, 140),
+                                       31: (0, 23),
+                                       47: (0, 154)},
+                                  11: {20: (1, {'@': 194}),
+                                       1: (1, {'@': 194}),
+                                       5: (1, {'@': 194}),
+                                       10: (1, {'@': 194}),
+                                       22: (1, {'@': 194}),
+                                       6: (1, {'@': 194}),
+                                       11: (1, {'@': 194}),
+                                       19: (1, {'@': 194}),
+                                       23: (1, {'@': 194}),
+                                       3: (1, {'@': 194}),
+                                       7: (1, {'@': 194}),
+                                       15: (1, {'@': 194}),
+                                       16: (1, {'@': 194}),
+                                       12: (1, {'@': 194}),
+                                       4: (1, {'@': 194}),
+                                       21: (1, {'@': 194})},
+                                  12: {0: (1, {'@': 205}),
+                                       1: (1, {'@': 205}),
+                                       2: (1, {'@': 205}),
+                                       3: (1, {'@': 205}),
+                                       4: (1, {'@': 205}),
+                                       5: (1, {'@': 205}),
+                                       6: (1, {'@': 205}),
+                                       7: (1, {'@': 205}),
+                                       8: (1, {'@': 205}),
+                                       9: (1, {'@': 205}),
+                                       10: (1, {'@': 205}),
+                                       11: (1, {'@': 205}),
+                                       12: (1, {'@': 205}),
+                                       13: (1, {'@': 205}),
+                                       14: (1, {'@': 205}),
+                                       15: (1, {'@': 205}),
+                                       16: (1, {'@': 205}),
+                                       17: (1, {'@': 205}),
+                                       18: (1, {'@': 205}),
+                                       19: (1, {'@': 205})},
+                                  13: {0: (1, {'@': 182}),
+                                       1: (1, {'@': 182}),
+                                       10: (1, {'@': 182}),
+                                       2: (1, {'@': 182}),
+                                       24: (1, {'@': 182}),
+                                       11: (1, {'@': 182}),
+                                       18: (1, {'@': 182}),
+                                       3: (1, {'@': 182}),
+                                       4: (1, {'@': 182}),
+                                       12: (1, {'@': 182}),
+                                       13: (1, {'@': 182}),
+                                       5: (1, {'@': 182}),
+                                       6: (1, {'@': 182}),
+                                       25: (1, {'@': 182}),
+                                       14: (1, {'@': 182}),
+                                       7: (1, {'@': 182}),
+                                       15: (1, {'@': 182}),
+                                       16: (1, {'@': 182}),
+                                       8: (1, {'@': 182}),
+                                       9: (1, {'@': 182}),
+                                       17: (1, {'@': 182}),
+                                       19: (1, {'@': 182}),
+                                       20: (1, {'@': 182}),
+                                       21: (1, {'@': 182}),
+                                       22: (1, {'@': 182}),
+                                       23: (1, {'@': 182}),
+                                       26: (1, {'@': 182}),
+                                       27: (1, {'@': 182}),
+                                       28: (1, {'@': 182})},
+                                  14: {10: (1, {'@': 217}),
+                                       20: (1, {'@': 217}),
+                                       5: (1, {'@': 217}),
+                                       1: (1, {'@': 217}),
+                                       11: (1, {'@': 217}),
+                                       3: (1, {'@': 217}),
+                                       7: (1, {'@': 217}),
+                                       12: (1, {'@': 217}),
+                                       15: (1, {'@': 217}),
+                                       4: (1, {'@': 217}),
+                                       18: (1, {'@': 217}),
+                                       19: (1, {'@': 217}),
+                                       16: (1, {'@': 217})},
+                                  15: {16: (0, 58),
+                                       36: (0, 197),
+                                       48: (0, 144),
+                                       42: (0, 64),
+                                       15: (0, 161),
+                                       31: (0, 71),
+                                       20: (0, 99),
+                                       32: (0, 4),
+                                       5: (0, 207),
+                                       12: (0, 216),
+                                       22: (0, 130),
+                                       19: (0, 27),
+                                       43: (0, 35),
+                                       44: (0, 62),
+                                       7: (0, 201),
+                                       3: (0, 56),
+                                       6: (0, 105),
+                                       46: (0, 125),
+                                       10: (0, 122),
+                                       34: (0, 115),
+                                       35: (0, 127),
+                                       37: (0, 158),
+                                       4: (0, 150),
+                                       18: (0, 195),
+                                       45: (0, 131),
+                                       39: (0, 30),
+                                       11: (0, 67),
+                                       49: (0, 134),
+                                       23: (0, 140),
+                                       1: (0, 145),
+                                       40: (0, 149),
+                                       47: (0, 154)},
+                                  16: {20: (1, {'@': 81}),
+                                       1: (1, {'@': 81}),
+                                       10: (1, {'@': 81}),
+                                       11: (1, {'@': 81}),
+                                       3: (1, {'@': 81}),
+                                       12: (1, {'@': 81}),
+                                       4: (1, {'@': 81}),
+                                       21: (1, {'@': 81}),
+                                       5: (1, {'@': 81}),
+                                       22: (1, {'@': 81}),
+                                       6: (1, {'@': 81}),
+                                       23: (1, {'@': 81}),
+                                       7: (1, {'@': 81}),
+                                       15: (1, {'@': 81}),
+                                       16: (1, {'@': 81}),
+                                       19: (1, {'@': 81})},
+                                  17: {20: (1, {'@': 84}),
+                                       1: (1, {'@': 84}),
+                                       10: (1, {'@': 84}),
+                                       11: (1, {'@': 84}),
+                                       3: (1, {'@': 84}),
+                                       12: (1, {'@': 84}),
+                                       4: (1, {'@': 84}),
+                                       21: (1, {'@': 84}),
+                                       5: (1, {'@': 84}),
+                                       22: (1, {'@': 84}),
+                                       6: (1, {'@': 84}),
+                                       23: (1, {'@': 84}),
+                                       7: (1, {'@': 84}),
+                                       15: (1, {'@': 84}),
+                                       16: (1, {'@': 84}),
+                                       19: (1, {'@': 84})},
+                                  18: {20: (1, {'@': 83}),
+                                       1: (1, {'@': 83}),
+                                       10: (1, {'@': 83}),
+                                       11: (1, {'@': 83}),
+                                       3: (1, {'@': 83}),
+                                       12: (1, {'@': 83}),
+                                       4: (1, {'@': 83}),
+                                       21: (1, {'@': 83}),
+                                       5: (1, {'@': 83}),
+                                       22: (1, {'@': 83}),
+                                       6: (1, {'@': 83}),
+                                       23: (1, {'@': 83}),
+                                       7: (1, {'@': 83}),
+                                       15: (1, {'@': 83}),
+                                       16: (1, {'@': 83}),
+                                       19: (1, {'@': 83})},
+                                  19: {10: (1, {'@': 136}),
+                                       5: (1, {'@': 136}),
+                                       6: (1, {'@': 136}),
+                                       11: (1, {'@': 136}),
+                                       3: (1, {'@': 136}),
+                                       7: (1, {'@': 136}),
+                                       12: (1, {'@': 136}),
+                                       15: (1, {'@': 136}),
+                                       4: (1, {'@': 136}),
+                                       18: (1, {'@': 136}),
+                                       19: (1, {'@': 136})},
+                                  20: {20: (1, {'@': 79}),
+                                       1: (1, {'@': 79}),
+                                       10: (1, {'@': 79}),
+                                       11: (1, {'@': 79}),
+                                       3: (1, {'@': 79}),
+                                       12: (1, {'@': 79}),
+                                       4: (1, {'@': 79}),
+                                       21: (1, {'@': 79}),
+                                       5: (1, {'@': 79}),
+                                       22: (1, {'@': 79}),
+                                       6: (1, {'@': 79}),
+                                       23: (1, {'@': 79}),
+                                       7: (1, {'@': 79}),
+                                       15: (1, {'@': 79}),
+                                       16: (1, {'@': 79}),
+                                       19: (1, {'@': 79})},
+                                  21: {0: (1, {'@': 158}),
+                                       1: (1, {'@': 158}),
+                                       10: (1, {'@': 158}),
+                                       2: (1, {'@': 158}),
+                                       24: (1, {'@': 158}),
+                                       11: (1, {'@': 158}),
+                                       18: (1, {'@': 158}),
+                                       3: (1, {'@': 158}),
+                                       4: (1, {'@': 158}),
+                                       12: (1, {'@': 158}),
+                                       13: (1, {'@': 158}),
+                                       5: (1, {'@': 158}),
+                                       6: (1, {'@': 158}),
+                                       25: (1, {'@': 158}),
+                                       14: (1, {'@': 158}),
+                                       7: (1, {'@': 158}),
+                                       15: (1, {'@': 158}),
+                                       16: (1, {'@': 158}),
+                                       8: (1, {'@': 158}),
+                                       9: (1, {'@': 158}),
+                                       17: (1, {'@': 158}),
+                                       19: (1, {'@': 158})},
+                                  22: {0: (1, {'@': 145}),
+                                       1: (1, {'@': 145}),
+                                       10: (1, {'@': 145}),
+                                       2: (1, {'@': 145}),
+                                       24: (1, {'@': 145}),
+                                       11: (1, {'@': 145}),
+                                       18: (1, {'@': 145}),
+                                       3: (1, {'@': 145}),
+                                       4: (1, {'@': 145}),
+                                       12: (1, {'@': 145}),
+                                       13: (1, {'@': 145}),
+                                       5: (1, {'@': 145}),
+                                       6: (1, {'@': 145}),
+                                       14: (1, {'@': 145}),
+                                       7: (1, {'@': 145}),
+                                       15: (1, {'@': 145}),
+                                       17: (1, {'@': 145}),
+                                       8: (1, {'@': 145}),
+                                       9: (1, {'@': 145}),
+                                       19: (1, {'@': 145}),
+                                       16: (1, {'@': 145})},
+                                  23: {20: (1, {'@': 82}),
+                                       1: (1, {'@': 82}),
+                                       10: (1, {'@': 82}),
+                                       11: (1, {'@': 82}),
+                                       3: (1, {'@': 82}),
+                                       12: (1, {'@': 82}),
+                                       4: (1, {'@': 82}),
+                                       21: (1, {'@': 82}),
+                                       5: (1, {'@': 82}),
+                                       22: (1, {'@': 82}),
+                                       6: (1, {'@': 82}),
+                                       23: (1, {'@': 82}),
+                                       7: (1, {'@': 82}),
+                                       15: (1, {'@': 82}),
+                                       16: (1, {'@': 82}),
+                                       19: (1, {'@': 82})},
+                                  24: {36: (0, 181),
+                                       29: (0, 183),
+                                       40: (0, 186),
+                                       15: (0, 161),
+                                       32: (0, 4),
+                                       5: (0, 207),
+                                       12: (0, 216),
+                                       7: (0, 15),
+                                       19: (0, 27),
+                                       33: (0, 53),
+                                       1: (0, 32),
+                                       3: (0, 56),
+                                       6: (0, 25),
+                                       35: (0, 118),
+                                       34: (0, 200),
+                                       10: (0, 122),
+                                       37: (0, 158),
+                                       4: (0, 150),
+                                       18: (0, 195),
+                                       39: (0, 30),
+                                       50: (0, 37),
+                                       11: (0, 67),
+                                       51: (0, 66),
+                                       0: (1, {'@': 134}),
+                                       2: (1, {'@': 134}),
+                                       13: (1, {'@': 134}),
+                                       25: (1, {'@': 134}),
+                                       14: (1, {'@': 134}),
+                                       16: (1, {'@': 134}),
+                                       8: (1, {'@': 134}),
+                                       9: (1, {'@': 134}),
+                                       17: (1, {'@': 134})},
+                                  25: {52: (0, 135)},
+                                  26: {0: (1, {'@': 206}),
+                                       1: (1, {'@': 206}),
+                                       2: (1, {'@': 206}),
+                                       3: (1, {'@': 206}),
+                                       4: (1, {'@': 206}),
+                                       5: (1, {'@': 206}),
+                                       6: (1, {'@': 206}),
+                                       25: (1, {'@': 206}),
+                                       7: (1, {'@': 206}),
+                                       8: (1, {'@': 206}),
+                                       9: (1, {'@': 206}),
+                                       10: (1, {'@': 206}),
+                                       11: (1, {'@': 206}),
+                                       12: (1, {'@': 206}),
+                                       13: (1, {'@': 206}),
+                                       14: (1, {'@': 206}),
+                                       15: (1, {'@': 206}),
+                                       16: (1, {'@': 206}),
+                                       17: (1, {'@': 206}),
+                                       18: (1, {'@': 206}),
+                                       19: (1, {'@': 206})},
+                                  27: {0: (1, {'@': 50}),
+                                       1: (1, {'@': 50}),
+                                       10: (1, {'@': 50}),
+                                       2: (1, {'@': 50}),
+                                       24: (1, {'@': 50}),
+                                       11: (1, {'@': 50}),
+                                       18: (1, {'@': 50}),
+                                       3: (1, {'@': 50}),
+                                       4: (1, {'@': 50}),
+                                       12: (1, {'@': 50}),
+                                       13: (1, {'@': 50}),
+                                       5: (1, {'@': 50}),
+                                       6: (1, {'@': 50}),
+                                       25: (1, {'@': 50}),
+                                       14: (1, {'@': 50}),
+                                       7: (1, {'@': 50}),
+                                       15: (1, {'@': 50}),
+                                       16: (1, {'@': 50}),
+                                       8: (1, {'@': 50}),
+                                       9: (1, {'@': 50}),
+                                       17: (1, {'@': 50}),
+                                       19: (1, {'@': 50}),
+                                       20: (1, {'@': 50}),
+                                       21: (1, {'@': 50}),
+                                       22: (1, {'@': 50}),
+                                       23: (1, {'@': 50}),
+                                       26: (1, {'@': 50}),
+                                       27: (1, {'@': 50}),
+                                       28: (1, {'@': 50})},
+                                  28: {10: (1, {'@': 187}),
+                                       20: (1, {'@': 187}),
+                                       5: (1, {'@': 187}),
+                                       1: (1, {'@': 187}),
+                                       11: (1, {'@': 187}),
+                                       3: (1, {'@': 187}),
+                                       7: (1, {'@': 187}),
+                                       12: (1, {'@': 187}),
+                                       15: (1, {'@': 187}),
+                                       4: (1, {'@': 187}),
+                                       18: (1, {'@': 187}),
+                                       19: (1, {'@': 187}),
+                                       16: (1, {'@': 187}),
+                                       13: (1, {'@': 187})},
+                                  29: {1: (1, {'@': 200}),
+                                       5: (1, {'@': 200}),
+                                       26: (1, {'@': 200}),
+                                       6: (1, {'@': 200}),
+                                       3: (1, {'@': 200}),
+                                       7: (1, {'@': 200}),
+                                       12: (1, {'@': 200}),
+                                       16: (1, {'@': 200}),
+                                       4: (1, {'@': 200}),
+                                       18: (1, {'@': 200}),
+                                       19: (1, {'@': 200})},
+                                  30: {0: (1, {'@': 64}),
+                                       1: (1, {'@': 64}),
+                                       10: (1, {'@': 64}),
+                                       2: (1, {'@': 64}),
+                                       24: (1, {'@': 64}),
+                                       11: (1, {'@': 64}),
+                                       18: (1, {'@': 64}),
+                                       3: (1, {'@': 64}),
+                                       4: (1, {'@': 64}),
+                                       12: (1, {'@': 64}),
+                                       13: (1, {'@': 64}),
+                                       5: (1, {'@': 64}),
+                                       6: (1, {'@': 64}),
+                                       25: (1, {'@': 64}),
+                                       14: (1, {'@': 64}),
+                                       7: (1, {'@': 64}),
+                                       15: (1, {'@': 64}),
+                                       16: (1, {'@': 64}),
+                                       8: (1, {'@': 64}),
+                                       9: (1, {'@': 64}),
+                                       17: (1, {'@': 64}),
+                                       19: (1, {'@': 64}),
+                                       20: (1, {'@': 64}),
+                                       21: (1, {'@': 64}),
+                                       22: (1, {'@': 64}),
+                                       23: (1, {'@': 64})},
+                                  31: {1: (1, {'@': 103}),
+                                       5: (1, {'@': 103}),
+                                       26: (1, {'@': 103}),
+                                       6: (1, {'@': 103}),
+                                       3: (1, {'@': 103}),
+                                       7: (1, {'@': 103}),
+                                       12: (1, {'@': 103}),
+                                       16: (1, {'@': 103}),
+                                       4: (1, {'@': 103}),
+                                       18: (1, {'@': 103}),
+                                       19: (1, {'@': 103})},
+                                  32: {0: (1, {'@': 141}),
+                                       1: (1, {'@': 141}),
+                                       10: (1, {'@': 141}),
+                                       2: (1, {'@': 141}),
+                                       11: (1, {'@': 141}),
+                                       18: (1, {'@': 141}),
+                                       3: (1, {'@': 141}),
+                                       4: (1, {'@': 141}),
+                                       12: (1, {'@': 141}),
+                                       13: (1, {'@': 141}),
+                                       5: (1, {'@': 141}),
+                                       6: (1, {'@': 141}),
+                                       25: (1, {'@': 141}),
+                                       14: (1, {'@': 141}),
+                                       7: (1, {'@': 141}),
+                                       15: (1, {'@': 141}),
+                                       16: (1, {'@': 141}),
+                                       8: (1, {'@': 141}),
+                                       9: (1, {'@': 141}),
+                                       17: (1, {'@': 141}),
+                                       19: (1, {'@': 141})},
+                                  33: {0: (1, {'@': 41}),
+                                       10: (1, {'@': 41}),
+                                       2: (1, {'@': 41}),
+                                       11: (1, {'@': 41}),
+                                       3: (1, {'@': 41}),
+                                       12: (1, {'@': 41}),
+                                       9: (1, {'@': 41}),
+                                       4: (1, {'@': 41}),
+                                       13: (1, {'@': 41}),
+                                       5: (1, {'@': 41}),
+                                       6: (1, {'@': 41}),
+                                       14: (1, {'@': 41}),
+                                       7: (1, {'@': 41}),
+                                       15: (1, {'@': 41}),
+                                       16: (1, {'@': 41}),
+                                       8: (1, {'@': 41}),
+                                       18: (1, {'@': 41}),
+                                       17: (1, {'@': 41}),
+                                       19: (1, {'@': 41})},
+                                  34: {29: (0, 208),
+                                       40: (0, 142),
+                                       15: (0, 161),
+                                       16: (0, 179),
+                                       53: (0, 116),
+                                       5: (0, 207),
+                                       32: (0, 4),
+                                       12: (0, 216),
+                                       7: (0, 15),
+                                       19: (0, 27),
+                                       33: (0, 53),
+                                       3: (0, 56),
+                                       36: (0, 75),
+                                       20: (0, 117),
+                                       35: (0, 118),
+                                       10: (0, 122),
+                                       37: (0, 158),
+                                       4: (0, 150),
+                                       18: (0, 195),
+                                       54: (0, 28),
+                                       39: (0, 30),
+                                       1: (0, 68),
+                                       11: (0, 67),
+                                       55: (0, 120)},
+                                  35: {20: (1, {'@': 58}),
+                                       1: (1, {'@': 58}),
+                                       10: (1, {'@': 58}),
+                                       11: (1, {'@': 58}),
+                                       3: (1, {'@': 58}),
+                                       12: (1, {'@': 58}),
+                                       4: (1, {'@': 58}),
+                                       21: (1, {'@': 58}),
+                                       5: (1, {'@': 58}),
+                                       22: (1, {'@': 58}),
+                                       6: (1, {'@': 58}),
+                                       23: (1, {'@': 58}),
+                                       7: (1, {'@': 58}),
+                                       15: (1, {'@': 58}),
+                                       16: (1, {'@': 58}),
+                                       19: (1, {'@': 58}),
+                                       18: (1, {'@': 58})},
+                                  36: {1: (1, {'@': 100}),
+                                       5: (1, {'@': 100}),
+                                       26: (1, {'@': 100}),
+                                       6: (1, {'@': 100}),
+                                       3: (1, {'@': 100}),
+                                       7: (1, {'@': 100}),
+                                       12: (1, {'@': 100}),
+                                       16: (1, {'@': 100}),
+                                       4: (1, {'@': 100}),
+                                       18: (1, {'@': 100}),
+                                       19: (1, {'@': 100})},
+                                  37: {0: (1, {'@': 142}),
+                                       1: (1, {'@': 142}),
+                                       10: (1, {'@': 142}),
+                                       2: (1, {'@': 142}),
+                                       11: (1, {'@': 142}),
+                                       18: (1, {'@': 142}),
+                                       3: (1, {'@': 142}),
+                                       4: (1, {'@': 142}),
+                                       12: (1, {'@': 142}),
+                                       13: (1, {'@': 142}),
+                                       5: (1, {'@': 142}),
+                                       6: (1, {'@': 142}),
+                                       25: (1, {'@': 142}),
+                                       14: (1, {'@': 142}),
+                                       7: (1, {'@': 142}),
+                                       15: (1, {'@': 142}),
+                                       16: (1, {'@': 142}),
+                                       8: (1, {'@': 142}),
+                                       9: (1, {'@': 142}),
+                                       17: (1, {'@': 142}),
+                                       19: (1, {'@': 142})},
+                                  38: {0: (1, {'@': 203}),
+                                       1: (1, {'@': 203}),
+                                       2: (1, {'@': 203}),
+                                       3: (1, {'@': 203}),
+                                       4: (1, {'@': 203}),
+                                       5: (1, {'@': 203}),
+                                       6: (1, {'@': 203}),
+                                       7: (1, {'@': 203}),
+                                       8: (1, {'@': 203}),
+                                       9: (1, {'@': 203}),
+                                       10: (1, {'@': 203}),
+                                       11: (1, {'@': 203}),
+                                       12: (1, {'@': 203}),
+                                       13: (1, {'@': 203}),
+                                       14: (1, {'@': 203}),
+                                       15: (1, {'@': 203}),
+                                       16: (1, {'@': 203}),
+                                       17: (1, {'@': 203}),
+                                       18: (1, {'@': 203}),
+                                       19: (1, {'@': 203})},
+                                  39: {0: (1, {'@': 150}),
+                                       1: (1, {'@': 150}),
+                                       10: (1, {'@': 150}),
+                                       2: (1, {'@': 150}),
+                                       24: (1, {'@': 150}),
+                                       11: (1, {'@': 150}),
+                                       18: (1, {'@': 150}),
+                                       3: (1, {'@': 150}),
+                                       4: (1, {'@': 150}),
+                                       12: (1, {'@': 150}),
+                                       13: (1, {'@': 150}),
+                                       5: (1, {'@': 150}),
+                                       6: (1, {'@': 150}),
+                                       14: (1, {'@': 150}),
+                                       7: (1, {'@': 150}),
+                                       15: (1, {'@': 150}),
+                                       17: (1, {'@': 150}),
+                                       8: (1, {'@': 150}),
+                                       9: (1, {'@': 150}),
+                                       19: (1, {'@': 150}),
+                                       16: (1, {'@': 150})},
+                                  40: {56: (0, 204), 57: (0, 60)},
+                                  41: {1: (1, {'@': 104}),
+                                       5: (1, {'@': 104}),
+                                       26: (1, {'@': 104}),
+                                       6: (1, {'@': 104}),
+                                       3: (1, {'@': 104}),
+                                       7: (1, {'@': 104}),
+                                       12: (1, {'@': 104}),
+                                       16: (1, {'@': 104}),
+                                       4: (1, {'@': 104}),
+                                       18: (1, {'@': 104}),
+                                       19: (1, {'@': 104})},
+                                  42: {29: (0, 44),
+                                       1: (0, 46),
+                                       31: (0, 121),
+                                       15: (0, 161),
+                                       5: (0, 207),
+                                       32: (0, 4),
+                                       16: (0, 34),
+                                       12: (0, 216),
+                                       7: (0, 15),
+                                       19: (0, 27),
+                                       33: (0, 53),
+                                       3: (0, 56),
+                                       34: (0, 21),
+                                       6: (0, 25),
+                                       35: (0, 118),
+                                       10: (0, 122),
+                                       36: (0, 123),
+                                       37: (0, 158),
+                                       4: (0, 150),
+                                       18: (0, 195),
+                                       39: (0, 30),
+                                       40: (0, 128),
+                                       11: (0, 67),
+                                       38: (0, 85),
+                                       0: (1, {'@': 155}),
+                                       2: (1, {'@': 155}),
+                                       13: (1, {'@': 155}),
+                                       25: (1, {'@': 155}),
+                                       14: (1, {'@': 155}),
+                                       8: (1, {'@': 155}),
+                                       9: (1, {'@': 155}),
+                                       17: (1, {'@': 155}),
+                                       24: (1, {'@': 155})},
+                                  43: {31: (0, 31),
+                                       1: (0, 36),
+                                       40: (0, 41),
+                                       5: (0, 207),
+                                       16: (0, 34),
+                                       12: (0, 216),
+                                       26: (0, 217),
+                                       7: (0, 15),
+                                       19: (0, 27),
+                                       33: (0, 53),
+                                       29: (0, 55),
+                                       3: (0, 56),
+                                       6: (0, 25),
+                                       35: (0, 118),
+                                       4: (0, 150),
+                                       18: (0, 195),
+                                       34: (0, 45),
+                                       58: (0, 189)},
+                                  44: {0: (1, {'@': 159}),
+                                       1: (1, {'@': 159}),
+                                       10: (1, {'@': 159}),
+                                       2: (1, {'@': 159}),
+                                       24: (1, {'@': 159}),
+                                       11: (1, {'@': 159}),
+                                       18: (1, {'@': 159}),
+                                       3: (1, {'@': 159}),
+                                       4: (1, {'@': 159}),
+                                       12: (1, {'@': 159}),
+                                       13: (1, {'@': 159}),
+                                       5: (1, {'@': 159}),
+                                       6: (1, {'@': 159}),
+                                       25: (1, {'@': 159}),
+                                       14: (1, {'@': 159}),
+                                       7: (1, {'@': 159}),
+                                       15: (1, {'@': 159}),
+                                       16: (1, {'@': 159}),
+                                       8: (1, {'@': 159}),
+                                       9: (1, {'@': 159}),
+                                       17: (1, {'@': 159}),
+                                       19: (1, {'@': 159})},
+                                  45: {1: (1, {'@': 101}),
+                                       5: (1, {'@': 101}),
+                                       26: (1, {'@': 101}),
+                                       6: (1, {'@': 101}),
+                                       3: (1, {'@': 101}),
+                                       7: (1, {'@': 101}),
+                                       12: (1, {'@': 101}),
+                                       16: (1, {'@': 101}),
+                                       4: (1, {'@': 101}),
+                                       18: (1, {'@': 101}),
+                                       19: (1, {'@': 101})},
+                                  46: {0: (1, {'@': 156}),
+                                       1: (1, {'@': 156}),
+                                       10: (1, {'@': 156}),
+                                       2: (1, {'@': 156}),
+                                       24: (1, {'@': 156}),
+                                       11: (1, {'@': 156}),
+                                       18: (1, {'@': 156}),
+                                       3: (1, {'@': 156}),
+                                       4: (1, {'@': 156}),
+                                       12: (1, {'@': 156}),
+                                       13: (1, {'@': 156}),
+                                       5: (1, {'@': 156}),
+                                       6: (1, {'@': 156}),
+                                       25: (1, {'@': 156}),
+                                       14: (1, {'@': 156}),
+                                       7: (1, {'@': 156}),
+                                       15: (1, {'@': 156}),
+                                       16: (1, {'@': 156}),
+                                       8: (1, {'@': 156}),
+                                       9: (1, {'@': 156}),
+                                       17: (1, {'@': 156}),
+                                       19: (1, {'@': 156})},
+                                  47: {10: (1, {'@': 130}),
+                                       5: (1, {'@': 130}),
+                                       6: (1, {'@': 130}),
+                                       11: (1, {'@': 130}),
+                                       3: (1, {'@': 130}),
+                                       7: (1, {'@': 130}),
+                                       12: (1, {'@': 130}),
+                                       15: (1, {'@': 130}),
+                                       4: (1, {'@': 130}),
+                                       18: (1, {'@': 130}),
+                                       19: (1, {'@': 130})},
+                                  48: {0: (1, {'@': 124}),
+                                       1: (1, {'@': 124}),
+                                       10: (1, {'@': 124}),
+                                       2: (1, {'@': 124}),
+                                       11: (1, {'@': 124}),
+                                       18: (1, {'@': 124}),
+                                       3: (1, {'@': 124}),
+                                       4: (1, {'@': 124}),
+                                       12: (1, {'@': 124}),
+                                       13: (1, {'@': 124}),
+                                       5: (1, {'@': 124}),
+                                       25: (1, {'@': 124}),
+                                       6: (1, {'@': 124}),
+                                       14: (1, {'@': 124}),
+                                       7: (1, {'@': 124}),
+                                       15: (1, {'@': 124}),
+                                       16: (1, {'@': 124}),
+                                       8: (1, {'@': 124}),
+                                       9: (1, {'@': 124}),
+                                       17: (1, {'@': 124}),
+                                       19: (1, {'@': 124})},
+                                  49: {0: (1, {'@': 42}),
+                                       10: (1, {'@': 42}),
+                                       2: (1, {'@': 42}),
+                                       11: (1, {'@': 42}),
+                                       3: (1, {'@': 42}),
+                                       12: (1, {'@': 42}),
+                                       9: (1, {'@': 42}),
+                                       4: (1, {'@': 42}),
+                                       13: (1, {'@': 42}),
+                                       5: (1, {'@': 42}),
+                                       6: (1, {'@': 42}),
+                                       14: (1, {'@': 42}),
+                                       7: (1, {'@': 42}),
+                                       15: (1, {'@': 42}),
+                                       16: (1, {'@': 42}),
+                                       8: (1, {'@': 42}),
+                                       18: (1, {'@': 42}),
+                                       17: (1, {'@': 42}),
+                                       19: (1, {'@': 42})},
+                                  50: {13: (1, {'@': 181}),
+                                       20: (1, {'@': 181}),
+                                       10: (1, {'@': 181}),
+                                       5: (1, {'@': 181}),
+                                       1: (1, {'@': 181}),
+                                       11: (1, {'@': 181}),
+                                       3: (1, {'@': 181}),
+                                       7: (1, {'@': 181}),
+                                       12: (1, {'@': 181}),
+                                       15: (1, {'@': 181}),
+                                       4: (1, {'@': 181}),
+                                       18: (1, {'@': 181}),
+                                       19: (1, {'@': 181}),
+                                       16: (1, {'@': 181})},
+                                  51: {59: (0, 132),
+                                       60: (0, 155),
+                                       61: (0, 146),
+                                       62: (0, 167)},
+                                  52: {0: (1, {'@': 213}),
+                                       1: (1, {'@': 213}),
+                                       2: (1, {'@': 213}),
+                                       3: (1, {'@': 213}),
+                                       4: (1, {'@': 213}),
+                                       5: (1, {'@': 213}),
+                                       25: (1, {'@': 213}),
+                                       6: (1, {'@': 213}),
+                                       7: (1, {'@': 213}),
+                                       8: (1, {'@': 213}),
+                                       9: (1, {'@': 213}),
+                                       10: (1, {'@': 213}),
+                                       11: (1, {'@': 213}),
+                                       12: (1, {'@': 213}),
+                                       13: (1, {'@': 213}),
+                                       14: (1, {'@': 213}),
+                                       15: (1, {'@': 213}),
+                                       16: (1, {'@': 213}),
+                                       17: (1, {'@': 213}),
+                                       18: (1, {'@': 213}),
+                                       19: (1, {'@': 213})},
+                                  53: {0: (1, {'@': 65}),
+                                       1: (1, {'@': 65}),
+                                       10: (1, {'@': 65}),
+                                       2: (1, {'@': 65}),
+                                       24: (1, {'@': 65}),
+                                       11: (1, {'@': 65}),
+                                       18: (1, {'@': 65}),
+                                       3: (1, {'@': 65}),
+                                       4: (1, {'@': 65}),
+                                       12: (1, {'@': 65}),
+                                       13: (1, {'@': 65}),
+                                       5: (1, {'@': 65}),
+                                       6: (1, {'@': 65}),
+                                       25: (1, {'@': 65}),
+                                       14: (1, {'@': 65}),
+                                       7: (1, {'@': 65}),
+                                       15: (1, {'@': 65}),
+                                       16: (1, {'@': 65}),
+                                       8: (1, {'@': 65}),
+                                       9: (1, {'@': 65}),
+                                       17: (1, {'@': 65}),
+                                       19: (1, {'@': 65}),
+                                       20: (1, {'@': 65}),
+                                       26: (1, {'@': 65}),
+                                       27: (1, {'@': 65}),
+                                       28: (1, {'@': 65})},
+                                  54: {1: (0, 137)},
+                                  55: {1: (1, {'@': 102}),
+                                       5: (1, {'@': 102}),
+                                       26: (1, {'@': 102}),
+                                       6: (1, {'@': 102}),
+                                       3: (1, {'@': 102}),
+                                       7: (1, {'@': 102}),
+                                       12: (1, {'@': 102}),
+                                       16: (1, {'@': 102}),
+                                       4: (1, {'@': 102}),
+                                       18: (1, {'@': 102}),
+                                       19: (1, {'@': 102})},
+                                  56: {0: (1, {'@': 48}),
+                                       1: (1, {'@': 48}),
+                                       10: (1, {'@': 48}),
+                                       2: (1, {'@': 48}),
+                                       24: (1, {'@': 48}),
+                                       11: (1, {'@': 48}),
+                                       18: (1, {'@': 48}),
+                                       3: (1, {'@': 48}),
+                                       4: (1, {'@': 48}),
+                                       12: (1, {'@': 48}),
+                                       13: (1, {'@': 48}),
+                                       5: (1, {'@': 48}),
+                                       6: (1, {'@': 48}),
+                                       25: (1, {'@': 48}),
+                                       14: (1, {'@': 48}),
+                                       7: (1, {'@': 48}),
+                                       15: (1, {'@': 48}),
+                                       16: (1, {'@': 48}),
+                                       8: (1, {'@': 48}),
+                                       9: (1, {'@': 48}),
+                                       17: (1, {'@': 48}),
+                                       19: (1, {'@': 48}),
+                                       20: (1, {'@': 48}),
+                                       21: (1, {'@': 48}),
+                                       22: (1, {'@': 48}),
+                                       23: (1, {'@': 48}),
+                                       26: (1, {'@': 48}),
+                                       27: (1, {'@': 48}),
+                                       28: (1, {'@': 48})},
+                                  57: {0: (1, {'@': 44}),
+                                       10: (1, {'@': 44}),
+                                       2: (1, {'@': 44}),
+                                       11: (1, {'@': 44}),
+                                       3: (1, {'@': 44}),
+                                       12: (1, {'@': 44}),
+                                       9: (1, {'@': 44}),
+                                       4: (1, {'@': 44}),
+                                       13: (1, {'@': 44}),
+                                       5: (1, {'@': 44}),
+                                       6: (1, {'@': 44}),
+                                       14: (1, {'@': 44}),
+                                       7: (1, {'@': 44}),
+                                       15: (1, {'@': 44}),
+                                       16: (1, {'@': 44}),
+                                       8: (1, {'@': 44}),
+                                       18: (1, {'@': 44}),
+                                       17: (1, {'@': 44}),
+                                       19: (1, {'@': 44})},
+                                  58: {29: (0, 208),
+                                       40: (0, 142),
+                                       15: (0, 161),
+                                       16: (0, 179),
+                                       53: (0, 116),
+                                       5: (0, 207),
+                                       32: (0, 4),
+                                       12: (0, 216),
+                                       7: (0, 15),
+                                       19: (0, 27),
+                                       33: (0, 53),
+                                       3: (0, 56),
+                                       36: (0, 75),
+                                       20: (0, 117),
+                                       35: (0, 118),
+                                       10: (0, 122),
+                                       37: (0, 158),
+                                       4: (0, 150),
+                                       18: (0, 195),
+                                       54: (0, 28),
+                                       39: (0, 30),
+                                       1: (0, 68),
+                                       11: (0, 67),
+                                       55: (0, 120),
+                                       21: (1, {'@': 52}),
+                                       22: (1, {'@': 52}),
+                                       6: (1, {'@': 52}),
+                                       23: (1, {'@': 52})},
+                                  59: {13: (1, {'@': 180}),
+                                       20: (1, {'@': 180}),
+                                       10: (1, {'@': 180}),
+                                       5: (1, {'@': 180}),
+                                       1: (1, {'@': 180}),
+                                       11: (1, {'@': 180}),
+                                       3: (1, {'@': 180}),
+                                       7: (1, {'@': 180}),
+                                       12: (1, {'@': 180}),
+                                       15: (1, {'@': 180}),
+                                       4: (1, {'@': 180}),
+                                       18: (1, {'@': 180}),
+                                       19: (1, {'@': 180}),
+                                       16: (1, {'@': 180})},
+                                  60: {63: (1, {'@': 176})},
+                                  61: {0: (1, {'@': 149}),
+                                       1: (1, {'@': 149}),
+                                       10: (1, {'@': 149}),
+                                       2: (1, {'@': 149}),
+                                       24: (1, {'@': 149}),
+                                       11: (1, {'@': 149}),
+                                       18: (1, {'@': 149}),
+                                       3: (1, {'@': 149}),
+                                       4: (1, {'@': 149}),
+                                       12: (1, {'@': 149}),
+                                       13: (1, {'@': 149}),
+                                       5: (1, {'@': 149}),
+                                       6: (1, {'@': 149}),
+                                       14: (1, {'@': 149}),
+                                       7: (1, {'@': 149}),
+                                       15: (1, {'@': 149}),
+                                       17: (1, {'@': 149}),
+                                       8: (1, {'@': 149}),
+                                       9: (1, {'@': 149}),
+                                       19: (1, {'@': 149}),
+                                       16: (1, {'@': 149})},
+                                  62: {20: (1, {'@': 60}),
+                                       1: (1, {'@': 60}),
+                                       10: (1, {'@': 60}),
+                                       11: (1, {'@': 60}),
+                                       3: (1, {'@': 60}),
+                                       12: (1, {'@': 60}),
+                                       4: (1, {'@': 60}),
+                                       21: (1, {'@': 60}),
+                                       5: (1, {'@': 60}),
+                                       22: (1, {'@': 60}),
+                                       6: (1, {'@': 60}),
+                                       23: (1, {'@': 60}),
+                                       7: (1, {'@': 60}),
+                                       15: (1, {'@': 60}),
+                                       16: (1, {'@': 60}),
+                                       19: (1, {'@': 60}),
+                                       18: (1, {'@': 60})},
+                                  63: {0: (1, {'@': 147}),
+                                       1: (1, {'@': 147}),
+                                       10: (1, {'@': 147}),
+                                       2: (1, {'@': 147}),
+                                       24: (1, {'@': 147}),
+                                       11: (1, {'@': 147}),
+                                       18: (1, {'@': 147}),
+                                       3: (1, {'@': 147}),
+                                       4: (1, {'@': 147}),
+                                       12: (1, {'@': 147}),
+                                       13: (1, {'@': 147}),
+                                       5: (1, {'@': 147}),
+                                       6: (1, {'@': 147}),
+                                       14: (1, {'@': 147}),
+                                       7: (1, {'@': 147}),
+                                       15: (1, {'@': 147}),
+                                       17: (1, {'@': 147}),
+                                       8: (1, {'@': 147}),
+                                       9: (1, {'@': 147}),
+                                       19: (1, {'@': 147}),
+                                       16: (1, {'@': 147})},
+                                  64: {20: (1, {'@': 61}),
+                                       1: (1, {'@': 61}),
+                                       10: (1, {'@': 61}),
+                                       11: (1, {'@': 61}),
+                                       3: (1, {'@': 61}),
+                                       12: (1, {'@': 61}),
+                                       4: (1, {'@': 61}),
+                                       21: (1, {'@': 61}),
+                                       5: (1, {'@': 61}),
+                                       22: (1, {'@': 61}),
+                                       6: (1, {'@': 61}),
+                                       23: (1, {'@': 61}),
+                                       7: (1, {'@': 61}),
+                                       15: (1, {'@': 61}),
+                                       16: (1, {'@': 61}),
+                                       19: (1, {'@': 61}),
+                                       18: (1, {'@': 61})},
+                                  65: {13: (1, {'@': 215}),
+                                       20: (1, {'@': 215}),
+                                       10: (1, {'@': 215}),
+                                       5: (1, {'@': 215}),
+                                       1: (1, {'@': 215}),
+                                       11: (1, {'@': 215}),
+                                       3: (1, {'@': 215}),
+                                       7: (1, {'@': 215}),
+                                       12: (1, {'@': 215}),
+                                       15: (1, {'@': 215}),
+                                       4: (1, {'@': 215}),
+                                       18: (1, {'@': 215}),
+                                       19: (1, {'@': 215}),
+                                       16: (1, {'@': 215})},
+                                  66: {0: (1, {'@': 207}),
+                                       1: (1, {'@': 207}),
+                                       2: (1, {'@': 207}),
+                                       3: (1, {'@': 207}),
+                                       4: (1, {'@': 207}),
+                                       5: (1, {'@': 207}),
+                                       6: (1, {'@': 207}),
+                                       25: (1, {'@': 207}),
+                                       7: (1, {'@': 207}),
+                                       8: (1, {'@': 207}),
+                                       9: (1, {'@': 207}),
+                                       10: (1, {'@': 207}),
+                                       11: (1, {'@': 207}),
+                                       12: (1, {'@': 207}),
+                                       13: (1, {'@': 207}),
+                                       14: (1, {'@': 207}),
+                                       15: (1, {'@': 207}),
+                                       16: (1, {'@': 207}),
+                                       17: (1, {'@': 207}),
+                                       18: (1, {'@': 207}),
+                                       19: (1, {'@': 207})},
+                                  67: {58: (0, 29),
+                                       31: (0, 31),
+                                       1: (0, 36),
+                                       40: (0, 41),
+                                       5: (0, 207),
+                                       16: (0, 34),
+                                       64: (0, 43),
+                                       12: (0, 216),
+                                       7: (0, 15),
+                                       19: (0, 27),
+                                       33: (0, 53),
+                                       29: (0, 55),
+                                       3: (0, 56),
+                                       6: (0, 25),
+                                       35: (0, 118),
+                                       4: (0, 150),
+                                       18: (0, 195),
+                                       34: (0, 45)},
+                                  68: {10: (1, {'@': 184}),
+                                       20: (1, {'@': 184}),
+                                       5: (1, {'@': 184}),
+                                       1: (1, {'@': 184}),
+                                       11: (1, {'@': 184}),
+                                       3: (1, {'@': 184}),
+                                       7: (1, {'@': 184}),
+                                       12: (1, {'@': 184}),
+                                       15: (1, {'@': 184}),
+                                       4: (1, {'@': 184}),
+                                       18: (1, {'@': 184}),
+                                       19: (1, {'@': 184}),
+                                       16: (1, {'@': 184}),
+                                       13: (1, {'@': 184})},
+                                  69: {0: (1, {'@': 209}),
+                                       1: (1, {'@': 209}),
+                                       2: (1, {'@': 209}),
+                                       3: (1, {'@': 209}),
+                                       4: (1, {'@': 209}),
+                                       5: (1, {'@': 209}),
+                                       6: (1, {'@': 209}),
+                                       7: (1, {'@': 209}),
+                                       8: (1, {'@': 209}),
+                                       9: (1, {'@': 209}),
+                                       10: (1, {'@': 209}),
+                                       24: (1, {'@': 209}),
+                                       11: (1, {'@': 209}),
+                                       12: (1, {'@': 209}),
+                                       13: (1, {'@': 209}),
+                                       14: (1, {'@': 209}),
+                                       15: (1, {'@': 209}),
+                                       17: (1, {'@': 209}),
+                                       18: (1, {'@': 209}),
+                                       19: (1, {'@': 209}),
+                                       16: (1, {'@': 209})},
+                                  70: {36: (0, 181),
+                                       29: (0, 183),
+                                       40: (0, 186),
+                                       15: (0, 161),
+                                       32: (0, 4),
+                                       5: (0, 207),
+                                       12: (0, 216),
+                                       65: (0, 107),
+                                       7: (0, 15),
+                                       19: (0, 27),
+                                       33: (0, 53),
+                                       1: (0, 32),
+                                       3: (0, 56),
+                                       6: (0, 25),
+                                       35: (0, 118),
+                                       34: (0, 200),
+                                       10: (0, 122),
+                                       37: (0, 158),
+                                       4: (0, 150),
+                                       18: (0, 195),
+                                       51: (0, 26),
+                                       39: (0, 30),
+                                       50: (0, 37),
+                                       11: (0, 67),
+                                       0: (1, {'@': 132}),
+                                       2: (1, {'@': 132}),
+                                       13: (1, {'@': 132}),
+                                       25: (1, {'@': 132}),
+                                       14: (1, {'@': 132}),
+                                       16: (1, {'@': 132}),
+                                       8: (1, {'@': 132}),
+                                       9: (1, {'@': 132}),
+                                       17: (1, {'@': 132})},
+                                  71: {20: (1, {'@': 73}),
+                                       10: (1, {'@': 73}),
+                                       1: (1, {'@': 73}),
+                                       11: (1, {'@': 73}),
+                                       3: (1, {'@': 73}),
+                                       12: (1, {'@': 73}),
+                                       4: (1, {'@': 73}),
+                                       5: (1, {'@': 73}),
+                                       22: (1, {'@': 73}),
+                                       6: (1, {'@': 73}),
+                                       23: (1, {'@': 73}),
+                                       7: (1, {'@': 73}),
+                                       15: (1, {'@': 73}),
+                                       16: (1, {'@': 73}),
+                                       18: (1, {'@': 73}),
+                                       19: (1, {'@': 73})},
+                                  72: {0: (1, {'@': 85}),
+                                       1: (1, {'@': 85}),
+                                       10: (1, {'@': 85}),
+                                       2: (1, {'@': 85}),
+                                       24: (1, {'@': 85}),
+                                       11: (1, {'@': 85}),
+                                       18: (1, {'@': 85}),
+                                       3: (1, {'@': 85}),
+                                       4: (1, {'@': 85}),
+                                       12: (1, {'@': 85}),
+                                       13: (1, {'@': 85}),
+                                       5: (1, {'@': 85}),
+                                       6: (1, {'@': 85}),
+                                       25: (1, {'@': 85}),
+                                       14: (1, {'@': 85}),
+                                       7: (1, {'@': 85}),
+                                       15: (1, {'@': 85}),
+                                       16: (1, {'@': 85}),
+                                       8: (1, {'@': 85}),
+                                       9: (1, {'@': 85}),
+                                       17: (1, {'@': 85}),
+                                       19: (1, {'@': 85}),
+                                       20: (1, {'@': 85}),
+                                       21: (1, {'@': 85}),
+                                       22: (1, {'@': 85}),
+                                       23: (1, {'@': 85}),
+                                       27: (1, {'@': 85})},
+                                  73: {0: (1, {'@': 125}),
+                                       1: (1, {'@': 125}),
+                                       10: (1, {'@': 125}),
+                                       2: (1, {'@': 125}),
+                                       11: (1, {'@': 125}),
+                                       18: (1, {'@': 125}),
+                                       3: (1, {'@': 125}),
+                                       4: (1, {'@': 125}),
+                                       12: (1, {'@': 125}),
+                                       13: (1, {'@': 125}),
+                                       5: (1, {'@': 125}),
+                                       25: (1, {'@': 125}),
+                                       6: (1, {'@': 125}),
+                                       14: (1, {'@': 125}),
+                                       7: (1, {'@': 125}),
+                                       15: (1, {'@': 125}),
+                                       16: (1, {'@': 125}),
+                                       8: (1, {'@': 125}),
+                                       9: (1, {'@': 125}),
+                                       17: (1, {'@': 125}),
+                                       19: (1, {'@': 125})},
+                                  74: {0: (1, {'@': 117}),
+                                       1: (1, {'@': 117}),
+                                       10: (1, {'@': 117}),
+                                       2: (1, {'@': 117}),
+                                       11: (1, {'@': 117}),
+                                       18: (1, {'@': 117}),
+                                       3: (1, {'@': 117}),
+                                       4: (1, {'@': 117}),
+                                       12: (1, {'@': 117}),
+                                       13: (1, {'@': 117}),
+                                       5: (1, {'@': 117}),
+                                       6: (1, {'@': 117}),
+                                       14: (1, {'@': 117}),
+                                       7: (1, {'@': 117}),
+                                       15: (1, {'@': 117}),
+                                       16: (1, {'@': 117}),
+                                       8: (1, {'@': 117}),
+                                       9: (1, {'@': 117}),
+                                       17: (1, {'@': 117}),
+                                       19: (1, {'@': 117})},
+                                  75: {10: (1, {'@': 185}),
+                                       20: (1, {'@': 185}),
+                                       5: (1, {'@': 185}),
+                                       1: (1, {'@': 185}),
+                                       11: (1, {'@': 185}),
+                                       3: (1, {'@': 185}),
+                                       7: (1, {'@': 185}),
+                                       12: (1, {'@': 185}),
+                                       15: (1, {'@': 185}),
+                                       4: (1, {'@': 185}),
+                                       18: (1, {'@': 185}),
+                                       19: (1, {'@': 185}),
+                                       16: (1, {'@': 185}),
+                                       13: (1, {'@': 185})},
+                                  76: {0: (1, {'@': 121}),
+                                       1: (1, {'@': 121}),
+                                       10: (1, {'@': 121}),
+                                       2: (1, {'@': 121}),
+                                       11: (1, {'@': 121}),
+                                       18: (1, {'@': 121}),
+                                       3: (1, {'@': 121}),
+                                       4: (1, {'@': 121}),
+                                       12: (1, {'@': 121}),
+                                       13: (1, {'@': 121}),
+                                       5: (1, {'@': 121}),
+                                       6: (1, {'@': 121}),
+                                       14: (1, {'@': 121}),
+                                       7: (1, {'@': 121}),
+                                       15: (1, {'@': 121}),
+                                       16: (1, {'@': 121}),
+                                       8: (1, {'@': 121}),
+                                       9: (1, {'@': 121}),
+                                       17: (1, {'@': 121}),
+                                       19: (1, {'@': 121})},
+                                  77: {0: (1, {'@': 40}),
+                                       10: (1, {'@': 40}),
+                                       2: (1, {'@': 40}),
+                                       11: (1, {'@': 40}),
+                                       3: (1, {'@': 40}),
+                                       12: (1, {'@': 40}),
+                                       9: (1, {'@': 40}),
+                                       4: (1, {'@': 40}),
+                                       13: (1, {'@': 40}),
+                                       5: (1, {'@': 40}),
+                                       6: (1, {'@': 40}),
+                                       14: (1, {'@': 40}),
+                                       7: (1, {'@': 40}),
+                                       15: (1, {'@': 40}),
+                                       16: (1, {'@': 40}),
+                                       8: (1, {'@': 40}),
+                                       18: (1, {'@': 40}),
+                                       17: (1, {'@': 40}),
+                                       19: (1, {'@': 40})},
+                                  78: {0: (1, {'@': 169}),
+                                       1: (1, {'@': 169}),
+                                       10: (1, {'@': 169}),
+                                       2: (1, {'@': 169}),
+                                       11: (1, {'@': 169}),
+                                       18: (1, {'@': 169}),
+                                       3: (1, {'@': 169}),
+                                       4: (1, {'@': 169}),
+                                       12: (1, {'@': 169}),
+                                       13: (1, {'@': 169}),
+                                       5: (1, {'@': 169}),
+                                       25: (1, {'@': 169}),
+                                       6: (1, {'@': 169}),
+                                       14: (1, {'@': 169}),
+                                       7: (1, {'@': 169}),
+                                       15: (1, {'@': 169}),
+                                       16: (1, {'@': 169}),
+                                       8: (1, {'@': 169}),
+                                       9: (1, {'@': 169}),
+                                       17: (1, {'@': 169}),
+                                       19: (1, {'@': 169})},
+                                  79: {1: (0, 74),
+                                       15: (0, 161),
+                                       66: (0, 12),
+                                       5: (0, 207),
+                                       32: (0, 4),
+                                       16: (0, 34),
+                                       12: (0, 216),
+                                       7: (0, 15),
+                                       19: (0, 27),
+                                       33: (0, 53),
+                                       31: (0, 76),
+                                       3: (0, 56),
+                                       6: (0, 25),
+                                       35: (0, 118),
+                                       10: (0, 122),
+                                       37: (0, 158),
+                                       29: (0, 89),
+                                       36: (0, 81),
+                                       40: (0, 95),
+                                       4: (0, 150),
+                                       18: (0, 195),
+                                       34: (0, 100),
+                                       39: (0, 30),
+                                       11: (0, 67),
+                                       0: (1, {'@': 116}),
+                                       2: (1, {'@': 116}),
+                                       9: (1, {'@': 116}),
+                                       13: (1, {'@': 116}),
+                                       14: (1, {'@': 116}),
+                                       8: (1, {'@': 116}),
+                                       17: (1, {'@': 116})},
+                                  80: {0: (1, {'@': 46}),
+                                       10: (1, {'@': 46}),
+                                       2: (1, {'@': 46}),
+                                       11: (1, {'@': 46}),
+                                       3: (1, {'@': 46}),
+                                       12: (1, {'@': 46}),
+                                       9: (1, {'@': 46}),
+                                       4: (1, {'@': 46}),
+                                       13: (1, {'@': 46}),
+                                       5: (1, {'@': 46}),
+                                       6: (1, {'@': 46}),
+                                       14: (1, {'@': 46}),
+                                       7: (1, {'@': 46}),
+                                       15: (1, {'@': 46}),
+                                       16: (1, {'@': 46}),
+                                       8: (1, {'@': 46}),
+                                       18: (1, {'@': 46}),
+                                       17: (1, {'@': 46}),
+                                       19: (1, {'@': 46})},
+                                  81: {0: (1, {'@': 118}),
+                                       1: (1, {'@': 118}),
+                                       10: (1, {'@': 118}),
+                                       2: (1, {'@': 118}),
+                                       11: (1, {'@': 118}),
+                                       18: (1, {'@': 118}),
+                                       3: (1, {'@': 118}),
+                                       4: (1, {'@': 118}),
+                                       12: (1, {'@': 118}),
+                                       13: (1, {'@': 118}),
+                                       5: (1, {'@': 118}),
+                                       6: (1, {'@': 118}),
+                                       14: (1, {'@': 118}),
+                                       7: (1, {'@': 118}),
+                                       15: (1, {'@': 118}),
+                                       16: (1, {'@': 118}),
+                                       8: (1, {'@': 118}),
+                                       9: (1, {'@': 118}),
+                                       17: (1, {'@': 118}),
+                                       19: (1, {'@': 118})},
+                                  82: {0: (1, {'@': 172}),
+                                       1: (1, {'@': 172}),
+                                       10: (1, {'@': 172}),
+                                       2: (1, {'@': 172}),
+                                       11: (1, {'@': 172}),
+                                       18: (1, {'@': 172}),
+                                       3: (1, {'@': 172}),
+                                       4: (1, {'@': 172}),
+                                       12: (1, {'@': 172}),
+                                       13: (1, {'@': 172}),
+                                       5: (1, {'@': 172}),
+                                       25: (1, {'@': 172}),
+                                       6: (1, {'@': 172}),
+                                       14: (1, {'@': 172}),
+                                       7: (1, {'@': 172}),
+                                       15: (1, {'@': 172}),
+                                       16: (1, {'@': 172}),
+                                       8: (1, {'@': 172}),
+                                       9: (1, {'@': 172}),
+                                       17: (1, {'@': 172}),
+                                       19: (1, {'@': 172})},
+                                  83: {13: (1, {'@': 214}),
+                                       20: (1, {'@': 214}),
+                                       10: (1, {'@': 214}),
+                                       5: (1, {'@': 214}),
+                                       1: (1, {'@': 214}),
+                                       11: (1, {'@': 214}),
+                                       3: (1, {'@': 214}),
+                                       7: (1, {'@': 214}),
+                                       12: (1, {'@': 214}),
+                                       15: (1, {'@': 214}),
+                                       4: (1, {'@': 214}),
+                                       18: (1, {'@': 214}),
+                                       19: (1, {'@': 214}),
+                                       16: (1, {'@': 214})},
+                                  84: {0: (1, {'@': 126}),
+                                       1: (1, {'@': 126}),
+                                       10: (1, {'@': 126}),
+                                       2: (1, {'@': 126}),
+                                       11: (1, {'@': 126}),
+                                       18: (1, {'@': 126}),
+                                       3: (1, {'@': 126}),
+                                       4: (1, {'@': 126}),
+                                       12: (1, {'@': 126}),
+                                       13: (1, {'@': 126}),
+                                       5: (1, {'@': 126}),
+                                       25: (1, {'@': 126}),
+                                       6: (1, {'@': 126}),
+                                       14: (1, {'@': 126}),
+                                       7: (1, {'@': 126}),
+                                       15: (1, {'@': 126}),
+                                       16: (1, {'@': 126}),
+                                       8: (1, {'@': 126}),
+                                       9: (1, {'@': 126}),
+                                       17: (1, {'@': 126}),
+                                       19: (1, {'@': 126})},
+                                  85: {0: (1, {'@': 211}),
+                                       1: (1, {'@': 211}),
+                                       2: (1, {'@': 211}),
+                                       3: (1, {'@': 211}),
+                                       4: (1, {'@': 211}),
+                                       5: (1, {'@': 211}),
+                                       6: (1, {'@': 211}),
+                                       25: (1, {'@': 211}),
+                                       7: (1, {'@': 211}),
+                                       8: (1, {'@': 211}),
+                                       9: (1, {'@': 211}),
+                                       10: (1, {'@': 211}),
+                                       24: (1, {'@': 211}),
+                                       11: (1, {'@': 211}),
+                                       12: (1, {'@': 211}),
+                                       13: (1, {'@': 211}),
+                                       14: (1, {'@': 211}),
+                                       15: (1, {'@': 211}),
+                                       16: (1, {'@': 211}),
+                                       17: (1, {'@': 211}),
+                                       18: (1, {'@': 211}),
+                                       19: (1, {'@': 211})},
+                                  86: {0: (1, {'@': 174}),
+                                       1: (1, {'@': 174}),
+                                       10: (1, {'@': 174}),
+                                       2: (1, {'@': 174}),
+                                       11: (1, {'@': 174}),
+                                       18: (1, {'@': 174}),
+                                       3: (1, {'@': 174}),
+                                       4: (1, {'@': 174}),
+                                       12: (1, {'@': 174}),
+                                       13: (1, {'@': 174}),
+                                       5: (1, {'@': 174}),
+                                       25: (1, {'@': 174}),
+                                       6: (1, {'@': 174}),
+                                       14: (1, {'@': 174}),
+                                       7: (1, {'@': 174}),
+                                       15: (1, {'@': 174}),
+                                       16: (1, {'@': 174}),
+                                       8: (1, {'@': 174}),
+                                       9: (1, {'@': 174}),
+                                       17: (1, {'@': 174}),
+                                       19: (1, {'@': 174})},
+                                  87: {36: (0, 181),
+                                       29: (0, 183),
+                                       65: (0, 178),
+                                       40: (0, 186),
+                                       15: (0, 161),
+                                       32: (0, 4),
+                                       5: (0, 207),
+                                       12: (0, 216),
+                                       7: (0, 15),
+                                       19: (0, 27),
+                                       33: (0, 53),
+                                       1: (0, 32),
+                                       3: (0, 56),
+                                       6: (0, 25),
+                                       35: (0, 118),
+                                       34: (0, 200),
+                                       10: (0, 122),
+                                       37: (0, 158),
+                                       4: (0, 150),
+                                       18: (0, 195),
+                                       51: (0, 26),
+                                       39: (0, 30),
+                                       50: (0, 37),
+                                       11: (0, 67),
+                                       0: (1, {'@': 129}),
+                                       2: (1, {'@': 129}),
+                                       13: (1, {'@': 129}),
+                                       25: (1, {'@': 129}),
+                                       14: (1, {'@': 129}),
+                                       16: (1, {'@': 129}),
+                                       8: (1, {'@': 129}),
+                                       9: (1, {'@': 129}),
+                                       17: (1, {'@': 129})},
+                                  88: {10: (1, {'@': 133}),
+                                       5: (1, {'@': 133}),
+                                       6: (1, {'@': 133}),
+                                       11: (1, {'@': 133}),
+                                       3: (1, {'@': 133}),
+                                       7: (1, {'@': 133}),
+                                       12: (1, {'@': 133}),
+                                       15: (1, {'@': 133}),
+                                       4: (1, {'@': 133}),
+                                       18: (1, {'@': 133}),
+                                       19: (1, {'@': 133})},
+                                  89: {0: (1, {'@': 120}),
+                                       1: (1, {'@': 120}),
+                                       10: (1, {'@': 120}),
+                                       2: (1, {'@': 120}),
+                                       11: (1, {'@': 120}),
+                                       18: (1, {'@': 120}),
+                                       3: (1, {'@': 120}),
+                                       4: (1, {'@': 120}),
+                                       12: (1, {'@': 120}),
+                                       13: (1, {'@': 120}),
+                                       5: (1, {'@': 120}),
+                                       6: (1, {'@': 120}),
+                                       14: (1, {'@': 120}),
+                                       7: (1, {'@': 120}),
+                                       15: (1, {'@': 120}),
+                                       16: (1, {'@': 120}),
+                                       8: (1, {'@': 120}),
+                                       9: (1, {'@': 120}),
+                                       17: (1, {'@': 120}),
+                                       19: (1, {'@': 120})},
+                                  90: {0: (1, {'@': 171}),
+                                       1: (1, {'@': 171}),
+                                       10: (1, {'@': 171}),
+                                       2: (1, {'@': 171}),
+                                       11: (1, {'@': 171}),
+                                       18: (1, {'@': 171}),
+                                       3: (1, {'@': 171}),
+                                       4: (1, {'@': 171}),
+                                       12: (1, {'@': 171}),
+                                       13: (1, {'@': 171}),
+                                       5: (1, {'@': 171}),
+                                       25: (1, {'@': 171}),
+                                       6: (1, {'@': 171}),
+                                       14: (1, {'@': 171}),
+                                       7: (1, {'@': 171}),
+                                       15: (1, {'@': 171}),
+                                       16: (1, {'@': 171}),
+                                       8: (1, {'@': 171}),
+                                       9: (1, {'@': 171}),
+                                       17: (1, {'@': 171}),
+                                       19: (1, {'@': 171})},
+                                  91: {1: (0, 74),
+                                       15: (0, 161),
+                                       5: (0, 207),
+                                       32: (0, 4),
+                                       16: (0, 34),
+                                       12: (0, 216),
+                                       7: (0, 15),
+                                       19: (0, 27),
+                                       33: (0, 53),
+                                       31: (0, 76),
+                                       3: (0, 56),
+                                       6: (0, 25),
+                                       67: (0, 79),
+                                       35: (0, 118),
+                                       10: (0, 122),
+                                       37: (0, 158),
+                                       29: (0, 89),
+                                       36: (0, 81),
+                                       40: (0, 95),
+                                       4: (0, 150),
+                                       18: (0, 195),
+                                       34: (0, 100),
+                                       39: (0, 30),
+                                       66: (0, 106),
+                                       11: (0, 67)},
+                                  92: {0: (1, {'@': 170}),
+                                       1: (1, {'@': 170}),
+                                       10: (1, {'@': 170}),
+                                       2: (1, {'@': 170}),
+                                       11: (1, {'@': 170}),
+                                       18: (1, {'@': 170}),
+                                       3: (1, {'@': 170}),
+                                       4: (1, {'@': 170}),
+                                       12: (1, {'@': 170}),
+                                       13: (1, {'@': 170}),
+                                       5: (1, {'@': 170}),
+                                       25: (1, {'@': 170}),
+                                       6: (1, {'@': 170}),
+                                       14: (1, {'@': 170}),
+                                       7: (1, {'@': 170}),
+                                       15: (1, {'@': 170}),
+                                       16: (1, {'@': 170}),
+                                       8: (1, {'@': 170}),
+                                       9: (1, {'@': 170}),
+                                       17: (1, {'@': 170}),
+                                       19: (1, {'@': 170})},
+                                  93: {57: (1, {'@': 175})},
+                                  94: {0: (1, {'@': 152}),
+                                       1: (1, {'@': 152}),
+                                       10: (1, {'@': 152}),
+                                       2: (1, {'@': 152}),
+                                       24: (1, {'@': 152}),
+                                       11: (1, {'@': 152}),
+                                       18: (1, {'@': 152}),
+                                       3: (1, {'@': 152}),
+                                       4: (1, {'@': 152}),
+                                       12: (1, {'@': 152}),
+                                       13: (1, {'@': 152}),
+                                       5: (1, {'@': 152}),
+                                       6: (1, {'@': 152}),
+                                       14: (1, {'@': 152}),
+                                       7: (1, {'@': 152}),
+                                       15: (1, {'@': 152}),
+                                       17: (1, {'@': 152}),
+                                       8: (1, {'@': 152}),
+                                       9: (1, {'@': 152}),
+                                       19: (1, {'@': 152}),
+                                       16: (1, {'@': 152})},
+                                  95: {0: (1, {'@': 122}),
+                                       1: (1, {'@': 122}),
+                                       10: (1, {'@': 122}),
+                                       2: (1, {'@': 122}),
+                                       11: (1, {'@': 122}),
+                                       18: (1, {'@': 122}),
+                                       3: (1, {'@': 122}),
+                                       4: (1, {'@': 122}),
+                                       12: (1, {'@': 122}),
+                                       13: (1, {'@': 122}),
+                                       5: (1, {'@': 122}),
+                                       6: (1, {'@': 122}),
+                                       14: (1, {'@': 122}),
+                                       7: (1, {'@': 122}),
+                                       15: (1, {'@': 122}),
+                                       16: (1, {'@': 122}),
+                                       8: (1, {'@': 122}),
+                                       9: (1, {'@': 122}),
+                                       17: (1, {'@': 122}),
+                                       19: (1, {'@': 122})},
+                                  96: {68: (0, 48),
+                                       25: (0, 51),
+                                       40: (0, 82),
+                                       15: (0, 161),
+                                       5: (0, 207),
+                                       32: (0, 4),
+                                       16: (0, 34),
+                                       12: (0, 216),
+                                       7: (0, 15),
+                                       19: (0, 27),
+                                       33: (0, 53),
+                                       36: (0, 78),
+                                       17: (0, 54),
+                                       3: (0, 56),
+                                       69: (0, 73),
+                                       35: (0, 118),
+                                       70: (0, 84),
+                                       71: (0, 52),
+                                       10: (0, 122),
+                                       72: (0, 86),
+                                       37: (0, 158),
+                                       31: (0, 90),
+                                       9: (0, 124),
+                                       4: (0, 150),
+                                       18: (0, 195),
+                                       29: (0, 92),
+                                       1: (0, 108),
+                                       39: (0, 30),
+                                       73: (0, 111),
+                                       11: (0, 67),
+                                       74: (0, 113),
+                                       0: (1, {'@': 167}),
+                                       2: (1, {'@': 167}),
+                                       13: (1, {'@': 167}),
+                                       6: (1, {'@': 167}),
+                                       14: (1, {'@': 167}),
+                                       8: (1, {'@': 167})},
+                                  97: {0: (1, {'@': 146}),
+                                       1: (1, {'@': 146}),
+                                       10: (1, {'@': 146}),
+                                       2: (1, {'@': 146}),
+                                       24: (1, {'@': 146}),
+                                       11: (1, {'@': 146}),
+                                       18: (1, {'@': 146}),
+                                       3: (1, {'@': 146}),
+                                       4: (1, {'@': 146}),
+                                       12: (1, {'@': 146}),
+                                       13: (1, {'@': 146}),
+                                       5: (1, {'@': 146}),
+                                       6: (1, {'@': 146}),
+                                       14: (1, {'@': 146}),
+                                       7: (1, {'@': 146}),
+                                       15: (1, {'@': 146}),
+                                       17: (1, {'@': 146}),
+                                       8: (1, {'@': 146}),
+                                       9: (1, {'@': 146}),
+                                       19: (1, {'@': 146}),
+                                       16: (1, {'@': 146})},
+                                  98: {0: (1, {'@': 151}),
+                                       1: (1, {'@': 151}),
+                                       10: (1, {'@': 151}),
+                                       2: (1, {'@': 151}),
+                                       24: (1, {'@': 151}),
+                                       11: (1, {'@': 151}),
+                                       18: (1, {'@': 151}),
+                                       3: (1, {'@': 151}),
+                                       4: (1, {'@': 151}),
+                                       12: (1, {'@': 151}),
+                                       13: (1, {'@': 151}),
+                                       5: (1, {'@': 151}),
+                                       6: (1, {'@': 151}),
+                                       14: (1, {'@': 151}),
+                                       7: (1, {'@': 151}),
+                                       15: (1, {'@': 151}),
+                                       17: (1, {'@': 151}),
+                                       8: (1, {'@': 151}),
+                                       9: (1, {'@': 151}),
+                                       19: (1, {'@': 151}),
+                                       16: (1, {'@': 151})},
+                                  99: {20: (1, {'@': 53}),
+                                       1: (1, {'@': 53}),
+                                       10: (1, {'@': 53}),
+                                       11: (1, {'@': 53}),
+                                       3: (1, {'@': 53}),
+                                       12: (1, {'@': 53}),
+                                       4: (1, {'@': 53}),
+                                       21: (1, {'@': 53}),
+                                       5: (1, {'@': 53}),
+                                       22: (1, {'@': 53}),
+                                       6: (1, {'@': 53}),
+                                       23: (1, {'@': 53}),
+                                       7: (1, {'@': 53}),
+                                       15: (1, {'@': 53}),
+                                       16: (1, {'@': 53}),
+                                       19: (1, {'@': 53}),
+                                       18: (1, {'@': 53})},
+                                  100: {0: (1, {'@': 119}),
+                                        1: (1, {'@': 119}),
+                                        10: (1, {'@': 119}),
+                                        2: (1, {'@': 119}),
+                                        11: (1, {'@': 119}),
+                                        18: (1, {'@': 119}),
+                                        3: (1, {'@': 119}),
+                                        4: (1, {'@': 119}),
+                                        12: (1, {'@': 119}),
+                                        13: (1, {'@': 119}),
+                                        5: (1, {'@': 119}),
+                                        6: (1, {'@': 119}),
+                                        14: (1, {'@': 119}),
+                                        7: (1, {'@': 119}),
+                                        15: (1, {'@': 119}),
+                                        16: (1, {'@': 119}),
+                                        8: (1, {'@': 119}),
+                                        9: (1, {'@': 119}),
+                                        17: (1, {'@': 119}),
+                                        19: (1, {'@': 119})},
+                                  101: {0: (1, {'@': 208}),
+                                        1: (1, {'@': 208}),
+                                        2: (1, {'@': 208}),
+                                        3: (1, {'@': 208}),
+                                        4: (1, {'@': 208}),
+                                        5: (1, {'@': 208}),
+                                        6: (1, {'@': 208}),
+                                        7: (1, {'@': 208}),
+                                        8: (1, {'@': 208}),
+                                        9: (1, {'@': 208}),
+                                        10: (1, {'@': 208}),
+                                        24: (1, {'@': 208}),
+                                        11: (1, {'@': 208}),
+                                        12: (1, {'@': 208}),
+                                        13: (1, {'@': 208}),
+                                        14: (1, {'@': 208}),
+                                        15: (1, {'@': 208}),
+                                        17: (1, {'@': 208}),
+                                        18: (1, {'@': 208}),
+                                        19: (1, {'@': 208}),
+                                        16: (1, {'@': 208})},
+                                  102: {0: (1, {'@': 190}),
+                                        10: (1, {'@': 190}),
+                                        2: (1, {'@': 190}),
+                                        11: (1, {'@': 190}),
+                                        3: (1, {'@': 190}),
+                                        12: (1, {'@': 190}),
+                                        9: (1, {'@': 190}),
+                                        4: (1, {'@': 190}),
+                                        13: (1, {'@': 190}),
+                                        5: (1, {'@': 190}),
+                                        6: (1, {'@': 190}),
+                                        14: (1, {'@': 190}),
+                                        7: (1, {'@': 190}),
+                                        15: (1, {'@': 190}),
+                                        16: (1, {'@': 190}),
+                                        8: (1, {'@': 190}),
+                                        18: (1, {'@': 190}),
+                                        17: (1, {'@': 190}),
+                                        19: (1, {'@': 190})},
+                                  103: {0: (1, {'@': 212}),
+                                        1: (1, {'@': 212}),
+                                        2: (1, {'@': 212}),
+                                        3: (1, {'@': 212}),
+                                        4: (1, {'@': 212}),
+                                        5: (1, {'@': 212}),
+                                        25: (1, {'@': 212}),
+                                        6: (1, {'@': 212}),
+                                        7: (1, {'@': 212}),
+                                        8: (1, {'@': 212}),
+                                        9: (1, {'@': 212}),
+                                        10: (1, {'@': 212}),
+                                        11: (1, {'@': 212}),
+                                        12: (1, {'@': 212}),
+                                        13: (1, {'@': 212}),
+                                        14: (1, {'@': 212}),
+                                        15: (1, {'@': 212}),
+                                        16: (1, {'@': 212}),
+                                        17: (1, {'@': 212}),
+                                        18: (1, {'@': 212}),
+                                        19: (1, {'@': 212})},
+                                  104: {0: (1, {'@': 148}),
+                                        1: (1, {'@': 148}),
+                                        10: (1, {'@': 148}),
+                                        2: (1, {'@': 148}),
+                                        24: (1, {'@': 148}),
+                                        11: (1, {'@': 148}),
+                                        18: (1, {'@': 148}),
+                                        3: (1, {'@': 148}),
+                                        4: (1, {'@': 148}),
+                                        12: (1, {'@': 148}),
+                                        13: (1, {'@': 148}),
+                                        5: (1, {'@': 148}),
+                                        6: (1, {'@': 148}),
+                                        14: (1, {'@': 148}),
+                                        7: (1, {'@': 148}),
+                                        15: (1, {'@': 148}),
+                                        17: (1, {'@': 148}),
+                                        8: (1, {'@': 148}),
+                                        9: (1, {'@': 148}),
+                                        19: (1, {'@': 148}),
+                                        16: (1, {'@': 148})},
+                                  105: {52: (0, 135),
+                                        20: (1, {'@': 56}),
+                                        1: (1, {'@': 56}),
+                                        10: (1, {'@': 56}),
+                                        11: (1, {'@': 56}),
+                                        3: (1, {'@': 56}),
+                                        12: (1, {'@': 56}),
+                                        4: (1, {'@': 56}),
+                                        21: (1, {'@': 56}),
+                                        5: (1, {'@': 56}),
+                                        22: (1, {'@': 56}),
+                                        6: (1, {'@': 56}),
+                                        23: (1, {'@': 56}),
+                                        7: (1, {'@': 56}),
+                                        15: (1, {'@': 56}),
+                                        16: (1, {'@': 56}),
+                                        19: (1, {'@': 56}),
+                                        18: (1, {'@': 56})},
+                                  106: {0: (1, {'@': 204}),
+                                        1: (1, {'@': 204}),
+                                        2: (1, {'@': 204}),
+                                        3: (1, {'@': 204}),
+                                        4: (1, {'@': 204}),
+                                        5: (1, {'@': 204}),
+                                        6: (1, {'@': 204}),
+                                        7: (1, {'@': 204}),
+                                        8: (1, {'@': 204}),
+                                        9: (1, {'@': 204}),
+                                        10: (1, {'@': 204}),
+                                        11: (1, {'@': 204}),
+                                        12: (1, {'@': 204}),
+                                        13: (1, {'@': 204}),
+                                        14: (1, {'@': 204}),
+                                        15: (1, {'@': 204}),
+                                        16: (1, {'@': 204}),
+                                        17: (1, {'@': 204}),
+                                        18: (1, {'@': 204}),
+                                        19: (1, {'@': 204})},
+                                  107: {36: (0, 181),
+                                        29: (0, 183),
+                                        40: (0, 186),
+                                        15: (0, 161),
+                                        32: (0, 4),
+                                        5: (0, 207),
+                                        12: (0, 216),
+                                        7: (0, 15),
+                                        19: (0, 27),
+                                        33: (0, 53),
+                                        1: (0, 32),
+                                        3: (0, 56),
+                                        6: (0, 25),
+                                        35: (0, 118),
+                                        34: (0, 200),
+                                        10: (0, 122),
+                                        37: (0, 158),
+                                        4: (0, 150),
+                                        18: (0, 195),
+                                        39: (0, 30),
+                                        50: (0, 37),
+                                        11: (0, 67),
+                                        51: (0, 66),
+                                        0: (1, {'@': 131}),
+                                        2: (1, {'@': 131}),
+                                        13: (1, {'@': 131}),
+                                        25: (1, {'@': 131}),
+                                        14: (1, {'@': 131}),
+                                        16: (1, {'@': 131}),
+                                        8: (1, {'@': 131}),
+                                        9: (1, {'@': 131}),
+                                        17: (1, {'@': 131})},
+                                  108: {0: (1, {'@': 168}),
+                                        1: (1, {'@': 168}),
+                                        10: (1, {'@': 168}),
+                                        2: (1, {'@': 168}),
+                                        11: (1, {'@': 168}),
+                                        18: (1, {'@': 168}),
+                                        3: (1, {'@': 168}),
+                                        4: (1, {'@': 168}),
+                                        12: (1, {'@': 168}),
+                                        13: (1, {'@': 168}),
+                                        5: (1, {'@': 168}),
+                                        25: (1, {'@': 168}),
+                                        6: (1, {'@': 168}),
+                                        14: (1, {'@': 168}),
+                                        7: (1, {'@': 168}),
+                                        15: (1, {'@': 168}),
+                                        16: (1, {'@': 168}),
+                                        8: (1, {'@': 168}),
+                                        9: (1, {'@': 168}),
+                                        17: (1, {'@': 168}),
+                                        19: (1, {'@': 168})},
+                                  109: {75: (0, 69),
+                                        15: (0, 161),
+                                        16: (0, 179),
+                                        76: (0, 94),
+                                        32: (0, 4),
+                                        5: (0, 207),
+                                        12: (0, 216),
+                                        7: (0, 15),
+                                        19: (0, 27),
+                                        33: (0, 53),
+                                        24: (0, 98),
+                                        3: (0, 56),
+                                        17: (0, 54),
+                                        6: (0, 25),
+                                        36: (0, 97),
+                                        29: (0, 104),
+                                        35: (0, 118),
+                                        10: (0, 122),
+                                        37: (0, 158),
+                                        74: (0, 39),
+                                        4: (0, 150),
+                                        18: (0, 195),
+                                        1: (0, 119),
+                                        39: (0, 30),
+                                        40: (0, 22),
+                                        54: (0, 61),
+                                        77: (0, 112),
+                                        11: (0, 67),
+                                        34: (0, 63),
+                                        0: (1, {'@': 143}),
+                                        2: (1, {'@': 143}),
+                                        9: (1, {'@': 143}),
+                                        13: (1, {'@': 143}),
+                                        14: (1, {'@': 143}),
+                                        8: (1, {'@': 143})},
+                                  110: {1: (1, {'@': 197}),
+                                        10: (1, {'@': 197}),
+                                        5: (1, {'@': 197}),
+                                        6: (1, {'@': 197}),
+                                        28: (1, {'@': 197}),
+                                        3: (1, {'@': 197}),
+                                        7: (1, {'@': 197}),
+                                        12: (1, {'@': 197}),
+                                        16: (1, {'@': 197}),
+                                        4: (1, {'@': 197}),
+                                        18: (1, {'@': 197}),
+                                        19: (1, {'@': 197})},
+                                  111: {0: (1, {'@': 127}),
+                                        1: (1, {'@': 127}),
+                                        10: (1, {'@': 127}),
+                                        2: (1, {'@': 127}),
+                                        11: (1, {'@': 127}),
+                                        18: (1, {'@': 127}),
+                                        3: (1, {'@': 127}),
+                                        4: (1, {'@': 127}),
+                                        12: (1, {'@': 127}),
+                                        13: (1, {'@': 127}),
+                                        5: (1, {'@': 127}),
+                                        25: (1, {'@': 127}),
+                                        6: (1, {'@': 127}),
+                                        14: (1, {'@': 127}),
+                                        7: (1, {'@': 127}),
+                                        15: (1, {'@': 127}),
+                                        16: (1, {'@': 127}),
+                                        8: (1, {'@': 127}),
+                                        9: (1, {'@': 127}),
+                                        17: (1, {'@': 127}),
+                                        19: (1, {'@': 127})},
+                                  112: {0: (1, {'@': 154}),
+                                        1: (1, {'@': 154}),
+                                        10: (1, {'@': 154}),
+                                        2: (1, {'@': 154}),
+                                        24: (1, {'@': 154}),
+                                        11: (1, {'@': 154}),
+                                        18: (1, {'@': 154}),
+                                        3: (1, {'@': 154}),
+                                        4: (1, {'@': 154}),
+                                        12: (1, {'@': 154}),
+                                        13: (1, {'@': 154}),
+                                        5: (1, {'@': 154}),
+                                        6: (1, {'@': 154}),
+                                        14: (1, {'@': 154}),
+                                        7: (1, {'@': 154}),
+                                        15: (1, {'@': 154}),
+                                        17: (1, {'@': 154}),
+                                        8: (1, {'@': 154}),
+                                        9: (1, {'@': 154}),
+                                        19: (1, {'@': 154}),
+                                        16: (1, {'@': 154})},
+                                  113: {0: (1, {'@': 173}),
+                                        1: (1, {'@': 173}),
+                                        10: (1, {'@': 173}),
+                                        2: (1, {'@': 173}),
+                                        11: (1, {'@': 173}),
+                                        18: (1, {'@': 173}),
+                                        3: (1, {'@': 173}),
+                                        4: (1, {'@': 173}),
+                                        12: (1, {'@': 173}),
+                                        13: (1, {'@': 173}),
+                                        5: (1, {'@': 173}),
+                                        25: (1, {'@': 173}),
+                                        6: (1, {'@': 173}),
+                                        14: (1, {'@': 173}),
+                                        7: (1, {'@': 173}),
+                                        15: (1, {'@': 173}),
+                                        16: (1, {'@': 173}),
+                                        8: (1, {'@': 173}),
+                                        9: (1, {'@': 173}),
+                                        17: (1, {'@': 173}),
+                                        19: (1, {'@': 173})},
+                                  114: {0: (1, {'@': 189}),
+                                        1: (1, {'@': 189}),
+                                        10: (1, {'@': 189}),
+                                        2: (1, {'@': 189}),
+                                        24: (1, {'@': 189}),
+                                        11: (1, {'@': 189}),
+                                        18: (1, {'@': 189}),
+                                        3: (1, {'@': 189}),
+                                        4: (1, {'@': 189}),
+                                        12: (1, {'@': 189}),
+                                        13: (1, {'@': 189}),
+                                        5: (1, {'@': 189}),
+                                        6: (1, {'@': 189}),
+                                        25: (1, {'@': 189}),
+                                        14: (1, {'@': 189}),
+                                        7: (1, {'@': 189}),
+                                        15: (1, {'@': 189}),
+                                        16: (1, {'@': 189}),
+                                        8: (1, {'@': 189}),
+                                        9: (1, {'@': 189}),
+                                        17: (1, {'@': 189}),
+                                        19: (1, {'@': 189}),
+                                        20: (1, {'@': 189}),
+                                        21: (1, {'@': 189}),
+                                        22: (1, {'@': 189}),
+                                        23: (1, {'@': 189}),
+                                        26: (1, {'@': 189}),
+                                        27: (1, {'@': 189}),
+                                        28: (1, {'@': 189})},
+                                  115: {20: (1, {'@': 71}),
+                                        10: (1, {'@': 71}),
+                                        1: (1, {'@': 71}),
+                                        11: (1, {'@': 71}),
+                                        3: (1, {'@': 71}),
+                                        12: (1, {'@': 71}),
+                                        4: (1, {'@': 71}),
+                                        5: (1, {'@': 71}),
+                                        22: (1, {'@': 71}),
+                                        6: (1, {'@': 71}),
+                                        23: (1, {'@': 71}),
+                                        7: (1, {'@': 71}),
+                                        15: (1, {'@': 71}),
+                                        16: (1, {'@': 71}),
+                                        18: (1, {'@': 71}),
+                                        19: (1, {'@': 71})},
+                                  116: {10: (1, {'@': 216}),
+                                        20: (1, {'@': 216}),
+                                        5: (1, {'@': 216}),
+                                        1: (1, {'@': 216}),
+                                        11: (1, {'@': 216}),
+                                        3: (1, {'@': 216}),
+                                        7: (1, {'@': 216}),
+                                        12: (1, {'@': 216}),
+                                        15: (1, {'@': 216}),
+                                        4: (1, {'@': 216}),
+                                        18: (1, {'@': 216}),
+                                        19: (1, {'@': 216}),
+                                        16: (1, {'@': 216})},
+                                  117: {0: (1, {'@': 183}),
+                                        1: (1, {'@': 183}),
+                                        10: (1, {'@': 183}),
+                                        2: (1, {'@': 183}),
+                                        24: (1, {'@': 183}),
+                                        11: (1, {'@': 183}),
+                                        18: (1, {'@': 183}),
+                                        3: (1, {'@': 183}),
+                                        4: (1, {'@': 183}),
+                                        12: (1, {'@': 183}),
+                                        13: (1, {'@': 183}),
+                                        5: (1, {'@': 183}),
+                                        6: (1, {'@': 183}),
+                                        25: (1, {'@': 183}),
+                                        14: (1, {'@': 183}),
+                                        7: (1, {'@': 183}),
+                                        15: (1, {'@': 183}),
+                                        16: (1, {'@': 183}),
+                                        8: (1, {'@': 183}),
+                                        9: (1, {'@': 183}),
+                                        17: (1, {'@': 183}),
+                                        19: (1, {'@': 183}),
+                                        20: (1, {'@': 183}),
+                                        21: (1, {'@': 183}),
+                                        22: (1, {'@': 183}),
+                                        23: (1, {'@': 183}),
+                                        26: (1, {'@': 183}),
+                                        27: (1, {'@': 183}),
+                                        28: (1, {'@': 183})},
+                                  118: {0: (1, {'@': 66}),
+                                        1: (1, {'@': 66}),
+                                        10: (1, {'@': 66}),
+                                        2: (1, {'@': 66}),
+                                        24: (1, {'@': 66}),
+                                        11: (1, {'@': 66}),
+                                        18: (1, {'@': 66}),
+                                        3: (1, {'@': 66}),
+                                        4: (1, {'@': 66}),
+                                        12: (1, {'@': 66}),
+                                        13: (1, {'@': 66}),
+                                        5: (1, {'@': 66}),
+                                        6: (1, {'@': 66}),
+                                        25: (1, {'@': 66}),
+                                        14: (1, {'@': 66}),
+                                        7: (1, {'@': 66}),
+                                        15: (1, {'@': 66}),
+                                        16: (1, {'@': 66}),
+                                        8: (1, {'@': 66}),
+                                        9: (1, {'@': 66}),
+                                        17: (1, {'@': 66}),
+                                        19: (1, {'@': 66}),
+                                        20: (1, {'@': 66}),
+                                        26: (1, {'@': 66}),
+                                        27: (1, {'@': 66}),
+                                        28: (1, {'@': 66})},
+                                  119: {0: (1, {'@': 153}),
+                                        1: (1, {'@': 153}),
+                                        10: (1, {'@': 153}),
+                                        2: (1, {'@': 153}),
+                                        24: (1, {'@': 153}),
+                                        11: (1, {'@': 153}),
+                                        18: (1, {'@': 153}),
+                                        3: (1, {'@': 153}),
+                                        4: (1, {'@': 153}),
+                                        12: (1, {'@': 153}),
+                                        13: (1, {'@': 153}),
+                                        5: (1, {'@': 153}),
+                                        6: (1, {'@': 153}),
+                                        14: (1, {'@': 153}),
+                                        7: (1, {'@': 153}),
+                                        15: (1, {'@': 153}),
+                                        17: (1, {'@': 153}),
+                                        8: (1, {'@': 153}),
+                                        9: (1, {'@': 153}),
+                                        19: (1, {'@': 153}),
+                                        16: (1, {'@': 153})},
+                                  120: {29: (0, 208),
+                                        40: (0, 142),
+                                        15: (0, 161),
+                                        16: (0, 179),
+                                        5: (0, 207),
+                                        32: (0, 4),
+                                        12: (0, 216),
+                                        7: (0, 15),
+                                        19: (0, 27),
+                                        33: (0, 53),
+                                        3: (0, 56),
+                                        36: (0, 75),
+                                        35: (0, 118),
+                                        10: (0, 122),
+                                        37: (0, 158),
+                                        20: (0, 13),
+                                        4: (0, 150),
+                                        18: (0, 195),
+                                        53: (0, 14),
+                                        54: (0, 28),
+                                        39: (0, 30),
+                                        1: (0, 68),
+                                        11: (0, 67)},
+                                  121: {0: (1, {'@': 160}),
+                                        1: (1, {'@': 160}),
+                                        10: (1, {'@': 160}),
+                                        2: (1, {'@': 160}),
+                                        24: (1, {'@': 160}),
+                                        11: (1, {'@': 160}),
+                                        18: (1, {'@': 160}),
+                                        3: (1, {'@': 160}),
+                                        4: (1, {'@': 160}),
+                                        12: (1, {'@': 160}),
+                                        13: (1, {'@': 160}),
+                                        5: (1, {'@': 160}),
+                                        6: (1, {'@': 160}),
+                                        25: (1, {'@': 160}),
+                                        14: (1, {'@': 160}),
+                                        7: (1, {'@': 160}),
+                                        15: (1, {'@': 160}),
+                                        16: (1, {'@': 160}),
+                                        8: (1, {'@': 160}),
+                                        9: (1, {'@': 160}),
+                                        17: (1, {'@': 160}),
+                                        19: (1, {'@': 160})},
+                                  122: {31: (0, 168),
+                                        15: (0, 161),
+                                        78: (0, 171),
+                                        5: (0, 207),
+                                        34: (0, 180),
+                                        16: (0, 34),
+                                        1: (0, 173),
+                                        12: (0, 216),
+                                        7: (0, 15),
+                                        19: (0, 27),
+                                        33: (0, 53),
+                                        3: (0, 56),
+                                        6: (0, 25),
+                                        35: (0, 118),
+                                        79: (0, 182),
+                                        4: (0, 150),
+                                        18: (0, 195),
+                                        40: (0, 184),
+                                        29: (0, 187),
+                                        32: (0, 191)},
+                                  123: {0: (1, {'@': 157}),
+                                        1: (1, {'@': 157}),
+                                        10: (1, {'@': 157}),
+                                        2: (1, {'@': 157}),
+                                        24: (1, {'@': 157}),
+                                        11: (1, {'@': 157}),
+                                        18: (1, {'@': 157}),
+                                        3: (1, {'@': 157}),
+                                        4: (1, {'@': 157}),
+                                        12: (1, {'@': 157}),
+                                        13: (1, {'@': 157}),
+                                        5: (1, {'@': 157}),
+                                        6: (1, {'@': 157}),
+                                        25: (1, {'@': 157}),
+                                        14: (1, {'@': 157}),
+                                        7: (1, {'@': 157}),
+                                        15: (1, {'@': 157}),
+                                        16: (1, {'@': 157}),
+                                        8: (1, {'@': 157}),
+                                        9: (1, {'@': 157}),
+                                        17: (1, {'@': 157}),
+                                        19: (1, {'@': 157})},
+                                  124: {80: (0, 162), 81: (0, 165)},
+                                  125: {20: (1, {'@': 74}),
+                                        10: (1, {'@': 74}),
+                                        1: (1, {'@': 74}),
+                                        11: (1, {'@': 74}),
+                                        3: (1, {'@': 74}),
+                                        12: (1, {'@': 74}),
+                                        4: (1, {'@': 74}),
+                                        5: (1, {'@': 74}),
+                                        22: (1, {'@': 74}),
+                                        6: (1, {'@': 74}),
+                                        23: (1, {'@': 74}),
+                                        7: (1, {'@': 74}),
+                                        15: (1, {'@': 74}),
+                                        16: (1, {'@': 74}),
+                                        18: (1, {'@': 74}),
+                                        19: (1, {'@': 74})},
+                                  126: {0: (1, {'@': 210}),
+                                        1: (1, {'@': 210}),
+                                        2: (1, {'@': 210}),
+                                        3: (1, {'@': 210}),
+                                        4: (1, {'@': 210}),
+                                        5: (1, {'@': 210}),
+                                        6: (1, {'@': 210}),
+                                        25: (1, {'@': 210}),
+                                        7: (1, {'@': 210}),
+                                        8: (1, {'@': 210}),
+                                        9: (1, {'@': 210}),
+                                        10: (1, {'@': 210}),
+                                        24: (1, {'@': 210}),
+                                        11: (1, {'@': 210}),
+                                        12: (1, {'@': 210}),
+                                        13: (1, {'@': 210}),
+                                        14: (1, {'@': 210}),
+                                        15: (1, {'@': 210}),
+                                        16: (1, {'@': 210}),
+                                        17: (1, {'@': 210}),
+                                        18: (1, {'@': 210}),
+                                        19: (1, {'@': 210})},
+                                  127: {20: (1, {'@': 72}),
+                                        10: (1, {'@': 72}),
+                                        1: (1, {'@': 72}),
+                                        11: (1, {'@': 72}),
+                                        3: (1, {'@': 72}),
+                                        12: (1, {'@': 72}),
+                                        4: (1, {'@': 72}),
+                                        5: (1, {'@': 72}),
+                                        22: (1, {'@': 72}),
+                                        6: (1, {'@': 72}),
+                                        23: (1, {'@': 72}),
+                                        7: (1, {'@': 72}),
+                                        15: (1, {'@': 72}),
+                                        16: (1, {'@': 72}),
+                                        18: (1, {'@': 72}),
+                                        19: (1, {'@': 72})},
+                                  128: {0: (1, {'@': 161}),
+                                        1: (1, {'@': 161}),
+                                        10: (1, {'@': 161}),
+                                        2: (1, {'@': 161}),
+                                        24: (1, {'@': 161}),
+                                        11: (1, {'@': 161}),
+                                        18: (1, {'@': 161}),
+                                        3: (1, {'@': 161}),
+                                        4: (1, {'@': 161}),
+                                        12: (1, {'@': 161}),
+                                        13: (1, {'@': 161}),
+                                        5: (1, {'@': 161}),
+                                        6: (1, {'@': 161}),
+                                        25: (1, {'@': 161}),
+                                        14: (1, {'@': 161}),
+                                        7: (1, {'@': 161}),
+                                        15: (1, {'@': 161}),
+                                        16: (1, {'@': 161}),
+                                        8: (1, {'@': 161}),
+                                        9: (1, {'@': 161}),
+                                        17: (1, {'@': 161}),
+                                        19: (1, {'@': 161})},
+                                  129: {20: (1, {'@': 193}),
+                                        10: (1, {'@': 193}),
+                                        5: (1, {'@': 193}),
+                                        1: (1, {'@': 193}),
+                                        22: (1, {'@': 193}),
+                                        6: (1, {'@': 193}),
+                                        11: (1, {'@': 193}),
+                                        23: (1, {'@': 193}),
+                                        3: (1, {'@': 193}),
+                                        7: (1, {'@': 193}),
+                                        12: (1, {'@': 193}),
+                                        15: (1, {'@': 193}),
+                                        4: (1, {'@': 193}),
+                                        18: (1, {'@': 193}),
+                                        19: (1, {'@': 193}),
+                                        16: (1, {'@': 193})},
+                                  130: {20: (1, {'@': 55}),
+                                        1: (1, {'@': 55}),
+                                        10: (1, {'@': 55}),
+                                        11: (1, {'@': 55}),
+                                        3: (1, {'@': 55}),
+                                        12: (1, {'@': 55}),
+                                        4: (1, {'@': 55}),
+                                        21: (1, {'@': 55}),
+                                        5: (1, {'@': 55}),
+                                        22: (1, {'@': 55}),
+                                        6: (1, {'@': 55}),
+                                        23: (1, {'@': 55}),
+                                        7: (1, {'@': 55}),
+                                        15: (1, {'@': 55}),
+                                        16: (1, {'@': 55}),
+                                        19: (1, {'@': 55}),
+                                        18: (1, {'@': 55})},
+                                  131: {20: (1, {'@': 57}),
+                                        1: (1, {'@': 57}),
+                                        10: (1, {'@': 57}),
+                                        11: (1, {'@': 57}),
+                                        3: (1, {'@': 57}),
+                                        12: (1, {'@': 57}),
+                                        4: (1, {'@': 57}),
+                                        21: (1, {'@': 57}),
+                                        5: (1, {'@': 57}),
+                                        22: (1, {'@': 57}),
+                                        6: (1, {'@': 57}),
+                                        23: (1, {'@': 57}),
+                                        7: (1, {'@': 57}),
+                                        15: (1, {'@': 57}),
+                                        16: (1, {'@': 57}),
+                                        19: (1, {'@': 57}),
+                                        18: (1, {'@': 57})},
+                                  132: {36: (0, 181),
+                                        29: (0, 183),
+                                        40: (0, 186),
+                                        15: (0, 161),
+                                        32: (0, 4),
+                                        5: (0, 207),
+                                        12: (0, 216),
+                                        7: (0, 15),
+                                        19: (0, 27),
+                                        33: (0, 53),
+                                        3: (0, 56),
+                                        6: (0, 25),
+                                        35: (0, 118),
+                                        50: (0, 87),
+                                        34: (0, 200),
+                                        10: (0, 122),
+                                        37: (0, 158),
+                                        4: (0, 150),
+                                        18: (0, 195),
+                                        39: (0, 30),
+                                        11: (0, 67)},
+                                  133: {63: (1, {'@': 165})},
+                                  134: {20: (1, {'@': 192}),
+                                        10: (1, {'@': 192}),
+                                        5: (1, {'@': 192}),
+                                        1: (1, {'@': 192}),
+                                        22: (1, {'@': 192}),
+                                        6: (1, {'@': 192}),
+                                        11: (1, {'@': 192}),
+                                        23: (1, {'@': 192}),
+                                        3: (1, {'@': 192}),
+                                        7: (1, {'@': 192}),
+                                        12: (1, {'@': 192}),
+                                        15: (1, {'@': 192}),
+                                        4: (1, {'@': 192}),
+                                        18: (1, {'@': 192}),
+                                        19: (1, {'@': 192}),
+                                        16: (1, {'@': 192})},
+                                  135: {6: (0, 114)},
+                                  136: {0: (1, {'@': 67}),
+                                        1: (1, {'@': 67}),
+                                        10: (1, {'@': 67}),
+                                        2: (1, {'@': 67}),
+                                        24: (1, {'@': 67}),
+                                        11: (1, {'@': 67}),
+                                        18: (1, {'@': 67}),
+                                        3: (1, {'@': 67}),
+                                        4: (1, {'@': 67}),
+                                        12: (1, {'@': 67}),
+                                        13: (1, {'@': 67}),
+                                        5: (1, {'@': 67}),
+                                        6: (1, {'@': 67}),
+                                        25: (1, {'@': 67}),
+                                        14: (1, {'@': 67}),
+                                        7: (1, {'@': 67}),
+                                        15: (1, {'@': 67}),
+                                        16: (1, {'@': 67}),
+                                        8: (1, {'@': 67}),
+                                        9: (1, {'@': 67}),
+                                        17: (1, {'@': 67}),
+                                        19: (1, {'@': 67}),
+                                        20: (1, {'@': 67}),
+                                        21: (1, {'@': 67}),
+                                        22: (1, {'@': 67}),
+                                        23: (1, {'@': 67}),
+                                        26: (1, {'@': 67}),
+                                        27: (1, {'@': 67}),
+                                        28: (1, {'@': 67})},
+                                  137: {23: (0, 133),
+                                        82: (0, 143),
+                                        83: (0, 148),
+                                        84: (0, 151),
+                                        85: (0, 157),
+                                        86: (0, 159)},
+                                  138: {0: (1, {'@': 191}),
+                                        10: (1, {'@': 191}),
+                                        2: (1, {'@': 191}),
+                                        11: (1, {'@': 191}),
+                                        3: (1, {'@': 191}),
+                                        12: (1, {'@': 191}),
+                                        9: (1, {'@': 191}),
+                                        4: (1, {'@': 191}),
+                                        13: (1, {'@': 191}),
+                                        5: (1, {'@': 191}),
+                                        6: (1, {'@': 191}),
+                                        14: (1, {'@': 191}),
+                                        7: (1, {'@': 191}),
+                                        15: (1, {'@': 191}),
+                                        16: (1, {'@': 191}),
+                                        8: (1, {'@': 191}),
+                                        18: (1, {'@': 191}),
+                                        17: (1, {'@': 191}),
+                                        19: (1, {'@': 191})},
+                                  139: {5: (0, 207),
+                                        31: (0, 141),
+                                        16: (0, 34),
+                                        12: (0, 216),
+                                        7: (0, 15),
+                                        19: (0, 27),
+                                        33: (0, 53),
+                                        29: (0, 218),
+                                        3: (0, 56),
+                                        6: (0, 25),
+                                        1: (0, 152),
+                                        35: (0, 118),
+                                        28: (0, 72),
+                                        10: (0, 122),
+                                        34: (0, 219),
+                                        4: (0, 150),
+                                        18: (0, 195),
+                                        37: (0, 194),
+                                        87: (0, 110),
+                                        40: (0, 172)},
+                                  140: {20: (1, {'@': 54}),
+                                        1: (1, {'@': 54}),
+                                        10: (1, {'@': 54}),
+                                        11: (1, {'@': 54}),
+                                        3: (1, {'@': 54}),
+                                        12: (1, {'@': 54}),
+                                        4: (1, {'@': 54}),
+                                        21: (1, {'@': 54}),
+                                        5: (1, {'@': 54}),
+                                        22: (1, {'@': 54}),
+                                        6: (1, {'@': 54}),
+                                        23: (1, {'@': 54}),
+                                        7: (1, {'@': 54}),
+                                        15: (1, {'@': 54}),
+                                        16: (1, {'@': 54}),
+                                        19: (1, {'@': 54}),
+                                        18: (1, {'@': 54})},
+                                  141: {1: (1, {'@': 90}),
+                                        10: (1, {'@': 90}),
+                                        5: (1, {'@': 90}),
+                                        6: (1, {'@': 90}),
+                                        28: (1, {'@': 90}),
+                                        3: (1, {'@': 90}),
+                                        7: (1, {'@': 90}),
+                                        12: (1, {'@': 90}),
+                                        16: (1, {'@': 90}),
+                                        4: (1, {'@': 90}),
+                                        18: (1, {'@': 90}),
+                                        19: (1, {'@': 90})},
+                                  142: {10: (1, {'@': 188}),
+                                        20: (1, {'@': 188}),
+                                        5: (1, {'@': 188}),
+                                        1: (1, {'@': 188}),
+                                        11: (1, {'@': 188}),
+                                        3: (1, {'@': 188}),
+                                        7: (1, {'@': 188}),
+                                        12: (1, {'@': 188}),
+                                        15: (1, {'@': 188}),
+                                        4: (1, {'@': 188}),
+                                        18: (1, {'@': 188}),
+                                        19: (1, {'@': 188}),
+                                        16: (1, {'@': 188}),
+                                        13: (1, {'@': 188})},
+                                  143: {63: (1, {'@': 163})},
+                                  144: {16: (0, 58),
+                                        36: (0, 197),
+                                        42: (0, 64),
+                                        15: (0, 161),
+                                        31: (0, 71),
+                                        20: (0, 99),
+                                        32: (0, 4),
+                                        5: (0, 207),
+                                        12: (0, 216),
+                                        22: (0, 130),
+                                        19: (0, 27),
+                                        43: (0, 35),
+                                        44: (0, 62),
+                                        3: (0, 56),
+                                        6: (0, 105),
+                                        46: (0, 125),
+                                        10: (0, 122),
+                                        34: (0, 115),
+                                        35: (0, 127),
+                                        37: (0, 158),
+                                        4: (0, 150),
+                                        18: (0, 195),
+                                        7: (0, 136),
+                                        45: (0, 131),
+                                        49: (0, 129),
+                                        39: (0, 30),
+                                        11: (0, 67),
+                                        23: (0, 140),
+                                        1: (0, 145),
+                                        40: (0, 149),
+                                        47: (0, 154)},
+                                  145: {20: (1, {'@': 69}),
+                                        10: (1, {'@': 69}),
+                                        1: (1, {'@': 69}),
+                                        11: (1, {'@': 69}),
+                                        3: (1, {'@': 69}),
+                                        12: (1, {'@': 69}),
+                                        4: (1, {'@': 69}),
+                                        5: (1, {'@': 69}),
+                                        22: (1, {'@': 69}),
+                                        6: (1, {'@': 69}),
+                                        23: (1, {'@': 69}),
+                                        7: (1, {'@': 69}),
+                                        15: (1, {'@': 69}),
+                                        16: (1, {'@': 69}),
+                                        18: (1, {'@': 69}),
+                                        19: (1, {'@': 69})},
+                                  146: {36: (0, 181),
+                                        29: (0, 183),
+                                        50: (0, 70),
+                                        40: (0, 186),
+                                        15: (0, 161),
+                                        32: (0, 4),
+                                        5: (0, 207),
+                                        12: (0, 216),
+                                        7: (0, 15),
+                                        19: (0, 27),
+                                        33: (0, 53),
+                                        3: (0, 56),
+                                        6: (0, 25),
+                                        35: (0, 118),
+                                        34: (0, 200),
+                                        10: (0, 122),
+                                        37: (0, 158),
+                                        4: (0, 150),
+                                        18: (0, 195),
+                                        39: (0, 30),
+                                        11: (0, 67)},
+                                  147: {1: (1, {'@': 123}),
+                                        10: (1, {'@': 123}),
+                                        5: (1, {'@': 123}),
+                                        6: (1, {'@': 123}),
+                                        11: (1, {'@': 123}),
+                                        18: (1, {'@': 123}),
+                                        3: (1, {'@': 123}),
+                                        7: (1, {'@': 123}),
+                                        12: (1, {'@': 123}),
+                                        16: (1, {'@': 123}),
+                                        15: (1, {'@': 123}),
+                                        4: (1, {'@': 123}),
+                                        19: (1, {'@': 123})},
+                                  148: {63: (0, 8)},
+                                  149: {20: (1, {'@': 75}),
+                                        10: (1, {'@': 75}),
+                                        1: (1, {'@': 75}),
+                                        11: (1, {'@': 75}),
+                                        3: (1, {'@': 75}),
+                                        12: (1, {'@': 75}),
+                                        4: (1, {'@': 75}),
+                                        5: (1, {'@': 75}),
+                                        22: (1, {'@': 75}),
+                                        6: (1, {'@': 75}),
+                                        23: (1, {'@': 75}),
+                                        7: (1, {'@': 75}),
+                                        15: (1, {'@': 75}),
+                                        16: (1, {'@': 75}),
+                                        18: (1, {'@': 75}),
+                                        19: (1, {'@': 75})},
+                                  150: {0: (1, {'@': 49}),
+                                        1: (1, {'@': 49}),
+                                        10: (1, {'@': 49}),
+                                        2: (1, {'@': 49}),
+                                        24: (1, {'@': 49}),
+                                        11: (1, {'@': 49}),
+                                        18: (1, {'@': 49}),
+                                        3: (1, {'@': 49}),
+                                        4: (1, {'@': 49}),
+                                        12: (1, {'@': 49}),
+                                        13: (1, {'@': 49}),
+                                        5: (1, {'@': 49}),
+                                        6: (1, {'@': 49}),
+                                        25: (1, {'@': 49}),
+                                        14: (1, {'@': 49}),
+                                        7: (1, {'@': 49}),
+                                        15: (1, {'@': 49}),
+                                        16: (1, {'@': 49}),
+                                        8: (1, {'@': 49}),
+                                        9: (1, {'@': 49}),
+                                        17: (1, {'@': 49}),
+                                        19: (1, {'@': 49}),
+                                        20: (1, {'@': 49}),
+                                        21: (1, {'@': 49}),
+                                        22: (1, {'@': 49}),
+                                        23: (1, {'@': 49}),
+                                        26: (1, {'@': 49}),
+                                        27: (1, {'@': 49}),
+                                        28: (1, {'@': 49})},
+                                  151: {63: (1, {'@': 164})},
+                                  152: {1: (1, {'@': 86}),
+                                        10: (1, {'@': 86}),
+                                        5: (1, {'@': 86}),
+                                        6: (1, {'@': 86}),
+                                        28: (1, {'@': 86}),
+                                        3: (1, {'@': 86}),
+                                        7: (1, {'@': 86}),
+                                        12: (1, {'@': 86}),
+                                        16: (1, {'@': 86}),
+                                        4: (1, {'@': 86}),
+                                        18: (1, {'@': 86}),
+                                        19: (1, {'@': 86})},
+                                  153: {36: (0, 211),
+                                        15: (0, 161),
+                                        88: (0, 213),
+                                        32: (0, 4),
+                                        5: (0, 207),
+                                        12: (0, 216),
+                                        34: (0, 176),
+                                        16: (0, 34),
+                                        7: (0, 15),
+                                        19: (0, 27),
+                                        33: (0, 53),
+                                        3: (0, 56),
+                                        6: (0, 25),
+                                        35: (0, 118),
+                                        10: (0, 122),
+                                        37: (0, 158),
+                                        31: (0, 214),
+                                        4: (0, 150),
+                                        18: (0, 195),
+                                        39: (0, 30),
+                                        29: (0, 0),
+                                        40: (0, 1),
+                                        11: (0, 67)},
+                                  154: {20: (1, {'@': 59}),
+                                        1: (1, {'@': 59}),
+                                        10: (1, {'@': 59}),
+                                        11: (1, {'@': 59}),
+                                        3: (1, {'@': 59}),
+                                        12: (1, {'@': 59}),
+                                        4: (1, {'@': 59}),
+                                        21: (1, {'@': 59}),
+                                        5: (1, {'@': 59}),
+                                        22: (1, {'@': 59}),
+                                        6: (1, {'@': 59}),
+                                        23: (1, {'@': 59}),
+                                        7: (1, {'@': 59}),
+                                        15: (1, {'@': 59}),
+                                        16: (1, {'@': 59}),
+                                        19: (1, {'@': 59}),
+                                        18: (1, {'@': 59})},
+                                  155: {89: (0, 198)},
+                                  156: {0: (1, {'@': 105}),
+                                        10: (1, {'@': 105}),
+                                        2: (1, {'@': 105}),
+                                        11: (1, {'@': 105}),
+                                        3: (1, {'@': 105}),
+                                        12: (1, {'@': 105}),
+                                        9: (1, {'@': 105}),
+                                        4: (1, {'@': 105}),
+                                        13: (1, {'@': 105}),
+                                        5: (1, {'@': 105}),
+                                        6: (1, {'@': 105}),
+                                        14: (1, {'@': 105}),
+                                        7: (1, {'@': 105}),
+                                        15: (1, {'@': 105}),
+                                        16: (1, {'@': 105}),
+                                        8: (1, {'@': 105}),
+                                        18: (1, {'@': 105}),
+                                        17: (1, {'@': 105}),
+                                        19: (1, {'@': 105})},
+                                  157: {63: (1, {'@': 162})},
+                                  158: {0: (1, {'@': 63}),
+                                        1: (1, {'@': 63}),
+                                        10: (1, {'@': 63}),
+                                        2: (1, {'@': 63}),
+                                        24: (1, {'@': 63}),
+                                        11: (1, {'@': 63}),
+                                        18: (1, {'@': 63}),
+                                        3: (1, {'@': 63}),
+                                        4: (1, {'@': 63}),
+                                        12: (1, {'@': 63}),
+                                        13: (1, {'@': 63}),
+                                        5: (1, {'@': 63}),
+                                        6: (1, {'@': 63}),
+                                        25: (1, {'@': 63}),
+                                        14: (1, {'@': 63}),
+                                        7: (1, {'@': 63}),
+                                        15: (1, {'@': 63}),
+                                        16: (1, {'@': 63}),
+                                        8: (1, {'@': 63}),
+                                        9: (1, {'@': 63}),
+                                        17: (1, {'@': 63}),
+                                        19: (1, {'@': 63}),
+                                        20: (1, {'@': 63}),
+                                        21: (1, {'@': 63}),
+                                        22: (1, {'@': 63}),
+                                        23: (1, {'@': 63})},
+                                  159: {63: (1, {'@': 166})},
+                                  160: {15: (0, 161),
+                                        16: (0, 179),
+                                        76: (0, 94),
+                                        32: (0, 4),
+                                        5: (0, 207),
+                                        12: (0, 216),
+                                        7: (0, 15),
+                                        19: (0, 27),
+                                        33: (0, 53),
+                                        24: (0, 98),
+                                        75: (0, 101),
+                                        3: (0, 56),
+                                        17: (0, 54),
+                                        6: (0, 25),
+                                        90: (0, 109),
+                                        36: (0, 97),
+                                        29: (0, 104),
+                                        35: (0, 118),
+                                        10: (0, 122),
+                                        37: (0, 158),
+                                        74: (0, 39),
+                                        4: (0, 150),
+                                        18: (0, 195),
+                                        1: (0, 119),
+                                        39: (0, 30),
+                                        40: (0, 22),
+                                        54: (0, 61),
+                                        77: (0, 112),
+                                        11: (0, 67),
+                                        34: (0, 63),
+                                        0: (1, {'@': 144}),
+                                        2: (1, {'@': 144}),
+                                        9: (1, {'@': 144}),
+                                        13: (1, {'@': 144}),
+                                        14: (1, {'@': 144}),
+                                        8: (1, {'@': 144})},
+                                  161: {91: (0, 139),
+                                        5: (0, 207),
+                                        31: (0, 141),
+                                        16: (0, 34),
+                                        12: (0, 216),
+                                        7: (0, 15),
+                                        19: (0, 27),
+                                        33: (0, 53),
+                                        29: (0, 218),
+                                        3: (0, 56),
+                                        6: (0, 25),
+                                        1: (0, 152),
+                                        35: (0, 118),
+                                        10: (0, 122),
+                                        34: (0, 219),
+                                        4: (0, 150),
+                                        18: (0, 195),
+                                        37: (0, 194),
+                                        40: (0, 172),
+                                        87: (0, 196)},
+                                  162: {89: (0, 163)},
+                                  163: {63: (0, 19)},
+                                  164: {0: (1, {'@': 43}),
+                                        10: (1, {'@': 43}),
+                                        2: (1, {'@': 43}),
+                                        11: (1, {'@': 43}),
+                                        3: (1, {'@': 43}),
+                                        12: (1, {'@': 43}),
+                                        9: (1, {'@': 43}),
+                                        4: (1, {'@': 43}),
+                                        13: (1, {'@': 43}),
+                                        5: (1, {'@': 43}),
+                                        6: (1, {'@': 43}),
+                                        14: (1, {'@': 43}),
+                                        7: (1, {'@': 43}),
+                                        15: (1, {'@': 43}),
+                                        16: (1, {'@': 43}),
+                                        8: (1, {'@': 43}),
+                                        18: (1, {'@': 43}),
+                                        17: (1, {'@': 43}),
+                                        19: (1, {'@': 43})},
+                                  165: {36: (0, 181),
+                                        29: (0, 183),
+                                        40: (0, 186),
+                                        15: (0, 161),
+                                        50: (0, 188),
+                                        32: (0, 4),
+                                        5: (0, 207),
+                                        12: (0, 216),
+                                        7: (0, 15),
+                                        19: (0, 27),
+                                        33: (0, 53),
+                                        3: (0, 56),
+                                        6: (0, 25),
+                                        35: (0, 118),
+                                        34: (0, 200),
+                                        10: (0, 122),
+                                        37: (0, 158),
+                                        4: (0, 150),
+                                        18: (0, 195),
+                                        39: (0, 30),
+                                        11: (0, 67)},
+                                  166: {0: (1, {'@': 76}),
+                                        1: (1, {'@': 76}),
+                                        10: (1, {'@': 76}),
+                                        2: (1, {'@': 76}),
+                                        24: (1, {'@': 76}),
+                                        11: (1, {'@': 76}),
+                                        18: (1, {'@': 76}),
+                                        3: (1, {'@': 76}),
+                                        4: (1, {'@': 76}),
+                                        12: (1, {'@': 76}),
+                                        13: (1, {'@': 76}),
+                                        5: (1, {'@': 76}),
+                                        6: (1, {'@': 76}),
+                                        25: (1, {'@': 76}),
+                                        14: (1, {'@': 76}),
+                                        7: (1, {'@': 76}),
+                                        15: (1, {'@': 76}),
+                                        16: (1, {'@': 76}),
+                                        8: (1, {'@': 76}),
+                                        9: (1, {'@': 76}),
+                                        17: (1, {'@': 76}),
+                                        19: (1, {'@': 76}),
+                                        20: (1, {'@': 76}),
+                                        22: (1, {'@': 76}),
+                                        23: (1, {'@': 76}),
+                                        26: (1, {'@': 76}),
+                                        27: (1, {'@': 76}),
+                                        28: (1, {'@': 76})},
+                                  167: {89: (0, 202)},
+                                  168: {27: (1, {'@': 97}),
+                                        1: (1, {'@': 97}),
+                                        5: (1, {'@': 97}),
+                                        6: (1, {'@': 97}),
+                                        18: (1, {'@': 97}),
+                                        3: (1, {'@': 97}),
+                                        7: (1, {'@': 97}),
+                                        12: (1, {'@': 97}),
+                                        16: (1, {'@': 97}),
+                                        15: (1, {'@': 97}),
+                                        4: (1, {'@': 97}),
+                                        19: (1, {'@': 97})},
+                                  169: {27: (1, {'@': 199}),
+                                        1: (1, {'@': 199}),
+                                        5: (1, {'@': 199}),
+                                        6: (1, {'@': 199}),
+                                        18: (1, {'@': 199}),
+                                        3: (1, {'@': 199}),
+                                        7: (1, {'@': 199}),
+                                        12: (1, {'@': 199}),
+                                        16: (1, {'@': 199}),
+                                        15: (1, {'@': 199}),
+                                        4: (1, {'@': 199}),
+                                        19: (1, {'@': 199})},
+                                  170: {92: (0, 40), 93: (0, 93)},
+                                  171: {31: (0, 168),
+                                        15: (0, 161),
+                                        5: (0, 207),
+                                        34: (0, 180),
+                                        16: (0, 34),
+                                        1: (0, 173),
+                                        12: (0, 216),
+                                        7: (0, 15),
+                                        19: (0, 27),
+                                        33: (0, 53),
+                                        3: (0, 56),
+                                        6: (0, 25),
+                                        35: (0, 118),
+                                        79: (0, 169),
+                                        4: (0, 150),
+                                        18: (0, 195),
+                                        40: (0, 184),
+                                        29: (0, 187),
+                                        27: (0, 174),
+                                        32: (0, 191)},
+                                  172: {1: (1, {'@': 91}),
+                                        10: (1, {'@': 91}),
+                                        5: (1, {'@': 91}),
+                                        6: (1, {'@': 91}),
+                                        28: (1, {'@': 91}),
+                                        3: (1, {'@': 91}),
+                                        7: (1, {'@': 91}),
+                                        12: (1, {'@': 91}),
+                                        16: (1, {'@': 91}),
+                                        4: (1, {'@': 91}),
+                                        18: (1, {'@': 91}),
+                                        19: (1, {'@': 91})},
+                                  173: {27: (1, {'@': 93}),
+                                        1: (1, {'@': 93}),
+                                        5: (1, {'@': 93}),
+                                        6: (1, {'@': 93}),
+                                        18: (1, {'@': 93}),
+                                        3: (1, {'@': 93}),
+                                        7: (1, {'@': 93}),
+                                        12: (1, {'@': 93}),
+                                        16: (1, {'@': 93}),
+                                        15: (1, {'@': 93}),
+                                        4: (1, {'@': 93}),
+                                        19: (1, {'@': 93})},
+                                  174: {0: (1, {'@': 92}),
+                                        1: (1, {'@': 92}),
+                                        10: (1, {'@': 92}),
+                                        2: (1, {'@': 92}),
+                                        24: (1, {'@': 92}),
+                                        11: (1, {'@': 92}),
+                                        18: (1, {'@': 92}),
+                                        3: (1, {'@': 92}),
+                                        4: (1, {'@': 92}),
+                                        12: (1, {'@': 92}),
+                                        13: (1, {'@': 92}),
+                                        5: (1, {'@': 92}),
+                                        6: (1, {'@': 92}),
+                                        25: (1, {'@': 92}),
+                                        14: (1, {'@': 92}),
+                                        7: (1, {'@': 92}),
+                                        15: (1, {'@': 92}),
+                                        16: (1, {'@': 92}),
+                                        8: (1, {'@': 92}),
+                                        9: (1, {'@': 92}),
+                                        17: (1, {'@': 92}),
+                                        19: (1, {'@': 92}),
+                                        20: (1, {'@': 92}),
+                                        21: (1, {'@': 92}),
+                                        22: (1, {'@': 92}),
+                                        23: (1, {'@': 92}),
+                                        28: (1, {'@': 92})},
+                                  175: {29: (0, 208),
+                                        20: (0, 209),
+                                        40: (0, 142),
+                                        15: (0, 161),
+                                        16: (0, 179),
+                                        5: (0, 207),
+                                        32: (0, 4),
+                                        12: (0, 216),
+                                        7: (0, 15),
+                                        19: (0, 27),
+                                        33: (0, 53),
+                                        3: (0, 56),
+                                        36: (0, 75),
+                                        53: (0, 50),
+                                        35: (0, 118),
+                                        94: (0, 65),
+                                        10: (0, 122),
+                                        37: (0, 158),
+                                        13: (0, 59),
+                                        4: (0, 150),
+                                        18: (0, 195),
+                                        54: (0, 28),
+                                        39: (0, 30),
+                                        1: (0, 68),
+                                        11: (0, 67)},
+                                  176: {0: (1, {'@': 110}),
+                                        1: (1, {'@': 110}),
+                                        2: (1, {'@': 110}),
+                                        3: (1, {'@': 110}),
+                                        4: (1, {'@': 110}),
+                                        5: (1, {'@': 110}),
+                                        6: (1, {'@': 110}),
+                                        7: (1, {'@': 110}),
+                                        8: (1, {'@': 110}),
+                                        9: (1, {'@': 110}),
+                                        10: (1, {'@': 110}),
+                                        11: (1, {'@': 110}),
+                                        12: (1, {'@': 110}),
+                                        13: (1, {'@': 110}),
+                                        14: (1, {'@': 110}),
+                                        15: (1, {'@': 110}),
+                                        16: (1, {'@': 110}),
+                                        17: (1, {'@': 110}),
+                                        18: (1, {'@': 110}),
+                                        19: (1, {'@': 110})},
+                                  177: {68: (0, 48),
+                                        25: (0, 51),
+                                        40: (0, 82),
+                                        15: (0, 161),
+                                        5: (0, 207),
+                                        32: (0, 4),
+                                        16: (0, 34),
+                                        12: (0, 216),
+                                        7: (0, 15),
+                                        19: (0, 27),
+                                        33: (0, 53),
+                                        36: (0, 78),
+                                        17: (0, 54),
+                                        3: (0, 56),
+                                        69: (0, 73),
+                                        35: (0, 118),
+                                        70: (0, 84),
+                                        10: (0, 122),
+                                        72: (0, 86),
+                                        37: (0, 158),
+                                        31: (0, 90),
+                                        9: (0, 124),
+                                        4: (0, 150),
+                                        18: (0, 195),
+                                        29: (0, 92),
+                                        95: (0, 96),
+                                        1: (0, 108),
+                                        39: (0, 30),
+                                        71: (0, 103),
+                                        73: (0, 111),
+                                        11: (0, 67),
+                                        74: (0, 113)},
+                                  178: {36: (0, 181),
+                                        29: (0, 183),
+                                        40: (0, 186),
+                                        15: (0, 161),
+                                        32: (0, 4),
+                                        5: (0, 207),
+                                        12: (0, 216),
+                                        7: (0, 15),
+                                        19: (0, 27),
+                                        33: (0, 53),
+                                        1: (0, 32),
+                                        3: (0, 56),
+                                        6: (0, 25),
+                                        35: (0, 118),
+                                        34: (0, 200),
+                                        10: (0, 122),
+                                        37: (0, 158),
+                                        4: (0, 150),
+                                        18: (0, 195),
+                                        39: (0, 30),
+                                        50: (0, 37),
+                                        11: (0, 67),
+                                        51: (0, 66),
+                                        0: (1, {'@': 128}),
+                                        2: (1, {'@': 128}),
+                                        13: (1, {'@': 128}),
+                                        25: (1, {'@': 128}),
+                                        14: (1, {'@': 128}),
+                                        16: (1, {'@': 128}),
+                                        8: (1, {'@': 128}),
+                                        9: (1, {'@': 128}),
+                                        17: (1, {'@': 128})},
+                                  179: {29: (0, 208),
+                                        40: (0, 142),
+                                        15: (0, 161),
+                                        16: (0, 179),
+                                        5: (0, 207),
+                                        32: (0, 4),
+                                        12: (0, 216),
+                                        7: (0, 15),
+                                        19: (0, 27),
+                                        33: (0, 53),
+                                        3: (0, 56),
+                                        36: (0, 75),
+                                        53: (0, 50),
+                                        35: (0, 118),
+                                        96: (0, 175),
+                                        10: (0, 122),
+                                        37: (0, 158),
+                                        94: (0, 83),
+                                        13: (0, 59),
+                                        4: (0, 150),
+                                        18: (0, 195),
+                                        54: (0, 28),
+                                        39: (0, 30),
+                                        1: (0, 68),
+                                        11: (0, 67),
+                                        20: (0, 9)},
+                                  180: {27: (1, {'@': 95}),
+                                        1: (1, {'@': 95}),
+                                        5: (1, {'@': 95}),
+                                        6: (1, {'@': 95}),
+                                        18: (1, {'@': 95}),
+                                        3: (1, {'@': 95}),
+                                        7: (1, {'@': 95}),
+                                        12: (1, {'@': 95}),
+                                        16: (1, {'@': 95}),
+                                        15: (1, {'@': 95}),
+                                        4: (1, {'@': 95}),
+                                        19: (1, {'@': 95})},
+                                  181: {0: (1, {'@': 138}),
+                                        1: (1, {'@': 138}),
+                                        10: (1, {'@': 138}),
+                                        2: (1, {'@': 138}),
+                                        11: (1, {'@': 138}),
+                                        18: (1, {'@': 138}),
+                                        3: (1, {'@': 138}),
+                                        4: (1, {'@': 138}),
+                                        12: (1, {'@': 138}),
+                                        13: (1, {'@': 138}),
+                                        5: (1, {'@': 138}),
+                                        6: (1, {'@': 138}),
+                                        25: (1, {'@': 138}),
+                                        14: (1, {'@': 138}),
+                                        7: (1, {'@': 138}),
+                                        15: (1, {'@': 138}),
+                                        16: (1, {'@': 138}),
+                                        8: (1, {'@': 138}),
+                                        9: (1, {'@': 138}),
+                                        17: (1, {'@': 138}),
+                                        19: (1, {'@': 138})},
+                                  182: {27: (1, {'@': 198}),
+                                        1: (1, {'@': 198}),
+                                        5: (1, {'@': 198}),
+                                        6: (1, {'@': 198}),
+                                        18: (1, {'@': 198}),
+                                        3: (1, {'@': 198}),
+                                        7: (1, {'@': 198}),
+                                        12: (1, {'@': 198}),
+                                        16: (1, {'@': 198}),
+                                        15: (1, {'@': 198}),
+                                        4: (1, {'@': 198}),
+                                        19: (1, {'@': 198})},
+                                  183: {0: (1, {'@': 140}),
+                                        1: (1, {'@': 140}),
+                                        10: (1, {'@': 140}),
+                                        2: (1, {'@': 140}),
+                                        11: (1, {'@': 140}),
+                                        18: (1, {'@': 140}),
+                                        3: (1, {'@': 140}),
+                                        4: (1, {'@': 140}),
+                                        12: (1, {'@': 140}),
+                                        13: (1, {'@': 140}),
+                                        5: (1, {'@': 140}),
+                                        6: (1, {'@': 140}),
+                                        25: (1, {'@': 140}),
+                                        14: (1, {'@': 140}),
+                                        7: (1, {'@': 140}),
+                                        15: (1, {'@': 140}),
+                                        16: (1, {'@': 140}),
+                                        8: (1, {'@': 140}),
+                                        9: (1, {'@': 140}),
+                                        17: (1, {'@': 140}),
+                                        19: (1, {'@': 140})},
+                                  184: {27: (1, {'@': 98}),
+                                        1: (1, {'@': 98}),
+                                        5: (1, {'@': 98}),
+                                        6: (1, {'@': 98}),
+                                        18: (1, {'@': 98}),
+                                        3: (1, {'@': 98}),
+                                        7: (1, {'@': 98}),
+                                        12: (1, {'@': 98}),
+                                        16: (1, {'@': 98}),
+                                        15: (1, {'@': 98}),
+                                        4: (1, {'@': 98}),
+                                        19: (1, {'@': 98})},
+                                  185: {70: (0, 164),
+                                        2: (0, 170),
+                                        97: (0, 203),
+                                        77: (0, 160),
+                                        8: (0, 199),
+                                        15: (0, 161),
+                                        98: (0, 80),
+                                        16: (0, 179),
+                                        99: (0, 156),
+                                        5: (0, 207),
+                                        12: (0, 216),
+                                        32: (0, 4),
+                                        7: (0, 15),
+                                        100: (0, 33),
+                                        19: (0, 27),
+                                        33: (0, 53),
+                                        101: (0, 190),
+                                        17: (0, 54),
+                                        3: (0, 56),
+                                        6: (0, 25),
+                                        36: (0, 97),
+                                        29: (0, 104),
+                                        35: (0, 118),
+                                        10: (0, 122),
+                                        37: (0, 158),
+                                        9: (0, 124),
+                                        14: (0, 153),
+                                        74: (0, 39),
+                                        4: (0, 150),
+                                        18: (0, 195),
+                                        39: (0, 30),
+                                        102: (0, 49),
+                                        40: (0, 22),
+                                        103: (0, 57),
+                                        54: (0, 61),
+                                        13: (0, 6),
+                                        11: (0, 67),
+                                        104: (0, 77),
+                                        34: (0, 63),
+                                        105: (0, 102),
+                                        0: (1, {'@': 39})},
+                                  186: {0: (1, {'@': 137}),
+                                        1: (1, {'@': 137}),
+                                        10: (1, {'@': 137}),
+                                        2: (1, {'@': 137}),
+                                        11: (1, {'@': 137}),
+                                        18: (1, {'@': 137}),
+                                        3: (1, {'@': 137}),
+                                        4: (1, {'@': 137}),
+                                        12: (1, {'@': 137}),
+                                        13: (1, {'@': 137}),
+                                        5: (1, {'@': 137}),
+                                        6: (1, {'@': 137}),
+                                        25: (1, {'@': 137}),
+                                        14: (1, {'@': 137}),
+                                        7: (1, {'@': 137}),
+                                        15: (1, {'@': 137}),
+                                        16: (1, {'@': 137}),
+                                        8: (1, {'@': 137}),
+                                        9: (1, {'@': 137}),
+                                        17: (1, {'@': 137}),
+                                        19: (1, {'@': 137})},
+                                  187: {27: (1, {'@': 96}),
+                                        1: (1, {'@': 96}),
+                                        5: (1, {'@': 96}),
+                                        6: (1, {'@': 96}),
+                                        18: (1, {'@': 96}),
+                                        3: (1, {'@': 96}),
+                                        7: (1, {'@': 96}),
+                                        12: (1, {'@': 96}),
+                                        16: (1, {'@': 96}),
+                                        15: (1, {'@': 96}),
+                                        4: (1, {'@': 96}),
+                                        19: (1, {'@': 96})},
+                                  188: {36: (0, 181),
+                                        29: (0, 183),
+                                        40: (0, 186),
+                                        15: (0, 161),
+                                        32: (0, 4),
+                                        5: (0, 207),
+                                        12: (0, 216),
+                                        65: (0, 24),
+                                        7: (0, 15),
+                                        19: (0, 27),
+                                        33: (0, 53),
+                                        1: (0, 32),
+                                        3: (0, 56),
+                                        6: (0, 25),
+                                        35: (0, 118),
+                                        34: (0, 200),
+                                        10: (0, 122),
+                                        37: (0, 158),
+                                        4: (0, 150),
+                                        18: (0, 195),
+                                        51: (0, 26),
+                                        39: (0, 30),
+                                        50: (0, 37),
+                                        11: (0, 67),
+                                        0: (1, {'@': 135}),
+                                        2: (1, {'@': 135}),
+                                        13: (1, {'@': 135}),
+                                        25: (1, {'@': 135}),
+                                        14: (1, {'@': 135}),
+                                        16: (1, {'@': 135}),
+                                        8: (1, {'@': 135}),
+                                        9: (1, {'@': 135}),
+                                        17: (1, {'@': 135})},
+                                  189: {1: (1, {'@': 201}),
+                                        5: (1, {'@': 201}),
+                                        26: (1, {'@': 201}),
+                                        6: (1, {'@': 201}),
+                                        3: (1, {'@': 201}),
+                                        7: (1, {'@': 201}),
+                                        12: (1, {'@': 201}),
+                                        16: (1, {'@': 201}),
+                                        4: (1, {'@': 201}),
+                                        18: (1, {'@': 201}),
+                                        19: (1, {'@': 201})},
+                                  190: {70: (0, 164),
+                                        2: (0, 170),
+                                        97: (0, 203),
+                                        77: (0, 160),
+                                        8: (0, 199),
+                                        15: (0, 161),
+                                        98: (0, 80),
+                                        16: (0, 179),
+                                        105: (0, 138),
+                                        99: (0, 156),
+                                        5: (0, 207),
+                                        12: (0, 216),
+                                        32: (0, 4),
+                                        7: (0, 15),
+                                        100: (0, 33),
+                                        19: (0, 27),
+                                        33: (0, 53),
+                                        17: (0, 54),
+                                        3: (0, 56),
+                                        6: (0, 25),
+                                        36: (0, 97),
+                                        29: (0, 104),
+                                        35: (0, 118),
+                                        10: (0, 122),
+                                        37: (0, 158),
+                                        9: (0, 124),
+                                        14: (0, 153),
+                                        74: (0, 39),
+                                        4: (0, 150),
+                                        18: (0, 195),
+                                        39: (0, 30),
+                                        102: (0, 49),
+                                        40: (0, 22),
+                                        103: (0, 57),
+                                        54: (0, 61),
+                                        13: (0, 6),
+                                        11: (0, 67),
+                                        104: (0, 77),
+                                        34: (0, 63),
+                                        0: (1, {'@': 38})},
+                                  191: {27: (1, {'@': 94}),
+                                        1: (1, {'@': 94}),
+                                        5: (1, {'@': 94}),
+                                        6: (1, {'@': 94}),
+                                        18: (1, {'@': 94}),
+                                        3: (1, {'@': 94}),
+                                        7: (1, {'@': 94}),
+                                        12: (1, {'@': 94}),
+                                        16: (1, {'@': 94}),
+                                        15: (1, {'@': 94}),
+                                        4: (1, {'@': 94}),
+                                        19: (1, {'@': 94})},
+                                  192: {10: (1, {'@': 177}),
+                                        1: (1, {'@': 177}),
+                                        5: (1, {'@': 177}),
+                                        25: (1, {'@': 177}),
+                                        11: (1, {'@': 177}),
+                                        18: (1, {'@': 177}),
+                                        3: (1, {'@': 177}),
+                                        7: (1, {'@': 177}),
+                                        9: (1, {'@': 177}),
+                                        12: (1, {'@': 177}),
+                                        16: (1, {'@': 177}),
+                                        15: (1, {'@': 177}),
+                                        17: (1, {'@': 177}),
+                                        4: (1, {'@': 177}),
+                                        19: (1, {'@': 177})},
+                                  193: {70: (0, 164),
+                                        2: (0, 170),
+                                        97: (0, 203),
+                                        77: (0, 160),
+                                        8: (0, 199),
+                                        15: (0, 161),
+                                        16: (0, 179),
+                                        98: (0, 185),
+                                        99: (0, 156),
+                                        5: (0, 207),
+                                        12: (0, 216),
+                                        106: (0, 2),
+                                        32: (0, 4),
+                                        7: (0, 15),
+                                        100: (0, 33),
+                                        19: (0, 27),
+                                        33: (0, 53),
+                                        17: (0, 54),
+                                        3: (0, 56),
+                                        6: (0, 25),
+                                        36: (0, 97),
+                                        29: (0, 104),
+                                        35: (0, 118),
+                                        10: (0, 122),
+                                        37: (0, 158),
+                                        9: (0, 124),
+                                        14: (0, 153),
+                                        74: (0, 39),
+                                        4: (0, 150),
+                                        18: (0, 195),
+                                        39: (0, 30),
+                                        102: (0, 49),
+                                        40: (0, 22),
+                                        103: (0, 57),
+                                        54: (0, 61),
+                                        11: (0, 67),
+                                        104: (0, 77),
+                                        34: (0, 63)},
+                                  194: {1: (1, {'@': 87}),
+                                        10: (1, {'@': 87}),
+                                        5: (1, {'@': 87}),
+                                        6: (1, {'@': 87}),
+                                        28: (1, {'@': 87}),
+                                        3: (1, {'@': 87}),
+                                        7: (1, {'@': 87}),
+                                        12: (1, {'@': 87}),
+                                        16: (1, {'@': 87}),
+                                        4: (1, {'@': 87}),
+                                        18: (1, {'@': 87}),
+                                        19: (1, {'@': 87})},
+                                  195: {16: (0, 58),
+                                        42: (0, 64),
+                                        15: (0, 161),
+                                        1: (0, 3),
+                                        20: (0, 99),
+                                        32: (0, 4),
+                                        5: (0, 207),
+                                        12: (0, 216),
+                                        22: (0, 130),
+                                        21: (0, 5),
+                                        34: (0, 7),
+                                        7: (0, 15),
+                                        19: (0, 27),
+                                        43: (0, 35),
+                                        44: (0, 62),
+                                        107: (0, 10),
+                                        3: (0, 56),
+                                        6: (0, 105),
+                                        33: (0, 16),
+                                        41: (0, 11),
+                                        10: (0, 122),
+                                        37: (0, 158),
+                                        40: (0, 17),
+                                        4: (0, 150),
+                                        45: (0, 131),
+                                        46: (0, 18),
+                                        39: (0, 30),
+                                        36: (0, 20),
+                                        11: (0, 67),
+                                        23: (0, 140),
+                                        31: (0, 23),
+                                        47: (0, 154)},
+                                  196: {1: (1, {'@': 196}),
+                                        10: (1, {'@': 196}),
+                                        5: (1, {'@': 196}),
+                                        6: (1, {'@': 196}),
+                                        28: (1, {'@': 196}),
+                                        3: (1, {'@': 196}),
+                                        7: (1, {'@': 196}),
+                                        12: (1, {'@': 196}),
+                                        16: (1, {'@': 196}),
+                                        4: (1, {'@': 196}),
+                                        18: (1, {'@': 196}),
+                                        19: (1, {'@': 196})},
+                                  197: {20: (1, {'@': 70}),
+                                        10: (1, {'@': 70}),
+                                        1: (1, {'@': 70}),
+                                        11: (1, {'@': 70}),
+                                        3: (1, {'@': 70}),
+                                        12: (1, {'@': 70}),
+                                        4: (1, {'@': 70}),
+                                        5: (1, {'@': 70}),
+                                        22: (1, {'@': 70}),
+                                        6: (1, {'@': 70}),
+                                        23: (1, {'@': 70}),
+                                        7: (1, {'@': 70}),
+                                        15: (1, {'@': 70}),
+                                        16: (1, {'@': 70}),
+                                        18: (1, {'@': 70}),
+                                        19: (1, {'@': 70})},
+                                  198: {63: (0, 47)},
+                                  199: {63: (0, 147), 108: (0, 91)},
+                                  200: {0: (1, {'@': 139}),
+                                        1: (1, {'@': 139}),
+                                        10: (1, {'@': 139}),
+                                        2: (1, {'@': 139}),
+                                        11: (1, {'@': 139}),
+                                        18: (1, {'@': 139}),
+                                        3: (1, {'@': 139}),
+                                        4: (1, {'@': 139}),
+                                        12: (1, {'@': 139}),
+                                        13: (1, {'@': 139}),
+                                        5: (1, {'@': 139}),
+                                        6: (1, {'@': 139}),
+                                        25: (1, {'@': 139}),
+                                        14: (1, {'@': 139}),
+                                        7: (1, {'@': 139}),
+                                        15: (1, {'@': 139}),
+                                        16: (1, {'@': 139}),
+                                        8: (1, {'@': 139}),
+                                        9: (1, {'@': 139}),
+                                        17: (1, {'@': 139}),
+                                        19: (1, {'@': 139})},
+                                  201: {0: (1, {'@': 68}),
+                                        1: (1, {'@': 68}),
+                                        10: (1, {'@': 68}),
+                                        2: (1, {'@': 68}),
+                                        24: (1, {'@': 68}),
+                                        11: (1, {'@': 68}),
+                                        18: (1, {'@': 68}),
+                                        3: (1, {'@': 68}),
+                                        4: (1, {'@': 68}),
+                                        12: (1, {'@': 68}),
+                                        13: (1, {'@': 68}),
+                                        5: (1, {'@': 68}),
+                                        6: (1, {'@': 68}),
+                                        25: (1, {'@': 68}),
+                                        14: (1, {'@': 68}),
+                                        7: (1, {'@': 68}),
+                                        15: (1, {'@': 68}),
+                                        16: (1, {'@': 68}),
+                                        8: (1, {'@': 68}),
+                                        9: (1, {'@': 68}),
+                                        17: (1, {'@': 68}),
+                                        19: (1, {'@': 68}),
+                                        20: (1, {'@': 68}),
+                                        21: (1, {'@': 68}),
+                                        22: (1, {'@': 68}),
+                                        23: (1, {'@': 68}),
+                                        26: (1, {'@': 68}),
+                                        27: (1, {'@': 68}),
+                                        28: (1, {'@': 68})},
+                                  202: {63: (0, 88)},
+                                  203: {0: (1, {'@': 115}),
+                                        10: (1, {'@': 115}),
+                                        2: (1, {'@': 115}),
+                                        11: (1, {'@': 115}),
+                                        3: (1, {'@': 115}),
+                                        12: (1, {'@': 115}),
+                                        9: (1, {'@': 115}),
+                                        4: (1, {'@': 115}),
+                                        13: (1, {'@': 115}),
+                                        5: (1, {'@': 115}),
+                                        6: (1, {'@': 115}),
+                                        14: (1, {'@': 115}),
+                                        7: (1, {'@': 115}),
+                                        15: (1, {'@': 115}),
+                                        16: (1, {'@': 115}),
+                                        8: (1, {'@': 115}),
+                                        18: (1, {'@': 115}),
+                                        17: (1, {'@': 115}),
+                                        19: (1, {'@': 115})},
+                                  204: {109: (0, 177), 63: (0, 192)},
+                                  205: {36: (0, 211),
+                                        15: (0, 161),
+                                        32: (0, 4),
+                                        5: (0, 207),
+                                        12: (0, 216),
+                                        34: (0, 176),
+                                        16: (0, 34),
+                                        7: (0, 15),
+                                        19: (0, 27),
+                                        33: (0, 53),
+                                        3: (0, 56),
+                                        6: (0, 25),
+                                        35: (0, 118),
+                                        10: (0, 122),
+                                        37: (0, 158),
+                                        31: (0, 214),
+                                        4: (0, 150),
+                                        88: (0, 210),
+                                        18: (0, 195),
+                                        39: (0, 30),
+                                        29: (0, 0),
+                                        40: (0, 1),
+                                        11: (0, 67),
+                                        110: (0, 38),
+                                        1: (0, 212),
+                                        0: (1, {'@': 106}),
+                                        2: (1, {'@': 106}),
+                                        9: (1, {'@': 106}),
+                                        13: (1, {'@': 106}),
+                                        14: (1, {'@': 106}),
+                                        8: (1, {'@': 106}),
+                                        17: (1, {'@': 106})},
+                                  206: {0: (1, {'@': 202}),
+                                        1: (1, {'@': 202}),
+                                        2: (1, {'@': 202}),
+                                        3: (1, {'@': 202}),
+                                        4: (1, {'@': 202}),
+                                        5: (1, {'@': 202}),
+                                        6: (1, {'@': 202}),
+                                        7: (1, {'@': 202}),
+                                        8: (1, {'@': 202}),
+                                        9: (1, {'@': 202}),
+                                        10: (1, {'@': 202}),
+                                        11: (1, {'@': 202}),
+                                        12: (1, {'@': 202}),
+                                        13: (1, {'@': 202}),
+                                        14: (1, {'@': 202}),
+                                        15: (1, {'@': 202}),
+                                        16: (1, {'@': 202}),
+                                        17: (1, {'@': 202}),
+                                        18: (1, {'@': 202}),
+                                        19: (1, {'@': 202})},
+                                  207: {0: (1, {'@': 47}),
+                                        1: (1, {'@': 47}),
+                                        10: (1, {'@': 47}),
+                                        2: (1, {'@': 47}),
+                                        24: (1, {'@': 47}),
+                                        11: (1, {'@': 47}),
+                                        18: (1, {'@': 47}),
+                                        3: (1, {'@': 47}),
+                                        4: (1, {'@': 47}),
+                                        12: (1, {'@': 47}),
+                                        13: (1, {'@': 47}),
+                                        5: (1, {'@': 47}),
+                                        6: (1, {'@': 47}),
+                                        25: (1, {'@': 47}),
+                                        14: (1, {'@': 47}),
+                                        7: (1, {'@': 47}),
+                                        15: (1, {'@': 47}),
+                                        16: (1, {'@': 47}),
+                                        8: (1, {'@': 47}),
+                                        9: (1, {'@': 47}),
+                                        17: (1, {'@': 47}),
+                                        19: (1, {'@': 47}),
+                                        20: (1, {'@': 47}),
+                                        21: (1, {'@': 47}),
+                                        22: (1, {'@': 47}),
+                                        23: (1, {'@': 47}),
+                                        26: (1, {'@': 47}),
+                                        27: (1, {'@': 47}),
+                                        28: (1, {'@': 47})},
+                                  208: {10: (1, {'@': 186}),
+                                        20: (1, {'@': 186}),
+                                        5: (1, {'@': 186}),
+                                        1: (1, {'@': 186}),
+                                        11: (1, {'@': 186}),
+                                        3: (1, {'@': 186}),
+                                        7: (1, {'@': 186}),
+                                        12: (1, {'@': 186}),
+                                        15: (1, {'@': 186}),
+                                        4: (1, {'@': 186}),
+                                        18: (1, {'@': 186}),
+                                        19: (1, {'@': 186}),
+                                        16: (1, {'@': 186}),
+                                        13: (1, {'@': 186})},
+                                  209: {10: (1, {'@': 178}),
+                                        20: (1, {'@': 178}),
+                                        5: (1, {'@': 178}),
+                                        1: (1, {'@': 178}),
+                                        11: (1, {'@': 178}),
+                                        3: (1, {'@': 178}),
+                                        7: (1, {'@': 178}),
+                                        12: (1, {'@': 178}),
+                                        15: (1, {'@': 178}),
+                                        4: (1, {'@': 178}),
+                                        18: (1, {'@': 178}),
+                                        19: (1, {'@': 178}),
+                                        16: (1, {'@': 178}),
+                                        0: (1, {'@': 178}),
+                                        2: (1, {'@': 178}),
+                                        24: (1, {'@': 178}),
+                                        13: (1, {'@': 178}),
+                                        6: (1, {'@': 178}),
+                                        14: (1, {'@': 178}),
+                                        17: (1, {'@': 178}),
+                                        8: (1, {'@': 178}),
+                                        9: (1, {'@': 178})},
+                                  210: {0: (1, {'@': 114}),
+                                        1: (1, {'@': 114}),
+                                        10: (1, {'@': 114}),
+                                        2: (1, {'@': 114}),
+                                        11: (1, {'@': 114}),
+                                        18: (1, {'@': 114}),
+                                        3: (1, {'@': 114}),
+                                        4: (1, {'@': 114}),
+                                        12: (1, {'@': 114}),
+                                        13: (1, {'@': 114}),
+                                        5: (1, {'@': 114}),
+                                        6: (1, {'@': 114}),
+                                        14: (1, {'@': 114}),
+                                        7: (1, {'@': 114}),
+                                        15: (1, {'@': 114}),
+                                        16: (1, {'@': 114}),
+                                        8: (1, {'@': 114}),
+                                        9: (1, {'@': 114}),
+                                        17: (1, {'@': 114}),
+                                        19: (1, {'@': 114})},
+                                  211: {0: (1, {'@': 109}),
+                                        1: (1, {'@': 109}),
+                                        2: (1, {'@': 109}),
+                                        3: (1, {'@': 109}),
+                                        4: (1, {'@': 109}),
+                                        5: (1, {'@': 109}),
+                                        6: (1, {'@': 109}),
+                                        7: (1, {'@': 109}),
+                                        8: (1, {'@': 109}),
+                                        9: (1, {'@': 109}),
+                                        10: (1, {'@': 109}),
+                                        11: (1, {'@': 109}),
+                                        12: (1, {'@': 109}),
+                                        13: (1, {'@': 109}),
+                                        14: (1, {'@': 109}),
+                                        15: (1, {'@': 109}),
+                                        16: (1, {'@': 109}),
+                                        17: (1, {'@': 109}),
+                                        18: (1, {'@': 109}),
+                                        19: (1, {'@': 109})},
+                                  212: {0: (1, {'@': 113}),
+                                        1: (1, {'@': 113}),
+                                        10: (1, {'@': 113}),
+                                        2: (1, {'@': 113}),
+                                        11: (1, {'@': 113}),
+                                        18: (1, {'@': 113}),
+                                        3: (1, {'@': 113}),
+                                        4: (1, {'@': 113}),
+                                        12: (1, {'@': 113}),
+                                        13: (1, {'@': 113}),
+                                        5: (1, {'@': 113}),
+                                        6: (1, {'@': 113}),
+                                        14: (1, {'@': 113}),
+                                        7: (1, {'@': 113}),
+                                        15: (1, {'@': 113}),
+                                        16: (1, {'@': 113}),
+                                        8: (1, {'@': 113}),
+                                        9: (1, {'@': 113}),
+                                        17: (1, {'@': 113}),
+                                        19: (1, {'@': 113})},
+                                  213: {36: (0, 211),
+                                        15: (0, 161),
+                                        111: (0, 205),
+                                        32: (0, 4),
+                                        5: (0, 207),
+                                        12: (0, 216),
+                                        34: (0, 176),
+                                        16: (0, 34),
+                                        7: (0, 15),
+                                        19: (0, 27),
+                                        33: (0, 53),
+                                        3: (0, 56),
+                                        6: (0, 25),
+                                        35: (0, 118),
+                                        10: (0, 122),
+                                        37: (0, 158),
+                                        31: (0, 214),
+                                        4: (0, 150),
+                                        88: (0, 210),
+                                        18: (0, 195),
+                                        39: (0, 30),
+                                        29: (0, 0),
+                                        40: (0, 1),
+                                        11: (0, 67),
+                                        110: (0, 206),
+                                        1: (0, 212),
+                                        0: (1, {'@': 107}),
+                                        2: (1, {'@': 107}),
+                                        9: (1, {'@': 107}),
+                                        13: (1, {'@': 107}),
+                                        14: (1, {'@': 107}),
+                                        8: (1, {'@': 107}),
+                                        17: (1, {'@': 107})},
+                                  214: {0: (1, {'@': 112}),
+                                        1: (1, {'@': 112}),
+                                        2: (1, {'@': 112}),
+                                        3: (1, {'@': 112}),
+                                        4: (1, {'@': 112}),
+                                        5: (1, {'@': 112}),
+                                        6: (1, {'@': 112}),
+                                        7: (1, {'@': 112}),
+                                        8: (1, {'@': 112}),
+                                        9: (1, {'@': 112}),
+                                        10: (1, {'@': 112}),
+                                        11: (1, {'@': 112}),
+                                        12: (1, {'@': 112}),
+                                        13: (1, {'@': 112}),
+                                        14: (1, {'@': 112}),
+                                        15: (1, {'@': 112}),
+                                        16: (1, {'@': 112}),
+                                        17: (1, {'@': 112}),
+                                        18: (1, {'@': 112}),
+                                        19: (1, {'@': 112})},
+                                  215: {20: (1, {'@': 195}),
+                                        1: (1, {'@': 195}),
+                                        5: (1, {'@': 195}),
+                                        10: (1, {'@': 195}),
+                                        22: (1, {'@': 195}),
+                                        6: (1, {'@': 195}),
+                                        11: (1, {'@': 195}),
+                                        19: (1, {'@': 195}),
+                                        23: (1, {'@': 195}),
+                                        3: (1, {'@': 195}),
+                                        7: (1, {'@': 195}),
+                                        15: (1, {'@': 195}),
+                                        16: (1, {'@': 195}),
+                                        12: (1, {'@': 195}),
+                                        4: (1, {'@': 195}),
+                                        21: (1, {'@': 195})},
+                                  216: {0: (1, {'@': 51}),
+                                        1: (1, {'@': 51}),
+                                        10: (1, {'@': 51}),
+                                        2: (1, {'@': 51}),
+                                        24: (1, {'@': 51}),
+                                        11: (1, {'@': 51}),
+                                        18: (1, {'@': 51}),
+                                        3: (1, {'@': 51}),
+                                        4: (1, {'@': 51}),
+                                        12: (1, {'@': 51}),
+                                        13: (1, {'@': 51}),
+                                        5: (1, {'@': 51}),
+                                        6: (1, {'@': 51}),
+                                        25: (1, {'@': 51}),
+                                        14: (1, {'@': 51}),
+                                        7: (1, {'@': 51}),
+                                        15: (1, {'@': 51}),
+                                        16: (1, {'@': 51}),
+                                        8: (1, {'@': 51}),
+                                        9: (1, {'@': 51}),
+                                        17: (1, {'@': 51}),
+                                        19: (1, {'@': 51}),
+                                        20: (1, {'@': 51}),
+                                        21: (1, {'@': 51}),
+                                        22: (1, {'@': 51}),
+                                        23: (1, {'@': 51}),
+                                        26: (1, {'@': 51}),
+                                        27: (1, {'@': 51}),
+                                        28: (1, {'@': 51})},
+                                  217: {0: (1, {'@': 99}),
+                                        1: (1, {'@': 99}),
+                                        10: (1, {'@': 99}),
+                                        2: (1, {'@': 99}),
+                                        24: (1, {'@': 99}),
+                                        11: (1, {'@': 99}),
+                                        18: (1, {'@': 99}),
+                                        3: (1, {'@': 99}),
+                                        4: (1, {'@': 99}),
+                                        12: (1, {'@': 99}),
+                                        13: (1, {'@': 99}),
+                                        5: (1, {'@': 99}),
+                                        6: (1, {'@': 99}),
+                                        25: (1, {'@': 99}),
+                                        14: (1, {'@': 99}),
+                                        7: (1, {'@': 99}),
+                                        15: (1, {'@': 99}),
+                                        16: (1, {'@': 99}),
+                                        8: (1, {'@': 99}),
+                                        9: (1, {'@': 99}),
+                                        17: (1, {'@': 99}),
+                                        19: (1, {'@': 99}),
+                                        20: (1, {'@': 99}),
+                                        21: (1, {'@': 99}),
+                                        22: (1, {'@': 99}),
+                                        23: (1, {'@': 99})},
+                                  218: {1: (1, {'@': 89}),
+                                        10: (1, {'@': 89}),
+                                        5: (1, {'@': 89}),
+                                        6: (1, {'@': 89}),
+                                        28: (1, {'@': 89}),
+                                        3: (1, {'@': 89}),
+                                        7: (1, {'@': 89}),
+                                        12: (1, {'@': 89}),
+                                        16: (1, {'@': 89}),
+                                        4: (1, {'@': 89}),
+                                        18: (1, {'@': 89}),
+                                        19: (1, {'@': 89})},
+                                  219: {1: (1, {'@': 88}),
+                                        10: (1, {'@': 88}),
+                                        5: (1, {'@': 88}),
+                                        6: (1, {'@': 88}),
+                                        28: (1, {'@': 88}),
+                                        3: (1, {'@': 88}),
+                                        7: (1, {'@': 88}),
+                                        12: (1, {'@': 88}),
+                                        16: (1, {'@': 88}),
+                                        4: (1, {'@': 88}),
+                                        18: (1, {'@': 88}),
+                                        19: (1, {'@': 88})}},
+                       'start_states': {'start': 193},
+                       'end_states': {'start': 2}},
+            '__type__': 'ParsingFrontend'},
+ 'rules': [{'@': 38},
+           {'@': 39},
+           {'@': 40},
+           {'@': 41},
+           {'@': 42},
+           {'@': 43},
+           {'@': 44},
+           {'@': 45},
+           {'@': 46},
+           {'@': 47},
+           {'@': 48},
+           {'@': 49},
+           {'@': 50},
+           {'@': 51},
+           {'@': 52},
+           {'@': 53},
+           {'@': 54},
+           {'@': 55},
+           {'@': 56},
+           {'@': 57},
+           {'@': 58},
+           {'@': 59},
+           {'@': 60},
+           {'@': 61},
+           {'@': 62},
+           {'@': 63},
+           {'@': 64},
+           {'@': 65},
+           {'@': 66},
+           {'@': 67},
+           {'@': 68},
+           {'@': 69},
+           {'@': 70},
+           {'@': 71},
+           {'@': 72},
+           {'@': 73},
+           {'@': 74},
+           {'@': 75},
+           {'@': 76},
+           {'@': 77},
+           {'@': 78},
+           {'@': 79},
+           {'@': 80},
+           {'@': 81},
+           {'@': 82},
+           {'@': 83},
+           {'@': 84},
+           {'@': 85},
+           {'@': 86},
+           {'@': 87},
+           {'@': 88},
+           {'@': 89},
+           {'@': 90},
+           {'@': 91},
+           {'@': 92},
+           {'@': 93},
+           {'@': 94},
+           {'@': 95},
+           {'@': 96},
+           {'@': 97},
+           {'@': 98},
+           {'@': 99},
+           {'@': 100},
+           {'@': 101},
+           {'@': 102},
+           {'@': 103},
+           {'@': 104},
+           {'@': 105},
+           {'@': 106},
+           {'@': 107},
+           {'@': 108},
+           {'@': 109},
+           {'@': 110},
+           {'@': 111},
+           {'@': 112},
+           {'@': 113},
+           {'@': 114},
+           {'@': 115},
+           {'@': 116},
+           {'@': 117},
+           {'@': 118},
+           {'@': 119},
+           {'@': 120},
+           {'@': 121},
+           {'@': 122},
+           {'@': 123},
+           {'@': 124},
+           {'@': 125},
+           {'@': 126},
+           {'@': 127},
+           {'@': 128},
+           {'@': 129},
+           {'@': 130},
+           {'@': 131},
+           {'@': 132},
+           {'@': 133},
+           {'@': 134},
+           {'@': 135},
+           {'@': 136},
+           {'@': 137},
+           {'@': 138},
+           {'@': 139},
+           {'@': 140},
+           {'@': 141},
+           {'@': 142},
+           {'@': 143},
+           {'@': 144},
+           {'@': 145},
+           {'@': 146},
+           {'@': 147},
+           {'@': 148},
+           {'@': 149},
+           {'@': 150},
+           {'@': 151},
+           {'@': 152},
+           {'@': 153},
+           {'@': 154},
+           {'@': 155},
+           {'@': 156},
+           {'@': 157},
+           {'@': 158},
+           {'@': 159},
+           {'@': 160},
+           {'@': 161},
+           {'@': 162},
+           {'@': 163},
+           {'@': 164},
+           {'@': 165},
+           {'@': 166},
+           {'@': 167},
+           {'@': 168},
+           {'@': 169},
+           {'@': 170},
+           {'@': 171},
+           {'@': 172},
+           {'@': 173},
+           {'@': 174},
+           {'@': 175},
+           {'@': 176},
+           {'@': 177},
+           {'@': 178},
+           {'@': 179},
+           {'@': 180},
+           {'@': 181},
+           {'@': 182},
+           {'@': 183},
+           {'@': 184},
+           {'@': 185},
+           {'@': 186},
+           {'@': 187},
+           {'@': 188},
+           {'@': 189},
+           {'@': 190},
+           {'@': 191},
+           {'@': 192},
+           {'@': 193},
+           {'@': 194},
+           {'@': 195},
+           {'@': 196},
+           {'@': 197},
+           {'@': 198},
+           {'@': 199},
+           {'@': 200},
+           {'@': 201},
+           {'@': 202},
+           {'@': 203},
+           {'@': 204},
+           {'@': 205},
+           {'@': 206},
+           {'@': 207},
+           {'@': 208},
+           {'@': 209},
+           {'@': 210},
+           {'@': 211},
+           {'@': 212},
+           {'@': 213},
+           {'@': 214},
+           {'@': 215},
+           {'@': 216},
+           {'@': 217}],
+ 'options': {'debug': False,
+             'strict': False,
+             'keep_all_tokens': False,
+             'tree_class': None,
+             'cache': False,
+             'cache_grammar': False,
+             'postlex': None,
+             'parser': 'lalr',
+             'lexer': ContainerLalrLexer,
+             'transformer': None,
+             'start': ['start'],
+             'priority': 'normal',
+             'ambiguity': 'auto',
+             'regex': False,
+             'propagate_positions': True,
+             'lexer_callbacks': {},
+             'maybe_placeholders': True,
+             'edit_terminals': None,
+             'g_regex_flags': 0,
+             'use_bytes': False,
+             'ordered_sets': True,
+             'import_paths': [],
+             'source_path': None,
+             '_plugins': {}},
+ '__type__': 'Lark'}
+
+MEMO = {0: {'name': 'HEADING_MARKER',
+     'pattern': {'value': '#+(?= )',
+                 'flags': [],
+                 'raw': '/#+(?= )/',
+                 '_width': [1, 18446744073709551616],
+                 '__type__': 'PatternRE'},
+     'priority': 5,
+     '__type__': 'TerminalDef'},
+ 1: {'name': 'WARNING_MARKER',
+     'pattern': {'value': 'WARNING',
+                 'flags': [],
+                 'raw': '"WARNING"',
+                 '__type__': 'PatternStr'},
+     'priority': 0,
+     '__type__': 'TerminalDef'},
+ 2: {'name': 'CAUTION_MARKER',
+     'pattern': {'value': 'CAUTION',
+                 'flags': [],
+                 'raw': '"CAUTION"',
+                 '__type__': 'PatternStr'},
+     'priority': 0,
+     '__type__': 'TerminalDef'},
+ 3: {'name': 'NOTE_MARKER',
+     'pattern': {'value': 'NOTE',
+                 'flags': [],
+                 'raw': '"NOTE"',
+                 '__type__': 'PatternStr'},
+     'priority': 0,
+     '__type__': 'TerminalDef'},
+ 4: {'name': 'NOTE_OR_SAFETY_LINE_START',
+     'pattern': {'value': '\r?\n(?=NOTE: )',
+                 'flags': [],
+                 'raw': '/\\r?\\n(?=NOTE: )/',
+                 '_width': [1, 2],
+                 '__type__': 'PatternRE'},
+     'priority': 5,
+     '__type__': 'TerminalDef'},
+ 5: {'name': 'SAFETY_LINE_START',
+     'pattern': {'value': '\r?\n(?=(?:WARNING|CAUTION): )',
+                 'flags': [],
+                 'raw': '/\\r?\\n(?=(?:WARNING|CAUTION): )/',
+                 '_width': [1, 2],
+                 '__type__': 'PatternRE'},
+     'priority': 5,
+     '__type__': 'TerminalDef'},
+ 6: {'name': 'SINGLE_NEWLINE',
+     'pattern': {'value': '\r?\n(?!\r?\n)',
+                 'flags': [],
+                 'raw': '/\\r?\\n(?!\\r?\\n)/',
+                 '_width': [1, 2],
+                 '__type__': 'PatternRE'},
+     'priority': 2,
+     '__type__': 'TerminalDef'},
+ 7: {'name': 'LIST_LINE_START',
+     'pattern': {'value': '\r?\n(?=[ \t]+(?:[a-zA-Z0-9]+|\\*|-) )',
+                 'flags': [],
+                 'raw': '/\\r?\\n(?=[ \\t]+(?:[a-zA-Z0-9]+|\\*|-) )/',
+                 '_width': [1, 2],
+                 '__type__': 'PatternRE'},
+     'priority': 5,
+     '__type__': 'TerminalDef'},
+ 8: {'name': 'LIST_MARKER_ALPHA_NUM',
+     'pattern': {'value': '[a-zA-Z0-9]+',
+                 'flags': [],
+                 'raw': '/[a-zA-Z0-9]+/',
+                 '_width': [1, 18446744073709551616],
+                 '__type__': 'PatternRE'},
+     'priority': 0,
+     '__type__': 'TerminalDef'},
+ 9: {'name': 'PROC_MARKER',
+     'pattern': {'value': '[a-zA-Z0-9]+',
+                 'flags': [],
+                 'raw': '/[a-zA-Z0-9]+/',
+                 '_width': [1, 18446744073709551616],
+                 '__type__': 'PatternRE'},
+     'priority': 0,
+     '__type__': 'TerminalDef'},
+ 10: {'name': 'PROC_DELIMITER',
+      'pattern': {'value': '[.)]',
+                  'flags': [],
+                  'raw': '/[.)]/',
+                  '_width': [1, 1],
+                  '__type__': 'PatternRE'},
+      'priority': 0,
+      '__type__': 'TerminalDef'},
+ 11: {'name': 'CODE',
+      'pattern': {'value': '[^`]+(?=`)',
+                  'flags': [],
+                  'raw': '/[^`]+(?=`)/',
+                  '_width': [1, 18446744073709551616],
+                  '__type__': 'PatternRE'},
+      'priority': 40,
+      '__type__': 'TerminalDef'},
+ 12: {'name': 'YEAR_SHORT',
+      'pattern': {'value': "'\\d{2}s?(?=[\\s.,!?;:]|$)",
+                  'flags': [],
+                  'raw': "/'\\d{2}s?(?=[\\s.,!?;:]|$)/",
+                  '_width': [3, 4],
+                  '__type__': 'PatternRE'},
+      'priority': 40,
+      '__type__': 'TerminalDef'},
+ 13: {'name': 'PLURAL_S',
+      'pattern': {'value': '(?<=[A-Za-z])\\(s\\)(?=[\\s.,!?;:]|$)',
+                  'flags': [],
+                  'raw': '/(?<=[A-Za-z])\\(s\\)(?=[\\s.,!?;:]|$)/',
+                  '_width': [3, 3],
+                  '__type__': 'PatternRE'},
+      'priority': 35,
+      '__type__': 'TerminalDef'},
+ 14: {'name': 'SQUOTE_CLOSE',
+      'pattern': {'value': "'(?!(?<=[A-Za-z0-9]')s(?=[\\s.,!?;:]|$))",
+                  'flags': [],
+                  'raw': "/'(?!(?<=[A-Za-z0-9]')s(?=[\\s.,!?;:]|$))/",
+                  '_width': [1, 1],
+                  '__type__': 'PatternRE'},
+      'priority': 31,
+      '__type__': 'TerminalDef'},
+ 15: {'name': 'APOSTROPHE',
+      'pattern': {'value': "(?<=[A-Za-z0-9])'(?:s)?(?=[\\s.,!?;:]|$)",
+                  'flags': [],
+                  'raw': "/(?<=[A-Za-z0-9])'(?:s)?(?=[\\s.,!?;:]|$)/",
+                  '_width': [1, 2],
+                  '__type__': 'PatternRE'},
+      'priority': 30,
+      '__type__': 'TerminalDef'},
+ 16: {'name': 'BOLD_EMPH_OPEN',
+      'pattern': {'value': '\\*_(?=[^\r\n]*?_\\*)',
+                  'flags': [],
+                  'raw': '/\\*_(?=[^\\r\\n]*?_\\*)/',
+                  '_width': [2, 2],
+                  '__type__': 'PatternRE'},
+      'priority': 10,
+      '__type__': 'TerminalDef'},
+ 17: {'name': 'BOLD_EMPH_CLOSE',
+      'pattern': {'value': '_*',
+                  'flags': [],
+                  'raw': '"_*"',
+                  '__type__': 'PatternStr'},
+      'priority': 10,
+      '__type__': 'TerminalDef'},
+ 18: {'name': 'CITE_LINE_START_FIRST',
+      'pattern': {'value': '(?:\\A|\r?\n)> ',
+                  'flags': [],
+                  'raw': '/(?:\\A|\\r?\\n)> /',
+                  '_width': [2, 4],
+                  '__type__': 'PatternRE'},
+      'priority': 10,
+      '__type__': 'TerminalDef'},
+ 19: {'name': 'PROC_LINE_START',
+      'pattern': {'value': '\r?\n(?=[a-zA-Z0-9]+[.)] )',
+                  'flags': [],
+                  'raw': '/\\r?\\n(?=[a-zA-Z0-9]+[.)] )/',
+                  '_width': [1, 2],
+                  '__type__': 'PatternRE'},
+      'priority': 5,
+      '__type__': 'TerminalDef'},
+ 20: {'name': 'PAREN_OPEN',
+      'pattern': {'value': '(',
+                  'flags': [],
+                  'raw': '"("',
+                  '__type__': 'PatternStr'},
+      'priority': 0,
+      '__type__': 'TerminalDef'},
+ 21: {'name': 'PAREN_CLOSE',
+      'pattern': {'value': ')',
+                  'flags': [],
+                  'raw': '")"',
+                  '__type__': 'PatternStr'},
+      'priority': 0,
+      '__type__': 'TerminalDef'},
+ 22: {'name': 'DQUOTE',
+      'pattern': {'value': '"',
+                  'flags': [],
+                  'raw': '"\\""',
+                  '__type__': 'PatternStr'},
+      'priority': 0,
+      '__type__': 'TerminalDef'},
+ 23: {'name': 'SQUOTE',
+      'pattern': {'value': "'",
+                  'flags': [],
+                  'raw': '"\'"',
+                  '__type__': 'PatternStr'},
+      'priority': 0,
+      '__type__': 'TerminalDef'},
+ 24: {'name': 'MULTIPLY',
+      'pattern': {'value': ' * ',
+                  'flags': [],
+                  'raw': '" * "',
+                  '__type__': 'PatternStr'},
+      'priority': 2,
+      '__type__': 'TerminalDef'},
+ 25: {'name': 'STAR',
+      'pattern': {'value': '*',
+                  'flags': [],
+                  'raw': '"*"',
+                  '__type__': 'PatternStr'},
+      'priority': 0,
+      '__type__': 'TerminalDef'},
+ 26: {'name': 'STAR_OPEN',
+      'pattern': {'value': '\\*(?=[^\\s*][^\r\n]*?(?<!\\s)\\*)',
+                  'flags': [],
+                  'raw': '/\\*(?=[^\\s*][^\\r\\n]*?(?<!\\s)\\*)/',
+                  '_width': [1, 1],
+                  '__type__': 'PatternRE'},
+      'priority': 2,
+      '__type__': 'TerminalDef'},
+ 27: {'name': 'STAR_CLOSE',
+      'pattern': {'value': '(?<!\\s)\\*',
+                  'flags': [],
+                  'raw': '/(?<!\\s)\\*/',
+                  '_width': [1, 1],
+                  '__type__': 'PatternRE'},
+      'priority': 2,
+      '__type__': 'TerminalDef'},
+ 28: {'name': 'UNDER',
+      'pattern': {'value': '_',
+                  'flags': [],
+                  'raw': '"_"',
+                  '__type__': 'PatternStr'},
+      'priority': 0,
+      '__type__': 'TerminalDef'},
+ 29: {'name': 'UNDER_OPEN',
+      'pattern': {'value': '_(?=[^\\s_][^\r\n]*?(?<!\\s)_)',
+                  'flags': [],
+                  'raw': '/_(?=[^\\s_][^\\r\\n]*?(?<!\\s)_)/',
+                  '_width': [1, 1],
+                  '__type__': 'PatternRE'},
+      'priority': 2,
+      '__type__': 'TerminalDef'},
+ 30: {'name': 'UNDER_CLOSE',
+      'pattern': {'value': '(?<!\\s)_',
+                  'flags': [],
+                  'raw': '/(?<!\\s)_/',
+                  '_width': [1, 1],
+                  '__type__': 'PatternRE'},
+      'priority': 2,
+      '__type__': 'TerminalDef'},
+ 31: {'name': 'BACK_TICK',
+      'pattern': {'value': '`',
+                  'flags': [],
+                  'raw': '"`"',
+                  '__type__': 'PatternStr'},
+      'priority': 0,
+      '__type__': 'TerminalDef'},
+ 32: {'name': 'SPACE',
+      'pattern': {'value': ' ',
+                  'flags': [],
+                  'raw': '" "',
+                  '__type__': 'PatternStr'},
+      'priority': 0,
+      '__type__': 'TerminalDef'},
+ 33: {'name': 'DASH',
+      'pattern': {'value': '-',
+                  'flags': [],
+                  'raw': '"-"',
+                  '__type__': 'PatternStr'},
+      'priority': 0,
+      '__type__': 'TerminalDef'},
+ 34: {'name': 'COLON',
+      'pattern': {'value': ':',
+                  'flags': [],
+                  'raw': '":"',
+                  '__type__': 'PatternStr'},
+      'priority': 0,
+      '__type__': 'TerminalDef'},
+ 35: {'name': 'WS',
+      'pattern': {'value': '[ \t]+',
+                  'flags': [],
+                  'raw': '/[ \\t]+/',
+                  '_width': [1, 18446744073709551616],
+                  '__type__': 'PatternRE'},
+      'priority': 0,
+      '__type__': 'TerminalDef'},
+ 36: {'name': 'NEWLINE',
+      'pattern': {'value': '\r?\n',
+                  'flags': [],
+                  'raw': '/\\r?\\n/',
+                  '_width': [1, 2],
+                  '__type__': 'PatternRE'},
+      'priority': 0,
+      '__type__': 'TerminalDef'},
+ 37: {'name': 'TEXT',
+      'pattern': {'value': '[^"\'*_`()\\s]+',
+                  'flags': [],
+                  'raw': '/[^"\'*_`()\\s]+/',
+                  '_width': [1, 18446744073709551616],
+                  '__type__': 'PatternRE'},
+      'priority': 0,
+      '__type__': 'TerminalDef'},
+ 38: {'origin': {'name': 'start', '__type__': 'NonTerminal'},
+      'expansion': [{'name': 'inline_first', '__type__': 'NonTerminal'},
+                    {'name': '__start_star_0', '__type__': 'NonTerminal'}],
+      'order': 0,
+      'alias': None,
+      'options': {'keep_all_tokens': False,
+                  'expand1': True,
+                  'priority': None,
+                  'template_source': None,
+                  'empty_indices': (),
+                  '__type__': 'RuleOptions'},
+      '__type__': 'Rule'},
+ 39: {'origin': {'name': 'start', '__type__': 'NonTerminal'},
+      'expansion': [{'name': 'inline_first', '__type__': 'NonTerminal'}],
+      'order': 1,
+      'alias': None,
+      'options': {'keep_all_tokens': False,
+                  'expand1': True,
+                  'priority': None,
+                  'template_source': None,
+                  'empty_indices': (),
+                  '__type__': 'RuleOptions'},
+      '__type__': 'Rule'},
+ 40: {'origin': {'name': 'inline_first', '__type__': 'NonTerminal'},
+      'expansion': [{'name': 'heading', '__type__': 'NonTerminal'}],
+      'order': 0,
+      'alias': None,
+      'options': {'keep_all_tokens': False,
+                  'expand1': True,
+                  'priority': None,
+                  'template_source': None,
+                  'empty_indices': (),
+                  '__type__': 'RuleOptions'},
+      '__type__': 'Rule'},
+ 41: {'origin': {'name': 'inline_first', '__type__': 'NonTerminal'},
+      'expansion': [{'name': 'paragraph', '__type__': 'NonTerminal'}],
+      'order': 1,
+      'alias': None,
+      'options': {'keep_all_tokens': False,
+                  'expand1': True,
+                  'priority': None,
+                  'template_source': None,
+                  'empty_indices': (),
+                  '__type__': 'RuleOptions'},
+      '__type__': 'Rule'},
+ 42: {'origin': {'name': 'inline_first', '__type__': 'NonTerminal'},
+      'expansion': [{'name': 'proc_line', '__type__': 'NonTerminal'}],
+      'order': 2,
+      'alias': None,
+      'options': {'keep_all_tokens': False,
+                  'expand1': True,
+                  'priority': None,
+                  'template_source': None,
+                  'empty_indices': (),
+                  '__type__': 'RuleOptions'},
+      '__type__': 'Rule'},
+ 43: {'origin': {'name': 'inline_first', '__type__': 'NonTerminal'},
+      'expansion': [{'name': 'note', '__type__': 'NonTerminal'}],
+      'order': 3,
+      'alias': None,
+      'options': {'keep_all_tokens': False,
+                  'expand1': True,
+                  'priority': None,
+                  'template_source': None,
+                  'empty_indices': (),
+                  '__type__': 'RuleOptions'},
+      '__type__': 'Rule'},
+ 44: {'origin': {'name': 'inline_first', '__type__': 'NonTerminal'},
+      'expansion': [{'name': 'cite', '__type__': 'NonTerminal'}],
+      'order': 4,
+      'alias': None,
+      'options': {'keep_all_tokens': False,
+                  'expand1': True,
+                  'priority': None,
+                  'template_source': None,
+                  'empty_indices': (),
+                  '__type__': 'RuleOptions'},
+      '__type__': 'Rule'},
+ 45: {'origin': {'name': 'inline_next', '__type__': 'NonTerminal'},
+      'expansion': [{'name': 'NEWLINE',
+                     'filter_out': False,
+                     '__type__': 'Terminal'}],
+      'order': 0,
+      'alias': None,
+      'options': {'keep_all_tokens': False,
+                  'expand1': True,
+                  'priority': None,
+                  'template_source': None,
+                  'empty_indices': (),
+                  '__type__': 'RuleOptions'},
+      '__type__': 'Rule'},
+ 46: {'origin': {'name': 'inline_next', '__type__': 'NonTerminal'},
+      'expansion': [{'name': 'inline_first', '__type__': 'NonTerminal'}],
+      'order': 1,
+      'alias': None,
+      'options': {'keep_all_tokens': False,
+                  'expand1': True,
+                  'priority': None,
+                  'template_source': None,
+                  'empty_indices': (),
+                  '__type__': 'RuleOptions'},
+      '__type__': 'Rule'},
+ 47: {'origin': {'name': 'common_text', '__type__': 'NonTerminal'},
+      'expansion': [{'name': 'TEXT',
+                     'filter_out': False,
+                     '__type__': 'Terminal'}],
+      'order': 0,
+      'alias': None,
+      'options': {'keep_all_tokens': False,
+                  'expand1': True,
+                  'priority': None,
+                  'template_source': None,
+                  'empty_indices': (),
+                  '__type__': 'RuleOptions'},
+      '__type__': 'Rule'},
+ 48: {'origin': {'name': 'common_text', '__type__': 'NonTerminal'},
+      'expansion': [{'name': 'APOSTROPHE',
+                     'filter_out': False,
+                     '__type__': 'Terminal'}],
+      'order': 1,
+      'alias': None,
+      'options': {'keep_all_tokens': False,
+                  'expand1': True,
+                  'priority': None,
+                  'template_source': None,
+                  'empty_indices': (),
+                  '__type__': 'RuleOptions'},
+      '__type__': 'Rule'},
+ 49: {'origin': {'name': 'common_text', '__type__': 'NonTerminal'},
+      'expansion': [{'name': 'PLURAL_S',
+                     'filter_out': False,
+                     '__type__': 'Terminal'}],
+      'order': 2,
+      'alias': None,
+      'options': {'keep_all_tokens': False,
+                  'expand1': True,
+                  'priority': None,
+                  'template_source': None,
+                  'empty_indices': (),
+                  '__type__': 'RuleOptions'},
+      '__type__': 'Rule'},
+ 50: {'origin': {'name': 'common_text', '__type__': 'NonTerminal'},
+      'expansion': [{'name': 'YEAR_SHORT',
+                     'filter_out': False,
+                     '__type__': 'Terminal'}],
+      'order': 3,
+      'alias': None,
+      'options': {'keep_all_tokens': False,
+                  'expand1': True,
+                  'priority': None,
+                  'template_source': None,
+                  'empty_indices': (),
+                  '__type__': 'RuleOptions'},
+      '__type__': 'Rule'},
+ 51: {'origin': {'name': 'common_text', '__type__': 'NonTerminal'},
+      'expansion': [{'name': 'MULTIPLY',
+                     'filter_out': False,
+                     '__type__': 'Terminal'}],
+      'order': 4,
+      'alias': None,
+      'options': {'keep_all_tokens': False,
+                  'expand1': True,
+                  'priority': None,
+                  'template_source': None,
+                  'empty_indices': (),
+                  '__type__': 'RuleOptions'},
+      '__type__': 'Rule'},
+ 52: {'origin': {'name': 'char_paren_open', '__type__': 'NonTerminal'},
+      'expansion': [{'name': 'PAREN_OPEN',
+                     'filter_out': False,
+                     '__type__': 'Terminal'}],
+      'order': 0,
+      'alias': None,
+      'options': {'keep_all_tokens': False,
+                  'expand1': False,
+                  'priority': None,
+                  'template_source': None,
+                  'empty_indices': (),
+                  '__type__': 'RuleOptions'},
+      '__type__': 'Rule'},
+ 53: {'origin': {'name': 'char_paren_close', '__type__': 'NonTerminal'},
+      'expansion': [{'name': 'PAREN_CLOSE',
+                     'filter_out': False,
+                     '__type__': 'Terminal'}],
+      'order': 0,
+      'alias': None,
+      'options': {'keep_all_tokens': False,
+                  'expand1': False,
+                  'priority': None,
+                  'template_source': None,
+                  'empty_indices': (),
+                  '__type__': 'RuleOptions'},
+      '__type__': 'Rule'},
+ 54: {'origin': {'name': 'char_star', '__type__': 'NonTerminal'},
+      'expansion': [{'name': 'STAR',
+                     'filter_out': False,
+                     '__type__': 'Terminal'}],
+      'order': 0,
+      'alias': None,
+      'options': {'keep_all_tokens': False,
+                  'expand1': False,
+                  'priority': None,
+                  'template_source': None,
+                  'empty_indices': (),
+                  '__type__': 'RuleOptions'},
+      '__type__': 'Rule'},
+ 55: {'origin': {'name': 'char_under', '__type__': 'NonTerminal'},
+      'expansion': [{'name': 'UNDER',
+                     'filter_out': False,
+                     '__type__': 'Terminal'}],
+      'order': 0,
+      'alias': None,
+      'options': {'keep_all_tokens': False,
+                  'expand1': False,
+                  'priority': None,
+                  'template_source': None,
+                  'empty_indices': (),
+                  '__type__': 'RuleOptions'},
+      '__type__': 'Rule'},
+ 56: {'origin': {'name': 'char_code', '__type__': 'NonTerminal'},
+      'expansion': [{'name': 'BACK_TICK',
+                     'filter_out': False,
+                     '__type__': 'Terminal'}],
+      'order': 0,
+      'alias': None,
+      'options': {'keep_all_tokens': False,
+                  'expand1': False,
+                  'priority': None,
+                  'template_source': None,
+                  'empty_indices': (),
+                  '__type__': 'RuleOptions'},
+      '__type__': 'Rule'},
+ 57: {'origin': {'name': 'char_single', '__type__': 'NonTerminal'},
+      'expansion': [{'name': 'char_paren_open', '__type__': 'NonTerminal'}],
+      'order': 0,
+      'alias': None,
+      'options': {'keep_all_tokens': False,
+                  'expand1': True,
+                  'priority': None,
+                  'template_source': None,
+                  'empty_indices': (),
+                  '__type__': 'RuleOptions'},
+      '__type__': 'Rule'},
+ 58: {'origin': {'name': 'char_single', '__type__': 'NonTerminal'},
+      'expansion': [{'name': 'char_paren_close', '__type__': 'NonTerminal'}],
+      'order': 1,
+      'alias': None,
+      'options': {'keep_all_tokens': False,
+                  'expand1': True,
+                  'priority': None,
+                  'template_source': None,
+                  'empty_indices': (),
+                  '__type__': 'RuleOptions'},
+      '__type__': 'Rule'},
+ 59: {'origin': {'name': 'char_single', '__type__': 'NonTerminal'},
+      'expansion': [{'name': 'char_star', '__type__': 'NonTerminal'}],
+      'order': 2,
+      'alias': None,
+      'options': {'keep_all_tokens': False,
+                  'expand1': True,
+                  'priority': None,
+                  'template_source': None,
+                  'empty_indices': (),
+                  '__type__': 'RuleOptions'},
+      '__type__': 'Rule'},
+ 60: {'origin': {'name': 'char_single', '__type__': 'NonTerminal'},
+      'expansion': [{'name': 'char_under', '__type__': 'NonTerminal'}],
+      'order': 3,
+      'alias': None,
+      'options': {'keep_all_tokens': False,
+                  'expand1': True,
+                  'priority': None,
+                  'template_source': None,
+                  'empty_indices': (),
+                  '__type__': 'RuleOptions'},
+      '__type__': 'Rule'},
+ 61: {'origin': {'name': 'char_single', '__type__': 'NonTerminal'},
+      'expansion': [{'name': 'char_code', '__type__': 'NonTerminal'}],
+      'order': 4,
+      'alias': None,
+      'options': {'keep_all_tokens': False,
+                  'expand1': True,
+                  'priority': None,
+                  'template_source': None,
+                  'empty_indices': (),
+                  '__type__': 'RuleOptions'},
+      '__type__': 'Rule'},
+ 62: {'origin': {'name': 'format_containers', '__type__': 'NonTerminal'},
+      'expansion': [{'name': 'bold', '__type__': 'NonTerminal'}],
+      'order': 0,
+      'alias': None,
+      'options': {'keep_all_tokens': False,
+                  'expand1': True,
+                  'priority': None,
+                  'template_source': None,
+                  'empty_indices': (),
+                  '__type__': 'RuleOptions'},
+      '__type__': 'Rule'},
+ 63: {'origin': {'name': 'format_containers', '__type__': 'NonTerminal'},
+      'expansion': [{'name': 'emph', '__type__': 'NonTerminal'}],
+      'order': 1,
+      'alias': None,
+      'options': {'keep_all_tokens': False,
+                  'expand1': True,
+                  'priority': None,
+                  'template_source': None,
+                  'empty_indices': (),
+                  '__type__': 'RuleOptions'},
+      '__type__': 'Rule'},
+ 64: {'origin': {'name': 'format_containers', '__type__': 'NonTerminal'},
+      'expansion': [{'name': 'bold_emph', '__type__': 'NonTerminal'}],
+      'order': 2,
+      'alias': None,
+      'options': {'keep_all_tokens': False,
+                  'expand1': True,
+                  'priority': None,
+                  'template_source': None,
+                  'empty_indices': (),
+                  '__type__': 'RuleOptions'},
+      '__type__': 'Rule'},
+ 65: {'origin': {'name': 'quote_containers', '__type__': 'NonTerminal'},
+      'expansion': [{'name': 'dquote', '__type__': 'NonTerminal'}],
+      'order': 0,
+      'alias': None,
+      'options': {'keep_all_tokens': False,
+                  'expand1': True,
+                  'priority': None,
+                  'template_source': None,
+                  'empty_indices': (),
+                  '__type__': 'RuleOptions'},
+      '__type__': 'Rule'},
+ 66: {'origin': {'name': 'quote_containers', '__type__': 'NonTerminal'},
+      'expansion': [{'name': 'squote', '__type__': 'NonTerminal'}],
+      'order': 1,
+      'alias': None,
+      'options': {'keep_all_tokens': False,
+                  'expand1': True,
+                  'priority': None,
+                  'template_source': None,
+                  'empty_indices': (),
+                  '__type__': 'RuleOptions'},
+      '__type__': 'Rule'},
+ 67: {'origin': {'name': 'dquote', '__type__': 'NonTerminal'},
+      'expansion': [{'name': 'DQUOTE',
+                     'filter_out': False,
+                     '__type__': 'Terminal'},
+                    {'name': '__dquote_star_1', '__type__': 'NonTerminal'},
+                    {'name': 'DQUOTE',
+                     'filter_out': False,
+                     '__type__': 'Terminal'}],
+      'order': 0,
+      'alias': None,
+      'options': {'keep_all_tokens': False,
+                  'expand1': False,
+                  'priority': None,
+                  'template_source': None,
+                  'empty_indices': (),
+                  '__type__': 'RuleOptions'},
+      '__type__': 'Rule'},
+ 68: {'origin': {'name': 'dquote', '__type__': 'NonTerminal'},
+      'expansion': [{'name': 'DQUOTE',
+                     'filter_out': False,
+                     '__type__': 'Terminal'},
+                    {'name': 'DQUOTE',
+                     'filter_out': False,
+                     '__type__': 'Terminal'}],
+      'order': 1,
+      'alias': None,
+      'options': {'keep_all_tokens': False,
+                  'expand1': False,
+                  'priority': None,
+                  'template_source': None,
+                  'empty_indices': (),
+                  '__type__': 'RuleOptions'},
+      '__type__': 'Rule'},
+ 69: {'origin': {'name': 'dquote_item', '__type__': 'NonTerminal'},
+      'expansion': [{'name': 'WS',
+                     'filter_out': False,
+                     '__type__': 'Terminal'}],
+      'order': 0,
+      'alias': None,
+      'options': {'keep_all_tokens': False,
+                  'expand1': True,
+                  'priority': None,
+                  'template_source': None,
+                  'empty_indices': (),
+                  '__type__': 'RuleOptions'},
+      '__type__': 'Rule'},
+ 70: {'origin': {'name': 'dquote_item', '__type__': 'NonTerminal'},
+      'expansion': [{'name': 'format_containers', '__type__': 'NonTerminal'}],
+      'order': 1,
+      'alias': None,
+      'options': {'keep_all_tokens': False,
+                  'expand1': True,
+                  'priority': None,
+                  'template_source': None,
+                  'empty_indices': (),
+                  '__type__': 'RuleOptions'},
+      '__type__': 'Rule'},
+ 71: {'origin': {'name': 'dquote_item', '__type__': 'NonTerminal'},
+      'expansion': [{'name': 'code', '__type__': 'NonTerminal'}],
+      'order': 2,
+      'alias': None,
+      'options': {'keep_all_tokens': False,
+                  'expand1': True,
+                  'priority': None,
+                  'template_source': None,
+                  'empty_indices': (),
+                  '__type__': 'RuleOptions'},
+      '__type__': 'Rule'},
+ 72: {'origin': {'name': 'dquote_item', '__type__': 'NonTerminal'},
+      'expansion': [{'name': 'squote', '__type__': 'NonTerminal'}],
+      'order': 3,
+      'alias': None,
+      'options': {'keep_all_tokens': False,
+                  'expand1': True,
+                  'priority': None,
+                  'template_source': None,
+                  'empty_indices': (),
+                  '__type__': 'RuleOptions'},
+      '__type__': 'Rule'},
+ 73: {'origin': {'name': 'dquote_item', '__type__': 'NonTerminal'},
+      'expansion': [{'name': 'paren_sl', '__type__': 'NonTerminal'}],
+      'order': 4,
+      'alias': None,
+      'options': {'keep_all_tokens': False,
+                  'expand1': True,
+                  'priority': None,
+                  'template_source': None,
+                  'empty_indices': (),
+                  '__type__': 'RuleOptions'},
+      '__type__': 'Rule'},
+ 74: {'origin': {'name': 'dquote_item', '__type__': 'NonTerminal'},
+      'expansion': [{'name': 'char_single', '__type__': 'NonTerminal'}],
+      'order': 5,
+      'alias': None,
+      'options': {'keep_all_tokens': False,
+                  'expand1': True,
+                  'priority': None,
+                  'template_source': None,
+                  'empty_indices': (),
+                  '__type__': 'RuleOptions'},
+      '__type__': 'Rule'},
+ 75: {'origin': {'name': 'dquote_item', '__type__': 'NonTerminal'},
+      'expansion': [{'name': 'common_text', '__type__': 'NonTerminal'}],
+      'order': 6,
+      'alias': None,
+      'options': {'keep_all_tokens': False,
+                  'expand1': True,
+                  'priority': None,
+                  'template_source': None,
+                  'empty_indices': (),
+                  '__type__': 'RuleOptions'},
+      '__type__': 'Rule'},
+ 76: {'origin': {'name': 'squote', '__type__': 'NonTerminal'},
+      'expansion': [{'name': 'SQUOTE',
+                     'filter_out': False,
+                     '__type__': 'Terminal'},
+                    {'name': '__squote_star_2', '__type__': 'NonTerminal'},
+                    {'name': 'SQUOTE_CLOSE',
+                     'filter_out': False,
+                     '__type__': 'Terminal'}],
+      'order': 0,
+      'alias': None,
+      'options': {'keep_all_tokens': False,
+                  'expand1': False,
+                  'priority': None,
+                  'template_source': None,
+                  'empty_indices': (),
+                  '__type__': 'RuleOptions'},
+      '__type__': 'Rule'},
+ 77: {'origin': {'name': 'squote', '__type__': 'NonTerminal'},
+      'expansion': [{'name': 'SQUOTE',
+                     'filter_out': False,
+                     '__type__': 'Terminal'},
+                    {'name': 'SQUOTE_CLOSE',
+                     'filter_out': False,
+                     '__type__': 'Terminal'}],
+      'order': 1,
+      'alias': None,
+      'options': {'keep_all_tokens': False,
+                  'expand1': False,
+                  'priority': None,
+                  'template_source': None,
+                  'empty_indices': (),
+                  '__type__': 'RuleOptions'},
+      '__type__': 'Rule'},
+ 78: {'origin': {'name': 'squote_item', '__type__': 'NonTerminal'},
+      'expansion': [{'name': 'WS',
+                     'filter_out': False,
+                     '__type__': 'Terminal'}],
+      'order': 0,
+      'alias': None,
+      'options': {'keep_all_tokens': False,
+                  'expand1': True,
+                  'priority': None,
+                  'template_source': None,
+                  'empty_indices': (),
+                  '__type__': 'RuleOptions'},
+      '__type__': 'Rule'},
+ 79: {'origin': {'name': 'squote_item', '__type__': 'NonTerminal'},
+      'expansion': [{'name': 'format_containers', '__type__': 'NonTerminal'}],
+      'order': 1,
+      'alias': None,
+      'options': {'keep_all_tokens': False,
+                  'expand1': True,
+                  'priority': None,
+                  'template_source': None,
+                  'empty_indices': (),
+                  '__type__': 'RuleOptions'},
+      '__type__': 'Rule'},
+ 80: {'origin': {'name': 'squote_item', '__type__': 'NonTerminal'},
+      'expansion': [{'name': 'code', '__type__': 'NonTerminal'}],
+      'order': 2,
+      'alias': None,
+      'options': {'keep_all_tokens': False,
+                  'expand1': True,
+                  'priority': None,
+                  'template_source': None,
+                  'empty_indices': (),
+                  '__type__': 'RuleOptions'},
+      '__type__': 'Rule'},
+ 81: {'origin': {'name': 'squote_item', '__type__': 'NonTerminal'},
+      'expansion': [{'name': 'dquote', '__type__': 'NonTerminal'}],
+      'order': 3,
+      'alias': None,
+      'options': {'keep_all_tokens': False,
+                  'expand1': True,
+                  'priority': None,
+                  'template_source': None,
+                  'empty_indices': (),
+                  '__type__': 'RuleOptions'},
+      '__type__': 'Rule'},
+ 82: {'origin': {'name': 'squote_item', '__type__': 'NonTerminal'},
+      'expansion': [{'name': 'paren_sl', '__type__': 'NonTerminal'}],
+      'order': 4,
+      'alias': None,
+      'options': {'keep_all_tokens': False,
+                  'expand1': True,
+                  'priority': None,
+                  'template_source': None,
+                  'empty_indices': (),
+                  '__type__': 'RuleOptions'},
+      '__type__': 'Rule'},
+ 83: {'origin': {'name': 'squote_item', '__type__': 'NonTerminal'},
+      'expansion': [{'name': 'char_single', '__type__': 'NonTerminal'}],
+      'order': 5,
+      'alias': None,
+      'options': {'keep_all_tokens': False,
+                  'expand1': True,
+                  'priority': None,
+                  'template_source': None,
+                  'empty_indices': (),
+                  '__type__': 'RuleOptions'},
+      '__type__': 'Rule'},
+ 84: {'origin': {'name': 'squote_item', '__type__': 'NonTerminal'},
+      'expansion': [{'name': 'common_text', '__type__': 'NonTerminal'}],
+      'order': 6,
+      'alias': None,
+      'options': {'keep_all_tokens': False,
+                  'expand1': True,
+                  'priority': None,
+                  'template_source': None,
+                  'empty_indices': (),
+                  '__type__': 'RuleOptions'},
+      '__type__': 'Rule'},
+ 85: {'origin': {'name': 'bold', '__type__': 'NonTerminal'},
+      'expansion': [{'name': 'STAR_OPEN',
+                     'filter_out': False,
+                     '__type__': 'Terminal'},
+                    {'name': '__bold_plus_3', '__type__': 'NonTerminal'},
+                    {'name': 'STAR_CLOSE',
+                     'filter_out': False,
+                     '__type__': 'Terminal'}],
+      'order': 0,
+      'alias': None,
+      'options': {'keep_all_tokens': False,
+                  'expand1': False,
+                  'priority': None,
+                  'template_source': None,
+                  'empty_indices': (),
+                  '__type__': 'RuleOptions'},
+      '__type__': 'Rule'},
+ 86: {'origin': {'name': 'bold_item', '__type__': 'NonTerminal'},
+      'expansion': [{'name': 'WS',
+                     'filter_out': False,
+                     '__type__': 'Terminal'}],
+      'order': 0,
+      'alias': None,
+      'options': {'keep_all_tokens': False,
+                  'expand1': True,
+                  'priority': None,
+                  'template_source': None,
+                  'empty_indices': (),
+                  '__type__': 'RuleOptions'},
+      '__type__': 'Rule'},
+ 87: {'origin': {'name': 'bold_item', '__type__': 'NonTerminal'},
+      'expansion': [{'name': 'emph', '__type__': 'NonTerminal'}],
+      'order': 1,
+      'alias': None,
+      'options': {'keep_all_tokens': False,
+                  'expand1': True,
+                  'priority': None,
+                  'template_source': None,
+                  'empty_indices': (),
+                  '__type__': 'RuleOptions'},
+      '__type__': 'Rule'},
+ 88: {'origin': {'name': 'bold_item', '__type__': 'NonTerminal'},
+      'expansion': [{'name': 'code', '__type__': 'NonTerminal'}],
+      'order': 2,
+      'alias': None,
+      'options': {'keep_all_tokens': False,
+                  'expand1': True,
+                  'priority': None,
+                  'template_source': None,
+                  'empty_indices': (),
+                  '__type__': 'RuleOptions'},
+      '__type__': 'Rule'},
+ 89: {'origin': {'name': 'bold_item', '__type__': 'NonTerminal'},
+      'expansion': [{'name': 'quote_containers', '__type__': 'NonTerminal'}],
+      'order': 3,
+      'alias': None,
+      'options': {'keep_all_tokens': False,
+                  'expand1': True,
+                  'priority': None,
+                  'template_source': None,
+                  'empty_indices': (),
+                  '__type__': 'RuleOptions'},
+      '__type__': 'Rule'},
+ 90: {'origin': {'name': 'bold_item', '__type__': 'NonTerminal'},
+      'expansion': [{'name': 'paren_sl', '__type__': 'NonTerminal'}],
+      'order': 4,
+      'alias': None,
+      'options': {'keep_all_tokens': False,
+                  'expand1': True,
+                  'priority': None,
+                  'template_source': None,
+                  'empty_indices': (),
+                  '__type__': 'RuleOptions'},
+      '__type__': 'Rule'},
+ 91: {'origin': {'name': 'bold_item', '__type__': 'NonTerminal'},
+      'expansion': [{'name': 'common_text', '__type__': 'NonTerminal'}],
+      'order': 5,
+      'alias': None,
+      'options': {'keep_all_tokens': False,
+                  'expand1': True,
+                  'priority': None,
+                  'template_source': None,
+                  'empty_indices': (),
+                  '__type__': 'RuleOptions'},
+      '__type__': 'Rule'},
+ 92: {'origin': {'name': 'emph', '__type__': 'NonTerminal'},
+      'expansion': [{'name': 'UNDER_OPEN',
+                     'filter_out': False,
+                     '__type__': 'Terminal'},
+                    {'name': '__emph_plus_4', '__type__': 'NonTerminal'},
+                    {'name': 'UNDER_CLOSE',
+                     'filter_out': False,
+                     '__type__': 'Terminal'}],
+      'order': 0,
+      'alias': None,
+      'options': {'keep_all_tokens': False,
+                  'expand1': False,
+                  'priority': None,
+                  'template_source': None,
+                  'empty_indices': (),
+                  '__type__': 'RuleOptions'},
+      '__type__': 'Rule'},
+ 93: {'origin': {'name': 'emph_item', '__type__': 'NonTerminal'},
+      'expansion': [{'name': 'WS',
+                     'filter_out': False,
+                     '__type__': 'Terminal'}],
+      'order': 0,
+      'alias': None,
+      'options': {'keep_all_tokens': False,
+                  'expand1': True,
+                  'priority': None,
+                  'template_source': None,
+                  'empty_indices': (),
+                  '__type__': 'RuleOptions'},
+      '__type__': 'Rule'},
+ 94: {'origin': {'name': 'emph_item', '__type__': 'NonTerminal'},
+      'expansion': [{'name': 'bold', '__type__': 'NonTerminal'}],
+      'order': 1,
+      'alias': None,
+      'options': {'keep_all_tokens': False,
+                  'expand1': True,
+                  'priority': None,
+                  'template_source': None,
+                  'empty_indices': (),
+                  '__type__': 'RuleOptions'},
+      '__type__': 'Rule'},
+ 95: {'origin': {'name': 'emph_item', '__type__': 'NonTerminal'},
+      'expansion': [{'name': 'code', '__type__': 'NonTerminal'}],
+      'order': 2,
+      'alias': None,
+      'options': {'keep_all_tokens': False,
+                  'expand1': True,
+                  'priority': None,
+                  'template_source': None,
+                  'empty_indices': (),
+                  '__type__': 'RuleOptions'},
+      '__type__': 'Rule'},
+ 96: {'origin': {'name': 'emph_item', '__type__': 'NonTerminal'},
+      'expansion': [{'name': 'quote_containers', '__type__': 'NonTerminal'}],
+      'order': 3,
+      'alias': None,
+      'options': {'keep_all_tokens': False,
+                  'expand1': True,
+                  'priority': None,
+                  'template_source': None,
+                  'empty_indices': (),
+                  '__type__': 'RuleOptions'},
+      '__type__': 'Rule'},
+ 97: {'origin': {'name': 'emph_item', '__type__': 'NonTerminal'},
+      'expansion': [{'name': 'paren_sl', '__type__': 'NonTerminal'}],
+      'order': 4,
+      'alias': None,
+      'options': {'keep_all_tokens': False,
+                  'expand1': True,
+                  'priority': None,
+                  'template_source': None,
+                  'empty_indices': (),
+                  '__type__': 'RuleOptions'},
+      '__type__': 'Rule'},
+ 98: {'origin': {'name': 'emph_item', '__type__': 'NonTerminal'},
+      'expansion': [{'name': 'common_text', '__type__': 'NonTerminal'}],
+      'order': 5,
+      'alias': None,
+      'options': {'keep_all_tokens': False,
+                  'expand1': True,
+                  'priority': None,
+                  'template_source': None,
+                  'empty_indices': (),
+                  '__type__': 'RuleOptions'},
+      '__type__': 'Rule'},
+ 99: {'origin': {'name': 'bold_emph', '__type__': 'NonTerminal'},
+      'expansion': [{'name': 'BOLD_EMPH_OPEN',
+                     'filter_out': False,
+                     '__type__': 'Terminal'},
+                    {'name': '__bold_emph_plus_5', '__type__': 'NonTerminal'},
+                    {'name': 'BOLD_EMPH_CLOSE',
+                     'filter_out': False,
+                     '__type__': 'Terminal'}],
+      'order': 0,
+      'alias': None,
+      'options': {'keep_all_tokens': False,
+                  'expand1': False,
+                  'priority': None,
+                  'template_source': None,
+                  'empty_indices': (),
+                  '__type__': 'RuleOptions'},
+      '__type__': 'Rule'},
+ 100: {'origin': {'name': 'bold_emph_item', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'WS',
+                      'filter_out': False,
+                      '__type__': 'Terminal'}],
+       'order': 0,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': True,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 101: {'origin': {'name': 'bold_emph_item', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'code', '__type__': 'NonTerminal'}],
+       'order': 1,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': True,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 102: {'origin': {'name': 'bold_emph_item', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'quote_containers', '__type__': 'NonTerminal'}],
+       'order': 2,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': True,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 103: {'origin': {'name': 'bold_emph_item', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'paren_sl', '__type__': 'NonTerminal'}],
+       'order': 3,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': True,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 104: {'origin': {'name': 'bold_emph_item', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'common_text', '__type__': 'NonTerminal'}],
+       'order': 4,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': True,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 105: {'origin': {'name': 'cite', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'cite_line', '__type__': 'NonTerminal'}],
+       'order': 0,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': False,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 106: {'origin': {'name': 'cite_line', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'CITE_LINE_START_FIRST',
+                      'filter_out': False,
+                      '__type__': 'Terminal'},
+                     {'name': 'cite_first_item', '__type__': 'NonTerminal'},
+                     {'name': '__cite_line_star_6', '__type__': 'NonTerminal'}],
+       'order': 0,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': True,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 107: {'origin': {'name': 'cite_line', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'CITE_LINE_START_FIRST',
+                      'filter_out': False,
+                      '__type__': 'Terminal'},
+                     {'name': 'cite_first_item', '__type__': 'NonTerminal'}],
+       'order': 1,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': True,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 108: {'origin': {'name': 'cite_first_item', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'common_text', '__type__': 'NonTerminal'}],
+       'order': 0,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': True,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 109: {'origin': {'name': 'cite_first_item', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'format_containers', '__type__': 'NonTerminal'}],
+       'order': 1,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': True,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 110: {'origin': {'name': 'cite_first_item', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'code', '__type__': 'NonTerminal'}],
+       'order': 2,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': True,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 111: {'origin': {'name': 'cite_first_item', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'quote_containers', '__type__': 'NonTerminal'}],
+       'order': 3,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': True,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 112: {'origin': {'name': 'cite_first_item', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'paren_sl', '__type__': 'NonTerminal'}],
+       'order': 4,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': True,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 113: {'origin': {'name': 'cite_next_item', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'WS',
+                      'filter_out': False,
+                      '__type__': 'Terminal'}],
+       'order': 0,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': True,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 114: {'origin': {'name': 'cite_next_item', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'cite_first_item', '__type__': 'NonTerminal'}],
+       'order': 1,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': True,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 115: {'origin': {'name': 'heading', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'heading_first_line', '__type__': 'NonTerminal'}],
+       'order': 0,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': False,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 116: {'origin': {'name': 'heading_first_line', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'HEADING_MARKER',
+                      'filter_out': False,
+                      '__type__': 'Terminal'},
+                     {'name': 'heading_marker_suffix',
+                      '__type__': 'NonTerminal'},
+                     {'name': '__heading_first_line_plus_7',
+                      '__type__': 'NonTerminal'}],
+       'order': 0,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': True,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 117: {'origin': {'name': 'heading_item', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'WS',
+                      'filter_out': False,
+                      '__type__': 'Terminal'}],
+       'order': 0,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': True,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 118: {'origin': {'name': 'heading_item', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'format_containers', '__type__': 'NonTerminal'}],
+       'order': 1,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': True,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 119: {'origin': {'name': 'heading_item', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'code', '__type__': 'NonTerminal'}],
+       'order': 2,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': True,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 120: {'origin': {'name': 'heading_item', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'quote_containers', '__type__': 'NonTerminal'}],
+       'order': 3,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': True,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 121: {'origin': {'name': 'heading_item', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'paren_sl', '__type__': 'NonTerminal'}],
+       'order': 4,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': True,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 122: {'origin': {'name': 'heading_item', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'common_text', '__type__': 'NonTerminal'}],
+       'order': 5,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': True,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 123: {'origin': {'name': 'heading_marker_suffix', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'SPACE',
+                      'filter_out': False,
+                      '__type__': 'Terminal'}],
+       'order': 0,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': True,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 124: {'origin': {'name': 'safety_instruction', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'warning', '__type__': 'NonTerminal'}],
+       'order': 0,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': True,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 125: {'origin': {'name': 'safety_instruction', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'caution', '__type__': 'NonTerminal'}],
+       'order': 1,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': True,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 126: {'origin': {'name': 'note_or_safety_instruction',
+                  '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'note', '__type__': 'NonTerminal'}],
+       'order': 0,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': True,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 127: {'origin': {'name': 'note_or_safety_instruction',
+                  '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'safety_instruction', '__type__': 'NonTerminal'}],
+       'order': 1,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': True,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 128: {'origin': {'name': 'warning', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'SAFETY_LINE_START',
+                      'filter_out': False,
+                      '__type__': 'Terminal'},
+                     {'name': 'warning_marker', '__type__': 'NonTerminal'},
+                     {'name': 'note_or_safety_first',
+                      '__type__': 'NonTerminal'},
+                     {'name': '__warning_star_8', '__type__': 'NonTerminal'}],
+       'order': 0,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': False,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 129: {'origin': {'name': 'warning', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'SAFETY_LINE_START',
+                      'filter_out': False,
+                      '__type__': 'Terminal'},
+                     {'name': 'warning_marker', '__type__': 'NonTerminal'},
+                     {'name': 'note_or_safety_first',
+                      '__type__': 'NonTerminal'}],
+       'order': 1,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': False,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 130: {'origin': {'name': 'warning_marker', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'WARNING_MARKER',
+                      'filter_out': False,
+                      '__type__': 'Terminal'},
+                     {'name': 'COLON',
+                      'filter_out': False,
+                      '__type__': 'Terminal'},
+                     {'name': 'SPACE',
+                      'filter_out': False,
+                      '__type__': 'Terminal'}],
+       'order': 0,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': False,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 131: {'origin': {'name': 'caution', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'SAFETY_LINE_START',
+                      'filter_out': False,
+                      '__type__': 'Terminal'},
+                     {'name': 'caution_marker', '__type__': 'NonTerminal'},
+                     {'name': 'note_or_safety_first',
+                      '__type__': 'NonTerminal'},
+                     {'name': '__warning_star_8', '__type__': 'NonTerminal'}],
+       'order': 0,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': False,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 132: {'origin': {'name': 'caution', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'SAFETY_LINE_START',
+                      'filter_out': False,
+                      '__type__': 'Terminal'},
+                     {'name': 'caution_marker', '__type__': 'NonTerminal'},
+                     {'name': 'note_or_safety_first',
+                      '__type__': 'NonTerminal'}],
+       'order': 1,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': False,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 133: {'origin': {'name': 'caution_marker', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'CAUTION_MARKER',
+                      'filter_out': False,
+                      '__type__': 'Terminal'},
+                     {'name': 'COLON',
+                      'filter_out': False,
+                      '__type__': 'Terminal'},
+                     {'name': 'SPACE',
+                      'filter_out': False,
+                      '__type__': 'Terminal'}],
+       'order': 0,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': False,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 134: {'origin': {'name': 'note', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'NOTE_OR_SAFETY_LINE_START',
+                      'filter_out': False,
+                      '__type__': 'Terminal'},
+                     {'name': 'note_marker', '__type__': 'NonTerminal'},
+                     {'name': 'note_or_safety_first',
+                      '__type__': 'NonTerminal'},
+                     {'name': '__warning_star_8', '__type__': 'NonTerminal'}],
+       'order': 0,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': False,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 135: {'origin': {'name': 'note', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'NOTE_OR_SAFETY_LINE_START',
+                      'filter_out': False,
+                      '__type__': 'Terminal'},
+                     {'name': 'note_marker', '__type__': 'NonTerminal'},
+                     {'name': 'note_or_safety_first',
+                      '__type__': 'NonTerminal'}],
+       'order': 1,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': False,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 136: {'origin': {'name': 'note_marker', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'NOTE_MARKER',
+                      'filter_out': False,
+                      '__type__': 'Terminal'},
+                     {'name': 'COLON',
+                      'filter_out': False,
+                      '__type__': 'Terminal'},
+                     {'name': 'SPACE',
+                      'filter_out': False,
+                      '__type__': 'Terminal'}],
+       'order': 0,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': False,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 137: {'origin': {'name': 'note_or_safety_first', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'common_text', '__type__': 'NonTerminal'}],
+       'order': 0,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': True,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 138: {'origin': {'name': 'note_or_safety_first', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'format_containers', '__type__': 'NonTerminal'}],
+       'order': 1,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': True,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 139: {'origin': {'name': 'note_or_safety_first', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'code', '__type__': 'NonTerminal'}],
+       'order': 2,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': True,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 140: {'origin': {'name': 'note_or_safety_first', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'quote_containers', '__type__': 'NonTerminal'}],
+       'order': 3,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': True,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 141: {'origin': {'name': 'note_or_safety_next', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'WS',
+                      'filter_out': False,
+                      '__type__': 'Terminal'}],
+       'order': 0,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': True,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 142: {'origin': {'name': 'note_or_safety_next', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'note_or_safety_first',
+                      '__type__': 'NonTerminal'}],
+       'order': 1,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': True,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 143: {'origin': {'name': 'paragraph', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'paragraph_first_item',
+                      '__type__': 'NonTerminal'},
+                     {'name': '__paragraph_star_9', '__type__': 'NonTerminal'}],
+       'order': 0,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': False,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 144: {'origin': {'name': 'paragraph', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'paragraph_first_item',
+                      '__type__': 'NonTerminal'}],
+       'order': 1,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': False,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 145: {'origin': {'name': 'paragraph_first_item', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'common_text', '__type__': 'NonTerminal'}],
+       'order': 0,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': True,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 146: {'origin': {'name': 'paragraph_first_item', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'format_containers', '__type__': 'NonTerminal'}],
+       'order': 1,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': True,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 147: {'origin': {'name': 'paragraph_first_item', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'code', '__type__': 'NonTerminal'}],
+       'order': 2,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': True,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 148: {'origin': {'name': 'paragraph_first_item', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'quote_containers', '__type__': 'NonTerminal'}],
+       'order': 3,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': True,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 149: {'origin': {'name': 'paragraph_first_item', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'paren', '__type__': 'NonTerminal'}],
+       'order': 4,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': True,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 150: {'origin': {'name': 'paragraph_first_item', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'list_line', '__type__': 'NonTerminal'}],
+       'order': 5,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': True,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 151: {'origin': {'name': 'paragraph_next_item', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'SINGLE_NEWLINE',
+                      'filter_out': False,
+                      '__type__': 'Terminal'}],
+       'order': 0,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': True,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 152: {'origin': {'name': 'paragraph_next_item', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'paragraph_item', '__type__': 'NonTerminal'}],
+       'order': 1,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': True,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 153: {'origin': {'name': 'paragraph_item', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'WS',
+                      'filter_out': False,
+                      '__type__': 'Terminal'}],
+       'order': 0,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': True,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 154: {'origin': {'name': 'paragraph_item', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'paragraph_first_item',
+                      '__type__': 'NonTerminal'}],
+       'order': 1,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': True,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 155: {'origin': {'name': 'list_line', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'LIST_LINE_START',
+                      'filter_out': False,
+                      '__type__': 'Terminal'},
+                     {'name': 'WS',
+                      'filter_out': False,
+                      '__type__': 'Terminal'},
+                     {'name': 'list_marker', '__type__': 'NonTerminal'},
+                     {'name': 'SPACE',
+                      'filter_out': False,
+                      '__type__': 'Terminal'},
+                     {'name': '__list_line_plus_10',
+                      '__type__': 'NonTerminal'}],
+       'order': 0,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': False,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 156: {'origin': {'name': 'list_item', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'WS',
+                      'filter_out': False,
+                      '__type__': 'Terminal'}],
+       'order': 0,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': True,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 157: {'origin': {'name': 'list_item', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'format_containers', '__type__': 'NonTerminal'}],
+       'order': 1,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': True,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 158: {'origin': {'name': 'list_item', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'code', '__type__': 'NonTerminal'}],
+       'order': 2,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': True,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 159: {'origin': {'name': 'list_item', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'quote_containers', '__type__': 'NonTerminal'}],
+       'order': 3,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': True,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 160: {'origin': {'name': 'list_item', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'paren_sl', '__type__': 'NonTerminal'}],
+       'order': 4,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': True,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 161: {'origin': {'name': 'list_item', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'common_text', '__type__': 'NonTerminal'}],
+       'order': 5,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': True,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 162: {'origin': {'name': 'list_marker', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'LIST_MARKER_ALPHA_NUM',
+                      'filter_out': False,
+                      '__type__': 'Terminal'}],
+       'order': 0,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': True,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 163: {'origin': {'name': 'list_marker', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'list_marker_star', '__type__': 'NonTerminal'}],
+       'order': 1,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': True,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 164: {'origin': {'name': 'list_marker', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'list_marker_dash', '__type__': 'NonTerminal'}],
+       'order': 2,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': True,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 165: {'origin': {'name': 'list_marker_star', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'STAR',
+                      'filter_out': False,
+                      '__type__': 'Terminal'}],
+       'order': 0,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': True,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 166: {'origin': {'name': 'list_marker_dash', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'DASH',
+                      'filter_out': False,
+                      '__type__': 'Terminal'}],
+       'order': 0,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': True,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 167: {'origin': {'name': 'proc_line', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'PROC_LINE_START',
+                      'filter_out': False,
+                      '__type__': 'Terminal'},
+                     {'name': 'proc_marker', '__type__': 'NonTerminal'},
+                     {'name': 'proc_delimiter', '__type__': 'NonTerminal'},
+                     {'name': 'proc_indent_suffix', '__type__': 'NonTerminal'},
+                     {'name': '__proc_line_plus_11',
+                      '__type__': 'NonTerminal'}],
+       'order': 0,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': False,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 168: {'origin': {'name': 'proc_item', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'WS',
+                      'filter_out': False,
+                      '__type__': 'Terminal'}],
+       'order': 0,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': True,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 169: {'origin': {'name': 'proc_item', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'format_containers', '__type__': 'NonTerminal'}],
+       'order': 1,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': True,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 170: {'origin': {'name': 'proc_item', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'quote_containers', '__type__': 'NonTerminal'}],
+       'order': 2,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': True,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 171: {'origin': {'name': 'proc_item', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'paren_sl', '__type__': 'NonTerminal'}],
+       'order': 3,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': True,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 172: {'origin': {'name': 'proc_item', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'common_text', '__type__': 'NonTerminal'}],
+       'order': 4,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': True,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 173: {'origin': {'name': 'proc_item', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'list_line', '__type__': 'NonTerminal'}],
+       'order': 5,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': True,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 174: {'origin': {'name': 'proc_item', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'note_or_safety_instruction',
+                      '__type__': 'NonTerminal'}],
+       'order': 6,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': True,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 175: {'origin': {'name': 'proc_marker', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'PROC_MARKER',
+                      'filter_out': False,
+                      '__type__': 'Terminal'}],
+       'order': 0,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': True,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 176: {'origin': {'name': 'proc_delimiter', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'PROC_DELIMITER',
+                      'filter_out': False,
+                      '__type__': 'Terminal'}],
+       'order': 0,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': True,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 177: {'origin': {'name': 'proc_indent_suffix', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'SPACE',
+                      'filter_out': False,
+                      '__type__': 'Terminal'}],
+       'order': 0,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': True,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 178: {'origin': {'name': 'paren', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'PAREN_OPEN',
+                      'filter_out': False,
+                      '__type__': 'Terminal'},
+                     {'name': '__paren_star_12', '__type__': 'NonTerminal'},
+                     {'name': 'PAREN_CLOSE',
+                      'filter_out': False,
+                      '__type__': 'Terminal'}],
+       'order': 0,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': False,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 179: {'origin': {'name': 'paren', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'PAREN_OPEN',
+                      'filter_out': False,
+                      '__type__': 'Terminal'},
+                     {'name': 'PAREN_CLOSE',
+                      'filter_out': False,
+                      '__type__': 'Terminal'}],
+       'order': 1,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': False,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 180: {'origin': {'name': 'paren_item_ml', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'NEWLINE',
+                      'filter_out': False,
+                      '__type__': 'Terminal'}],
+       'order': 0,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': True,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 181: {'origin': {'name': 'paren_item_ml', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'paren_item_sl', '__type__': 'NonTerminal'}],
+       'order': 1,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': True,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 182: {'origin': {'name': 'paren_sl', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'PAREN_OPEN',
+                      'filter_out': False,
+                      '__type__': 'Terminal'},
+                     {'name': '__paren_sl_star_13', '__type__': 'NonTerminal'},
+                     {'name': 'PAREN_CLOSE',
+                      'filter_out': False,
+                      '__type__': 'Terminal'}],
+       'order': 0,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': False,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 183: {'origin': {'name': 'paren_sl', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'PAREN_OPEN',
+                      'filter_out': False,
+                      '__type__': 'Terminal'},
+                     {'name': 'PAREN_CLOSE',
+                      'filter_out': False,
+                      '__type__': 'Terminal'}],
+       'order': 1,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': False,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 184: {'origin': {'name': 'paren_item_sl', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'WS',
+                      'filter_out': False,
+                      '__type__': 'Terminal'}],
+       'order': 0,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': True,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 185: {'origin': {'name': 'paren_item_sl', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'format_containers', '__type__': 'NonTerminal'}],
+       'order': 1,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': True,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 186: {'origin': {'name': 'paren_item_sl', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'quote_containers', '__type__': 'NonTerminal'}],
+       'order': 2,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': True,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 187: {'origin': {'name': 'paren_item_sl', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'paren', '__type__': 'NonTerminal'}],
+       'order': 3,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': True,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 188: {'origin': {'name': 'paren_item_sl', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'common_text', '__type__': 'NonTerminal'}],
+       'order': 4,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': True,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 189: {'origin': {'name': 'code', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'BACK_TICK',
+                      'filter_out': False,
+                      '__type__': 'Terminal'},
+                     {'name': 'CODE',
+                      'filter_out': False,
+                      '__type__': 'Terminal'},
+                     {'name': 'BACK_TICK',
+                      'filter_out': False,
+                      '__type__': 'Terminal'}],
+       'order': 0,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': False,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 190: {'origin': {'name': '__start_star_0', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'inline_next', '__type__': 'NonTerminal'}],
+       'order': 0,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': False,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 191: {'origin': {'name': '__start_star_0', '__type__': 'NonTerminal'},
+       'expansion': [{'name': '__start_star_0', '__type__': 'NonTerminal'},
+                     {'name': 'inline_next', '__type__': 'NonTerminal'}],
+       'order': 1,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': False,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 192: {'origin': {'name': '__dquote_star_1', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'dquote_item', '__type__': 'NonTerminal'}],
+       'order': 0,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': False,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 193: {'origin': {'name': '__dquote_star_1', '__type__': 'NonTerminal'},
+       'expansion': [{'name': '__dquote_star_1', '__type__': 'NonTerminal'},
+                     {'name': 'dquote_item', '__type__': 'NonTerminal'}],
+       'order': 1,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': False,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 194: {'origin': {'name': '__squote_star_2', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'squote_item', '__type__': 'NonTerminal'}],
+       'order': 0,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': False,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 195: {'origin': {'name': '__squote_star_2', '__type__': 'NonTerminal'},
+       'expansion': [{'name': '__squote_star_2', '__type__': 'NonTerminal'},
+                     {'name': 'squote_item', '__type__': 'NonTerminal'}],
+       'order': 1,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': False,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 196: {'origin': {'name': '__bold_plus_3', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'bold_item', '__type__': 'NonTerminal'}],
+       'order': 0,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': False,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 197: {'origin': {'name': '__bold_plus_3', '__type__': 'NonTerminal'},
+       'expansion': [{'name': '__bold_plus_3', '__type__': 'NonTerminal'},
+                     {'name': 'bold_item', '__type__': 'NonTerminal'}],
+       'order': 1,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': False,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 198: {'origin': {'name': '__emph_plus_4', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'emph_item', '__type__': 'NonTerminal'}],
+       'order': 0,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': False,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 199: {'origin': {'name': '__emph_plus_4', '__type__': 'NonTerminal'},
+       'expansion': [{'name': '__emph_plus_4', '__type__': 'NonTerminal'},
+                     {'name': 'emph_item', '__type__': 'NonTerminal'}],
+       'order': 1,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': False,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 200: {'origin': {'name': '__bold_emph_plus_5', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'bold_emph_item', '__type__': 'NonTerminal'}],
+       'order': 0,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': False,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 201: {'origin': {'name': '__bold_emph_plus_5', '__type__': 'NonTerminal'},
+       'expansion': [{'name': '__bold_emph_plus_5', '__type__': 'NonTerminal'},
+                     {'name': 'bold_emph_item', '__type__': 'NonTerminal'}],
+       'order': 1,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': False,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 202: {'origin': {'name': '__cite_line_star_6', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'cite_next_item', '__type__': 'NonTerminal'}],
+       'order': 0,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': False,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 203: {'origin': {'name': '__cite_line_star_6', '__type__': 'NonTerminal'},
+       'expansion': [{'name': '__cite_line_star_6', '__type__': 'NonTerminal'},
+                     {'name': 'cite_next_item', '__type__': 'NonTerminal'}],
+       'order': 1,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': False,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 204: {'origin': {'name': '__heading_first_line_plus_7',
+                  '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'heading_item', '__type__': 'NonTerminal'}],
+       'order': 0,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': False,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 205: {'origin': {'name': '__heading_first_line_plus_7',
+                  '__type__': 'NonTerminal'},
+       'expansion': [{'name': '__heading_first_line_plus_7',
+                      '__type__': 'NonTerminal'},
+                     {'name': 'heading_item', '__type__': 'NonTerminal'}],
+       'order': 1,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': False,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 206: {'origin': {'name': '__warning_star_8', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'note_or_safety_next',
+                      '__type__': 'NonTerminal'}],
+       'order': 0,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': False,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 207: {'origin': {'name': '__warning_star_8', '__type__': 'NonTerminal'},
+       'expansion': [{'name': '__warning_star_8', '__type__': 'NonTerminal'},
+                     {'name': 'note_or_safety_next',
+                      '__type__': 'NonTerminal'}],
+       'order': 1,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': False,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 208: {'origin': {'name': '__paragraph_star_9', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'paragraph_next_item',
+                      '__type__': 'NonTerminal'}],
+       'order': 0,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': False,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 209: {'origin': {'name': '__paragraph_star_9', '__type__': 'NonTerminal'},
+       'expansion': [{'name': '__paragraph_star_9', '__type__': 'NonTerminal'},
+                     {'name': 'paragraph_next_item',
+                      '__type__': 'NonTerminal'}],
+       'order': 1,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': False,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 210: {'origin': {'name': '__list_line_plus_10', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'list_item', '__type__': 'NonTerminal'}],
+       'order': 0,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': False,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 211: {'origin': {'name': '__list_line_plus_10', '__type__': 'NonTerminal'},
+       'expansion': [{'name': '__list_line_plus_10', '__type__': 'NonTerminal'},
+                     {'name': 'list_item', '__type__': 'NonTerminal'}],
+       'order': 1,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': False,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 212: {'origin': {'name': '__proc_line_plus_11', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'proc_item', '__type__': 'NonTerminal'}],
+       'order': 0,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': False,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 213: {'origin': {'name': '__proc_line_plus_11', '__type__': 'NonTerminal'},
+       'expansion': [{'name': '__proc_line_plus_11', '__type__': 'NonTerminal'},
+                     {'name': 'proc_item', '__type__': 'NonTerminal'}],
+       'order': 1,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': False,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 214: {'origin': {'name': '__paren_star_12', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'paren_item_ml', '__type__': 'NonTerminal'}],
+       'order': 0,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': False,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 215: {'origin': {'name': '__paren_star_12', '__type__': 'NonTerminal'},
+       'expansion': [{'name': '__paren_star_12', '__type__': 'NonTerminal'},
+                     {'name': 'paren_item_ml', '__type__': 'NonTerminal'}],
+       'order': 1,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': False,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 216: {'origin': {'name': '__paren_sl_star_13', '__type__': 'NonTerminal'},
+       'expansion': [{'name': 'paren_item_sl', '__type__': 'NonTerminal'}],
+       'order': 0,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': False,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'},
+ 217: {'origin': {'name': '__paren_sl_star_13', '__type__': 'NonTerminal'},
+       'expansion': [{'name': '__paren_sl_star_13', '__type__': 'NonTerminal'},
+                     {'name': 'paren_item_sl', '__type__': 'NonTerminal'}],
+       'order': 1,
+       'alias': None,
+       'options': {'keep_all_tokens': False,
+                   'expand1': False,
+                   'priority': None,
+                   'template_source': None,
+                   'empty_indices': (),
+                   '__type__': 'RuleOptions'},
+       '__type__': 'Rule'}}
+
+
+def load(**kwargs) -> Lark:
+    """Returns the parser without compiling the grammar."""
+
+    return Lark._load_from_dict(DATA, MEMO, **kwargs)
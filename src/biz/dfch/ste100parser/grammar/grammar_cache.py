@@ -0,0 +1,210 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""grammar_cache"""
+
+import hashlib
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import lark
+from lark import Lark
+
+from .grammar_type import GrammarType
+
+__all__ = [
+    "GrammarCache",
+]
+
+
+class GrammarCache:
+    """
+    Persistent cache of compiled Lark parsers.
+
+    The name of a cache file contains a hash over all `.lark` files in the
+    grammar directory, the lark version, the Python version and the Lark
+    options. A change to any of these creates a new cache file and removes
+    the stale cache files of the same grammar.
+
+    Lark can only serialize LALR parsers. Grammars that use the Earley
+    parser are always compiled.
+    """
+
+    # Environment variable with the default cache directory.
+    ENV_CACHE_DIR = "STE100PARSER_CACHE_DIR"
+
+    SUFFIX = ".cache"
+
+    _cache_dir: Path
+    _grammar_dir: Path
+
+    def __init__(
+        self,
+        cache_dir: str | Path,
+        grammar_dir: str | Path | None = None,
+    ):
+        """Default .ctor."""
+
+        assert cache_dir is not None and str(cache_dir).strip()
+
+        self._cache_dir = Path(cache_dir)
+        self._grammar_dir = (
+            Path(grammar_dir) if grammar_dir is not None
+            else Path(__file__).parent
+        )
+
+    @classmethod
+    def from_env(cls) -> "GrammarCache | None":
+        """Returns a cache for the directory in ENV_CACHE_DIR or None."""
+
+        value = os.environ.get(cls.ENV_CACHE_DIR, "")
+        if not value.strip():
+            return None
+
+        return cls(value)
+
+    @property
+    def cache_dir(self) -> Path:
+        """The directory of the cache files."""
+
+        return self._cache_dir
+
+    @staticmethod
+    def is_cacheable(options: dict) -> bool:
+        """Returns True, if Lark can serialize a parser with these options."""
+
+        return "lalr" == options.get("parser")
+
+    @staticmethod
+    def _format_option(value) -> str:
+        if isinstance(value, type):
+            return f"{value.__module__}.{value.__qualname__}"
+
+        return repr(value)
+
+    @classmethod
+    def get_grammar_key(
+        cls,
+        options: dict,
+        grammar_dir: str | Path | None = None,
+    ) -> str:
+        """
+        Returns the hash over the grammar files, the lark version and the
+        options.
+        """
+
+        grammar_dir = (
+            Path(grammar_dir) if grammar_dir is not None
+            else Path(__file__).parent
+        )
+
+        digest = hashlib.sha256()
+
+        for path in sorted(grammar_dir.glob("*.lark")):
+            digest.update(path.name.encode("utf-8"))
+            digest.update(b"\0")
+            digest.update(path.read_bytes())
+            digest.update(b"\0")
+
+        digest.update(lark.__version__.encode("utf-8"))
+
+        for name, value in sorted(options.items()):
+            digest.update(f"{name}={cls._format_option(value)};".encode(
+                "utf-8"))
+
+        return digest.hexdigest()
+
+    def get_key(self, options: dict) -> str:
+        """Returns the key of the cache file. Pickle depends on Python."""
+
+        digest = hashlib.sha256()
+        digest.update(self.get_grammar_key(options, self._grammar_dir).encode(
+            "utf-8"))
+        digest.update(str(sys.version_info[:2]).encode("utf-8"))
+
+        return digest.hexdigest()
+
+    def get_path(self, grammar: GrammarType, options: dict) -> Path:
+        """Returns the path of the cache file."""
+
+        name = Path(grammar).stem
+
+        return self._cache_dir / f"{name}-{self.get_key(options)}{self.SUFFIX}"
+
+    def load(self, grammar: GrammarType, options: dict) -> Lark:
+        """Loads the parser from the cache or compiles and stores it."""
+
+        path = self._grammar_dir / grammar
+
+        if not self.is_cacheable(options):
+            return Lark.open(str(path), **options)
+
+        cache_file = self.get_path(grammar, options)
+
+        result = self._read(cache_file)
+        if result is not None:
+            return result
+
+        result = Lark.open(str(path), **options)
+        self._write(cache_file, result)
+        self._remove_stale(grammar, cache_file)
+
+        return result
+
+    @staticmethod
+    def _read(cache_file: Path) -> Lark | None:
+        """Returns None, if the file does not exist or cannot be loaded."""
+
+        try:
+            with cache_file.open("rb") as f:
+                return Lark.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception:  # pylint: disable=W0718
+            # A damaged or incompatible file is a cache miss.
+            return None
+
+    @staticmethod
+    def _write(cache_file: Path, value: Lark) -> None:
+        """Writes to a temporary file and renames it atomically."""
+
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+
+            fd, temp = tempfile.mkstemp(
+                prefix=cache_file.name, suffix=".tmp", dir=cache_file.parent)
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    value.save(f)
+                os.replace(temp, cache_file)
+            except BaseException:
+                os.unlink(temp)
+                raise
+        except OSError:
+            # A read-only or full cache directory must not break the parser.
+            pass
+
+    def _remove_stale(self, grammar: GrammarType, cache_file: Path) -> None:
+        name = Path(grammar).stem
+
+        for path in self._cache_dir.glob(f"{name}-*{self.SUFFIX}"):
+            if path == cache_file or path.name.rsplit("-", 1)[0] != name:
+                continue
+            try:
+                path.unlink()
+            except OSError:
+                pass
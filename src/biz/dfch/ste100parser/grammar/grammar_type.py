@@ -27,3 +27,4 @@ class GrammarType(StrEnum):
     FP = "fp.lark"
     WORD = "word.lark"
     CONTAINER = "container.lark"
+    CONTAINER_LALR = "container_lalr.lark"
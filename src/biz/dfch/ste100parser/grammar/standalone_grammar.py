@@ -0,0 +1,220 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# pylint: disable=W0212
+
+"""
+standalone_grammar
+
+Generates Python modules with the compiled parse tables of the grammars.
+
+    python -m biz.dfch.ste100parser.grammar.generated
+"""
+
+import importlib
+import pprint
+import sys
+from pathlib import Path
+
+import lark
+from lark import Lark
+from lark.grammar import Rule
+from lark.lexer import TerminalDef
+
+from .grammar_cache import GrammarCache
+from .grammar_type import GrammarType
+
+__all__ = [
+    "StandaloneGrammar",
+    "main",
+]
+
+
+_HEADER = '''\
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# Generated by biz.dfch.ste100parser.grammar.standalone_grammar.
+# Do not edit. Run `python -m biz.dfch.ste100parser.grammar.generated`
+# after a change to a grammar file.
+
+# pylint: skip-file
+# type: ignore
+'''
+
+
+class _Name:
+    """Writes a class as its name into the generated module."""
+
+    def __init__(self, value: type):
+        self.value = value
+
+    def __repr__(self) -> str:
+        return self.value.__name__
+
+
+class StandaloneGrammar:
+    """
+    Pregenerated parsers.
+
+    A generated module contains the serialized Lark parser as Python
+    literals. Loading the module does not compile the grammar. The module
+    is only used, if the grammar files, the lark version and the Lark
+    options are the same as at generation time.
+
+    Lark can only serialize LALR parsers. Grammars that use the Earley
+    parser are always compiled.
+    """
+
+    PACKAGE = f"{__package__}.generated"
+
+    @staticmethod
+    def is_supported(options: dict) -> bool:
+        """Returns True, if a module can be generated for these options."""
+
+        return GrammarCache.is_cacheable(options)
+
+    @classmethod
+    def get_module_name(cls, grammar: GrammarType) -> str:
+        """Returns the full name of the generated module."""
+
+        return f"{cls.PACKAGE}.{Path(grammar).stem}"
+
+    @classmethod
+    def _convert(cls, value, imports: set):
+        if isinstance(value, type):
+            imports.add((value.__module__, value.__name__))
+            return _Name(value)
+        if isinstance(value, dict):
+            return {k: cls._convert(v, imports) for k, v in value.items()}
+        if isinstance(value, list):
+            return [cls._convert(v, imports) for v in value]
+        if isinstance(value, tuple):
+            return tuple(cls._convert(v, imports) for v in value)
+
+        return value
+
+    @classmethod
+    def generate(cls, grammar: GrammarType, options: dict) -> str:
+        """Returns the source code of the module for the grammar."""
+
+        assert cls.is_supported(options), grammar
+
+        path = Path(__file__).parent / grammar
+        lark_inst = Lark.open(str(path), **options)
+
+        imports: set = set()
+        data, memo = lark_inst.memo_serialize([TerminalDef, Rule])
+        data = cls._convert(data, imports)
+        memo = cls._convert(memo, imports)
+
+        lines = [
+            _HEADER,
+            f'"""{Path(grammar).stem}"""',
+            "",
+            "from lark import Lark",
+            "",
+        ]
+        lines.extend(
+            f"from {module} import {name}"
+            for module, name in sorted(imports))
+        lines.extend([
+            "",
+            f'GRAMMAR = "{grammar.value}"',
+            f'GRAMMAR_KEY = "{GrammarCache.get_grammar_key(options)}"',
+            f'LARK_VERSION = "{lark.__version__}"',
+            "",
+            f"DATA = {pprint.pformat(data, sort_dicts=False)}",
+            "",
+            f"MEMO = {pprint.pformat(memo, sort_dicts=False)}",
+            "",
+            "",
+            "def load(**kwargs) -> Lark:",
+            '    """Returns the parser without compiling the grammar."""',
+            "",
+            "    return Lark._load_from_dict(DATA, MEMO, **kwargs)",
+            "",
+        ])
+
+        return "\n".join(lines)
+
+    @classmethod
+    def write(
+        cls,
+        grammar: GrammarType,
+        options: dict,
+        directory: str | Path | None = None,
+    ) -> Path:
+        """Writes the module for the grammar and returns its path."""
+
+        directory = (
+            Path(directory) if directory is not None
+            else Path(__file__).parent / "generated"
+        )
+
+        result = directory / f"{Path(grammar).stem}.py"
+        result.write_text(cls.generate(grammar, options), encoding="utf-8")
+
+        return result
+
+    @classmethod
+    def load(cls, grammar: GrammarType, options: dict) -> Lark | None:
+        """
+        Returns the parser from the generated module. None, if there is no
+        module or the module is out of date.
+        """
+
+        if not cls.is_supported(options):
+            return None
+
+        name = cls.get_module_name(grammar)
+        try:
+            module = importlib.import_module(name)
+        except ModuleNotFoundError as ex:
+            if ex.name != name:
+                raise
+            return None
+
+        if module.GRAMMAR_KEY != GrammarCache.get_grammar_key(options):
+            return None
+
+        return module.load()
+
+
+def main() -> None:
+    """Generates the modules for all grammars that use the LALR parser."""
+
+    from ..parser import Parser  # pylint: disable=C0415
+
+    for grammar in GrammarType:
+        options = Parser.get_options(grammar)
+        if not StandaloneGrammar.is_supported(options):
+            print(f"{grammar.name}: skipped (no LALR parser)", file=sys.stderr)
+            continue
+
+        path = StandaloneGrammar.write(grammar, options)
+        print(f"{grammar.name}: {path}", file=sys.stderr)
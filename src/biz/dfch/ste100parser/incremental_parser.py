@@ -0,0 +1,338 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# pylint: disable=W0212
+
+"""incremental_parser"""
+
+from dataclasses import dataclass, field
+
+from lark import Token as LarkToken, Tree
+from lark.tree import Meta
+
+from .chunked_parser import Chunk, ChunkedParser
+from .grammar.grammar_type import GrammarType
+from .token import Token
+from .transformer.container_transformer import ContainerTransformer
+from .transformer.text_transformer import TextTransformer
+
+__all__ = [
+    "IncrementalParser",
+    "TextEdit",
+]
+
+# Wraps a list of nodes, so that a transformer processes all of them, but
+# does not run the `start` callback.
+_ITEMS = "_items"
+
+_SENTENCE = Token.sentence.name
+
+
+@dataclass(frozen=True)
+class TextEdit:
+    """Replaces the characters from `start_pos` to `end_pos` with `text`."""
+
+    start_pos: int
+    end_pos: int
+    text: str
+
+
+@dataclass
+class _Block:
+    """The transformed top-level items of one chunk."""
+
+    chunk: Chunk
+    # Meta of the parse tree of the chunk.
+    meta: Meta
+    # Top-level items after ContainerTransformer (without `start`).
+    items: list
+    # False, if the parse tree of the chunk is a single item.
+    is_start: bool = True
+    # TextTransformer results of the items, by id of the item.
+    texts: dict[int, Tree] = field(default_factory=dict)
+    # All metas and tokens of the items and results. See `_shift`.
+    positions: list = field(default_factory=list)
+
+
+class IncrementalParser:
+    """
+    Parses and transforms a text after every edit.
+
+    The parser keeps the transformed items of every chunk (see
+    ChunkedParser) of the previous text. After an edit, it only parses and
+    transforms the chunks with a changed text. The other chunks are moved
+    to their new positions. The `start` rules of ContainerTransformer and
+    TextTransformer run on all top-level items, because they join
+    neighbouring items.
+
+    The result is the same as:
+
+        pass1 = ContainerTransformer().transform(Parser(grammar).invoke(text))
+        result = TextTransformer().transform(pass1)
+
+    With GrammarType.CONTAINER, this only holds, if the Earley parser
+    resolves the ambiguities of a chunk as for the whole text. See
+    ChunkedParser.
+
+    Consecutive results share their unchanged nodes. An edit moves the
+    positions of these nodes in the previous result, too.
+    """
+
+    _chunked: ChunkedParser
+    _container: ContainerTransformer
+    _text: TextTransformer
+    _source: str | None
+    _tree: Tree | None
+    _blocks: list[_Block]
+    _parsed_chunks: int
+
+    def __init__(
+        self,
+        grammar: GrammarType = GrammarType.CONTAINER,
+        container: ContainerTransformer | None = None,
+        text: TextTransformer | None = None,
+    ):
+        """Default .ctor."""
+
+        assert grammar in (GrammarType.CONTAINER, GrammarType.CONTAINER_LALR)
+
+        self._chunked = ChunkedParser(grammar)
+
+        self._container = (
+            container if container is not None
+            else ContainerTransformer()
+        )
+        self._text = (
+            text if text is not None
+            else TextTransformer()
+        )
+        assert isinstance(self._container, ContainerTransformer)
+        assert isinstance(self._text, TextTransformer)
+
+        self._source = None
+        self._tree = None
+        self._blocks = []
+        self._parsed_chunks = 0
+
+    @property
+    def text(self) -> str | None:
+        """The current text."""
+
+        return self._source
+
+    @property
+    def tree(self) -> Tree | None:
+        """The transformed tree of the current text."""
+
+        return self._tree
+
+    @property
+    def parsed_chunks(self) -> int:
+        """The number of chunks that the last call parsed."""
+
+        return self._parsed_chunks
+
+    def invoke(self, text: str) -> Tree:
+        """
+        Parses and transforms the text. Chunks with the same text as in the
+        previous text are not parsed again.
+        """
+
+        assert isinstance(text, str) and text.strip()
+
+        self._source = text
+        self._tree = None
+        self._tree = self._update(text)
+
+        return self._tree
+
+    def edit(self, value: TextEdit) -> Tree:
+        """Applies the edit to the current text and returns the new tree."""
+
+        assert isinstance(value, TextEdit)
+        assert self._source is not None, "Call invoke() first."
+        assert 0 <= value.start_pos <= value.end_pos <= len(self._source), (
+            f"{value.start_pos}..{value.end_pos}: {len(self._source)}")
+        assert isinstance(value.text, str)
+
+        return self.invoke(
+            self._source[:value.start_pos] +
+            value.text +
+            self._source[value.end_pos:]
+        )
+
+    def _update(self, text: str) -> Tree:
+        chunks = self._chunked.get_chunks(text)
+
+        # Blocks of the previous text, by the text of their chunk.
+        reusable: dict[str, list[_Block]] = {}
+        for block in self._blocks:
+            reusable.setdefault(block.chunk.text, []).append(block)
+
+        self._parsed_chunks = 0
+        blocks: list[_Block] = []
+        try:
+            for chunk in chunks:
+                candidates = reusable.get(chunk.text)
+                if candidates:
+                    block = candidates.pop()
+                    self._move(block, chunk)
+                else:
+                    block = self._parse(chunk)
+                    self._parsed_chunks += 1
+                blocks.append(block)
+        except Exception:  # pylint: disable=W0718
+            # Keeps all blocks for the next edit.
+            self._blocks = blocks + [
+                block for values in reusable.values() for block in values
+            ]
+
+            # Raises the error with the positions in the whole text.
+            tree = self._chunked._parser.invoke(text)
+            return self._text.transform(self._container.transform(tree))
+
+        self._blocks = blocks
+
+        return self._join(text, blocks)
+
+    def _parse(self, chunk: Chunk) -> _Block:
+        tree = self._chunked._parser.invoke(chunk.text)
+        is_start = Token.start.name == tree.data
+        children = tree.children if is_start else [tree]
+        items = self._container.transform(Tree(_ITEMS, children)).children
+
+        result = _Block(chunk, tree.meta, items, is_start=is_start)
+        result.positions.append(tree.meta)
+        self._collect(result, items)
+
+        # Every chunk starts at column 1, so only lines and positions move.
+        self._shift(result, chunk.line - 1, chunk.start_pos)
+
+        return result
+
+    def _move(self, block: _Block, chunk: Chunk) -> None:
+        lines = chunk.line - block.chunk.line
+        pos = chunk.start_pos - block.chunk.start_pos
+
+        block.chunk = chunk
+        if lines or pos:
+            self._shift(block, lines, pos)
+
+    @staticmethod
+    def _collect(block: _Block, nodes: list) -> None:
+        """Adds the metas and tokens of the nodes to the block positions."""
+
+        seen = {id(value) for value in block.positions}
+
+        def add(value) -> None:
+            if id(value) not in seen:
+                seen.add(id(value))
+                block.positions.append(value)
+
+        for node in nodes:
+            if isinstance(node, LarkToken):
+                add(node)
+                continue
+            if not isinstance(node, Tree):
+                continue
+            for subtree in node.iter_subtrees():
+                # TextTransformer does not set the positions of a sentence.
+                if _SENTENCE != subtree.data:
+                    add(subtree.meta)
+                for child in subtree.children:
+                    if isinstance(child, LarkToken):
+                        add(child)
+
+    @staticmethod
+    def _shift(block: _Block, lines: int, pos: int) -> None:
+        """Moves all positions in the block."""
+
+        for value in block.positions:
+            # Metas of transformed nodes do not always have all positions.
+            if hasattr(value, "line"):
+                value.line += lines
+            if getattr(value, "end_line", None) is not None:
+                value.end_line += lines
+            if hasattr(value, "start_pos"):
+                value.start_pos += pos
+            if getattr(value, "end_pos", None) is not None:
+                value.end_pos += pos
+
+    def _join(self, text: str, blocks: list[_Block]) -> Tree:
+        """Runs the `start` rules on the items of all blocks."""
+
+        items: list = []
+        owners: dict[int, _Block] = {}
+        previous_end = 0
+        for block in blocks:
+            newlines = self._chunked._get_newlines(
+                text, previous_end, block.chunk)
+            if newlines:
+                items.extend(
+                    self._container.transform(Tree(_ITEMS, newlines)).children)
+
+            items.extend(block.items)
+            for item in block.items:
+                owners[id(item)] = block
+
+            previous_end = block.chunk.start_pos + len(block.chunk.text)
+
+        if 1 == len(blocks) and not blocks[0].is_start:
+            return self._get_texts(items, owners)[0]
+
+        first, last = blocks[0].meta, blocks[-1].meta
+        meta = Meta()
+        meta.empty = False
+        meta.line = first.line
+        meta.column = first.column
+        meta.start_pos = first.start_pos
+        meta.end_line = last.end_line
+        meta.end_column = last.end_column
+        meta.end_pos = last.end_pos
+
+        tree = self._container._call_userfunc(
+            Tree(Token.start.name, items, meta=meta))
+
+        children = self._get_texts(tree.children, owners)
+
+        return self._text._call_userfunc(
+            Tree(Token.start.name, children, meta=meta))
+
+    def _get_texts(self, items: list, owners: dict[int, _Block]) -> list:
+        """
+        Returns the TextTransformer results of the items. Items that the
+        `start` rules did not change keep their result.
+        """
+
+        result = list(items)
+        missing = []
+        for i, item in enumerate(items):
+            block = owners.get(id(item))
+            if block is not None and id(item) in block.texts:
+                result[i] = block.texts[id(item)]
+            else:
+                missing.append(i)
+
+        if missing:
+            values = self._text.transform(
+                Tree(_ITEMS, [items[i] for i in missing])).children
+            for i, value in zip(missing, values):
+                block = owners.get(id(items[i]))
+                if block is not None:
+                    block.texts[id(items[i])] = value
+                    self._collect(block, [value])
+                result[i] = value
+
+        return result
@@ -0,0 +1,171 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""interner"""
+
+import sys
+from dataclasses import dataclass
+from threading import Lock
+
+from lark import Tree
+from lark.tree import Meta
+
+from .token import Token
+
+__all__ = [
+    "Interner",
+    "InternerInfo",
+]
+
+
+@dataclass(frozen=True)
+class InternerInfo:
+    """Statistics of an Interner."""
+
+    # Number of distinct strings and of lookups that found another object.
+    strings: int
+    string_hits: int
+    # Number of shared containers and of lookups that found one.
+    trees: int
+    tree_hits: int
+    # Memory of the strings that were replaced by an existing object.
+    saved_bytes: int
+
+
+class Interner:
+    """
+    Shares equal leaf strings and equal transformed containers across the
+    documents of a corpus.
+
+    ContainerTransformer and TextTransformer use an interner, if it is set
+    in their `interner` attribute. Every leaf string (the value of a TEXT,
+    WORD or EOS node) is replaced with the first equal string.
+
+    A container (`paragraph`, NOTE, WARNING or CAUTION) is shared, if
+    another document has the same source text at the same position, line
+    and column, because only then are all positions in the subtree the
+    same (for example, a safety instruction at the start of every manual).
+    A shared subtree must not be changed. Its metas can refer to the
+    LineIndex (and so the text) of the first document.
+
+    The lookups are safe in threads. The statistics are exact in a single
+    thread.
+    """
+
+    # Containers that are shared.
+    CONTAINERS = frozenset((
+        Token.paragraph.name,
+        Token.NOTE.name,
+        Token.WARNING.name,
+        Token.CAUTION.name,
+    ))
+
+    _strings: dict[str, str]
+    _trees: dict[tuple, Tree]
+    _lock: Lock
+    _string_hits: int
+    _tree_hits: int
+    _saved_bytes: int
+
+    def __init__(self):
+        """Default .ctor."""
+
+        self._strings = {}
+        self._trees = {}
+        self._lock = Lock()
+        self._string_hits = 0
+        self._tree_hits = 0
+        self._saved_bytes = 0
+
+    def intern(self, value: str) -> str:
+        """Returns the first string that is equal to the value."""
+
+        result = self._strings.setdefault(value, value)
+        if result is not value:
+            self._string_hits += 1
+            self._saved_bytes += sys.getsizeof(value)
+
+        return result
+
+    @classmethod
+    def get_key(
+        cls,
+        data: str,
+        meta: Meta,
+        text: str,
+        options: str = "",
+    ) -> tuple | None:
+        """
+        Returns the key of a container or None, if the container is not
+        shared or the meta does not have the positions. `options` describes
+        everything else that changes the subtree, for example the
+        dictionary.
+        """
+
+        if data not in cls.CONTAINERS:
+            return None
+
+        start_pos = getattr(meta, "start_pos", None)
+        end_pos = getattr(meta, "end_pos", None)
+        if start_pos is None or end_pos is None:
+            return None
+
+        return (
+            data, start_pos, getattr(meta, "line", None),
+            getattr(meta, "column", None), options, text[start_pos:end_pos],
+        )
+
+    def get_tree(self, key: tuple) -> Tree | None:
+        """Returns the shared container of the key or None."""
+
+        result = self._trees.get(key)
+        if result is not None:
+            self._tree_hits += 1
+
+        return result
+
+    def add_tree(self, key: tuple, tree: Tree) -> Tree:
+        """
+        Stores the container. Returns the container that is stored for the
+        key (from another thread, it can be a different one).
+        """
+
+        assert isinstance(key, tuple)
+        assert isinstance(tree, Tree)
+
+        with self._lock:
+            return self._trees.setdefault(key, tree)
+
+    def clear(self) -> None:
+        """Removes all strings and containers and resets the statistics."""
+
+        with self._lock:
+            self._strings.clear()
+            self._trees.clear()
+            self._string_hits = 0
+            self._tree_hits = 0
+            self._saved_bytes = 0
+
+    def info(self) -> InternerInfo:
+        """Returns the statistics of the interner."""
+
+        with self._lock:
+            return InternerInfo(
+                strings=len(self._strings),
+                string_hits=self._string_hits,
+                trees=len(self._trees),
+                tree_hits=self._tree_hits,
+                saved_bytes=self._saved_bytes,
+            )
@@ -0,0 +1,170 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""line_index"""
+
+from bisect import bisect_right
+
+from lark.tree import Meta
+
+__all__ = [
+    "LazyMeta",
+    "LineIndex",
+]
+
+# Characters outside the BMP are two UTF-16 code units.
+_BMP_MAX = 0xFFFF
+
+
+class LineIndex:
+    """
+    Converts positions in a text to lines and columns (both 1-based).
+
+    The index stores the start position of every line. A lookup is a
+    binary search over these positions.
+    """
+
+    _text: str
+    # Position of the first character of every line.
+    _starts: list[int]
+
+    def __init__(self, text: str):
+        """Default .ctor."""
+
+        assert isinstance(text, str)
+
+        self._text = text
+        self._starts = [0]
+        pos = text.find("\n")
+        while 0 <= pos:
+            self._starts.append(pos + 1)
+            pos = text.find("\n", pos + 1)
+
+    @property
+    def text(self) -> str:
+        """The text of the index."""
+
+        return self._text
+
+    @property
+    def lines(self) -> int:
+        """The number of lines."""
+
+        return len(self._starts)
+
+    def get_line_column(self, pos: int) -> tuple[int, int]:
+        """Returns the line and the column of the position."""
+
+        assert 0 <= pos <= len(self._text), pos
+
+        line = bisect_right(self._starts, pos)
+
+        return line, pos - self._starts[line - 1] + 1
+
+    def get_utf16_column(self, pos: int) -> int:
+        """
+        Returns the column of the position in UTF-16 code units (1-based),
+        as editors and the Language Server Protocol count them.
+        """
+
+        line, column = self.get_line_column(pos)
+        start = self._starts[line - 1]
+
+        return column + sum(
+            1 for char in self._text[start:pos] if _BMP_MAX < ord(char))
+
+    def get_meta(
+        self,
+        start_pos: int,
+        end_pos: int,
+        lazy: bool = True,
+    ) -> Meta:
+        """
+        Returns a meta with the positions. See LazyMeta. Without `lazy`,
+        the lines and columns are computed now and the result is a Meta.
+        """
+
+        if lazy:
+            return LazyMeta(self, start_pos, end_pos)
+
+        result = Meta()
+        result.empty = False
+        result.start_pos = start_pos
+        result.end_pos = end_pos
+        result.line, result.column = self.get_line_column(start_pos)
+        result.end_line, result.end_column = self.get_line_column(end_pos)
+
+        return result
+
+
+class LazyMeta(Meta):
+    """
+    A Meta that only stores the start and end position.
+
+    The line and the column (and the end line and the end column) are
+    computed from the LineIndex of the document on first access. After that,
+    they are normal attributes, so they can be changed.
+
+    The end line and the end column are the position after the last
+    character, so a token that ends with a line break ends at the start of
+    the next line. This is what the LALR lexer does; the Earley lexer ends
+    such a token on the line of the line break.
+    """
+
+    __slots__ = ("empty", "start_pos", "end_pos", "_index")
+
+    # Attributes that are computed from the start position.
+    _FROM_START = ("line", "column")
+    # Attributes that are computed from the end position.
+    _FROM_END = ("end_line", "end_column")
+
+    empty: bool
+    start_pos: int
+    end_pos: int
+    _index: LineIndex
+
+    def __init__(self, index: LineIndex, start_pos: int, end_pos: int):
+        """Default .ctor."""
+
+        # Meta.__init__ would create the instance dictionary.
+        self.empty = True
+        self.start_pos = start_pos
+        self.end_pos = end_pos
+        self._index = index
+
+    def __getattr__(self, name: str):
+        # Only called, if the attribute was not computed or set yet.
+        if name in self._FROM_START:
+            self.line, self.column = self._index.get_line_column(
+                self.start_pos)
+        elif name in self._FROM_END:
+            self.end_line, self.end_column = self._index.get_line_column(
+                self.end_pos)
+        else:
+            raise AttributeError(name)
+
+        return self.__dict__[name]
+
+    @property
+    def utf16_column(self) -> int:
+        """The column of the start position in UTF-16 code units."""
+
+        return self._index.get_utf16_column(self.start_pos)
+
+    @property
+    def utf16_end_column(self) -> int:
+        """The column of the end position in UTF-16 code units."""
+
+        return self._index.get_utf16_column(self.end_pos)
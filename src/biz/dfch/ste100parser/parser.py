@@ -15,11 +15,46 @@
 
 """TestMain"""
 
+from dataclasses import dataclass
 from pathlib import Path
+from threading import Lock
 
-from lark import Lark, ParseTree
+from lark import Lark, ParseTree, Token
+from lark.exceptions import UnexpectedEOF, UnexpectedInput, UnexpectedToken
+from lark.parsers.lalr_analysis import Shift
+from lark.parsers.lalr_parser_state import ParseConf, ParserState
 
+from .grammar.container_lalr_lexer import ContainerLalrLexer
+from .grammar.grammar_cache import GrammarCache
 from .grammar.grammar_type import GrammarType
+from .grammar.standalone_grammar import StandaloneGrammar
+
+
+@dataclass(frozen=True)
+class ParserCacheInfo:
+    """Statistics of the process-wide Lark cache."""
+
+    hits: int
+    misses: int
+    size: int
+
+
+@dataclass(frozen=True)
+class ValidationResult:
+    """
+    Result of Parser.validate.
+
+    For an invalid text, `pos` (0-based), `line` and `column` (1-based) are
+    the position of the first error and `expected` contains the names of the
+    terminals that the parser accepts there.
+    """
+
+    valid: bool
+    pos: int | None = None
+    line: int | None = None
+    column: int | None = None
+    expected: frozenset[str] = frozenset()
+    error: str | None = None
 
 
 class Parser:
@@ -28,30 +63,256 @@ class Parser:
     _lark: Lark
     _grammar: GrammarType
 
-    def __init__(self, grammar: GrammarType = GrammarType.DEFAULT):
-        """Default .ctor."""
+    # Process-wide cache of Lark instances by grammar and Lark options.
+    _cache: dict[tuple, Lark] = {}
+    _cache_lock = Lock()
+    _cache_hits: int = 0
+    _cache_misses: int = 0
+
+    # Lark options per grammar. Other grammars use the Earley parser.
+    _options: dict[GrammarType, dict] = {
+        GrammarType.CONTAINER_LALR: {
+            "parser": "lalr",
+            "lexer": ContainerLalrLexer,
+        },
+    }
+
+    # Lark options of the Earley parsers for `validate`. With the "forest"
+    # ambiguity, Lark returns the shared packed parse forest and does not
+    # build a tree from it.
+    _validation_options: dict = {
+        "propagate_positions": False,
+        "ambiguity": "forest",
+    }
+
+    def __init__(
+        self,
+        grammar: GrammarType = GrammarType.DEFAULT,
+        cache_dir: str | Path | None = None,
+    ):
+        """
+        Default .ctor.
+
+        The parser uses the pregenerated module of the grammar, if the module
+        is up to date. Otherwise, with a `cache_dir` (or the environment
+        variable STE100PARSER_CACHE_DIR), the compiled LALR grammars are
+        stored on disk and loaded from there by the next process.
+        """
 
         assert isinstance(grammar, GrammarType) and grammar.strip()
 
         self._grammar = grammar
 
-        path = Path("grammar") / grammar
-        self._lark = Lark.open(
-            path.as_posix(),
-            rel_to=__file__,
-            propagate_positions=True,
-        )  # type: ignore
+        options = self.get_options(grammar)
+        disk_cache = (
+            GrammarCache(cache_dir) if cache_dir is not None
+            else GrammarCache.from_env()
+        )
+        self._lark = self._get_lark(grammar, options, disk_cache)
+
+    @classmethod
+    def get_options(cls, grammar: GrammarType) -> dict:
+        """Returns the Lark options for the grammar."""
+
+        return {
+            "propagate_positions": True,
+            **cls._options.get(grammar, {}),
+        }
+
+    @classmethod
+    def _get_lark(
+        cls,
+        grammar: GrammarType,
+        options: dict,
+        disk_cache: GrammarCache | None = None,
+    ) -> Lark:
+        """Returns a cached Lark instance or creates a new one."""
+
+        key = (grammar, tuple(sorted(options.items())))
+
+        with cls._cache_lock:
+            result = cls._cache.get(key)
+            if result is not None:
+                cls._cache_hits += 1
+                return result
+
+            cls._cache_misses += 1
+
+            result = StandaloneGrammar.load(grammar, options)
+            if result is not None:
+                cls._cache[key] = result
+                return result
+
+            if disk_cache is not None:
+                result = disk_cache.load(grammar, options)
+                cls._cache[key] = result
+                return result
+
+            path = Path("grammar") / grammar
+            result = Lark.open(
+                path.as_posix(),
+                rel_to=__file__,
+                **options,
+            )  # type: ignore
+            cls._cache[key] = result
+
+            return result
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Removes all Lark instances and resets the cache statistics."""
+
+        with cls._cache_lock:
+            cls._cache.clear()
+            cls._cache_hits = 0
+            cls._cache_misses = 0
+
+    @classmethod
+    def cache_info(cls) -> ParserCacheInfo:
+        """Returns the statistics of the Lark cache."""
+
+        with cls._cache_lock:
+            return ParserCacheInfo(
+                hits=cls._cache_hits,
+                misses=cls._cache_misses,
+                size=len(cls._cache),
+            )
 
     def is_valid(self, text: str) -> bool:
         """Returns True, if the text is valid. False, otherwise."""
 
-        try:
-            self.invoke(text)
+        if not isinstance(text, str) or not text.strip():
+            return False
 
-            return True
+        try:
+            return self.validate(text).valid
         except Exception:  # pylint: disable=W0718
             return False
 
+    def validate(self, text: str) -> ValidationResult:
+        """
+        Checks the text without building a parse tree.
+
+        The LALR grammar runs the parse table of the parser on the tokens and
+        only keeps the state stack. The Earley grammars use a parser without
+        position propagation that stops at the parse forest.
+        """
+
+        assert isinstance(text, str) and text.strip()
+
+        try:
+            if "lalr" == self._lark.options.parser:
+                self._recognize(text)
+            else:
+                self._get_validation_lark().parse(text)
+        except UnexpectedInput as ex:
+            return self._get_error(text, ex)
+
+        return ValidationResult(valid=True)
+
+    def _get_validation_lark(self) -> Lark:
+        """Returns the cached Earley parser for `validate`."""
+
+        options = {
+            **self.get_options(self._grammar),
+            **self._validation_options,
+        }
+
+        return self._get_lark(self._grammar, options)
+
+    def _recognize(self, text: str) -> None:
+        """
+        Runs the LALR parse table of the parser on the text. Raises an
+        UnexpectedInput on the first error.
+
+        Same as the lark parser loop, but without the value stack and the
+        tree callbacks.
+        """
+
+        frontend = self._lark.parser
+        start = frontend._verify_start()  # pylint: disable=W0212
+        parse_conf = ParseConf(
+            frontend.parser._parse_table, {}, start)  # pylint: disable=W0212
+        lexer = frontend._make_lexer_thread(text)  # pylint: disable=W0212
+        # The lexer selects its terminals by the state of the parser.
+        parser_state = ParserState(parse_conf, lexer)
+
+        token = None
+        for token in lexer.lex(parser_state):
+            self._feed(parse_conf, parser_state, token)
+
+        end = (
+            Token.new_borrow_pos("$END", "", token) if token
+            else Token("$END", "", 0, 1, 1)
+        )
+        self._feed(parse_conf, parser_state, end, is_end=True)
+
+    @staticmethod
+    def _feed(
+        parse_conf: ParseConf,
+        parser_state: ParserState,
+        token: Token,
+        is_end: bool = False,
+    ) -> None:
+        """
+        Reduces until the token is shifted or, at the end of the input, until
+        the parser reaches the end state.
+        """
+
+        states = parse_conf.states
+        stack = parser_state.state_stack
+
+        while True:
+            actions = states[stack[-1]]
+            action = actions.get(token.type)
+            if action is None:
+                expected = {item for item in actions if item.isupper()}
+                raise UnexpectedToken(token, expected, state=parser_state)
+
+            kind, arg = action
+            if kind is Shift:
+                assert not is_end
+                stack.append(arg)
+                return
+
+            size = len(arg.expansion)
+            if size:
+                del stack[-size:]
+            _, state = states[stack[-1]][arg.origin.name]
+            stack.append(state)
+
+            if is_end and state == parse_conf.end_state:
+                return
+
+    @staticmethod
+    def _get_error(text: str, ex: UnexpectedInput) -> ValidationResult:
+        """Returns the result with the position of the error."""
+
+        expected = getattr(ex, "expected", None)
+        if expected is None:
+            expected = getattr(ex, "allowed", None)
+
+        if isinstance(ex, UnexpectedEOF) or (
+                isinstance(ex, UnexpectedToken) and "$END" == ex.token.type):
+            # The error is at the end of the input. Lark does not set a
+            # position (Earley) or uses the position of the last token (LALR).
+            pos = len(text)
+            line = text.count("\n") + 1
+            column = pos - text.rfind("\n")
+        else:
+            pos = ex.pos_in_stream
+            line = ex.line
+            column = ex.column
+
+        return ValidationResult(
+            valid=False,
+            pos=pos,
+            line=line,
+            column=column,
+            expected=frozenset(expected or ()),
+            error=type(ex).__name__,
+        )
+
     def invoke(self, text: str) -> ParseTree:
         """Invokes the parser."""
 
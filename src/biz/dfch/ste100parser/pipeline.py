@@ -0,0 +1,200 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""pipeline"""
+
+from copy import copy
+
+from lark import Tree
+
+from .compact_tree import CompactLeaf, CompactNode, to_compact
+from .grammar.grammar_type import GrammarType
+from .interner import Interner
+from .line_index import LineIndex
+from .parser import Parser
+from .result_cache import ResultCache
+from .stats import PipelineStats
+from .token import Token
+from .transformer.container_transformer import ContainerTransformer
+from .transformer.pipeline_transformer import PipelineTransformer
+from .transformer.text_transformer import TextTransformer
+
+__all__ = [
+    "Pipeline",
+]
+
+
+class Pipeline:
+    """
+    Parses a text and applies ContainerTransformer and TextTransformer.
+
+    The result is the same as:
+
+        pass1 = ContainerTransformer().transform(Parser(grammar).invoke(text))
+        result = TextTransformer().transform(pass1)
+
+    But both transformers run in one pass over the parse tree, and the root
+    is always `start`. With `?start`, the parser does not wrap a single
+    item, but the Earley parser can split a paragraph into several items
+    that ContainerTransformer joins again. Because of this, both grammars
+    create the same tree.
+
+    With `lazy_positions`, the metas of the tokens only store the start and
+    end position. The lines and columns are computed from a line index of
+    the text on first access. See LazyMeta. With GrammarType.CONTAINER, the
+    Earley lexer ends a token that ends with a line break on the line of the
+    line break, a LazyMeta ends it at the start of the next line; all other
+    positions are the same.
+
+    With a `cache`, the result of a text is looked up in the cache first.
+    The key includes the transformer classes and the dictionary. See
+    ResultCache.
+
+    With an `interner`, both transformers share equal strings and equal
+    containers with the other documents of this interner. See Interner.
+    """
+
+    _grammar: GrammarType
+    _parser: Parser
+    _transformer: PipelineTransformer
+    _lazy_positions: bool
+    _cache: ResultCache | None
+    _cache_options: str
+
+    def __init__(
+        self,
+        grammar: GrammarType = GrammarType.CONTAINER,
+        container: ContainerTransformer | None = None,
+        text: TextTransformer | None = None,
+        lazy_positions: bool = True,
+        cache: ResultCache | None = None,
+        interner: Interner | None = None,
+    ):
+        """Default .ctor."""
+
+        assert grammar in (GrammarType.CONTAINER, GrammarType.CONTAINER_LALR)
+        assert isinstance(lazy_positions, bool)
+        assert cache is None or isinstance(cache, ResultCache)
+        assert interner is None or isinstance(interner, Interner)
+
+        self._grammar = grammar
+        self._parser = Parser(grammar)
+        self._transformer = PipelineTransformer(container, text)
+        if interner is not None:
+            self._transformer.container.interner = interner
+            self._transformer.text.interner = interner
+        self._lazy_positions = lazy_positions
+        self._cache = cache
+        self._cache_options = ";".join(
+            f"{type(item).__module__}.{type(item).__qualname__}"
+            for item in (self._transformer.container, self._transformer.text)
+        ) + f";{self._transformer.text.dictionary.fingerprint}"
+
+    @property
+    def cache(self) -> ResultCache | None:
+        """The result cache or None."""
+
+        return self._cache
+
+    def invoke(self, text: str, stats: PipelineStats | None = None) -> Tree:
+        """
+        Parses and transforms the text.
+
+        With `stats`, the pipeline records the time of every phase and the
+        counters in this object. Then, the transformers run one after the
+        other, so that their times can be measured.
+        """
+
+        if self._cache is None:
+            return self._invoke(text, stats)
+
+        key = self._cache.get_key(text, self._grammar, self._cache_options)
+        if stats is None:
+            result = self._cache.get(key, text, self._lazy_positions)
+        else:
+            with stats.measure("cache"):
+                result = self._cache.get(key, text, self._lazy_positions)
+            if result is not None:
+                stats.add_input(text)
+                stats.add_nodes(result)
+        if result is not None:
+            return result
+
+        result = self._invoke(text, stats)
+        self._cache.put(key, result)
+
+        return result
+
+    def _invoke(self, text: str, stats: PipelineStats | None) -> Tree:
+        if stats is not None:
+            return self._invoke_with_stats(text, stats)
+
+        parse_tree = self._parse(text)
+
+        line_index = LineIndex(text) if self._lazy_positions else None
+        result = self._transformer.transform(parse_tree, line_index)
+
+        return result
+
+    def _parse(self, text: str) -> Tree:
+        result = self._parser.invoke(text)
+        if Token.start.name != result.data:
+            result = Tree(Token.start.name, [result], meta=copy(result.meta))
+
+        return result
+
+    def _invoke_with_stats(self, text: str, stats: PipelineStats) -> Tree:
+        assert isinstance(stats, PipelineStats)
+
+        stats.add_input(text)
+
+        with stats.measure("parse"):
+            parse_tree = self._parse(text)
+
+        container = self._transformer.container
+        text_transformer = self._transformer.text
+        previous = (
+            container.line_index, container.rule_hits,
+            text_transformer.line_index, text_transformer.rule_hits,
+        )
+        try:
+            container.rule_hits = stats.rule_hits
+            text_transformer.rule_hits = stats.rule_hits
+
+            with stats.measure("container"):
+                if self._lazy_positions:
+                    container.line_index = LineIndex(text)
+                    text_transformer.line_index = container.line_index
+                pass1 = container.transform(parse_tree)
+
+            with stats.measure("text"):
+                result = text_transformer.transform(pass1)
+        finally:
+            (
+                container.line_index, container.rule_hits,
+                text_transformer.line_index, text_transformer.rule_hits,
+            ) = previous
+
+        stats.add_nodes(result)
+
+        return result
+
+    def invoke_compact(self, text: str) -> CompactNode | CompactLeaf:
+        """
+        Parses and transforms the text. Returns the result as compact nodes.
+        See `compact_tree`.
+        """
+
+        return to_compact(self.invoke(text))
@@ -0,0 +1,366 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""result_cache"""
+
+import hashlib
+import os
+import tempfile
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from importlib import metadata
+from pathlib import Path
+from threading import Lock
+
+from lark import Tree
+
+from .binary_tree import BinaryTree, dumps
+from .grammar.grammar_cache import GrammarCache
+from .grammar.grammar_type import GrammarType
+from .parser import Parser
+
+__all__ = [
+    "ResultCache",
+    "ResultCacheInfo",
+]
+
+_DISTRIBUTION = "biz-dfch-ste100parser"
+
+
+@dataclass(frozen=True)
+class ResultCacheInfo:
+    """Statistics of a ResultCache."""
+
+    # Lookups found in memory or on disk.
+    hits: int
+    # Lookups found on disk (part of `hits`).
+    disk_hits: int
+    misses: int
+    # Number and bytes of the entries in memory.
+    size: int
+    memory_bytes: int
+
+    @property
+    def hit_rate(self) -> float:
+        """The share of lookups that were found (0.0 without lookups)."""
+
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class ResultCache:
+    """
+    Content-addressed cache of transformed trees.
+
+    The key is a hash over the text, the grammar files and Lark options,
+    the package version and the transformer options (see `get_key`). The
+    trees are stored in the format of `binary_tree`: in memory, in an LRU
+    with a maximum number of bytes, and, with a `cache_dir`, in one file
+    per key. A tree from the cache is a new tree for every lookup.
+    """
+
+    SUFFIX = ".tree"
+
+    _version: str | None = None
+    # Hash over the grammar files and Lark options per grammar.
+    _grammar_keys: dict[GrammarType, str] = {}
+
+    _max_bytes: int
+    _cache_dir: Path | None
+    _entries: OrderedDict[str, bytes]
+    _memory_bytes: int
+    _lock: Lock
+    _hits: int
+    _disk_hits: int
+    _misses: int
+
+    def __init__(
+        self,
+        max_bytes: int = 64 * 2**20,
+        cache_dir: str | Path | None = None,
+    ):
+        """
+        Default .ctor.
+
+        `max_bytes` is the size of all entries in memory. With 0, only the
+        disk tier is used.
+        """
+
+        assert isinstance(max_bytes, int) and 0 <= max_bytes, max_bytes
+
+        self._max_bytes = max_bytes
+        self._cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self._entries = OrderedDict()
+        self._memory_bytes = 0
+        self._lock = Lock()
+        self._hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+
+    @property
+    def cache_dir(self) -> Path | None:
+        """The directory of the disk tier or None."""
+
+        return self._cache_dir
+
+    @classmethod
+    def get_version(cls) -> str:
+        """
+        Returns the version of the installed package. Without package
+        metadata (a source checkout), a hash over the Python files of the
+        package is used, so that a change to the code creates new keys.
+        """
+
+        if cls._version is None:
+            try:
+                cls._version = metadata.version(_DISTRIBUTION)
+            except metadata.PackageNotFoundError:
+                digest = hashlib.sha256()
+                root = Path(__file__).parent
+                for path in sorted(root.rglob("*.py")):
+                    digest.update(path.relative_to(root).as_posix().encode(
+                        "utf-8"))
+                    digest.update(path.read_bytes())
+                cls._version = f"source-{digest.hexdigest()}"
+
+        return cls._version
+
+    @classmethod
+    def _get_grammar_key(cls, grammar: GrammarType) -> str:
+        """
+        Returns the key of the grammar files once per grammar. Reading the
+        files for every text would cost more than most lookups save.
+        """
+
+        result = cls._grammar_keys.get(grammar)
+        if result is None:
+            result = GrammarCache.get_grammar_key(Parser.get_options(grammar))
+            cls._grammar_keys[grammar] = result
+
+        return result
+
+    @classmethod
+    def get_key(
+        cls,
+        text: str,
+        grammar: GrammarType,
+        options: str = "",
+    ) -> str:
+        """
+        Returns the key of the result of a text.
+
+        `options` describes everything else that changes the result, for
+        example the transformer classes and the dictionary.
+        """
+
+        assert isinstance(text, str)
+        assert isinstance(grammar, GrammarType)
+        assert isinstance(options, str)
+
+        digest = hashlib.sha256()
+        digest.update(grammar.name.encode("utf-8") + b"\0")
+        digest.update(cls._get_grammar_key(grammar).encode("utf-8") + b"\0")
+        digest.update(cls.get_version().encode("utf-8") + b"\0")
+        digest.update(options.encode("utf-8") + b"\0")
+        digest.update(text.encode("utf-8", "surrogatepass"))
+
+        return digest.hexdigest()
+
+    def get(
+        self,
+        key: str,
+        text: str | None = None,
+        lazy_positions: bool = True,
+    ) -> Tree | None:
+        """
+        Returns the tree of the key or None. With the source `text`, the
+        metas have the lines and columns, too (computed on first access with
+        `lazy_positions`, see BinaryTree.to_tree).
+        """
+
+        with self._lock:
+            data = self._entries.get(key)
+            if data is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+
+        if data is None:
+            data = self._read(key)
+            with self._lock:
+                if data is None:
+                    self._misses += 1
+                    return None
+                self._hits += 1
+                self._disk_hits += 1
+                self._add(key, data)
+
+        return BinaryTree(data).to_tree(
+            text=text, lazy_positions=lazy_positions)
+
+    def put(self, key: str, tree: Tree) -> None:
+        """Stores the tree in memory and on disk."""
+
+        assert isinstance(key, str) and key
+        assert isinstance(tree, Tree)
+
+        data = dumps(tree)
+
+        with self._lock:
+            self._add(key, data)
+
+        self._write(key, data)
+
+    def _add(self, key: str, data: bytes) -> None:
+        """Adds an entry and evicts the least recently used entries."""
+
+        if len(data) > self._max_bytes:
+            return
+
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._memory_bytes -= len(previous)
+
+        self._entries[key] = data
+        self._memory_bytes += len(data)
+
+        while self._memory_bytes > self._max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._memory_bytes -= len(evicted)
+
+    def _get_path(self, key: str) -> Path:
+        assert self._cache_dir is not None
+
+        return self._cache_dir / f"{key}{self.SUFFIX}"
+
+    def _read(self, key: str) -> bytes | None:
+        """Returns None without a disk tier or if the file does not exist."""
+
+        if self._cache_dir is None:
+            return None
+
+        path = self._get_path(key)
+        try:
+            result = path.read_bytes()
+            # The modification time is the time of the last use. See prune.
+            os.utime(path)
+        except OSError:
+            return None
+
+        try:
+            BinaryTree(result)
+        except ValueError:
+            # A damaged file is a cache miss.
+            return None
+
+        return result
+
+    def _write(self, key: str, data: bytes) -> None:
+        """Writes to a temporary file and renames it atomically."""
+
+        if self._cache_dir is None:
+            return
+
+        path = self._get_path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+
+            fd, temp = tempfile.mkstemp(
+                prefix=path.name, suffix=".tmp", dir=path.parent)
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                os.replace(temp, path)
+            except BaseException:
+                os.unlink(temp)
+                raise
+        except OSError:
+            # A read-only or full cache directory must not break the parser.
+            pass
+
+    def prune(
+        self,
+        max_age: float | None = None,
+        max_bytes: int | None = None,
+    ) -> int:
+        """
+        Removes the files of the disk tier that were not used for
+        `max_age` seconds and then the least recently used files until all
+        files have at most `max_bytes`. With `max_bytes`, the memory tier is
+        reduced to the same size. Returns the number of removed files.
+        """
+
+        assert max_age is None or 0 <= max_age, max_age
+        assert max_bytes is None or 0 <= max_bytes, max_bytes
+
+        if max_bytes is not None:
+            with self._lock:
+                while self._memory_bytes > max_bytes:
+                    _, evicted = self._entries.popitem(last=False)
+                    self._memory_bytes -= len(evicted)
+
+        if self._cache_dir is None or not self._cache_dir.is_dir():
+            return 0
+
+        files = []
+        for path in self._cache_dir.glob(f"*{self.SUFFIX}"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+        # The least recently used files first.
+        files.sort()
+
+        now = time.time()
+        total = sum(size for _, size, _ in files)
+
+        result = 0
+        for mtime, size, path in files:
+            expired = max_age is not None and now - mtime > max_age
+            too_large = max_bytes is not None and total > max_bytes
+            if not expired and not too_large:
+                continue
+
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+            result += 1
+
+        return result
+
+    def clear(self) -> None:
+        """Removes all entries in memory and resets the statistics."""
+
+        with self._lock:
+            self._entries.clear()
+            self._memory_bytes = 0
+            self._hits = 0
+            self._disk_hits = 0
+            self._misses = 0
+
+    def info(self) -> ResultCacheInfo:
+        """Returns the statistics of the cache."""
+
+        with self._lock:
+            return ResultCacheInfo(
+                hits=self._hits,
+                disk_hits=self._disk_hits,
+                misses=self._misses,
+                size=len(self._entries),
+                memory_bytes=self._memory_bytes,
+            )
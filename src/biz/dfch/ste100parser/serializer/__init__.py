@@ -16,7 +16,9 @@
 """serializer module."""
 
 from .container_serializer import ContainerSerializer
+from .dict_serializer import DictSerializer
 
 __all__ = [
     "ContainerSerializer",
+    "DictSerializer",
 ]
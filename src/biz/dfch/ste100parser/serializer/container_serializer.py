@@ -17,8 +17,6 @@
 
 """ContainerSerializer class."""
 
-import sys
-
 from biz.dfch.ste100parser.char import Char
 from biz.dfch.ste100parser.transformer.transformer_base import TransformerBase
 
@@ -32,9 +30,6 @@ class ContainerSerializer(TransformerBase):
         assert isinstance(children, list)
         assert 0 < len(children)
 
-        method_name = sys._getframe(0).f_code.co_name
-        self.print(children, f"{self.__class__.__name__}-{method_name}")
-
         result = f"{Char.STAR}{Char.EMPTY.join(children)}{Char.STAR}"
 
         return result
@@ -45,9 +40,6 @@ class ContainerSerializer(TransformerBase):
         assert isinstance(children, list)
         assert 0 < len(children)
 
-        method_name = sys._getframe(0).f_code.co_name
-        self.print(children, f"{self.__class__.__name__}-{method_name}")
-
         result = f"{Char.UNDER}{Char.EMPTY.join(children)}{Char.UNDER}"
 
         return result
@@ -58,9 +50,6 @@ class ContainerSerializer(TransformerBase):
         assert isinstance(children, list)
         assert 0 < len(children)
 
-        method_name = sys._getframe(0).f_code.co_name
-        self.print(children, f"{self.__class__.__name__}-{method_name}")
-
         result = (
             f"{Char.BOLD_EMPH_OPEN}"
             f"{Char.EMPTY.join(children)}"
@@ -75,9 +64,6 @@ class ContainerSerializer(TransformerBase):
         # assert isinstance(children, list)
         # assert 0 < len(children)
 
-        method_name = sys._getframe(0).f_code.co_name
-        self.print(children, f"{self.__class__.__name__}-{method_name}")
-
         result = f"{Char.SPACE}{Char.EMPTY.join(children)}{Char.SPACE}"
 
         return result
@@ -88,9 +74,6 @@ class ContainerSerializer(TransformerBase):
         assert isinstance(children, list)
         assert 0 < len(children)
 
-        method_name = sys._getframe(0).f_code.co_name
-        self.print(children, f"{self.__class__.__name__}-{method_name}")
-
         result = f"{Char.DQUOTE}{Char.EMPTY.join(children)}{Char.DQUOTE}"
 
         return result
@@ -101,9 +84,6 @@ class ContainerSerializer(TransformerBase):
         assert isinstance(children, list)
         assert 0 < len(children)
 
-        method_name = sys._getframe(0).f_code.co_name
-        self.print(children, f"{self.__class__.__name__}-{method_name}")
-
         result = f"{Char.SQUOTE}{Char.EMPTY.join(children)}{Char.SQUOTE}"
 
         return result
@@ -0,0 +1,57 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""DictSerializer class."""
+
+from lark import Token as LarkToken
+from lark import Tree
+
+__all__ = [
+    "DictSerializer",
+]
+
+
+class DictSerializer:
+    """
+    Converts a Lark Tree into dicts, lists and strings for JSON.
+
+    A tree is `{"type": ..., "start_pos": ..., "end_pos": ...,
+    "children": [...]}`, a lark Token is `{"type": ..., "value": ...,
+    "start_pos": ..., "end_pos": ...}`. The positions are only set, if the
+    node has them. Other children are strings.
+    """
+
+    def invoke(self, node: Tree | LarkToken | str) -> dict | str:
+        """Converts the node and its children."""
+
+        if isinstance(node, Tree):
+            result = {"type": str(node.data)}
+            # The transformers set the positions, but not `Meta.empty`.
+            meta = node._meta  # pylint: disable=W0212
+            start_pos = getattr(meta, "start_pos", None)
+            if start_pos is not None:
+                result["start_pos"] = start_pos
+                result["end_pos"] = meta.end_pos
+            result["children"] = [self.invoke(c) for c in node.children]
+            return result
+
+        if isinstance(node, LarkToken):
+            result = {"type": node.type, "value": str(node)}
+            if node.start_pos is not None:
+                result["start_pos"] = node.start_pos
+                result["end_pos"] = node.end_pos
+            return result
+
+        return str(node)
@@ -0,0 +1,157 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""stats"""
+
+import time
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Iterator
+
+from lark import Tree
+
+__all__ = [
+    "PhaseTime",
+    "PipelineStats",
+]
+
+
+@dataclass(frozen=True)
+class PhaseTime:
+    """Wall clock and CPU time of a phase in seconds."""
+
+    wall: float = 0.0
+    cpu: float = 0.0
+
+    def __add__(self, other: "PhaseTime") -> "PhaseTime":
+        return PhaseTime(self.wall + other.wall, self.cpu + other.cpu)
+
+
+@dataclass
+class PipelineStats:
+    """
+    Times and counters of one or more pipeline runs.
+
+    Pass an instance to `Pipeline.invoke`, which records the phases
+    `parse` (lexer and parser), `container` (ContainerTransformer),
+    `text` (TextTransformer) and, with a ResultCache, `cache`. Other phases
+    (for example `read` or `serializer`) can be recorded with `measure`.
+    The times and counters of several runs add up.
+    """
+
+    # Size of the input.
+    characters: int = 0
+    lines: int = 0
+    documents: int = 0
+    # Time per phase, in the order of the first run.
+    phases: dict[str, PhaseTime] = field(default_factory=dict)
+    # Number of nodes per Token name in the transformed trees.
+    nodes: Counter = field(default_factory=Counter)
+    # Number of TreeRewriter replacements per rule pattern.
+    rule_hits: Counter = field(default_factory=Counter)
+
+    @contextmanager
+    def measure(self, phase: str) -> Iterator[None]:
+        """Adds the time of the `with` block to the phase."""
+
+        assert isinstance(phase, str) and phase
+
+        wall = time.perf_counter()
+        cpu = time.process_time()
+        try:
+            yield
+        finally:
+            value = PhaseTime(
+                time.perf_counter() - wall, time.process_time() - cpu)
+            self.phases[phase] = self.phases.get(phase, PhaseTime()) + value
+
+    def add_input(self, text: str) -> None:
+        """Adds the size of a document."""
+
+        self.characters += len(text)
+        self.lines += text.count("\n")
+        if text and not text.endswith("\n"):
+            self.lines += 1
+        self.documents += 1
+
+    def add_nodes(self, tree: Tree) -> None:
+        """Counts the nodes of a transformed tree."""
+
+        self.nodes.update(node.data for node in tree.iter_subtrees())
+
+    def merge(self, other: "PipelineStats") -> None:
+        """Adds the times and counters of another instance."""
+
+        self.characters += other.characters
+        self.lines += other.lines
+        self.documents += other.documents
+        for phase, value in other.phases.items():
+            self.phases[phase] = self.phases.get(phase, PhaseTime()) + value
+        self.nodes.update(other.nodes)
+        self.rule_hits.update(other.rule_hits)
+
+    @property
+    def total(self) -> PhaseTime:
+        """The time of all phases."""
+
+        return sum(self.phases.values(), PhaseTime())
+
+    @property
+    def characters_per_second(self) -> float:
+        """Throughput over the wall clock time of all phases."""
+
+        wall = self.total.wall
+        return self.characters / wall if 0 < wall else 0.0
+
+    def to_dict(self) -> dict:
+        """Returns the values as a dictionary for JSON."""
+
+        return {
+            "characters": self.characters,
+            "lines": self.lines,
+            "documents": self.documents,
+            "phases": {
+                phase: {"wall": value.wall, "cpu": value.cpu}
+                for phase, value in self.phases.items()
+            },
+            "nodes": dict(self.nodes.most_common()),
+            "rule_hits": dict(self.rule_hits.most_common()),
+            "characters_per_second": self.characters_per_second,
+        }
+
+    def format(self) -> str:
+        """Returns the values as lines of text."""
+
+        total = self.total
+        result = [
+            f"{self.documents} documents, {self.characters} characters, "
+            f"{self.lines} lines, {total.wall * 1000:.1f} ms "
+            f"({self.characters_per_second / 1000:.1f} kchars/s)",
+        ]
+        result.extend(
+            f"  {phase:10} wall {value.wall * 1000:9.1f} ms  "
+            f"cpu {value.cpu * 1000:9.1f} ms"
+            for phase, value in self.phases.items()
+        )
+        if self.nodes:
+            result.append("  nodes: " + ", ".join(
+                f"{name}={count}" for name, count in self.nodes.most_common()))
+        if self.rule_hits:
+            result.append("  rules: " + ", ".join(
+                f"[{name}]={count}"
+                for name, count in self.rule_hits.most_common()))
+
+        return "\n".join(result)
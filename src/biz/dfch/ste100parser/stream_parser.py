@@ -0,0 +1,276 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# pylint: disable=W0212
+
+"""stream_parser"""
+
+import re
+from typing import AsyncIterable, AsyncIterator, Iterable, Iterator
+
+from lark import Tree
+from lark.exceptions import UnexpectedInput
+
+from .chunked_parser import Chunk, ChunkedParser
+from .grammar.grammar_type import GrammarType
+from .parser import Parser
+from .token import Token
+from .transformer.container_transformer import ContainerTransformer
+from .transformer.container_transformer_rules import (
+    ContainerTransformerRules,
+)
+from .transformer.text_transformer import TextTransformer
+from .transformer.text_transformer_rules import TextTransformerRules
+from .transformer.tree_rewriter import TreeRewriter
+
+__all__ = [
+    "StreamParser",
+]
+
+# Wraps a list of nodes, so that a transformer processes all of them, but
+# does not run the `start` callback.
+_ITEMS = "_items"
+
+
+class _PendingRewrite:
+    """Applies the `start` rules of a transformer to a continued list."""
+
+    _rules: list
+    _pending: list
+
+    def __init__(self, rules: list):
+        self._rules = rules
+        self._pending = []
+
+    def feed(self, items: list) -> list:
+        """Returns the items that the next items cannot change anymore."""
+
+        self._pending.extend(items)
+
+        count = TreeRewriter().invoke_prefix(self._pending, self._rules)
+        result = self._pending[:count]
+        del self._pending[:count]
+
+        return result
+
+    def close(self) -> list:
+        """Returns all remaining items."""
+
+        result = TreeRewriter().invoke(self._pending, self._rules)
+        self._pending = []
+
+        return result
+
+
+class StreamParser:
+    """
+    Parses and transforms a text stream.
+
+    The parser reads the stream (for example a file object, an iterator of
+    lines or an async iterator) and yields every top-level item (heading,
+    paragraph, proc item, note, cite) as soon as it is complete. An item
+    is complete after the blank lines that follow it and the first line of
+    the next item. See ChunkedParser.
+
+    The yielded items are the children of the `start` tree of Pipeline,
+    with the positions in the whole stream. The memory depends on the
+    largest item, not on the length of the stream.
+    """
+
+    # A blank line and the first character of the next line.
+    _BOUNDARY = re.compile(r"\n(?:\r?\n)+[^\r\n]")
+
+    _parser: Parser
+    _chunked: ChunkedParser
+    _container: ContainerTransformer
+    _text: TextTransformer
+
+    # The text from the start of the current item.
+    _buffer: str
+    # Position and line of the buffer in the stream.
+    _start_pos: int
+    _line: int
+    # End of the buffer part that was searched for a boundary.
+    _checked: int
+
+    _container_rewrite: _PendingRewrite
+    _text_rewrite: _PendingRewrite
+
+    def __init__(
+        self,
+        grammar: GrammarType = GrammarType.CONTAINER,
+        container: ContainerTransformer | None = None,
+        text: TextTransformer | None = None,
+    ):
+        """Default .ctor."""
+
+        assert grammar in (GrammarType.CONTAINER, GrammarType.CONTAINER_LALR)
+
+        self._parser = Parser(grammar)
+        self._chunked = ChunkedParser(grammar)
+
+        self._container = (
+            container if container is not None
+            else ContainerTransformer()
+        )
+        self._text = (
+            text if text is not None
+            else TextTransformer()
+        )
+        assert isinstance(self._container, ContainerTransformer)
+        assert isinstance(self._text, TextTransformer)
+
+        self._reset()
+
+    def _reset(self) -> None:
+        self._buffer = ""
+        self._start_pos = 0
+        self._line = 1
+        self._checked = 0
+
+        self._container_rewrite = _PendingRewrite(
+            ContainerTransformerRules().get_rules_start())
+        self._text_rewrite = _PendingRewrite(
+            TextTransformerRules().get_rules_start())
+
+    def iter_items(self, stream: Iterable[str]) -> Iterator[Tree]:
+        """Yields the top-level items of the stream."""
+
+        try:
+            for value in stream:
+                yield from self.feed(value)
+            yield from self.close()
+        finally:
+            self._reset()
+
+    async def aiter_items(
+        self,
+        stream: AsyncIterable[str],
+    ) -> AsyncIterator[Tree]:
+        """
+        Yields the top-level items of the async stream. The parser runs in
+        the event loop.
+        """
+
+        try:
+            async for value in stream:
+                for item in self.feed(value):
+                    yield item
+            for item in self.close():
+                yield item
+        finally:
+            self._reset()
+
+    def feed(self, value: str) -> list[Tree]:
+        """Adds text to the stream. Returns the items that are complete."""
+
+        assert isinstance(value, str)
+
+        self._buffer += value
+
+        # Only complete lines are split.
+        end = self._buffer.rfind("\n") + 1
+        if end <= self._checked:
+            return []
+
+        checked = max(0, self._checked - 3)
+        self._checked = end
+        if not self._BOUNDARY.search(self._buffer, checked, end):
+            return []
+
+        chunks = self._chunked.get_chunks(self._buffer[:end])
+        if 1 == len(chunks):
+            return []
+
+        return self._process(chunks[:-1], chunks[-1], False)
+
+    def close(self) -> list[Tree]:
+        """Ends the stream. Returns the remaining items."""
+
+        try:
+            chunks = (
+                self._chunked.get_chunks(self._buffer)
+                if self._buffer.strip() else []
+            )
+
+            return self._process(chunks, None, True)
+        finally:
+            self._reset()
+
+    def _process(
+        self,
+        chunks: list[Chunk],
+        next_chunk: Chunk | None,
+        is_last: bool,
+    ) -> list[Tree]:
+        """Parses and transforms the complete chunks of the buffer."""
+
+        # Moves from positions in the buffer to positions in the stream.
+        offset = Chunk(self._start_pos, self._line, "")
+
+        items: list = []
+        for i, chunk in enumerate(chunks):
+            tree = self._parse(chunk)
+            items.extend(
+                tree.children if Token.start.name == tree.data else [tree])
+
+            following = chunks[i + 1] if i + 1 < len(chunks) else next_chunk
+            if following is not None:
+                end = chunk.start_pos + len(chunk.text)
+                newlines = Tree(_ITEMS, self._chunked._get_newlines(
+                    self._buffer, end, following))
+                ChunkedParser._move(newlines, offset)
+                items.extend(newlines.children)
+
+        if next_chunk is not None:
+            self._start_pos += next_chunk.start_pos
+            self._line += next_chunk.line - 1
+            self._checked -= next_chunk.start_pos
+            self._buffer = self._buffer[next_chunk.start_pos:]
+
+        result = self._container.transform(Tree(_ITEMS, items)).children
+        result = self._container_rewrite.feed(result)
+        if is_last:
+            result += self._container_rewrite.close()
+            result = ContainerTransformerRules.process_end(result)
+
+        result = self._text.transform(Tree(_ITEMS, result)).children
+        result = self._text_rewrite.feed(result)
+        if is_last:
+            result += self._text_rewrite.close()
+
+        return result
+
+    def _parse(self, chunk: Chunk) -> Tree:
+        """Parses the chunk with the positions in the stream."""
+
+        position = Chunk(
+            self._start_pos + chunk.start_pos,
+            self._line + chunk.line - 1,
+            chunk.text,
+        )
+
+        try:
+            result = self._parser.invoke(chunk.text)
+        except UnexpectedInput as ex:
+            if 0 < getattr(ex, "line", 0):
+                ex.line += position.line - 1
+            if isinstance(getattr(ex, "pos_in_stream", None), int):
+                ex.pos_in_stream += position.start_pos
+            raise
+
+        ChunkedParser._move(result, position)
+
+        return result
@@ -16,11 +16,17 @@
 """transformer module."""
 
 from .container_transformer import ContainerTransformer  # type: ignore
+from .pipeline_transformer import PipelineTransformer
 from .text_transformer import TextTransformer  # type: ignore
 from .token_converter import TokenConverter
+from .tracing import LoggingTracer, TraceEvent, TraceEventType
 
 __all__ = [
     "ContainerTransformer",
+    "LoggingTracer",
+    "PipelineTransformer",
     "TextTransformer",
     "TokenConverter",
+    "TraceEvent",
+    "TraceEventType",
 ]
@@ -28,6 +28,7 @@ from biz.dfch.ste100parser.transformer.container_transformer_rules import (
 from biz.dfch.ste100parser.transformer.tree_rewriter import TreeRewriter
 
 from ..char import Char
+from ..line_index import LineIndex
 from ..token import Token
 
 from .transformer_base import TransformerBase
@@ -48,11 +49,23 @@ class ContainerTransformer(TransformerBase):  # pylint: disable=R0904
       * cite.
 
     Inside paragraph, there are still only TEXT and WS tokens (and no WORDs).
+
+    With a `line_index` of the text, the metas of the tokens only store the
+    positions. See LazyMeta.
     """
 
+    # The index of the text that is transformed or None.
+    line_index: LineIndex | None = None
+
     def _get_meta(self, node: lexer.Token) -> Meta:
         assert isinstance(node, lexer.Token)
 
+        if self.line_index is not None:
+            return self.line_index.get_meta(
+                node.start_pos,
+                getattr(node, 'end_pos', node.start_pos + len(node)),
+            )
+
         meta = Meta()
         meta.line = node.line
         meta.column = node.column
@@ -84,8 +97,6 @@ class ContainerTransformer(TransformerBase):  # pylint: disable=R0904
 
         first, *mid, last = children
 
-        self.print(children, token)
-
         if end is None:
             end = start
         assert isinstance(first, str) and start == first
@@ -111,8 +122,6 @@ class ContainerTransformer(TransformerBase):  # pylint: disable=R0904
         if 2 == len(children):
             mid = Char.EMPTY
 
-        self.print(children, token)
-
         if end is None:
             end = start
         assert isinstance(first, str) and start == first, first
@@ -157,7 +166,6 @@ class ContainerTransformer(TransformerBase):  # pylint: disable=R0904
         first, mid, last = children
 
         token = Token.CODE.name
-        self.print(children, token)
 
         assert isinstance(first, str) and Char.CODE == first
         assert isinstance(last, str) and Char.CODE == last
@@ -213,12 +221,8 @@ class ContainerTransformer(TransformerBase):  # pylint: disable=R0904
         assert isinstance(children, list)
         assert 2 <= len(children), len(children)
 
-        token = Token.cite.name
-
         _, *mid = children
 
-        self.print(children, token)
-
         result = mid
         return result
 
@@ -228,8 +232,6 @@ class ContainerTransformer(TransformerBase):  # pylint: disable=R0904
 
         token = Token.NEWLINE.name
 
-        self.print(children, token)
-
         meta = self._get_meta(children)
         result = Tree(token, [Char.LF], meta=meta)
         return result
@@ -240,8 +242,6 @@ class ContainerTransformer(TransformerBase):  # pylint: disable=R0904
 
         token = Token.WS.name
 
-        self.print(children, token)
-
         meta = self._get_meta(children)
         result = Tree(token, [str(len(children))], meta=meta)
         return result
@@ -252,8 +252,6 @@ class ContainerTransformer(TransformerBase):  # pylint: disable=R0904
 
         token = Token.MULTIPLY.name
 
-        self.print(children, token)
-
         meta = self._get_meta(children)
         result = Tree(token, [f" {Char.MULTIPLY} "], meta=meta)
         return result
@@ -279,8 +277,6 @@ class ContainerTransformer(TransformerBase):  # pylint: disable=R0904
 
         token = Token.CHAR.name
 
-        self.print(children, token)
-
         meta = self._get_meta(children[0])
         # children[0] is a `lexer.Token` (token).
         # children[0][0] is the contents of that token.
@@ -306,8 +302,6 @@ class ContainerTransformer(TransformerBase):  # pylint: disable=R0904
 
         token = Token.PROC_STEP.name
 
-        self.print(children, token)
-
         items = [str(children)]
         meta = self._get_meta(children)
         result = Tree(token, items, meta=meta)
@@ -319,8 +313,6 @@ class ContainerTransformer(TransformerBase):  # pylint: disable=R0904
 
         token = Token.PROC_DELIMITER.name
 
-        self.print(children, token)
-
         items = [str(children)]
         meta = self._get_meta(children)
         result = Tree(token, items, meta=meta)
@@ -339,8 +331,6 @@ class ContainerTransformer(TransformerBase):  # pylint: disable=R0904
 
         token = Token.proc_item.name
 
-        self.print(children, token)
-
         item = children[0]
         assert isinstance(item, Tree)
         assert Token.PROC_STEP.name == item.data
@@ -366,10 +356,12 @@ class ContainerTransformer(TransformerBase):  # pylint: disable=R0904
 
         token = Token.TEXT.name
 
-        self.print(children, token)
+        value = str(children)
+        if self.interner is not None:
+            value = self.interner.intern(value)
 
         meta = self._get_meta(children)
-        result = Tree(token, [str(children)], meta=meta)
+        result = Tree(token, [value], meta=meta)
         return result
 
     def APOSTROPHE(self, children):  # pylint: disable=C0103
@@ -379,7 +371,6 @@ class ContainerTransformer(TransformerBase):  # pylint: disable=R0904
         token = Token.APOSTROPHE.name
 
         *_, last = children
-        self.print(last, token)
 
         assert isinstance(last, str)
         assert last in (Char.SQUOTE, Char.CHAR_LOWER_S)
@@ -403,8 +394,6 @@ class ContainerTransformer(TransformerBase):  # pylint: disable=R0904
 
         token = Token.HEADING_LEVEL.name
 
-        self.print(children, token)
-
         meta = self._get_meta(children)
         result = Tree(token, [str(len(children))], meta=meta)
         return result
@@ -415,8 +404,6 @@ class ContainerTransformer(TransformerBase):  # pylint: disable=R0904
 
         token = Token.heading.name
 
-        self.print(children, token)
-
         level, _, *remaining = children
 
         items = [
@@ -430,20 +417,12 @@ class ContainerTransformer(TransformerBase):  # pylint: disable=R0904
         assert isinstance(children, list), children
         assert 2 <= len(children), f"#{len(children)}: [{children}]."
 
-        token = Token.heading.name
-
-        self.print(children, token)
-
         return self._process_heading_line(children)
 
     def heading_next_line(self, children):
         assert isinstance(children, list), children
         assert 2 <= len(children), f"#{len(children)}: [{children}]."
 
-        token = Token.heading.name
-
-        self.print(children, token)
-
         return self._process_heading_line(children)
 
     @v_args(meta=True)
@@ -453,8 +432,6 @@ class ContainerTransformer(TransformerBase):  # pylint: disable=R0904
 
         token = Token.heading.name
 
-        self.print(children, token)
-
         items = []
         for item in children:
             items.extend(item.children)
@@ -468,8 +445,6 @@ class ContainerTransformer(TransformerBase):  # pylint: disable=R0904
 
         token = Token.SPACE.name
 
-        self.print(children, token)
-
         items = children[0]
 
         meta = self._get_meta(children)
@@ -482,8 +457,6 @@ class ContainerTransformer(TransformerBase):  # pylint: disable=R0904
 
         token = Token.LINEBREAK.name
 
-        self.print(children, token)
-
         items = children[0]
 
         meta = self._get_meta(children)
@@ -497,8 +470,6 @@ class ContainerTransformer(TransformerBase):  # pylint: disable=R0904
 
         token = Token.paragraph.name
 
-        self.print(children, token)
-
         if (
             children and
             isinstance(children[-1], Tree) and
@@ -507,7 +478,7 @@ class ContainerTransformer(TransformerBase):  # pylint: disable=R0904
             children = children[:-1]
 
         rules = ContainerTransformerRules().get_rules_paragraph()
-        children = TreeRewriter().invoke(children, rules)
+        children = TreeRewriter(self.rule_hits).invoke(children, rules)
 
         result = Tree(token, children, meta=meta)
         return result
@@ -519,8 +490,6 @@ class ContainerTransformer(TransformerBase):  # pylint: disable=R0904
 
         token = Token.list_item.name
 
-        self.print(children, token)
-
         item = children[0]
         if isinstance(item, lexer.Token) and "LIST_LINE_START" == item.type:
             children = children[1:]
@@ -534,8 +503,6 @@ class ContainerTransformer(TransformerBase):  # pylint: disable=R0904
         )
         children = children[1:]
 
-        self.print(children, token)
-
         marker_token = children.pop(0)
         assert isinstance(marker_token, lexer.Token)
         marker_meta = self._get_meta(marker_token)
@@ -572,11 +539,9 @@ class ContainerTransformer(TransformerBase):  # pylint: disable=R0904
 
         token = Token.start.name
 
-        self.print(children, token)
-
         rules = ContainerTransformerRules().get_rules_start()
-        children = TreeRewriter().invoke(children, rules)
-        self.print(children, token)
+        children = TreeRewriter(self.rule_hits).invoke(children, rules)
+        children = ContainerTransformerRules.process_end(children)
 
         result = Tree(token, children, meta=meta)
         return result
@@ -604,11 +569,12 @@ class ContainerTransformer(TransformerBase):  # pylint: disable=R0904
         assert 3 <= len(children), f"#{len(children)}: [{children}]."
         assert isinstance(meta, Meta)
 
-        self.print(children, token)
-
         item = children.pop(0)
         assert lexer.Token == type(item), item
-        assert "NOTE_OR_SAFETY_LINE_START" == item.type
+        assert item.type in (
+            "NOTE_OR_SAFETY_LINE_START",
+            "SAFETY_LINE_START",
+        ), item.type
 
         marker = children.pop(0)
         assert Tree == type(marker), marker
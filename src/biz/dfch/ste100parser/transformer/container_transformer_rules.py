@@ -24,6 +24,7 @@ from lark import Tree
 from lark.tree import Meta
 
 from biz.dfch.ste100parser.token import Token
+from biz.dfch.ste100parser.transformer.tree_rewriter import TreeRewriter
 
 
 class ContainerTransformerRules:
@@ -133,7 +134,12 @@ class ContainerTransformerRules:
 
         assert isinstance(newline, Tree)
 
-        return cls.process_paragraph_paragraph(para1, para2)
+        # The Earley parser can read a line break in a paragraph as a
+        # NEWLINE between two paragraphs. It is the same LINEBREAK as a
+        # SINGLE_NEWLINE.
+        linebreak = Tree(Token.LINEBREAK.name, ["\n"], meta=newline.meta)
+
+        return cls._join(para1, [linebreak], para2)
 
     @classmethod
     def process_paragraph_paragraph(
@@ -144,16 +150,80 @@ class ContainerTransformerRules:
         assert isinstance(para1, Tree)
         assert isinstance(para2, Tree)
 
+        # The Earley parser can also end the first paragraph with a
+        # SINGLE_NEWLINE, which `paragraph` removed. The paragraph still
+        # covers the line break. After a list_item, the paragraph rules
+        # remove the LINEBREAK anyway.
+        last = para1.children[-1] if para1.children else None
+        if (
+            not isinstance(last, Tree) or
+            Token.list_item.name == last.data or
+            last.meta.end_pos >= para1.meta.end_pos
+        ):
+            return cls._join(para1, [], para2)
+
+        meta = Meta()
+        meta.line = last.meta.end_line
+        meta.column = last.meta.end_column
+        meta.start_pos = last.meta.end_pos
+        meta.end_pos = para1.meta.end_pos
+        meta.end_line = para1.meta.end_line
+        meta.end_column = para1.meta.end_column
+        linebreak = Tree(Token.LINEBREAK.name, ["\n"], meta=meta)
+
+        return cls._join(para1, [linebreak], para2)
+
+    @classmethod
+    def _join(cls, para1: Tree, items: list, para2: Tree) -> Tree:
         meta = Meta()
         meta.line = para1.meta.line
         meta.column = para1.meta.column
         meta.start_pos = para1.meta.start_pos
         meta.end_pos = para2.meta.end_pos
 
+        children = para1.children + items + para2.children
+        if items:
+            TreeRewriter().invoke(children, cls.get_rules_paragraph())
+
         result = Tree(
             Token.paragraph.name,
-            para1.children + para2.children,
+            children,
             meta=meta,
         )
 
         return result
+
+    @classmethod
+    def process_end(cls, children: list) -> list:
+        """
+        Moves the line break at the end of the text after a paragraph into
+        the paragraph.
+
+        The Earley parser reads it as a NEWLINE after the paragraph or as a
+        SINGLE_NEWLINE in the paragraph (which `paragraph` removes, but the
+        paragraph still covers).
+        """
+
+        if not (
+            2 <= len(children) and
+            isinstance(children[-1], Tree) and
+            Token.NEWLINE.name == children[-1].data and
+            isinstance(children[-2], Tree) and
+            Token.paragraph.name == children[-2].data
+        ):
+            return children
+
+        newline = children.pop()
+        para = children[-1]
+
+        meta = Meta()
+        meta.line = para.meta.line
+        meta.column = para.meta.column
+        meta.start_pos = para.meta.start_pos
+        meta.end_pos = newline.meta.end_pos
+        meta.end_line = newline.meta.end_line
+        meta.end_column = newline.meta.end_column
+
+        children[-1] = Tree(Token.paragraph.name, para.children, meta=meta)
+
+        return children
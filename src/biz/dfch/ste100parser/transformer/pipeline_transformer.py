@@ -0,0 +1,152 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# pylint: disable=W0212
+# type: ignore
+
+"""pipeline_transformer"""
+
+from lark import Transformer, Tree
+
+from ..line_index import LineIndex
+from ..token import Token
+
+from .container_transformer import ContainerTransformer
+from .text_transformer import TextTransformer
+
+__all__ = [
+    "PipelineTransformer",
+]
+
+_PARAGRAPH = Token.paragraph.name
+
+
+class PipelineTransformer(Transformer):
+    """
+    Applies ContainerTransformer and TextTransformer in one bottom-up pass.
+
+    For every node, the ContainerTransformer callback runs first. The
+    TextTransformer callback then runs on the result. Nodes without a
+    TextTransformer callback are not copied again.
+
+    The `start` rules of ContainerTransformer merge paragraphs. Because of
+    this, the TextTransformer callback for a paragraph runs after the
+    ContainerTransformer callback of its parent.
+    """
+
+    _container: ContainerTransformer
+    _text: TextTransformer
+    _text_callbacks: frozenset[str]
+    _finished: dict[int, Tree]
+
+    def __init__(
+        self,
+        container: ContainerTransformer | None = None,
+        text: TextTransformer | None = None,
+    ) -> None:
+
+        super().__init__(visit_tokens=True)
+
+        self._container = (
+            container if container is not None
+            else ContainerTransformer()
+        )
+        self._text = (
+            text if text is not None
+            else TextTransformer()
+        )
+        assert isinstance(self._container, ContainerTransformer)
+        assert isinstance(self._text, TextTransformer)
+
+        # Looking up a v_args callback creates a new wrapper. A set is faster.
+        self._text_callbacks = frozenset(dir(type(self._text)))
+        self._finished = {}
+
+    @property
+    def container(self) -> ContainerTransformer:
+        """The ContainerTransformer of the pipeline."""
+
+        return self._container
+
+    @property
+    def text(self) -> TextTransformer:
+        """The TextTransformer of the pipeline."""
+
+        return self._text
+
+    def transform(
+        self,
+        tree: Tree,
+        line_index: LineIndex | None = None,
+    ) -> Tree:
+        """
+        Transforms the tree. With the `line_index` of the text, the metas of
+        the tokens only store the positions. See LazyMeta.
+        """
+
+        previous = self._container.line_index, self._text.line_index
+        if line_index is not None:
+            self._container.line_index = line_index
+            self._text.line_index = line_index
+
+        try:
+            result = super().transform(tree)
+
+            if self._is_open_paragraph(result):
+                result = self._text._call_userfunc(result)
+        finally:
+            self._container.line_index, self._text.line_index = previous
+            self._finished.clear()
+
+        return result
+
+    def _is_open_paragraph(self, node) -> bool:
+        return (
+            isinstance(node, Tree) and
+            _PARAGRAPH == node.data and
+            id(node) not in self._finished
+        )
+
+    def _call_userfunc(self, tree, new_children=None):
+        children = new_children if new_children is not None else tree.children
+
+        result = self._container._call_userfunc(tree, children)
+
+        return self._apply_text(result)
+
+    def _call_userfunc_token(self, token):
+        result = self._container._call_userfunc_token(token)
+
+        return self._apply_text(result)
+
+    def _apply_text(self, node):
+        if not isinstance(node, Tree):
+            return node
+
+        children = node.children
+        for i, child in enumerate(children):
+            if self._is_open_paragraph(child):
+                result = self._text._call_userfunc(child)
+                # The reference keeps the id unique until the end.
+                self._finished[id(result)] = result
+                children[i] = result
+
+        if _PARAGRAPH == node.data:
+            return node
+
+        if node.data not in self._text_callbacks:
+            return node
+
+        return self._text._call_userfunc(node)
@@ -33,6 +33,9 @@ from biz.dfch.ste100parser.transformer.tree_rewriter import TreeRewriter
 
 from ..token import Token
 from ..char import Char
+from ..dictionary import Dictionary
+from ..interner import Interner
+from ..line_index import LineIndex
 
 
 class TextTransformer(TransformerBase):  # pylint: disable=R0904
@@ -43,8 +46,42 @@ class TextTransformer(TransformerBase):  # pylint: disable=R0904
       * ABBREV
       * PUNCT
     From these, the transformer creates sentences inside a paragraph.
+
+    With an `interner` and the `line_index` of the text, equal paragraphs,
+    notes and safety instructions of other documents are shared. See
+    Interner.
     """
 
+    # The index of the text that is transformed or None.
+    line_index: LineIndex | None = None
+
+    _dictionary: Dictionary
+
+    def __init__(
+        self,
+        *args,
+        dictionary: Dictionary | None = None,
+        **kwargs,
+    ) -> None:
+        """
+        The other arguments are the same as of TransformerBase. Without a
+        `dictionary`, the transformer uses the dictionary of the package.
+        """
+
+        super().__init__(*args, **kwargs)
+
+        self._dictionary = (
+            dictionary if dictionary is not None
+            else Dictionary.get_default()
+        )
+        assert isinstance(self._dictionary, Dictionary)
+
+    @property
+    def dictionary(self) -> Dictionary:
+        """The dictionary of approved words."""
+
+        return self._dictionary
+
     @v_args(meta=True)
     def start(self, meta, children):
         """start"""
@@ -54,11 +91,8 @@ class TextTransformer(TransformerBase):  # pylint: disable=R0904
 
         token = Token.start.name
 
-        self.print(children, token)
-
         rules = TextTransformerRules().get_rules_start()
-        children = TreeRewriter().invoke(children, rules)
-        self.print(children, token)
+        children = TreeRewriter(self.rule_hits).invoke(children, rules)
 
         result = Tree(token, children, meta=meta)
         return result
@@ -185,14 +219,57 @@ class TextTransformer(TransformerBase):  # pylint: disable=R0904
 
         token = Token.paragraph.name
 
+        key = self._get_shared_key(token, meta)
+        if key is not None:
+            shared = self.interner.get_tree(key)
+            if shared is not None:
+                return shared
+
         items = self.process_sentences(
             children,
             fill=True,
             terminators=[Token.list_item],
         )
         result = Tree(token, items, meta=meta)
+
+        if key is not None:
+            result = self.interner.add_tree(key, result)
+        return result
+
+    @v_args(meta=True)
+    def NOTE(self, meta, children):  # pylint: disable=C0103
+        return self._process_shared(Token.NOTE.name, meta, children)
+
+    @v_args(meta=True)
+    def WARNING(self, meta, children):  # pylint: disable=C0103
+        return self._process_shared(Token.WARNING.name, meta, children)
+
+    @v_args(meta=True)
+    def CAUTION(self, meta, children):  # pylint: disable=C0103
+        return self._process_shared(Token.CAUTION.name, meta, children)
+
+    def _process_shared(self, token: str, meta: Meta, children) -> Tree:
+        """Returns the shared container or a new one."""
+
+        key = self._get_shared_key(token, meta)
+        if key is not None:
+            shared = self.interner.get_tree(key)
+            if shared is not None:
+                return shared
+
+        result = Tree(token, children, meta=meta)
+
+        if key is not None:
+            result = self.interner.add_tree(key, result)
         return result
 
+    def _get_shared_key(self, token: str, meta: Meta) -> tuple | None:
+        if self.interner is None or self.line_index is None:
+            return None
+
+        return Interner.get_key(
+            token, meta, self.line_index.text, self._dictionary.fingerprint)
+
     def process_sentences(
         self,
         children: list[Tree],
@@ -321,15 +398,17 @@ class TextTransformer(TransformerBase):  # pylint: disable=R0904
             item1 = Tree(Token.WORD.name, [value], meta=node.meta)
             processed.append(item1)
 
+        if self.interner is not None:
+            for node in processed:
+                node.children[0] = self.interner.intern(node.children[0])
+
         return processed
 
     def is_in_dictionary(self, value: str) -> bool:
         assert isinstance(value, str)
         assert 0 < len(value)
 
-        result: bool = False
-        if "X" == value[-1]:
-            result = True
+        result = self._dictionary.contains(value)
 
         return result
 
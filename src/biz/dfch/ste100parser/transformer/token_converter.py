@@ -23,9 +23,17 @@ __all__ = [
     "TokenConverter",
 ]
 
+# The Token of every node name.
+_TOKENS: dict[str, Token] = {token.name: token for token in Token}
+
 
 class TokenConverter:
-    """TokenConverter"""
+    """
+    TokenConverter
+
+    Both methods use an explicit stack instead of recursion, so the depth of
+    a tree is not limited by the recursion limit.
+    """
 
     def invoke(self, node: Tree | str) -> tuple[Token, list] | str:
         """
@@ -36,8 +44,54 @@ class TokenConverter:
         if not isinstance(node, Tree):
             return str(node)
 
-        token = Token[node.data]
+        tokens = _TOKENS
+
+        result_children: list = []
+        result = (tokens[node.data], result_children)
+
+        # The children of a node and the list of their converted values.
+        stack = [(node.children, result_children)]
+        while stack:
+            children, target = stack.pop()
+            for child in children:
+                if isinstance(child, Tree):
+                    items: list = []
+                    target.append((tokens[child.data], items))
+                    stack.append((child.children, items))
+                else:
+                    target.append(str(child))
+
+        return result
+
+    def format(self, skeleton: tuple[Token, list] | str) -> str:
+        """
+        Formats the result of `invoke` into a readable indented format.
+
+        Every node is one line with its name, indented by one `.` per level.
+        A node with a single string has the string on its line. Other
+        strings are on their own line below their parent.
+        """
+
+        if isinstance(skeleton, str):
+            return skeleton
+
+        result = []
+
+        stack: list = [(skeleton, 0)]
+        while stack:
+            item, indent = stack.pop()
+
+            if isinstance(item, str):
+                result.append(f"{'.' * (indent - 1)}  {item}")
+                continue
+
+            token, children = item
+            padding = "." * indent
+            if 1 == len(children) and isinstance(children[0], str):
+                result.append(f"{padding}{token.name} {children[0]}")
+                continue
 
-        children = [self.invoke(c) for c in node.children]
+            result.append(f"{padding}{token.name}")
+            stack.extend((child, indent + 1) for child in reversed(children))
 
-        return (token, children)
+        return "\n".join(result)
@@ -0,0 +1,99 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""tracing"""
+
+import logging
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import Callable
+
+__all__ = [
+    "LoggingTracer",
+    "TraceEvent",
+    "TraceEventType",
+    "Tracer",
+    "print_tracer",
+]
+
+
+class TraceEventType(StrEnum):
+    """Type of a trace event."""
+
+    # Before the callback of a rule or a terminal.
+    ENTER = "enter"
+    # After the callback. The span and the children are the ones of the
+    # result.
+    EXIT = "exit"
+
+
+@dataclass(frozen=True, slots=True)
+class TraceEvent:
+    """A callback of a transformer."""
+
+    type: TraceEventType
+    # Class name of the transformer.
+    transformer: str
+    # Name of the rule or of the terminal.
+    rule: str
+    # Positions of the node or None, if the node does not have positions.
+    start_pos: int | None
+    end_pos: int | None
+    # Number of children. A terminal or a result that is not a tree has 0.
+    children: int
+
+
+Tracer = Callable[[TraceEvent], None]
+
+
+def print_tracer(event: TraceEvent) -> None:
+    """Prints the event to stdout. The tracer of `log=True`."""
+
+    print(f"#{event.children} [{event.transformer}-{event.rule}] "
+          f"{event.type}: {event.start_pos}..{event.end_pos}.")
+
+
+class LoggingTracer:
+    """Writes the events to a logger. The event is in `record.trace`."""
+
+    _logger: logging.Logger
+    _level: int
+
+    def __init__(
+        self,
+        logger: logging.Logger | None = None,
+        level: int = logging.DEBUG,
+    ):
+        """Default .ctor. Without a `logger`, the module logger is used."""
+
+        self._logger = (
+            logger if logger is not None else logging.getLogger(__name__))
+        self._level = level
+
+    def __call__(self, event: TraceEvent) -> None:
+        if not self._logger.isEnabledFor(self._level):
+            return
+
+        self._logger.log(
+            self._level,
+            "%s %s-%s %s..%s #%s",
+            event.type,
+            event.transformer,
+            event.rule,
+            event.start_pos,
+            event.end_pos,
+            event.children,
+            extra={"trace": event},
+        )
@@ -18,10 +18,14 @@
 
 """containers_transformer"""
 
-from dataclasses import dataclass
+from collections import Counter
+from dataclasses import dataclass, replace
 
 from lark import Transformer, Tree
 
+from ..interner import Interner
+from .tracing import TraceEvent, TraceEventType, Tracer, print_tracer
+
 __all__ = [
     "TransformerBase",
 ]
@@ -31,43 +35,108 @@ __all__ = [
 class TransformerConfiguration():
     """TransformerConfiguration"""
 
+    # Prints the trace events to stdout, if there is no tracer.
     log: bool = False
+    # Receives the trace events. See tracing.
+    tracer: Tracer | None = None
 
 
 class TransformerBase(Transformer):
-    """TransformerBase"""
+    """
+    TransformerBase
+
+    With a tracer, the transformer sends a TraceEvent before and after
+    every callback. Without a tracer, the callbacks are not wrapped, so
+    tracing does not cost anything.
+    """
 
     _cfg: TransformerConfiguration
+    _tracer: Tracer | None
+
+    # Counts the TreeRewriter replacements per rule pattern or None.
+    rule_hits: Counter | None = None
+    # Shares strings and containers across documents or None. See Interner.
+    interner: Interner | None = None
 
     def __init__(
         self,
         cfg: TransformerConfiguration = TransformerConfiguration(),
         log: bool = False,
-        visit_tokens: bool = True
+        visit_tokens: bool = True,
+        tracer: Tracer | None = None,
     ) -> None:
 
         super().__init__(visit_tokens)
 
         assert isinstance(cfg, TransformerConfiguration)
-        self._cfg = cfg
+        assert tracer is None or callable(tracer)
+
+        # The default configuration is shared by all transformers.
         if log:
-            self._cfg.log = log
+            cfg = replace(cfg, log=True)
+        self._cfg = cfg
+
+        self._tracer = tracer if tracer is not None else cfg.tracer
+        if self._tracer is None and cfg.log:
+            self._tracer = print_tracer
 
-    def print(self, children, data: str = '') -> None:
-        """Prints the token and its children."""
+        if self._tracer is not None:
+            self._call_userfunc = self._call_userfunc_traced
+            self._call_userfunc_token = self._call_userfunc_token_traced
 
-        if not self._cfg.log:
-            return
+    @property
+    def tracer(self) -> Tracer | None:
+        """The tracer of this transformer or None."""
 
-        print(f"#{len(children)} [{data}]: '{children}'.")
+        return self._tracer
+
+    def _trace(
+        self,
+        event_type: TraceEventType,
+        rule: str,
+        node,
+        new_children: list | None = None,
+    ) -> None:
+        if isinstance(node, Tree):
+            meta = node._meta  # pylint: disable=W0212
+            children = (
+                new_children if new_children is not None else node.children)
+            count = len(children)
+        else:
+            # A lark Token has the positions itself.
+            meta = node
+            count = 0
+
+        self._tracer(TraceEvent(
+            type=event_type,
+            transformer=self.__class__.__name__,
+            rule=rule,
+            start_pos=getattr(meta, "start_pos", None),
+            end_pos=getattr(meta, "end_pos", None),
+            children=count,
+        ))
+
+    def _call_userfunc_traced(self, tree, new_children=None):
+        self._trace(TraceEventType.ENTER, tree.data, tree, new_children)
+
+        result = type(self)._call_userfunc(self, tree, new_children)
+        self._trace(TraceEventType.EXIT, tree.data, result)
+
+        return result
+
+    def _call_userfunc_token_traced(self, token):
+        self._trace(TraceEventType.ENTER, token.type, token)
+
+        result = type(self)._call_userfunc_token(self, token)
+        self._trace(TraceEventType.EXIT, token.type, result)
+
+        return result
 
     def __default__(self, data, children, meta):
         # data = the rule name (e.g., "squote", "bold", "emph")
         # children = the list of children
         # meta = metadata (line/column info)
 
-        self.print(f"__default__: '{data}' [{meta}].")
-
         result = Tree(data=data, children=children, meta=meta)
 
         return result
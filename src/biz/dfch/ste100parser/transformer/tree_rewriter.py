@@ -20,11 +20,128 @@
 
 """tree_rewriter"""
 
+from collections import Counter
+
 from lark import Tree
 
+__all__ = [
+    "CompiledRules",
+    "TreeRewriter",
+]
+
+
+class _State:
+    """A state of the automaton: the patterns with the same prefix."""
+
+    __slots__ = ("next", "rule")
+
+    def __init__(self):
+        # The next state by the name of the next node.
+        self.next: dict[str, "_State"] = {}
+        # Index of the first rule with exactly this pattern or None.
+        self.rule: int | None = None
+
+
+class CompiledRules:
+    """
+    The rules of a TreeRewriter as an automaton over the node names.
+
+    A state is a prefix of one or more patterns. From a position in the
+    children, the automaton follows the names of the nodes and remembers
+    the first rule (in the order of the rule list) of every pattern that
+    ends on the way. So, it does not try every rule at every position.
+
+    The automaton only contains the patterns and the `do_again` flags. The
+    replacers are taken from the rule list of the call. The compiled form
+    is cached for rule lists with the same patterns and flags.
+    """
+
+    _cache: dict[tuple, "CompiledRules"] = {}
+
+    start: _State
+    do_again: tuple[bool, ...]
+    # The pattern of every rule, for example "NEWLINE heading".
+    names: tuple[str, ...]
+    # Length of the longest pattern.
+    longest: int
+
+    def __init__(self, key: tuple):
+        """Use `get` instead."""
+
+        self.start = _State()
+        self.do_again = tuple(do_again for _, do_again in key)
+        self.names = tuple(" ".join(names) for names, _ in key)
+        self.longest = max((len(names) for names, _ in key), default=1)
+
+        for index, (names, _) in enumerate(key):
+            assert 0 < len(names), index
+
+            state = self.start
+            for name in names:
+                state = state.next.setdefault(name, _State())
+            if state.rule is None:
+                state.rule = index
+
+    @staticmethod
+    def get_key(rules: list) -> tuple:
+        return tuple(
+            (tuple(token.name for token in pattern), do_again)
+            for pattern, _, do_again in rules
+        )
+
+    @classmethod
+    def get(cls, rules: list) -> "CompiledRules":
+        """Returns the compiled form of the rules."""
+
+        key = cls.get_key(rules)
+
+        result = cls._cache.get(key)
+        if result is None:
+            result = cls(key)
+            cls._cache[key] = result
+
+        return result
+
+    def match(self, work: list) -> int | None:
+        """
+        Returns the index of the first rule that matches at the end of
+        `work` (the nodes in reverse order) or None.
+        """
+
+        result = None
+        state = self.start
+        depth = len(work)
+        i = depth - 1
+        while 0 <= i and depth - i <= self.longest:
+            node = work[i]
+            if not isinstance(node, Tree):
+                break
+            state = state.next.get(node.data)
+            if state is None:
+                break
+            if state.rule is not None and (
+                    result is None or state.rule < result):
+                result = state.rule
+            i -= 1
+
+        return result
+
 
 class TreeRewriter:
-    """Rewrites a Lark Tree based on specified rules."""
+    """
+    Rewrites a Lark Tree based on specified rules.
+
+    With `hits`, the rewriter counts the replacements per rule pattern.
+    """
+
+    _hits: Counter | None
+
+    def __init__(self, hits: Counter | None = None):
+        """Default .ctor."""
+
+        assert hits is None or isinstance(hits, Counter)
+
+        self._hits = hits
 
     def invoke(self, children: list, rules: list) -> list:
         """Rewrites the children based ony rules."""
@@ -32,30 +149,68 @@ class TreeRewriter:
         assert isinstance(children, list)
         assert isinstance(rules, list)
 
-        i = 0
-        while i < len(children):
-            for pattern, replacer, do_again in rules:
-                pattern_length = len(pattern)
+        self._rewrite(children, rules, 0)
 
-                if i + pattern_length > len(children):
-                    continue
+        return children
 
-                segment = children[i:i + pattern_length]
+    def invoke_prefix(self, children: list, rules: list) -> int:
+        """
+        Rewrites the children at the start that more children at the end
+        cannot change anymore. Returns the number of these children.
 
-                if all(
-                    isinstance(node, Tree) and token.name == node.data
-                    for node, token in zip(segment, pattern)
-                ):
-                    new_segment = replacer(*segment)
-                    if isinstance(new_segment, list):
-                        children[i:i + pattern_length] = new_segment
-                    else:
-                        children[i:i + pattern_length] = [new_segment]
+        For a list that is continued later: the rest of the list (together
+        with the next children) must be rewritten again.
+        """
 
-                    if not do_again:
-                        i += 1
-                    break
-            else:
-                i += 1
+        assert isinstance(children, list)
+        assert isinstance(rules, list)
 
-        return children
+        margin = CompiledRules.get(rules).longest
+
+        return self._rewrite(children, rules, margin - 1)
+
+    def _rewrite(self, children: list, rules: list, margin: int) -> int:
+        """
+        Rewrites the children in one forward pass.
+
+        At every position, the first rule in the list that matches replaces
+        the matched nodes. With `do_again`, the rules are tried again at the
+        same position. Otherwise, the next position is the second node of
+        the replacement. Returns the number of processed children.
+        """
+
+        if not rules:
+            return max(0, len(children) - margin)
+
+        compiled = CompiledRules.get(rules)
+        do_again = compiled.do_again
+
+        # The children from the current position in reverse order.
+        work = children[::-1]
+        result = []
+
+        while len(work) > margin:
+            index = compiled.match(work)
+            if index is None:
+                result.append(work.pop())
+                continue
+
+            pattern, replacer, _ = rules[index]
+            if self._hits is not None:
+                self._hits[compiled.names[index]] += 1
+            segment = work[:-len(pattern) - 1:-1]
+            del work[-len(pattern):]
+
+            new_segment = replacer(*segment)
+            if not isinstance(new_segment, list):
+                new_segment = [new_segment]
+            work.extend(reversed(new_segment))
+
+            if not do_again[index] and work:
+                result.append(work.pop())
+
+        count = len(result)
+        work.reverse()
+        children[:] = result + work
+
+        return count
@@ -0,0 +1,285 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# pylint: disable=C0115
+# pylint: disable=C0116
+# type: ignore
+
+"""test_async_parser"""
+
+import asyncio
+import threading
+import unittest
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from unittest import mock
+
+from parameterized import parameterized
+
+from biz.dfch.ste100parser import (
+    AsyncParser,
+    GrammarType,
+    Parser,
+    Pipeline,
+    StreamParser,
+)
+
+_TEXT = "# Heading\n\nFirst paragraph.\n\nSecond paragraph, with words.\n"
+
+_INVOKE = "biz.dfch.ste100parser.async_parser._invoke"
+
+
+async def _get_stream(values: list):
+    for value in values:
+        await asyncio.sleep(0)
+        yield value
+
+
+class TestAsyncParser(unittest.TestCase):
+
+    @parameterized.expand([
+        ("default", None),
+        ("threads", 2),
+    ])
+    def test_invoke_returns_pipeline_tree(self, _, max_workers):
+        expected = Pipeline(GrammarType.CONTAINER_LALR).invoke(_TEXT)
+
+        async def invoke():
+            if max_workers is None:
+                return await AsyncParser(GrammarType.CONTAINER_LALR).invoke(
+                    _TEXT)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                return await AsyncParser(
+                    GrammarType.CONTAINER_LALR, executor=executor).invoke(
+                        _TEXT)
+
+        result = asyncio.run(invoke())
+
+        self.assertEqual(expected, result)
+
+    def test_invoke_in_process(self):
+        expected = Pipeline(GrammarType.CONTAINER_LALR).invoke(_TEXT)
+
+        async def invoke():
+            with ProcessPoolExecutor(max_workers=1) as executor:
+                sut = AsyncParser(
+                    GrammarType.CONTAINER_LALR, executor=executor)
+                return await asyncio.gather(
+                    sut.invoke(_TEXT), sut.invoke(_TEXT))
+
+        result = asyncio.run(invoke())
+
+        self.assertEqual([expected, expected], result)
+
+    def test_other_grammar_returns_parse_tree(self):
+        expected = Parser(GrammarType.INT).invoke("42")
+        sut = AsyncParser(GrammarType.INT)
+
+        result = asyncio.run(sut.invoke("42"))
+
+        self.assertEqual(expected, result)
+
+    def test_invoke_limits_concurrency(self):
+        lock = threading.Lock()
+        running = [0, 0]
+
+        def invoke(grammar, text):
+            _ = grammar
+            with lock:
+                running[0] += 1
+                running[1] = max(running)
+            threading.Event().wait(0.02)
+            with lock:
+                running[0] -= 1
+            return text
+
+        async def invoke_all(sut):
+            return await asyncio.gather(
+                *(sut.invoke(str(index)) for index in range(6)))
+
+        with ThreadPoolExecutor(max_workers=6) as executor, \
+                mock.patch(_INVOKE, invoke):
+            sut = AsyncParser(executor=executor, max_concurrency=2)
+            result = asyncio.run(invoke_all(sut))
+
+        self.assertEqual([str(index) for index in range(6)], result)
+        self.assertEqual(2, running[1])
+
+    def test_cancelled_calls_keep_slot_until_done(self):
+        lock = threading.Lock()
+        running = [0, 0]
+        started = threading.Semaphore(0)
+
+        def invoke(grammar, text):
+            _ = grammar
+            with lock:
+                running[0] += 1
+                running[1] = max(running)
+            started.release()
+            threading.Event().wait(0.05)
+            with lock:
+                running[0] -= 1
+            return text
+
+        async def run(sut):
+            loop = asyncio.get_running_loop()
+            tasks = [
+                asyncio.create_task(sut.invoke(str(index)))
+                for index in range(2)
+            ]
+            for _ in tasks:
+                await loop.run_in_executor(None, started.acquire)
+
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+            return await asyncio.gather(
+                *(sut.invoke(str(index)) for index in range(2, 6)))
+
+        with ThreadPoolExecutor(max_workers=6) as executor, \
+                mock.patch(_INVOKE, invoke):
+            sut = AsyncParser(executor=executor, max_concurrency=2)
+            result = asyncio.run(run(sut))
+
+        self.assertEqual([str(index) for index in range(2, 6)], result)
+        self.assertEqual(2, running[1])
+
+    def test_cancelled_call_does_not_run(self):
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def invoke(grammar, text):
+            _ = grammar
+            calls.append(text)
+            started.set()
+            release.wait(5)
+            return text
+
+        async def run(sut):
+            first = asyncio.create_task(sut.invoke("first"))
+            second = asyncio.create_task(sut.invoke("second"))
+            await asyncio.get_running_loop().run_in_executor(
+                None, started.wait, 5)
+
+            second.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await second
+            release.set()
+
+            return [await first, await sut.invoke("third")]
+
+        sut = AsyncParser(max_concurrency=1)
+        with mock.patch(_INVOKE, invoke):
+            result = asyncio.run(run(sut))
+
+        self.assertEqual(["first", "third"], result)
+        self.assertEqual(["first", "third"], calls)
+
+    def test_invoke_stream_decodes_bytes(self):
+        text = "Check the Ø of the valve.\n"
+        data = text.encode("utf-8")
+        # The split is inside the two bytes of "Ø".
+        split = data.index("Ø".encode("utf-8")) + 1
+        expected = Pipeline(GrammarType.CONTAINER_LALR).invoke(text)
+        sut = AsyncParser(GrammarType.CONTAINER_LALR)
+
+        result = asyncio.run(sut.invoke_stream(
+            _get_stream([data[:split], data[split:]])))
+
+        self.assertEqual(expected, result)
+
+    @parameterized.expand([
+        ("text", False),
+        ("bytes", True),
+    ])
+    def test_aiter_items_returns_stream_parser_items(self, _, as_bytes):
+        expected = list(StreamParser(GrammarType.CONTAINER_LALR).iter_items(
+            [_TEXT]))
+        values = _TEXT.splitlines(keepends=True)
+        if as_bytes:
+            values = [value.encode("utf-8") for value in values]
+        sut = AsyncParser(GrammarType.CONTAINER_LALR)
+
+        async def collect():
+            return [item async for item in sut.aiter_items(
+                _get_stream(values))]
+
+        result = asyncio.run(collect())
+
+        self.assertEqual(expected, result)
+
+    def test_cancelled_stream_releases_slot(self):
+        sut = AsyncParser(GrammarType.CONTAINER_LALR, max_concurrency=1)
+
+        async def run():
+            blocked = asyncio.Event()
+
+            async def stream():
+                yield "First paragraph.\n"
+                await blocked.wait()
+
+            async def collect():
+                return [item async for item in sut.aiter_items(stream())]
+
+            task = asyncio.create_task(collect())
+            await asyncio.sleep(0.05)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+            return await asyncio.wait_for(sut.invoke(_TEXT), 5)
+
+        result = asyncio.run(run())
+
+        self.assertEqual("start", result.data)
+
+    def test_cancelled_stream_keeps_slot_until_feed_is_done(self):
+        started = threading.Event()
+        calls = []
+
+        def feed(parser, value):
+            _ = parser, value
+            started.set()
+            threading.Event().wait(0.05)
+            calls.append("feed")
+            return []
+
+        def invoke(grammar, text):
+            _ = grammar
+            calls.append("invoke")
+            return text
+
+        async def run(sut):
+            async def collect():
+                return [item async for item in sut.aiter_items(
+                    _get_stream(["First paragraph.\n"]))]
+
+            task = asyncio.create_task(collect())
+            await asyncio.get_running_loop().run_in_executor(
+                None, started.wait, 5)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+            return await sut.invoke("text")
+
+        sut = AsyncParser(GrammarType.CONTAINER_LALR, max_concurrency=1)
+        with mock.patch.object(StreamParser, "feed", feed), \
+                mock.patch(_INVOKE, invoke):
+            result = asyncio.run(run(sut))
+
+        self.assertEqual("text", result)
+        self.assertEqual(["feed", "invoke"], calls)
@@ -0,0 +1,210 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# pylint: disable=C0116
+# type: ignore
+
+"""test_batch"""
+
+import contextlib
+import io
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from parameterized import parameterized
+
+from biz.dfch.ste100parser import BatchParser, GrammarType, Pipeline
+from biz.dfch.ste100parser.__main__ import main
+
+
+class _KillingPath(type(Path())):
+    """A path that kills the worker process that reads it."""
+
+    def read_text(self, *args, **kwargs):
+        self.with_suffix(".killed").touch()
+        os._exit(1)  # pylint: disable=W0212
+
+
+class _SlowKillingPath(_KillingPath):
+    """A path that kills its worker after the other workers are done."""
+
+    def read_text(self, *args, **kwargs):
+        time.sleep(1)
+        super().read_text(*args, **kwargs)
+
+
+class TestBatch(unittest.TestCase):
+    """TestBatch"""
+
+    _documents = [
+        "This is the first document.",
+        "\n 1. some-text",
+        "First paragraph.\n\nSecond paragraph.\n",
+        "",
+        "This is the last document.",
+    ]
+
+    @parameterized.expand([
+        ("in_process", 1),
+        ("process_pool", 2),
+    ])
+    def test_results_have_input_order(self, _, max_workers):
+
+        sut = BatchParser(GrammarType.CONTAINER_LALR, max_workers=max_workers)
+
+        result = sut.invoke(self._documents)
+
+        self.assertEqual(
+            list(range(len(self._documents))),
+            [item.index for item in result])
+        self.assertEqual(
+            [True, False, True, False, True],
+            [item.ok for item in result])
+
+        pipeline = Pipeline(GrammarType.CONTAINER_LALR)
+        for item in result:
+            if not item.ok:
+                self.assertIsNone(item.tree)
+                continue
+            expected = pipeline.invoke(self._documents[item.index])
+            self.assertEqual(expected, item.tree)
+
+    def test_failure_has_error(self):
+
+        sut = BatchParser(GrammarType.CONTAINER_LALR, max_workers=1)
+
+        result = sut.invoke([""])
+
+        self.assertEqual("<document 0>", result[0].source)
+        self.assertTrue(result[0].error.startswith("AssertionError"))
+
+    def test_other_grammar_returns_parse_tree(self):
+
+        sut = BatchParser(GrammarType.WORD, max_workers=1)
+
+        result = sut.invoke(["hello"])
+
+        self.assertTrue(result[0].ok)
+        self.assertEqual("hello", result[0].tree.children[0])
+        self.assertLess(0, result[0].seconds)
+
+    def test_killed_worker_fails_only_its_document(self):
+
+        with tempfile.TemporaryDirectory() as directory:
+            documents = [
+                "First document.",
+                _KillingPath(directory, "killed.md"),
+                "Third document.",
+                "Fourth document.",
+                "Fifth document.",
+            ]
+            sut = BatchParser(GrammarType.CONTAINER_LALR, max_workers=2)
+
+            result = sut.invoke(documents)
+
+        self.assertEqual(
+            list(range(len(documents))), [item.index for item in result])
+        self.assertEqual(
+            [True, False, True, True, True], [item.ok for item in result])
+        self.assertTrue(result[1].error.startswith("BrokenProcessPool"))
+
+    def test_killed_worker_with_queued_documents(self):
+
+        with tempfile.TemporaryDirectory() as directory:
+            killed = _SlowKillingPath(directory, "killed.md")
+            documents = [
+                "First document.", killed,
+                *[f"Document {index}." for index in range(2, 10)],
+            ]
+            sut = BatchParser(GrammarType.CONTAINER_LALR, max_workers=2)
+
+            results = sut.iter_results(documents)
+            first = next(results)
+            # Wait until the worker is killed, so that the next document is
+            # submitted to the broken pool.
+            deadline = time.monotonic() + 30
+            while (not killed.with_suffix(".killed").exists() and
+                    time.monotonic() < deadline):
+                time.sleep(0.05)
+            time.sleep(0.5)
+            result = [first, *results]
+
+        self.assertEqual(
+            list(range(len(documents))), [item.index for item in result])
+        self.assertEqual(
+            [True, False] + [True] * 8, [item.ok for item in result])
+        self.assertTrue(result[1].error.startswith("BrokenProcessPool"))
+
+    def test_documents_are_read_while_processed(self):
+
+        read = []
+
+        def get_documents():
+            for index in range(20):
+                read.append(index)
+                yield f"Document {index}."
+
+        sut = BatchParser(GrammarType.CONTAINER_LALR, max_workers=2)
+
+        results = sut.iter_results(get_documents())
+        first = next(results)
+        count = len(read)
+        rest = list(results)
+
+        self.assertTrue(first.ok)
+        # Two documents per worker are in flight.
+        self.assertEqual(4, count)
+        self.assertEqual(19, len(rest))
+
+    def test_paths(self):
+
+        with tempfile.TemporaryDirectory() as directory:
+            valid = Path(directory) / "valid.md"
+            valid.write_text("Text.\n", encoding="utf-8")
+            missing = Path(directory) / "missing.md"
+
+            sut = BatchParser(GrammarType.CONTAINER_LALR, max_workers=2)
+
+            result = sut.invoke([valid, missing])
+
+        self.assertEqual(str(valid), result[0].source)
+        self.assertTrue(result[0].ok)
+        self.assertEqual(str(missing), result[1].source)
+        self.assertTrue(result[1].error.startswith("FileNotFoundError"))
+
+    def test_main_batch(self):
+
+        with tempfile.TemporaryDirectory() as directory:
+            valid = Path(directory) / "valid.md"
+            valid.write_text("Text.\n", encoding="utf-8")
+            invalid = Path(directory) / "invalid.md"
+            invalid.write_text(" text", encoding="utf-8")
+
+            stdout = io.StringIO()
+            with (
+                contextlib.redirect_stdout(stdout),
+                contextlib.redirect_stderr(io.StringIO()),
+            ):
+                result = main([
+                    "batch", "-j", "1", "--grammar", "CONTAINER_LALR",
+                    str(valid), str(invalid)])
+
+        self.assertEqual(1, result)
+        lines = stdout.getvalue().splitlines()
+        self.assertEqual(f"{valid}: OK", lines[0])
+        self.assertEqual(f"{invalid}: ERROR", lines[1])
@@ -0,0 +1,224 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# pylint: disable=C0115
+# pylint: disable=C0116
+# type: ignore
+
+"""test_binary_tree"""
+
+import pickle
+import tempfile
+import unittest
+from pathlib import Path
+
+from lark import Token as LarkToken
+from lark import Tree
+from lark.tree import Meta
+from parameterized import parameterized
+
+from biz.dfch.ste100parser import BinaryTree, GrammarType, Parser, Pipeline
+from biz.dfch.ste100parser.binary_tree import BinaryNode, dump, dumps
+from biz.dfch.ste100parser.char import Char
+from biz.dfch.ste100parser.line_index import LineIndex
+from biz.dfch.ste100parser.transformer import TokenConverter
+
+_TEST_DATA = Path(__file__).parent / "test_data"
+
+_NAMES = [
+    ("complex_heading_proc_cite_para_list.md",),
+    ("complex_headings_para_proc_list.md",),
+    ("list_in_paragraph.md",),
+    ("list_in_proc.md",),
+    ("single_paragraph_with_linebreak.md",),
+]
+
+
+def _get_meta(start_pos: int, end_pos: int) -> Meta:
+    result = Meta()
+    result.empty = False
+    result.start_pos = start_pos
+    result.end_pos = end_pos
+
+    return result
+
+
+class TestBinaryTree(unittest.TestCase):
+
+    @parameterized.expand(_NAMES)
+    def test_round_trip_transformed_tree(self, name):
+        text = (_TEST_DATA / name).read_text(encoding="utf-8")
+        tree = Pipeline(GrammarType.CONTAINER_LALR).invoke(text)
+
+        result = BinaryTree(dumps(tree)).to_tree()
+
+        self.assertEqual(
+            TokenConverter().invoke(tree), TokenConverter().invoke(result))
+        self.assertEqual(tree, result)
+
+    @parameterized.expand(_NAMES)
+    def test_round_trip_parse_tree(self, name):
+        text = (_TEST_DATA / name).read_text(encoding="utf-8")
+        tree = Parser(GrammarType.CONTAINER_LALR).invoke(text)
+
+        result = BinaryTree(dumps(tree)).to_tree()
+
+        self.assertEqual(tree, result)
+        tokens = [item for item in result.scan_values(
+            lambda value: isinstance(value, LarkToken))]
+        expected = list(tree.scan_values(
+            lambda value: isinstance(value, LarkToken)))
+        self.assertEqual(
+            [(item.type, item.start_pos, item.end_pos) for item in expected],
+            [(item.type, item.start_pos, item.end_pos) for item in tokens])
+        self.assertEqual(dumps(tree), dumps(result))
+
+    def test_positions(self):
+        text = (_TEST_DATA / _NAMES[0][0]).read_text(encoding="utf-8")
+        tree = Pipeline(GrammarType.CONTAINER_LALR).invoke(text)
+
+        result = BinaryTree(dumps(tree)).to_tree(text=text)
+
+        line_index = LineIndex(text)
+        for expected, actual in zip(
+                tree.iter_subtrees(), result.iter_subtrees()):
+            if not hasattr(expected.meta, "start_pos"):
+                self.assertFalse(hasattr(actual.meta, "start_pos"))
+                continue
+            self.assertEqual(
+                (expected.meta.start_pos, expected.meta.end_pos),
+                (actual.meta.start_pos, actual.meta.end_pos))
+            # Some transformers set a line and column that do not come from
+            # the text. The binary format only stores the positions.
+            self.assertEqual(
+                line_index.get_line_column(expected.meta.start_pos),
+                (actual.meta.line, actual.meta.column))
+
+    def test_nodes_are_read_on_access(self):
+        tree = Tree("start", [
+            Tree("paragraph", [
+                Tree("WORD", ["valve"], meta=_get_meta(0, 5)),
+                "text",
+                Tree("empty", []),
+            ], meta=_get_meta(0, 9)),
+            Tree("WORD", ["valve"]),
+        ])
+
+        sut = BinaryTree(dumps(tree))
+
+        self.assertEqual(6, len(sut))
+        root = sut.root
+        self.assertEqual("start", root.data)
+        self.assertIsNone(root.parent)
+        self.assertIsNone(root.start_pos)
+
+        paragraph, word = root.children
+        self.assertIsInstance(paragraph, BinaryNode)
+        self.assertEqual((0, 9), (paragraph.start_pos, paragraph.end_pos))
+        self.assertEqual(root, paragraph.parent)
+        self.assertEqual(["valve"], word.children)
+
+        leaf, value, empty = paragraph.children
+        self.assertEqual("WORD", leaf.data)
+        self.assertEqual("text", value)
+        self.assertEqual([], empty.children)
+        self.assertEqual(tree.children[0], paragraph.to_tree())
+
+    @parameterized.expand([
+        ("small", 100),
+        ("large", 100_000),
+    ])
+    def test_column_sizes(self, _, count):
+        tree = Tree("start", [
+            Tree("WORD", [f"w{i % 1000}"], meta=_get_meta(i, 2**31 - 1))
+            for i in range(count)
+        ])
+
+        result = BinaryTree(dumps(tree)).to_tree()
+
+        self.assertEqual(tree, result)
+        self.assertEqual(2**31 - 1, result.children[-1].meta.end_pos)
+
+    def test_strings_are_stored_once(self):
+        tree = Tree("start", [Tree("WORD", ["välve"]) for _ in range(1000)])
+
+        result = dumps(tree)
+
+        self.assertEqual(1, result.count("välve".encode("utf-8")))
+        self.assertLess(len(result), len(pickle.dumps(tree)))
+        self.assertEqual(
+            "välve", BinaryTree(result).root.children[999].children[0])
+
+    def test_char_values_are_restored(self):
+        tree = Tree("start", [
+            Tree("NEWLINE", [Char.LF], meta=_get_meta(0, 1)),
+            Char.STAR,
+            Tree("WORD", ["\n"]),
+        ])
+
+        sut = BinaryTree(dumps(tree))
+        result = sut.to_tree()
+
+        self.assertEqual(tree, result)
+        self.assertIs(Char.LF, result.children[0].children[0])
+        self.assertIs(Char.STAR, result.children[1])
+        self.assertNotIsInstance(result.children[2].children[0], Char)
+        newline, star, _ = sut.root.children
+        self.assertIs(Char.LF, newline.children[0])
+        self.assertIs(Char.STAR, star)
+
+    def test_char_values_are_restored_in_transformed_tree(self):
+        text = "A.\nB.\n\n\n- C.\n\nD.\n"
+        tree = Pipeline(GrammarType.CONTAINER_LALR).invoke(text)
+
+        result = BinaryTree(dumps(tree)).to_tree()
+
+        expected = [type(value) for value in tree.scan_values(
+            lambda value: isinstance(value, str))]
+        self.assertIn(Char, expected)
+        self.assertEqual(expected, [type(value) for value in
+                                    result.scan_values(
+                                        lambda value: isinstance(value, str))])
+
+    def test_load_maps_file(self):
+        text = (_TEST_DATA / _NAMES[0][0]).read_text(encoding="utf-8")
+        tree = Pipeline(GrammarType.CONTAINER_LALR).invoke(text)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "tree.bin"
+            dump(tree, path)
+
+            with BinaryTree.load(path) as sut:
+                result = sut.to_tree()
+
+        self.assertEqual(tree, result)
+
+    @parameterized.expand([
+        ("magic", lambda data: b"NOPE" + data[4:]),
+        ("version", lambda data: data[:4] + bytes([255]) + data[5:]),
+        ("empty", lambda data: b""),
+        ("header", lambda data: data[:8]),
+        ("columns", lambda data: data[:64]),
+        ("strings", lambda data: data[:-1]),
+    ])
+    def test_invalid_buffer_throws(self, _, damage):
+        data = dumps(Tree("start", [Tree("WORD", ["valve"])]))
+
+        with self.assertRaises(ValueError):
+            BinaryTree(damage(data))
+
+
+if __name__ == "__main__":
+    unittest.main()
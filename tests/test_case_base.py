@@ -58,36 +58,10 @@ class TestCaseBase(unittest.TestCase):
     def format_parse_tree(
         self,
         skeleton: tuple[Token, list] | str,
-        indent: int = 0
     ) -> str:
         """
         Formats the result of the TokenConverter into a readable indented
         format.
         """
 
-        padding = "." * indent
-
-        # If the converter returned a string, it is a leaf value.
-        if isinstance(skeleton, str):
-            return skeleton
-
-        token, children = skeleton
-        token_name = token.name
-
-        # Check if this node contains only a single string leaf.
-        if 1 == len(children) and isinstance(children[0], str):
-            return f"{padding}{token_name} {children[0]}"
-
-        # Otherwise, it is a container with multiple children or sub-trees.
-        result = [f"{padding}{token_name}"]
-        for child in children:
-            formatted_child = self.format_parse_tree(child, indent + 1)
-
-            # If the child was a sub-tree, it is already padded.
-            # If it was a raw string (not inlined), we pad it here.
-            if isinstance(child, str):
-                result.append(f"{padding}  {formatted_child}")
-            else:
-                result.append(formatted_child)
-
-        return "\n".join(result)
+        return TokenConverter().format(skeleton)
@@ -0,0 +1,182 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# pylint: disable=C0115
+# pylint: disable=C0116
+# type: ignore
+
+"""test_chunked_parser"""
+
+from concurrent.futures import ProcessPoolExecutor
+
+from lark import Token as LarkToken
+from lark.exceptions import UnexpectedInput
+from parameterized import parameterized
+
+from biz.dfch.ste100parser import GrammarType, Parser, Token
+from biz.dfch.ste100parser.chunked_parser import ChunkedParser
+from biz.dfch.ste100parser.transformer import ContainerTransformer
+from biz.dfch.ste100parser.transformer import TextTransformer
+
+from tests.test_case_base import TestCaseBase
+from tests.test_data.test_data import TestData
+
+
+class TestChunkedParser(TestCaseBase):
+    """
+    ChunkedParser must create the same tree as Parser, with the same
+    positions.
+    """
+
+    _parser = None
+    _sut = None
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        if cls._parser is None:
+            cls._parser = Parser(GrammarType.CONTAINER_LALR)
+            cls._sut = ChunkedParser(GrammarType.CONTAINER_LALR)
+
+    def get_positions(self, tree):
+        result = []
+        for node in tree.iter_subtrees_topdown():
+            meta = node.meta
+            result.append((
+                node.data, meta.line, meta.column, meta.start_pos,
+                meta.end_line, meta.end_column, meta.end_pos))
+            result.extend(
+                (
+                    child.type, child.line, child.column, child.start_pos,
+                    child.end_line, child.end_column, child.end_pos
+                )
+                for child in node.children if isinstance(child, LarkToken)
+            )
+        return result
+
+    def assert_same_tree(self, value: str, sut: ChunkedParser = None):
+        sut = sut if sut is not None else self._sut
+
+        expected = self._parser.invoke(value)
+        result = sut.invoke(value)
+
+        self.assertEqual(expected, result)
+        self.assertEqual(
+            self.get_positions(expected), self.get_positions(result))
+
+    def get_document(self):
+        return "\n\n".join(
+            self.load_test_data(item.value).strip("\n") for item in TestData)
+
+    @parameterized.expand([
+        ("paragraphs", "A.\n\nB.\n\n\nC.", ["A.", "B.", "C."]),
+        ("proc", "A.\n\n1. Step.", ["A.", "\n1. Step."]),
+        ("note", "A.\n\nNOTE: Note.", ["A.", "\nNOTE: Note."]),
+        ("cite", "A.\n\n> Cite.", ["A.", "\n> Cite."]),
+        ("list", "A.\n\n  a Item.", ["A.", "\n  a Item."]),
+        ("warning", "A.\n\nWARNING: W.", ["A.", "WARNING: W."]),
+        ("heading", "# H\n\nA.", ["# H", "A."]),
+        ("crlf", "A.\r\n\r\nB.", ["A.", "B."]),
+        ("start_and_end", "\n\nA.\n\n", ["\n\nA.\n\n"]),
+        ("paren", "A (b\n\nc) d.\n\nE.", ["A (b\n\nc) d.", "E."]),
+        ("code", "A `b\n\nc` d.\n\nE.", ["A `b\n\nc` d.", "E."]),
+    ])
+    def test_get_chunks(self, _, value, expected):
+
+        result = self._sut.get_chunks(value)
+
+        self.assertEqual(expected, [chunk.text for chunk in result])
+        for chunk in result:
+            self.assertEqual(
+                chunk.text,
+                value[chunk.start_pos:chunk.start_pos + len(chunk.text)])
+            self.assertEqual(
+                chunk.line, 1 + value.count("\n", 0, chunk.start_pos))
+
+    @parameterized.expand([(item.name, item.value) for item in TestData])
+    def test_every_chunk_can_be_parsed(self, _, filename):
+
+        for chunk in self._sut.get_chunks(self.load_test_data(filename)):
+            self._parser.invoke(chunk.text)
+
+    def test_min_chunk_size(self):
+
+        sut = ChunkedParser(GrammarType.CONTAINER_LALR, min_chunk_size=5)
+
+        result = sut.get_chunks("A.\n\nB.\n\nC and D.\n\nE.")
+
+        self.assertEqual(
+            ["A.\n\nB.", "C and D.", "E."], [chunk.text for chunk in result])
+
+    @parameterized.expand([(item.name, item.value) for item in TestData])
+    def test_test_data(self, _, filename):
+
+        self.assert_same_tree(self.load_test_data(filename))
+
+    @parameterized.expand([
+        ("A.\n\nB.\n\n\nC.",),
+        ("# H\n\nA.\n\n1. Step.\n2. Step.\n\nNOTE: Note.\n\n> Cite.\n\nB.",),
+        ("A.\r\n\r\nB.\r\n",),
+    ])
+    def test_snippet(self, value):
+
+        self.assert_same_tree(value)
+
+    def test_document(self):
+
+        self.assert_same_tree(self.get_document())
+
+    def test_executor(self):
+
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            sut = ChunkedParser(GrammarType.CONTAINER_LALR, executor=executor)
+
+            self.assert_same_tree(self.get_document(), sut)
+
+    def test_error_has_positions_of_text(self):
+
+        value = "A.\n\nB.\n\n C."
+
+        with self.assertRaises(UnexpectedInput) as expected:
+            self._parser.invoke(value)
+        with self.assertRaises(UnexpectedInput) as result:
+            self._sut.invoke(value)
+
+        self.assertEqual(expected.exception.line, result.exception.line)
+        self.assertEqual(expected.exception.column, result.exception.column)
+
+    @parameterized.expand([
+        ("A.\n\nB.",),
+        ("# H\n\nA.\n\n1. Step.\n\n> Cite.",),
+        ("A.\n\nB.\n",),
+        ("A.\n\nB.\n\n",),
+        ("A.\n\n\nB.",),
+        ("A.\nB.\n\nC.\n",),
+        ("That *a*.\nB.\n\nC.\n",),
+        ("# H\n\nA.\n",),
+    ])
+    def test_earley(self, value):
+
+        sut = ChunkedParser(GrammarType.CONTAINER)
+
+        expected = Parser(GrammarType.CONTAINER).invoke(value)
+        expected = TextTransformer().transform(
+            ContainerTransformer().transform(expected))
+        result = TextTransformer().transform(
+            ContainerTransformer().transform(sut.invoke(value)))
+
+        self.assertEqual(Token.start.name, result.data)
+        self.assertEqual(
+            self.get_token_tree(expected), self.get_token_tree(result))
+        self.assertEqual(expected, result)
@@ -0,0 +1,121 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# pylint: disable=C0115
+# pylint: disable=C0116
+# type: ignore
+
+"""test_compact_tree"""
+
+import unittest
+from pathlib import Path
+
+from lark import Tree
+from lark.tree import Meta
+from parameterized import parameterized
+
+from biz.dfch.ste100parser import GrammarType, Pipeline, Token
+from biz.dfch.ste100parser.compact_tree import (
+    CompactLeaf,
+    CompactNode,
+    get_code,
+    get_name,
+    to_compact,
+    to_tree,
+)
+
+_TEST_DATA = Path(__file__).parent / "test_data"
+
+
+def _get_meta(start_pos: int, end_pos: int) -> Meta:
+    result = Meta()
+    result.start_pos = start_pos
+    result.end_pos = end_pos
+
+    return result
+
+
+class TestCompactTree(unittest.TestCase):
+
+    @parameterized.expand([
+        ("complex_heading_proc_cite_para_list.md",),
+        ("complex_headings_para_proc_list.md",),
+        ("list_in_paragraph.md",),
+        ("single_paragraph_with_linebreak.md",),
+    ])
+    def test_round_trip(self, name):
+        text = (_TEST_DATA / name).read_text(encoding="utf-8")
+        tree = Pipeline(GrammarType.CONTAINER_LALR).invoke(text)
+
+        result = to_tree(to_compact(tree), text)
+
+        self.assertEqual(tree, result)
+        for expected, actual in zip(
+            tree.iter_subtrees_topdown(), result.iter_subtrees_topdown()
+        ):
+            if Token.sentence.name == expected.data:
+                continue
+            self.assertEqual(expected.meta.start_pos, actual.meta.start_pos)
+            self.assertEqual(expected.meta.end_pos, actual.meta.end_pos)
+            if hasattr(expected.meta, "line"):
+                self.assertEqual(expected.meta.line, actual.meta.line)
+                self.assertEqual(expected.meta.column, actual.meta.column)
+
+    def test_leaf_stores_value_inline(self):
+        tree = Tree("WORD", ["valve"], meta=_get_meta(3, 8))
+
+        result = to_compact(tree)
+
+        self.assertIsInstance(result, CompactLeaf)
+        self.assertEqual("WORD", result.data)
+        self.assertEqual("valve", result.value)
+        self.assertEqual(3, result.start_pos)
+        self.assertEqual(8, result.end_pos)
+
+    def test_node_without_positions(self):
+        tree = Tree("sentence", [Tree("WORD", ["a"]), Tree("EOS", ["."])])
+
+        result = to_compact(tree)
+
+        self.assertIsInstance(result, CompactNode)
+        self.assertIsNone(result.start_pos)
+        self.assertIsNone(result.end_pos)
+        self.assertEqual(2, len(result.children))
+
+        back = to_tree(result)
+        self.assertEqual(tree, back)
+        self.assertFalse(hasattr(back.meta, "start_pos"))
+
+    def test_codes(self):
+        self.assertEqual(Token.WORD.name, get_name(get_code(Token.WORD.name)))
+        self.assertLess(get_code(Token.WORD.name), len(Token))
+
+        code = get_code("_unknown_node")
+        self.assertLessEqual(len(Token), code)
+        self.assertEqual(code, get_code("_unknown_node"))
+        self.assertEqual("_unknown_node", get_name(code))
+
+    def test_pipeline_invoke_compact(self):
+        text = "This is a test.\n\nThis is a second test.\n"
+        sut = Pipeline(GrammarType.CONTAINER_LALR)
+
+        result = sut.invoke_compact(text)
+
+        self.assertIsInstance(result, CompactNode)
+        self.assertEqual(sut.invoke(text), to_tree(result))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,443 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# pylint: disable=C0115
+# pylint: disable=C0116
+# type: ignore
+
+"""test_daemon"""
+
+import contextlib
+import io
+import json
+import os
+import socket
+import stat
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from parameterized import parameterized
+
+from biz.dfch.ste100parser import GrammarType, Parser, Pipeline
+from biz.dfch.ste100parser.__main__ import main
+from biz.dfch.ste100parser.daemon import (
+    ENV_ADDRESS,
+    ParseClient,
+    ParseServer,
+    get_default_address,
+    parse_address,
+)
+from biz.dfch.ste100parser.serializer import DictSerializer
+
+_TEXT = "First paragraph.\n\nSecond paragraph, with words.\n"
+
+
+class TestParseAddress(unittest.TestCase):
+
+    @parameterized.expand([
+        ("port", ":7100", ("127.0.0.1", 7100)),
+        ("host_port", "localhost:8000", ("localhost", 8000)),
+        ("socket", "/tmp/ste100.sock", "/tmp/ste100.sock"),
+        ("relative_socket", "ste100.sock", "ste100.sock"),
+    ])
+    def test_parse_address(self, _, value, expected):
+        self.assertEqual(expected, parse_address(value))
+
+    @parameterized.expand([
+        ("any", "0.0.0.0:7100"),
+        ("public", "192.0.2.1:7100"),
+        ("name", "example.com:7100"),
+    ])
+    def test_parse_address_not_loopback_throws(self, _, value):
+        with self.assertRaises(ValueError):
+            parse_address(value)
+
+    def test_parse_address_loopback(self):
+        self.assertEqual(("127.0.0.2", 7100), parse_address("127.0.0.2:7100"))
+
+
+class TestDefaultAddress(unittest.TestCase):
+
+    def setUp(self) -> None:
+        folder = tempfile.TemporaryDirectory()  # pylint: disable=R1732
+        self.addCleanup(folder.cleanup)
+        self.folder = Path(folder.name)
+        self.enterContext(mock.patch.dict(os.environ))
+        os.environ.pop(ENV_ADDRESS, None)
+        os.environ.pop("XDG_RUNTIME_DIR", None)
+        self.enterContext(mock.patch(
+            "tempfile.gettempdir", return_value=str(self.folder)))
+
+    def test_runtime_dir(self):
+        os.environ["XDG_RUNTIME_DIR"] = str(self.folder)
+
+        result = get_default_address()
+
+        self.assertEqual(str(self.folder / "ste100-parser.sock"), result)
+
+    def test_private_dir_is_created(self):
+        result = get_default_address()
+
+        directory = Path(result).parent
+        self.assertEqual(self.folder, directory.parent)
+        self.assertEqual(0o700, stat.S_IMODE(directory.stat().st_mode))
+
+    def test_shared_dir_throws(self):
+        directory = self.folder / f"ste100-parser-{os.getuid()}"
+        directory.mkdir()
+        directory.chmod(0o755)
+
+        with self.assertRaises(OSError):
+            get_default_address()
+
+    def test_socket_is_private(self):
+        os.environ["XDG_RUNTIME_DIR"] = str(self.folder)
+
+        with ParseServer(grammars=()) as sut:
+            mode = os.stat(sut.address).st_mode
+
+        self.assertEqual(0o600, stat.S_IMODE(mode))
+
+    def test_file_is_not_replaced(self):
+        path = self.folder / "daemon.sock"
+        path.write_text("", encoding="utf-8")
+
+        with self.assertRaises(OSError):
+            ParseServer(str(path), ())
+
+        self.assertTrue(path.exists())
+
+
+class TestParseServer(unittest.TestCase):
+
+    folder: tempfile.TemporaryDirectory
+    server: ParseServer
+    thread: threading.Thread
+
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.server = ParseServer(str(Path(self.folder.name, "daemon.sock")))
+        self.thread = threading.Thread(target=self.server.serve_forever)
+        self.thread.start()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.thread.join()
+        self.server.close()
+        self.folder.cleanup()
+
+    def test_parse_json(self):
+        expected = DictSerializer().invoke(
+            Pipeline(GrammarType.CONTAINER_LALR).invoke(_TEXT))
+
+        with ParseClient(self.server.address) as sut:
+            result = sut.call("parse", text=_TEXT)
+
+        self.assertTrue(result["ok"])
+        self.assertEqual(expected, result["tree"])
+
+    def test_parse_tree_returns_lark_tree_with_positions(self):
+        expected = Pipeline(GrammarType.CONTAINER_LALR).invoke(_TEXT)
+
+        with ParseClient(self.server.address) as sut:
+            result = sut.parse_tree(_TEXT)
+
+        self.assertEqual(expected, result["tree"])
+        self.assertEqual(
+            DictSerializer().invoke(expected),
+            DictSerializer().invoke(result["tree"]))
+
+    def test_parse_other_grammar_and_format(self):
+        expected = Parser(GrammarType.INT).invoke("42").pretty()
+
+        with ParseClient(self.server.address) as sut:
+            result = sut.call(
+                "parse", text="42", grammar="INT", format="tree")
+
+        self.assertEqual(expected, result["tree"])
+
+    @parameterized.expand([
+        ("valid", _TEXT, True),
+        ("invalid", " text", False),
+    ])
+    def test_validate(self, _, text, expected):
+        with ParseClient(self.server.address) as sut:
+            result = sut.call("validate", text=text)
+
+        self.assertEqual(expected, result["ok"])
+        self.assertNotIn("tree", result)
+        if not expected:
+            self.assertTrue(result["error"].startswith("UnexpectedToken"))
+
+    def test_batch_keeps_order(self):
+        with ParseClient(self.server.address) as sut:
+            result = sut.call_batch([
+                ("validate", {"text": " text"}),
+                ("ping", {}),
+                ("validate", {"text": _TEXT}),
+            ])
+
+        self.assertEqual(False, result[0]["ok"])
+        self.assertEqual(["CONTAINER_LALR"], result[1]["grammars"])
+        self.assertEqual(True, result[2]["ok"])
+
+    @parameterized.expand([
+        ("method", {"method": "missing"}, -32601),
+        ("grammar", {"method": "parse",
+                     "params": {"text": "", "grammar": "X"}}, -32602),
+        ("format", {"method": "parse",
+                    "params": {"text": "", "format": "X"}}, -32602),
+        ("text", {"method": "parse", "params": {"text": 1}}, -32602),
+        ("argument", {"method": "ping", "params": {"x": 1}}, -32602),
+        ("params", {"method": "ping", "params": [1]}, -32602),
+        ("version", {"jsonrpc": "1.0", "method": "ping"}, -32600),
+    ])
+    def test_errors(self, _, request, code):
+        request = {"jsonrpc": "2.0", "id": 7, **request}
+
+        result = json.loads(self.server.handle_line(json.dumps(request)))
+
+        self.assertEqual(7, result["id"])
+        self.assertEqual(code, result["error"]["code"])
+
+    def test_invalid_json(self):
+        result = json.loads(self.server.handle_line("{"))
+
+        self.assertEqual(-32700, result["error"]["code"])
+
+    def test_notification_has_no_response(self):
+        request = {"jsonrpc": "2.0", "method": "ping"}
+
+        self.assertIsNone(self.server.handle_line(json.dumps(request)))
+        self.assertIsNone(self.server.handle_line(json.dumps([request])))
+
+    def test_running_daemon_is_not_replaced(self):
+        with self.assertRaises(OSError):
+            ParseServer(self.server.address, ())
+
+    def test_cli_uses_daemon(self):
+        path = Path(self.folder.name, "a.md")
+        path.write_text(_TEXT, encoding="utf-8")
+        argv = ["parse", "-f", "json", "--address", self.server.address,
+                str(path)]
+
+        stdout = io.StringIO()
+        stderr = io.StringIO()
+        with contextlib.redirect_stdout(stdout), \
+                contextlib.redirect_stderr(stderr):
+            result = main(argv + ["--daemon"])
+        expected = io.StringIO()
+        with contextlib.redirect_stdout(expected), \
+                contextlib.redirect_stderr(io.StringIO()):
+            main(argv + ["-j", "1"])
+
+        self.assertEqual(0, result)
+        self.assertNotIn("No daemon", stderr.getvalue())
+        self.assertEqual(
+            json.loads(expected.getvalue())["tree"],
+            json.loads(stdout.getvalue())["tree"])
+
+
+class TestDaemonLifecycle(unittest.TestCase):
+
+    def test_tcp_and_shutdown(self):
+        with ParseServer(("127.0.0.1", 0), ()) as server:
+            thread = threading.Thread(target=server.serve_forever)
+            thread.start()
+
+            with ParseClient(server.address) as sut:
+                self.assertTrue(sut.call("validate", text=_TEXT)["ok"])
+                self.assertEqual({}, sut.call("shutdown"))
+
+            thread.join(5)
+            self.assertFalse(thread.is_alive())
+
+    def test_client_times_out(self):
+        with tempfile.TemporaryDirectory() as folder:
+            path = str(Path(folder, "hung.sock"))
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as hung:
+                hung.bind(path)
+                hung.listen()
+
+                with ParseClient(path) as sut:
+                    self.assertEqual(
+                        60, sut._socket.gettimeout())  # pylint: disable=W0212
+
+                with ParseClient(path, timeout=0.1) as sut, \
+                        self.assertRaises(TimeoutError):
+                    sut.call("ping")
+
+    def test_stale_socket_is_replaced(self):
+        with tempfile.TemporaryDirectory() as folder:
+            path = str(Path(folder, "daemon.sock"))
+            stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            stale.bind(path)
+            stale.close()
+
+            with ParseServer(path, ()) as server:
+                self.assertEqual(path, server.address)
+
+            self.assertFalse(Path(path).exists())
+
+    def test_cli_falls_back_without_daemon(self):
+        with tempfile.TemporaryDirectory() as folder:
+            path = Path(folder, "a.md")
+            path.write_text(_TEXT, encoding="utf-8")
+
+            stdout = io.StringIO()
+            stderr = io.StringIO()
+            with contextlib.redirect_stdout(stdout), \
+                    contextlib.redirect_stderr(stderr):
+                result = main([
+                    "parse", "-f", "none", "-j", "1", "--daemon",
+                    "--address", str(Path(folder, "missing.sock")),
+                    str(path)])
+
+        self.assertEqual(0, result)
+        self.assertIn("No daemon at", stderr.getvalue())
+        self.assertEqual(f"{path}: OK\n", stdout.getvalue())
+
+    def test_cli_falls_back_on_daemon_error(self):
+        with tempfile.TemporaryDirectory() as folder:
+            path = Path(folder, "a.md")
+            path.write_text(_TEXT, encoding="utf-8")
+            address = str(Path(folder, "daemon.sock"))
+
+            stdout = io.StringIO()
+            stderr = io.StringIO()
+            with ParseServer(address, ()) as server, \
+                    mock.patch.object(
+                        ParseServer, "_rpc_validate",
+                        side_effect=TypeError("Unexpected params.")), \
+                    contextlib.redirect_stdout(stdout), \
+                    contextlib.redirect_stderr(stderr):
+                thread = threading.Thread(target=server.serve_forever)
+                thread.start()
+                try:
+                    result = main([
+                        "parse", "-f", "none", "-j", "1", "--daemon",
+                        "--address", address, str(path)])
+                finally:
+                    server.shutdown()
+                    thread.join(5)
+
+        self.assertEqual(0, result)
+        self.assertIn("Unexpected params.", stderr.getvalue())
+        self.assertIn("parsing in this process", stderr.getvalue())
+        self.assertEqual(f"{path}: OK\n", stdout.getvalue())
+
+    def test_cli_address_not_loopback_fails(self):
+        with contextlib.redirect_stderr(io.StringIO()), \
+                self.assertRaises(SystemExit):
+            main(["parse", "--daemon", "--address", "0.0.0.0:7100", "a.md"])
+
+    def test_daemon_cannot_be_used_with_stats(self):
+        with contextlib.redirect_stderr(io.StringIO()), \
+                self.assertRaises(SystemExit):
+            main(["parse", "--daemon", "--stats", "a.md"])
+
+
+class TestDaemonCli(unittest.TestCase):
+
+    def _main(self, count: int, patch) -> tuple[int, str]:
+        with tempfile.TemporaryDirectory() as folder:
+            paths = []
+            for index in range(count):
+                path = Path(folder, f"{index}.md")
+                path.write_text(_TEXT, encoding="utf-8")
+                paths.append(str(path))
+            address = str(Path(folder, "daemon.sock"))
+
+            stdout = io.StringIO()
+            stderr = io.StringIO()
+            with ParseServer(address, ()) as server, patch, \
+                    mock.patch(
+                        "biz.dfch.ste100parser.__main__._DAEMON_BATCH_SIZE",
+                        2), \
+                    contextlib.redirect_stdout(stdout), \
+                    contextlib.redirect_stderr(stderr):
+                thread = threading.Thread(target=server.serve_forever)
+                thread.start()
+                try:
+                    result = main([
+                        "parse", "-f", "none", "-j", "1", "--daemon",
+                        "--address", address, *paths])
+                finally:
+                    server.shutdown()
+                    thread.join(5)
+
+        self.assertEqual(
+            [f"{path}: OK" for path in paths], stdout.getvalue().splitlines())
+        return result, stderr.getvalue()
+
+    def test_files_are_sent_in_chunks(self):
+        calls = []
+        original = ParseClient.call_batch
+
+        def call_batch(client, values):
+            calls.append(len(values))
+            return original(client, values)
+
+        patch = mock.patch.object(
+            ParseClient, "call_batch", autospec=True, side_effect=call_batch)
+
+        result, stderr = self._main(5, patch)
+
+        self.assertEqual(0, result)
+        self.assertEqual([2, 2, 1], calls)
+        self.assertNotIn("parsing in this process", stderr)
+
+    @parameterized.expand([
+        ("missing_key", "call_batch",
+         lambda _, calls: [{"ok": True}] * len(calls), "KeyError"),
+        ("fewer_results", "call_batch", lambda _, calls: [], "ValueError"),
+        ("not_an_object", "call_batch",
+         lambda _, calls: [None] * len(calls), "TypeError"),
+        ("invalid_json", "_send",
+         json.JSONDecodeError("Expecting value", "nope", 0),
+         "JSONDecodeError"),
+    ])
+    def test_invalid_reply_falls_back(self, _, name, side_effect, expected):
+        patch = mock.patch.object(
+            ParseClient, name, autospec=True, side_effect=side_effect)
+
+        result, stderr = self._main(5, patch)
+
+        self.assertEqual(0, result)
+        self.assertIn(expected, stderr)
+        self.assertIn("parsing in this process", stderr)
+
+    def test_failure_after_first_chunk_parses_remaining_files(self):
+        calls = []
+        original = ParseClient.call_batch
+
+        def call_batch(client, values):
+            calls.append(len(values))
+            if 1 < len(calls):
+                raise RuntimeError("-32603: Failed.")
+            return original(client, values)
+
+        patch = mock.patch.object(
+            ParseClient, "call_batch", autospec=True, side_effect=call_batch)
+
+        result, stderr = self._main(5, patch)
+
+        self.assertEqual(0, result)
+        self.assertEqual([2, 2], calls)
+        self.assertIn("-32603: Failed.", stderr)
+        self.assertEqual(1, stderr.count("parsing in this process"))
@@ -0,0 +1,117 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# pylint: disable=C0115
+# pylint: disable=C0116
+# type: ignore
+
+"""test_dictionary"""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from parameterized import parameterized
+
+from biz.dfch.ste100parser import GrammarType, Pipeline
+from biz.dfch.ste100parser.dictionary import Dictionary
+from biz.dfch.ste100parser.transformer import TextTransformer
+from biz.dfch.ste100parser.transformer.transformer_base import (
+    TransformerConfiguration,
+)
+
+
+class TestDictionary(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.sut = Dictionary([
+            "valve", "Check", "left-hand", "e.g.", "approx.", "", "  ",
+        ])
+
+    @parameterized.expand([
+        ("valve", True),
+        ("Valve", True),
+        ("VALVE", True),
+        ("check", True),
+        ("valve.", False),
+        ("valves", False),
+        ("e.g.", True),
+        ("E.g.", True),
+        ("E.G.", False),
+        ("e.g", False),
+        ("approx.", True),
+        ("left-hand", True),
+        ("check-valve", True),
+        ("Check-Valve", True),
+        ("check-door", False),
+        ("check-", False),
+        ("-", False),
+        ("door", False),
+    ])
+    def test_contains(self, value, expected):
+
+        self.assertEqual(expected, value in self.sut)
+        self.assertEqual(expected, self.sut.contains(value))
+
+    def test_len_and_info(self):
+
+        result = self.sut.get_info()
+
+        self.assertEqual(5, len(self.sut))
+        self.assertEqual(3, result.words)
+        self.assertEqual(2, result.abbreviations)
+        self.assertLess(0, result.size)
+
+    def test_from_file(self):
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "words.txt"
+            path.write_text(
+                "# Comment\n\nvalve\n  # Indented comment\nNr.\n",
+                encoding="utf-8")
+
+            sut = Dictionary.from_file(path)
+
+        self.assertEqual(2, len(sut))
+        self.assertIn("valve", sut)
+        self.assertIn("Nr.", sut)
+        self.assertNotIn("# Comment", sut)
+
+    def test_default(self):
+
+        result = Dictionary.get_default()
+
+        self.assertIs(result, Dictionary.get_default())
+        self.assertIn("the", result)
+        self.assertIn("e.g.", result)
+        self.assertNotIn("the.", result)
+
+    @parameterized.expand([
+        ("default", None, ["Nr", "."]),
+        ("custom", Dictionary(["Nr."]), ["Nr."]),
+    ])
+    def test_text_transformer(self, _, dictionary, expected):
+
+        text = TextTransformer(
+            TransformerConfiguration(), dictionary=dictionary)
+        sut = Pipeline(GrammarType.CONTAINER_LALR, text=text)
+
+        result = sut.invoke("See Nr.")
+
+        words = [
+            str(node.children[0]) for node in result.iter_subtrees_topdown()
+            if node.data in ("WORD", "EOS")
+        ]
+        self.assertEqual(["See"] + expected, words)
@@ -0,0 +1,200 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# pylint: disable=C0115
+# pylint: disable=C0116
+# type: ignore
+
+"""test_incremental_parser"""
+
+from lark import Token as LarkToken
+from lark.exceptions import UnexpectedInput
+from parameterized import parameterized
+
+from biz.dfch.ste100parser import GrammarType, Parser
+from biz.dfch.ste100parser.incremental_parser import IncrementalParser
+from biz.dfch.ste100parser.incremental_parser import TextEdit
+from biz.dfch.ste100parser.transformer import ContainerTransformer
+from biz.dfch.ste100parser.transformer import TextTransformer
+from biz.dfch.ste100parser.transformer.transformer_base import (
+    TransformerConfiguration,
+)
+
+from tests.test_case_base import TestCaseBase
+from tests.test_data.test_data import TestData
+
+
+class TestIncrementalParser(TestCaseBase):
+    """
+    IncrementalParser must create the same tree as a full parse with
+    ContainerTransformer and TextTransformer, with the same positions.
+    """
+
+    _grammar = GrammarType.CONTAINER_LALR
+    _parser = None
+
+    _document = (
+        "# Heading\n"
+        "\n"
+        "This is para1. It has two sentences.\n"
+        "\n"
+        "1. Do this.\n"
+        "2. Do that.\n"
+        "\n"
+        "NOTE: This is a note.\n"
+        "\n"
+        "> This is a cite.\n"
+        "\n"
+        "This is para2 (with\n"
+        "\n"
+        "a blank line in parentheses).\n"
+        "\n"
+        "This is para3.\n"
+    )
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        if cls._parser is None:
+            cls._parser = Parser(cls._grammar)
+
+    def setUp(self) -> None:
+        self.sut = IncrementalParser(self._grammar)
+
+    def get_expected(self, text: str):
+        tree = self._parser.invoke(text)
+        tree = ContainerTransformer(TransformerConfiguration()).transform(tree)
+        return TextTransformer(TransformerConfiguration()).transform(tree)
+
+    def get_positions(self, tree):
+        result = []
+        for node in tree.iter_subtrees_topdown():
+            result.append((node.data,) + tuple(
+                getattr(node.meta, name, None)
+                for name in (
+                    "line", "column", "start_pos",
+                    "end_line", "end_column", "end_pos",
+                )
+            ))
+            result.extend(
+                (
+                    child.type, child.line, child.column, child.start_pos,
+                    child.end_line, child.end_column, child.end_pos
+                )
+                for child in node.children if isinstance(child, LarkToken)
+            )
+        return result
+
+    def assert_same_tree(self, result):
+        expected = self.get_expected(self.sut.text)
+
+        self.assertEqual(expected, result)
+        self.assertEqual(
+            self.get_positions(expected), self.get_positions(result))
+
+    @parameterized.expand([(item.name, item.value) for item in TestData])
+    def test_invoke(self, _, filename):
+
+        result = self.sut.invoke(self.load_test_data(filename))
+
+        self.assert_same_tree(result)
+        self.assertIs(result, self.sut.tree)
+
+    @parameterized.expand([
+        ("insert_word", "para1.", "para1. More", 1),
+        ("delete_word", " It has two sentences.", "", 1),
+        ("new_line_in_proc", "2. Do that.", "2. Do that.\n3. Done.", 1),
+        ("change_note", "a note.", "an important note.", 1),
+        ("split_paragraph", "para1. It", "para1.\n\nIt", 2),
+        ("join_paragraphs", ").\n\nThis is para3.", "). Para3.", 1),
+        ("blank_line_in_paren", "(with\n\na", "(with a", 1),
+        ("heading", "# Heading", "## Other heading", 1),
+        ("append", "para3.\n", "para3.\n\nThis is para4.\n", 2),
+        ("prepend", "# Heading", "Intro.\n\n# Heading", 1),
+    ])
+    def test_edit(self, _, old, new, parsed_chunks):
+
+        self.sut.invoke(self._document)
+        start_pos = self._document.index(old)
+
+        result = self.sut.edit(
+            TextEdit(start_pos, start_pos + len(old), new))
+
+        self.assertEqual(self._document.replace(old, new, 1), self.sut.text)
+        self.assert_same_tree(result)
+        self.assertEqual(parsed_chunks, self.sut.parsed_chunks)
+
+    def test_many_edits(self):
+
+        self.sut.invoke(self._document)
+
+        for i in range(1, 20):
+            text = self.sut.text
+            start_pos = text.index("para1.")
+            result = self.sut.edit(TextEdit(start_pos, start_pos, f"W{i} "))
+
+            self.assert_same_tree(result)
+            self.assertEqual(1, self.sut.parsed_chunks)
+
+        start_pos = self.sut.text.index("W19")
+        result = self.sut.edit(TextEdit(0, start_pos, "Start "))
+
+        self.assert_same_tree(result)
+
+    def test_same_paragraph_twice(self):
+
+        self.sut.invoke("A.\n\nB.\n\nA.")
+
+        result = self.sut.edit(TextEdit(0, 0, "A.\n\n"))
+
+        self.assert_same_tree(result)
+        self.assertEqual(1, self.sut.parsed_chunks)
+
+    def test_invalid_edit_raises_and_next_edit_succeeds(self):
+
+        self.sut.invoke(self._document)
+        start_pos = self._document.index("This is para3.")
+
+        with self.assertRaises(UnexpectedInput) as expected:
+            self._parser.invoke(
+                self._document[:start_pos] + "*" + self._document[start_pos:])
+        with self.assertRaises(UnexpectedInput) as result:
+            self.sut.edit(TextEdit(start_pos, start_pos, "*"))
+
+        self.assertEqual(expected.exception.line, result.exception.line)
+        self.assertEqual(expected.exception.column, result.exception.column)
+        self.assertIsNone(self.sut.tree)
+
+        result = self.sut.edit(TextEdit(start_pos, start_pos + 1, ""))
+
+        self.assertEqual(self._document, self.sut.text)
+        self.assert_same_tree(result)
+        self.assertEqual(0, self.sut.parsed_chunks)
+
+    def test_edit_before_invoke_throws(self):
+
+        with self.assertRaises(AssertionError):
+            self.sut.edit(TextEdit(0, 0, "A."))
+
+    @parameterized.expand([
+        (-1, 0),
+        (2, 1),
+        (0, 100),
+    ])
+    def test_edit_with_invalid_range_throws(self, start_pos, end_pos):
+
+        self.sut.invoke("A.\n\nB.")
+
+        with self.assertRaises(AssertionError):
+            self.sut.edit(TextEdit(start_pos, end_pos, "C"))
@@ -0,0 +1,185 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# pylint: disable=C0115
+# pylint: disable=C0116
+# type: ignore
+
+"""test_interner"""
+
+import unittest
+
+from lark import Tree
+from lark.tree import Meta
+from parameterized import parameterized
+
+from biz.dfch.ste100parser import Dictionary, GrammarType, Interner, Pipeline
+from biz.dfch.ste100parser.transformer import TextTransformer
+
+_PREAMBLE = (
+    "Read all of the instructions before you start the work.\n"
+    "\n"
+    "NOTE: Keep the used parts for the inspection.\n"
+    "\n"
+)
+
+
+def _get_meta(start_pos: int, end_pos: int) -> Meta:
+    meta = Meta()
+    meta.empty = False
+    meta.line = 1
+    meta.column = start_pos + 1
+    meta.start_pos = start_pos
+    meta.end_pos = end_pos
+    return meta
+
+
+def _get_leaves(tree: Tree) -> list[str]:
+    return list(tree.scan_values(lambda value: isinstance(value, str)))
+
+
+class TestInterner(unittest.TestCase):
+
+    def test_intern_returns_first_equal_string(self):
+        sut = Interner()
+        first = "".join(["val", "ve"])
+        second = "".join(["va", "lve"])
+
+        self.assertIs(first, sut.intern(first))
+        result = sut.intern(second)
+
+        self.assertIs(first, result)
+        info = sut.info()
+        self.assertEqual((1, 1), (info.strings, info.string_hits))
+        self.assertLess(0, info.saved_bytes)
+
+    @parameterized.expand([
+        ("other_rule", "sentence", _get_meta(0, 5)),
+        ("without_positions", "paragraph", Meta()),
+    ])
+    def test_get_key_returns_none(self, _, data, meta):
+        result = Interner.get_key(data, meta, "valve")
+
+        self.assertIsNone(result)
+
+    @parameterized.expand([
+        ("text", "pumps", _get_meta(0, 5), ""),
+        ("position", "valve", _get_meta(1, 6), ""),
+        ("options", "valve", _get_meta(0, 5), "other"),
+    ])
+    def test_get_key_changes(self, _, text, meta, options):
+        expected = Interner.get_key("paragraph", _get_meta(0, 5), "valve ")
+
+        result = Interner.get_key("paragraph", meta, text + " ", options)
+
+        self.assertNotEqual(expected, result)
+
+    def test_add_tree_keeps_first_tree(self):
+        sut = Interner()
+        key = Interner.get_key("paragraph", _get_meta(0, 5), "valve")
+        first = Tree("paragraph", ["valve"])
+
+        sut.add_tree(key, first)
+        result = sut.add_tree(key, Tree("paragraph", ["valve"]))
+
+        self.assertIs(first, result)
+        self.assertIs(first, sut.get_tree(key))
+        self.assertEqual((1, 1), (sut.info().trees, sut.info().tree_hits))
+
+    def test_clear(self):
+        sut = Interner()
+        sut.intern("valve")
+        sut.intern("".join(["val", "ve"]))
+
+        sut.clear()
+
+        self.assertEqual((0, 0, 0), (
+            sut.info().strings, sut.info().string_hits,
+            sut.info().saved_bytes))
+
+
+class TestPipelineInterner(unittest.TestCase):
+
+    def test_trees_equal_trees_without_interner(self):
+        documents = [
+            _PREAMBLE + "Open the valve.\n",
+            _PREAMBLE + "Close the valve.\n",
+            "Other text.\n\n" + _PREAMBLE,
+        ]
+        expected = Pipeline(GrammarType.CONTAINER_LALR)
+        sut = Pipeline(GrammarType.CONTAINER_LALR, interner=Interner())
+
+        for text in documents:
+            self.assertEqual(expected.invoke(text), sut.invoke(text))
+
+    def test_equal_containers_are_shared(self):
+        interner = Interner()
+        sut = Pipeline(GrammarType.CONTAINER_LALR, interner=interner)
+
+        first = sut.invoke(_PREAMBLE + "Open the valve.\n")
+        second = sut.invoke(_PREAMBLE + "Close the valve.\n")
+
+        self.assertIs(first.children[0], second.children[0])
+        self.assertIsNot(first.children[-1], second.children[-1])
+        self.assertLess(0, interner.info().tree_hits)
+
+    def test_containers_at_other_positions_are_not_shared(self):
+        interner = Interner()
+        sut = Pipeline(GrammarType.CONTAINER_LALR, interner=interner)
+
+        first = sut.invoke(_PREAMBLE)
+        second = sut.invoke("Other text.\n\n" + _PREAMBLE)
+
+        self.assertEqual(0, interner.info().tree_hits)
+        self.assertEqual(
+            first.children[0].meta.start_pos + len("Other text.\n\n"),
+            second.children[1].meta.start_pos)
+
+    def test_leaf_strings_are_shared(self):
+        sut = Pipeline(GrammarType.CONTAINER_LALR, interner=Interner())
+
+        first = sut.invoke("Open the valve.\n")
+        second = sut.invoke("Close the valve.\n")
+
+        leaves = {id(item): item for item in _get_leaves(first)}
+        shared = [
+            item for item in _get_leaves(second)
+            if id(item) in leaves
+        ]
+        self.assertIn("valve", shared)
+
+    def test_other_dictionary_does_not_share_containers(self):
+        interner = Interner()
+        Pipeline(GrammarType.CONTAINER_LALR, interner=interner).invoke(
+            _PREAMBLE)
+        text = TextTransformer(dictionary=Dictionary(["read", "note"]))
+        sut = Pipeline(
+            GrammarType.CONTAINER_LALR, text=text, interner=interner)
+
+        sut.invoke(_PREAMBLE)
+
+        self.assertEqual(0, interner.info().tree_hits)
+
+    def test_eager_positions_only_share_strings(self):
+        interner = Interner()
+        sut = Pipeline(
+            GrammarType.CONTAINER_LALR, lazy_positions=False,
+            interner=interner)
+
+        sut.invoke(_PREAMBLE)
+        sut.invoke(_PREAMBLE)
+
+        self.assertEqual(0, interner.info().trees)
+        self.assertLess(0, interner.info().string_hits)
@@ -0,0 +1,148 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# pylint: disable=C0115
+# pylint: disable=C0116
+# type: ignore
+
+"""test_line_index"""
+
+import pickle
+import unittest
+from pathlib import Path
+
+from parameterized import parameterized
+
+from biz.dfch.ste100parser import GrammarType, Pipeline
+from biz.dfch.ste100parser.line_index import LazyMeta, LineIndex
+from tests.test_data.test_data import TestData
+
+_TEST_DATA = Path(__file__).parent / "test_data"
+
+_POSITIONS = ("line", "column", "start_pos", "end_pos", "end_line",
+              "end_column")
+
+
+class TestLineIndex(unittest.TestCase):
+
+    @parameterized.expand([
+        ("", 0, (1, 1)),
+        ("abc", 0, (1, 1)),
+        ("abc", 3, (1, 4)),
+        ("ab\ncd", 2, (1, 3)),
+        ("ab\ncd", 3, (2, 1)),
+        ("ab\ncd", 5, (2, 3)),
+        ("ab\n\ncd\n", 4, (3, 1)),
+        ("ab\n\ncd\n", 7, (4, 1)),
+    ])
+    def test_get_line_column(self, text, pos, expected):
+        sut = LineIndex(text)
+
+        result = sut.get_line_column(pos)
+
+        self.assertEqual(expected, result)
+
+    @parameterized.expand([
+        ("abc", 2, 3),
+        ("\U0001F600bc", 1, 3),
+        ("\U0001F600bc", 2, 4),
+        ("ab\n\U0001F600\U0001F600c", 5, 5),
+        ("äöü", 3, 4),
+    ])
+    def test_get_utf16_column(self, text, pos, expected):
+        sut = LineIndex(text)
+
+        result = sut.get_utf16_column(pos)
+
+        self.assertEqual(expected, result)
+
+    def test_lines(self):
+        self.assertEqual(3, LineIndex("a\nb\n").lines)
+
+    def test_lazy_meta(self):
+        text = "ab\ncd\U0001F600ef"
+        sut = LineIndex(text).get_meta(3, 8)
+
+        self.assertIsInstance(sut, LazyMeta)
+        self.assertEqual({}, sut.__dict__)
+
+        self.assertEqual(2, sut.line)
+        self.assertEqual(1, sut.column)
+        self.assertEqual(2, sut.end_line)
+        self.assertEqual(6, sut.end_column)
+        self.assertEqual(7, sut.utf16_end_column)
+
+        sut.line += 1
+        self.assertEqual(3, sut.line)
+        self.assertFalse(hasattr(sut, "container_line"))
+
+    def test_lazy_meta_pickle(self):
+        sut = LineIndex("ab\ncd").get_meta(3, 5)
+
+        result = pickle.loads(pickle.dumps(sut))
+
+        self.assertEqual(3, result.start_pos)
+        self.assertEqual(5, result.end_pos)
+        self.assertEqual((2, 1), (result.line, result.column))
+
+    @parameterized.expand([
+        (item.name, item.value, grammar)
+        for item in TestData
+        for grammar in (GrammarType.CONTAINER, GrammarType.CONTAINER_LALR)
+    ])
+    def test_pipeline_positions_are_the_same(self, _, name, grammar):
+        text = (_TEST_DATA / name).read_text(encoding="utf-8")
+        line_index = LineIndex(text)
+
+        expected = Pipeline(grammar, lazy_positions=False).invoke(text)
+        result = Pipeline(grammar).invoke(text)
+
+        self.assertEqual(expected, result)
+        for node, other in zip(
+            expected.iter_subtrees_topdown(), result.iter_subtrees_topdown()
+        ):
+            values = {
+                attr: getattr(node.meta, attr)
+                for attr in _POSITIONS if hasattr(node.meta, attr)
+            }
+            # The Earley lexer ends a token that ends with a line break on
+            # the line of the line break, a LazyMeta on the next line.
+            if (
+                GrammarType.CONTAINER == grammar and
+                isinstance(other.meta, LazyMeta) and
+                "end_line" in values and
+                text[node.meta.end_pos - 1] == "\n"
+            ):
+                line, column = line_index.get_line_column(
+                    node.meta.end_pos - 1)
+                self.assertEqual(
+                    (line, column + 1),
+                    (values["end_line"], values["end_column"]))
+                values["end_line"], values["end_column"] = (
+                    line_index.get_line_column(node.meta.end_pos))
+            for attr, value in values.items():
+                self.assertEqual(
+                    value, getattr(other.meta, attr), f"{node.data}.{attr}")
+
+    def test_pipeline_creates_lazy_metas(self):
+        result = Pipeline(GrammarType.CONTAINER_LALR).invoke("A test.\n")
+
+        metas = [node.meta for node in result.iter_subtrees()]
+
+        self.assertTrue(any(isinstance(meta, LazyMeta) for meta in metas))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,204 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# pylint: disable=C0115
+# pylint: disable=C0116
+# type: ignore
+
+"""test_main"""
+
+import contextlib
+import io
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from parameterized import parameterized
+
+from biz.dfch.ste100parser import GrammarType, Pipeline
+from biz.dfch.ste100parser.__main__ import main
+from biz.dfch.ste100parser.serializer import DictSerializer
+
+_TEXT = "First paragraph.\n\nSecond paragraph.\n"
+
+
+class _ClosedPipe(io.StringIO):
+    """Standard output after the reader closed the pipe."""
+
+    def write(self, s):
+        raise BrokenPipeError(32, "Broken pipe")
+
+
+class TestMain(unittest.TestCase):
+
+    def setUp(self) -> None:
+        # pylint: disable=R1732
+        self.directory = tempfile.TemporaryDirectory()
+        self.root = Path(self.directory.name)
+
+        (self.root / "a.md").write_text(_TEXT, encoding="utf-8")
+        (self.root / "sub").mkdir()
+        (self.root / "sub" / "b.md").write_text("Text.\n", encoding="utf-8")
+        (self.root / "sub" / "c.txt").write_text("Text.\n", encoding="utf-8")
+        (self.root / "invalid.md").write_text(" text", encoding="utf-8")
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def _main(self, argv: list[str], stdin: str | None = None):
+        stdout = io.StringIO()
+        stderr = io.StringIO()
+        with (
+            contextlib.redirect_stdout(stdout),
+            contextlib.redirect_stderr(stderr),
+            mock.patch("sys.stdin", io.StringIO(stdin or "")),
+        ):
+            result = main(argv)
+
+        return result, stdout.getvalue(), stderr.getvalue()
+
+    @parameterized.expand([
+        ("file", ["a.md"], ["a.md"]),
+        ("directory", ["sub"], ["sub/b.md"]),
+        ("glob", ["**/*.md"], ["a.md", "invalid.md", "sub/b.md"]),
+        ("no_duplicates", ["a.md", "a.md", "*.md"], ["a.md", "invalid.md"]),
+    ])
+    def test_paths(self, _, values, expected):
+        argv = ["parse", "-j", "1", "-f", "none"]
+        argv.extend(str(self.root / value) for value in values)
+
+        _, stdout, _ = self._main(argv)
+
+        sources = [
+            line.split(": ")[0] for line in stdout.splitlines()
+            if not line.startswith(" ")]
+        self.assertEqual([str(self.root / item) for item in expected], sources)
+
+    def test_json(self):
+        path = self.root / "a.md"
+
+        result, stdout, stderr = self._main(
+            ["parse", "-j", "1", "-f", "json", "-t", str(path),
+             str(self.root / "invalid.md")])
+
+        self.assertEqual(1, result)
+        lines = [json.loads(line) for line in stdout.splitlines()]
+        self.assertEqual(str(path), lines[0]["source"])
+        self.assertTrue(lines[0]["ok"])
+        self.assertLessEqual(0, lines[0]["seconds"])
+        self.assertEqual(
+            DictSerializer().invoke(
+                Pipeline(GrammarType.CONTAINER_LALR).invoke(_TEXT)),
+            lines[0]["tree"])
+        self.assertFalse(lines[1]["ok"])
+        self.assertTrue(lines[1]["error"].startswith("UnexpectedToken"))
+        self.assertIn("1 OK, 1 failed in ", stderr)
+
+    def test_tree_and_timing(self):
+        result, stdout, _ = self._main(
+            ["parse", "-j", "1", "-t", str(self.root / "sub")])
+
+        self.assertEqual(0, result)
+        lines = stdout.splitlines()
+        self.assertRegex(lines[0], r": OK \(\d+\.\d ms\)$")
+        self.assertEqual("start", lines[1])
+        self.assertEqual("  paragraph", lines[2])
+
+    def test_stdin_streams_items(self):
+        result, stdout, stderr = self._main(
+            ["parse", "-f", "json"], stdin=_TEXT)
+
+        self.assertEqual(0, result)
+        lines = [json.loads(line) for line in stdout.splitlines()]
+        self.assertEqual([0, 1], [line["index"] for line in lines])
+        self.assertEqual(18, lines[1]["tree"]["start_pos"])
+        self.assertIn("<stdin>: 2 items", stderr)
+
+    def test_stdin_error(self):
+        result, stdout, _ = self._main(["parse", "-", "-f", "none"], " text")
+
+        self.assertEqual(1, result)
+        self.assertTrue(stdout.startswith("<stdin>: ERROR"))
+
+    def test_stdin_other_grammar(self):
+        result, stdout, _ = self._main(
+            ["parse", "-g", "WORD", "-f", "json"], stdin="hello\n")
+
+        self.assertEqual(0, result)
+        value = json.loads(stdout)
+        self.assertEqual("<stdin>", value["source"])
+        self.assertEqual("hello", value["tree"]["children"][0]["value"])
+
+    def test_stdin_closed_pipe(self):
+        stderr = io.StringIO()
+        with (
+            contextlib.redirect_stdout(_ClosedPipe()),
+            contextlib.redirect_stderr(stderr),
+            mock.patch("sys.stdin", io.StringIO(_TEXT)),
+        ):
+            result = main(["parse", "-f", "json"])
+
+        self.assertEqual(1, result)
+        self.assertEqual("", stderr.getvalue())
+
+    def test_stdin_with_files_fails(self):
+        stderr = io.StringIO()
+        with (
+            contextlib.redirect_stderr(stderr),
+            self.assertRaises(SystemExit) as context,
+        ):
+            main(["parse", "-", str(self.root / "a.md")])
+
+        self.assertEqual(2, context.exception.code)
+        self.assertIn("'-' must be the only input.", stderr.getvalue())
+
+    @parameterized.expand([
+        ("stats", ["--stats"], "--stats"),
+        ("jobs", ["-j", "2"], "--jobs"),
+        ("cache_dir", ["--cache-dir", "cache"], "--cache-dir"),
+        ("daemon", ["--daemon"], "--daemon"),
+    ])
+    def test_stdin_with_file_option_fails(self, _, options, expected):
+        stderr = io.StringIO()
+        with (
+            contextlib.redirect_stderr(stderr),
+            mock.patch("sys.stdin", io.StringIO(_TEXT)),
+            self.assertRaises(SystemExit) as context,
+        ):
+            main(["parse", "-", *options])
+
+        self.assertEqual(2, context.exception.code)
+        self.assertIn(
+            f"{expected} cannot be used with the standard input.",
+            stderr.getvalue())
+
+    def test_no_files(self):
+        result, _, stderr = self._main(
+            ["parse", str(self.root / "*.missing")])
+
+        self.assertEqual(1, result)
+        self.assertIn("No files found.", stderr)
+
+    def test_without_command_prints_help(self):
+        result, stdout, _ = self._main([])
+
+        self.assertEqual(0, result)
+        self.assertTrue(stdout.startswith("usage: ste100-parser"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# pylint: disable=C0116
+# pylint: disable=W0212
+# type: ignore
+
+"""test_parser_cache"""
+
+from concurrent.futures import ThreadPoolExecutor
+import unittest
+
+from biz.dfch.ste100parser import Parser, GrammarType
+
+
+class TestParserCache(unittest.TestCase):
+    """TestParserCache"""
+
+    def setUp(self):
+        Parser.clear_cache()
+
+    def tearDown(self):
+        Parser.clear_cache()
+
+    def test_same_grammar_returns_cached_lark(self):
+
+        sut1 = Parser(GrammarType.INT)
+        sut2 = Parser(GrammarType.INT)
+
+        self.assertIs(sut1._lark, sut2._lark)
+
+        result = Parser.cache_info()
+        self.assertEqual(1, result.hits)
+        self.assertEqual(1, result.misses)
+        self.assertEqual(1, result.size)
+
+    def test_different_grammar_returns_different_lark(self):
+
+        sut1 = Parser(GrammarType.INT)
+        sut2 = Parser(GrammarType.FP)
+
+        self.assertIsNot(sut1._lark, sut2._lark)
+
+        result = Parser.cache_info()
+        self.assertEqual(0, result.hits)
+        self.assertEqual(2, result.misses)
+        self.assertEqual(2, result.size)
+
+    def test_clear_cache(self):
+
+        sut1 = Parser(GrammarType.INT)
+
+        Parser.clear_cache()
+
+        result = Parser.cache_info()
+        self.assertEqual(0, result.hits)
+        self.assertEqual(0, result.misses)
+        self.assertEqual(0, result.size)
+
+        sut2 = Parser(GrammarType.INT)
+
+        self.assertIsNot(sut1._lark, sut2._lark)
+        self.assertEqual(1, Parser.cache_info().misses)
+
+    def test_concurrent_construction_compiles_once(self):
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            parsers = list(executor.map(
+                lambda _: Parser(GrammarType.NUMBER), range(32)))
+
+        self.assertEqual(1, len({id(p._lark) for p in parsers}))
+
+        result = Parser.cache_info()
+        self.assertEqual(31, result.hits)
+        self.assertEqual(1, result.misses)
+
+        self.assertTrue(parsers[0].is_valid("-42"))
@@ -0,0 +1,171 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# pylint: disable=C0115
+# pylint: disable=C0116
+# type: ignore
+
+"""test_parser_container_lalr"""
+
+from parameterized import parameterized
+
+from lark import Tree
+
+from biz.dfch.ste100parser import GrammarType, Parser, Pipeline, Token
+from biz.dfch.ste100parser.transformer import ContainerTransformer
+from biz.dfch.ste100parser.transformer import TextTransformer
+
+from tests.test_case_base import TestCaseBase
+from tests.test_data.test_data import TestData
+
+
+class TestParserContainerLalr(TestCaseBase):
+    """
+    The CONTAINER_LALR grammar must create the same token tree as the
+    CONTAINER grammar.
+    """
+
+    _earley = None
+    _lalr = None
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls._earley = Parser(GrammarType.CONTAINER)
+        cls._lalr = Parser(GrammarType.CONTAINER_LALR)
+
+    def get_positions(self, tree):
+        return [
+            (node.data,) + tuple(
+                getattr(node.meta, name, None)
+                for name in ("line", "column", "start_pos", "end_pos")
+            )
+            for node in tree.iter_subtrees_topdown()
+        ]
+
+    def assert_same_pipeline(self, value: str):
+        expected = Pipeline(GrammarType.CONTAINER).invoke(value)
+        result = Pipeline(GrammarType.CONTAINER_LALR).invoke(value)
+
+        self.assertEqual(expected, result)
+        self.assertEqual(
+            self.get_positions(expected), self.get_positions(result))
+
+    def get_start(self, parser: Parser, value: str):
+        """
+        `?start` does not wrap a single item, but the Earley parser can
+        split it into several items. Like Pipeline, always use `start`.
+        """
+
+        result = parser.invoke(value)
+        if Token.start.name != result.data:
+            result = Tree(Token.start.name, [result], meta=result.meta)
+
+        return result
+
+    def get_container_tree(self, parser: Parser, value: str):
+        initial = self.get_start(parser, value)
+        transformed = ContainerTransformer().transform(initial)
+
+        return self.get_token_tree(transformed)
+
+    def get_text_tree(self, parser: Parser, value: str):
+        initial = self.get_start(parser, value)
+        pass1 = ContainerTransformer().transform(initial)
+        transformed = TextTransformer().transform(pass1)
+
+        return self.get_token_tree(transformed)
+
+    def assert_equivalent(self, value: str):
+        expected = self.get_container_tree(self._earley, value)
+        result = self.get_container_tree(self._lalr, value)
+        self.assertEqual(expected, result)
+
+        expected = self.get_text_tree(self._earley, value)
+        result = self.get_text_tree(self._lalr, value)
+        self.assertEqual(expected, result)
+
+    @parameterized.expand([(item.name, item.value) for item in TestData])
+    def test_test_data(self, _, filename):
+
+        value = self.load_test_data(filename)
+
+        self.assert_equivalent(value)
+
+    @parameterized.expand([
+        ("Peter's cat.",),
+        ("'Peter's cat.' in squote.",),
+        ('"Manufacturers\' regulations" in squote.',),
+        ("This is 's quoted text'",),
+        ('"`"',),
+        ("text-in*_bold-emph_*",),
+        ("a * b",),
+        ("This is a paragraph.\nNOTE: This is a note.\n\n",),
+        ("This is a paragraph.\n> This is a citation.\n\n",),
+        ("\n1. This is work step 1.\nWARNING: This is a warning.\n\n",),
+        ("\n1. This is work step 1.\n\nThis is a paragraph.\n\n",),
+        ("# This-is-a-heading\n\n## This-is-a-heading\n\nText.\n",),
+        ("Para-start:\n 1A First\n1B Second\n 1C Last.\nPara-end.",),
+        ("That *a*.\nB.\n",),
+        ("That (a).\nB.\n",),
+        ("Not (or (a)).\nSwitch must.\n",),
+        ("A.\n",),
+        ("A.\n\n\n",),
+        ("# This-is-a-heading\n",),
+    ])
+    def test_snippet(self, value):
+
+        self.assert_equivalent(value)
+
+    # Generated with benchmarks.synthetic.generate(200, seed). The Earley
+    # parser is slow on larger documents.
+    @parameterized.expand([(f"synthetic_{seed}.md",) for seed in range(6)])
+    def test_synthetic(self, filename):
+
+        value = self.load_test_data(filename)
+
+        self.assert_same_pipeline(value)
+
+    @parameterized.expand([
+        ("A.\n",),
+        ("A.\n\n\n",),
+        ("A.\nB.\n",),
+        ("A.\n\nB.\n",),
+        ("That *a*.\nB.\n",),
+        ("# H\n\nA.\n",),
+    ])
+    def test_line_break_at_end(self, value):
+
+        self.assert_same_pipeline(value)
+
+    @parameterized.expand([
+        ("",),
+        (" text",),
+        ("\n 1. some-text",),
+        ('"(round\nbrackets)"',),
+        ("_some-emph\nmore-emph_ ",),
+    ])
+    def test_invalid(self, value):
+
+        self.assertFalse(self._earley.is_valid(value))
+        self.assertFalse(self._lalr.is_valid(value))
+
+    def test_large_document(self):
+
+        value = self.load_test_data(
+            TestData.COMPLEX_HEADINGS_PROC_CITE_PARA_LIST)
+
+        result = self._lalr.invoke("\n".join([value] * 20))
+
+        self.assertEqual(Token.start.name, result.data)
@@ -0,0 +1,136 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# pylint: disable=C0116
+# pylint: disable=W0212
+# type: ignore
+
+"""test_parser_disk_cache"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from biz.dfch.ste100parser import Parser, GrammarType
+from biz.dfch.ste100parser.grammar import GrammarCache
+from biz.dfch.ste100parser.grammar.standalone_grammar import (
+    StandaloneGrammar
+)
+
+
+class TestParserDiskCache(unittest.TestCase):
+    """TestParserDiskCache"""
+
+    _options = Parser._options[GrammarType.CONTAINER_LALR]
+
+    def setUp(self):
+        Parser.clear_cache()
+        # Without the pregenerated module, the parser uses the disk cache.
+        patcher = mock.patch.object(
+            StandaloneGrammar, "load", return_value=None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self._temp = tempfile.TemporaryDirectory()  # pylint: disable=R1732
+        self.cache_dir = Path(self._temp.name) / "cache"
+
+    def tearDown(self):
+        Parser.clear_cache()
+        self._temp.cleanup()
+
+    def test_lalr_grammar_is_stored_and_loaded(self):
+
+        sut1 = Parser(GrammarType.CONTAINER_LALR, cache_dir=self.cache_dir)
+
+        files = list(self.cache_dir.glob("*.cache"))
+        self.assertEqual(1, len(files))
+        self.assertTrue(files[0].name.startswith("container_lalr-"))
+
+        Parser.clear_cache()
+        with mock.patch("lark.Lark.open") as lark_open:
+            sut2 = Parser(GrammarType.CONTAINER_LALR, cache_dir=self.cache_dir)
+            lark_open.assert_not_called()
+
+        value = "This is a paragraph.\nNOTE: This is a note.\n\n"
+        expected = sut1.invoke(value)
+        result = sut2.invoke(value)
+
+        self.assertEqual(expected, result)
+        self.assertEqual(
+            expected.children[0].meta.end_pos,
+            result.children[0].meta.end_pos)
+
+    def test_earley_grammar_is_not_stored(self):
+
+        sut = Parser(GrammarType.INT, cache_dir=self.cache_dir)
+
+        self.assertTrue(sut.is_valid("42"))
+        self.assertEqual([], list(self.cache_dir.glob("*")))
+
+    def test_environment_variable_sets_cache_dir(self):
+
+        with mock.patch.dict(
+                os.environ, {GrammarCache.ENV_CACHE_DIR: str(self.cache_dir)}):
+            Parser(GrammarType.CONTAINER_LALR)
+
+        self.assertEqual(1, len(list(self.cache_dir.glob("*.cache"))))
+
+    def test_damaged_file_is_recompiled(self):
+
+        sut = GrammarCache(self.cache_dir)
+        path = sut.get_path(GrammarType.CONTAINER_LALR, self._options)
+        self.cache_dir.mkdir()
+        path.write_bytes(b"damaged")
+
+        result = sut.load(GrammarType.CONTAINER_LALR, self._options)
+
+        self.assertEqual("start", result.parse("Text.\n\nText.").data)
+        self.assertNotEqual(b"damaged", path.read_bytes())
+
+    def test_changed_grammar_file_invalidates_cache(self):
+
+        grammar_dir = Path(self._temp.name) / "grammar"
+        shutil.copytree(
+            Path(GrammarCache(self.cache_dir)._grammar_dir), grammar_dir,
+            ignore=shutil.ignore_patterns("*.py", "__pycache__"))
+
+        sut = GrammarCache(self.cache_dir, grammar_dir)
+        sut.load(GrammarType.CONTAINER_LALR, self._options)
+        stale = sut.get_path(GrammarType.CONTAINER_LALR, self._options)
+
+        # Imported or unrelated grammar files are part of the key.
+        with (grammar_dir / GrammarType.WORD).open("a") as f:
+            f.write("\n// changed\n")
+
+        result = sut.get_path(GrammarType.CONTAINER_LALR, self._options)
+        self.assertNotEqual(stale, result)
+
+        sut.load(GrammarType.CONTAINER_LALR, self._options)
+
+        self.assertFalse(stale.exists())
+        self.assertTrue(result.exists())
+
+    def test_different_options_use_different_files(self):
+
+        sut = GrammarCache(self.cache_dir)
+
+        result1 = sut.get_path(GrammarType.CONTAINER_LALR, self._options)
+        result2 = sut.get_path(
+            GrammarType.CONTAINER_LALR,
+            {**self._options, "propagate_positions": True})
+
+        self.assertNotEqual(result1, result2)
@@ -0,0 +1,131 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# pylint: disable=C0115
+# pylint: disable=C0116
+# pylint: disable=W0212
+# type: ignore
+
+"""test_parser_standalone"""
+
+import importlib.util
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+from parameterized import parameterized
+from lark import Lark
+
+from biz.dfch.ste100parser import GrammarType, Parser
+from biz.dfch.ste100parser.grammar import GrammarCache
+from biz.dfch.ste100parser.grammar import standalone_grammar
+from biz.dfch.ste100parser.grammar.standalone_grammar import (
+    StandaloneGrammar
+)
+
+from tests.test_case_base import TestCaseBase
+from tests.test_data.test_data import TestData
+
+
+class TestParserStandalone(TestCaseBase):
+    """
+    The pregenerated parser must create the same tree as the parser that
+    compiles the grammar.
+    """
+
+    _grammar = GrammarType.CONTAINER_LALR
+    _options = Parser.get_options(GrammarType.CONTAINER_LALR)
+
+    _dynamic = None
+    _standalone = None
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        if cls._dynamic is None:
+            path = Path(standalone_grammar.__file__).parent / cls._grammar
+            cls._dynamic = Lark.open(str(path), **cls._options)
+        if cls._standalone is None:
+            cls._standalone = StandaloneGrammar.load(
+                cls._grammar, cls._options)
+
+    def setUp(self):
+        Parser.clear_cache()
+
+    def tearDown(self):
+        Parser.clear_cache()
+
+    def test_generated_module_is_up_to_date(self):
+
+        module = importlib.import_module(
+            StandaloneGrammar.get_module_name(self._grammar))
+
+        self.assertEqual(
+            GrammarCache.get_grammar_key(self._options),
+            module.GRAMMAR_KEY,
+            "Run `python -m biz.dfch.ste100parser.grammar.generated`.")
+
+    def test_parser_uses_generated_module(self):
+
+        with mock.patch("lark.Lark.open") as lark_open:
+            sut = Parser(self._grammar)
+            lark_open.assert_not_called()
+
+        self.assertTrue(sut.is_valid("Text."))
+
+    def test_out_of_date_module_is_not_used(self):
+
+        with mock.patch.object(
+                GrammarCache, "get_grammar_key", return_value="changed"):
+            result = StandaloneGrammar.load(self._grammar, self._options)
+
+        self.assertIsNone(result)
+
+    def test_earley_grammar_is_not_supported(self):
+
+        options = Parser.get_options(GrammarType.CONTAINER)
+
+        self.assertFalse(StandaloneGrammar.is_supported(options))
+        self.assertIsNone(StandaloneGrammar.load(
+            GrammarType.CONTAINER, options))
+
+    def test_write(self):
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = StandaloneGrammar.write(
+                self._grammar, self._options, directory)
+
+            spec = importlib.util.spec_from_file_location("generated", path)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+
+            result = module.load()
+
+        value = "This is a paragraph.\n> This is a citation.\n\n"
+        self.assertEqual(self._dynamic.parse(value), result.parse(value))
+
+    @parameterized.expand([(item.name, item.value) for item in TestData])
+    def test_test_data(self, _, filename):
+
+        value = self.load_test_data(filename)
+
+        expected = self._dynamic.parse(value)
+        result = self._standalone.parse(value)
+
+        self.assertEqual(expected, result)
+        self.assertEqual(
+            [(n.meta.line, n.meta.column, n.meta.end_pos)
+             for n in expected.iter_subtrees() if not n.meta.empty],
+            [(n.meta.line, n.meta.column, n.meta.end_pos)
+             for n in result.iter_subtrees() if not n.meta.empty])
@@ -0,0 +1,126 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# pylint: disable=C0115
+# pylint: disable=C0116
+# pylint: disable=W0212
+# type: ignore
+
+"""test_parser_validate"""
+
+import unittest
+from unittest import mock
+
+from parameterized import parameterized
+
+from biz.dfch.ste100parser import GrammarType, Parser, ValidationResult
+
+_TEXT = "# Heading\n\nFirst paragraph.\n\nSecond (paragraph), with words.\n"
+
+_INVALID = [
+    ("leading_space", " text"),
+    ("unclosed_bold", "**bold"),
+    ("unclosed_paren", "First paragraph.\n\nSecond (paragraph\n"),
+    ("unclosed_quote", "\"quote"),
+]
+
+
+class TestParserValidate(unittest.TestCase):
+
+    @parameterized.expand([
+        (GrammarType.CONTAINER_LALR,),
+        (GrammarType.CONTAINER,),
+    ])
+    def test_valid(self, grammar):
+        sut = Parser(grammar)
+
+        result = sut.validate(_TEXT)
+
+        self.assertEqual(ValidationResult(valid=True), result)
+
+    @parameterized.expand(_INVALID)
+    def test_invalid_agrees_with_invoke(self, _, text):
+        for grammar in (GrammarType.CONTAINER_LALR, GrammarType.CONTAINER):
+            with self.subTest(grammar=grammar):
+                sut = Parser(grammar)
+                with self.assertRaises(Exception):
+                    sut.invoke(text)
+
+                result = sut.validate(text)
+
+                self.assertFalse(result.valid)
+                self.assertFalse(sut.is_valid(text))
+                self.assertIsNotNone(result.error)
+                self.assertLess(0, len(result.expected))
+
+    @parameterized.expand([
+        ("start", " text", 0, 1, 1),
+        ("second_paragraph", "text\n\n text", 6, 3, 1),
+    ])
+    def test_error_position(self, _, text, pos, line, column):
+        sut = Parser(GrammarType.CONTAINER_LALR)
+
+        result = sut.validate(text)
+
+        self.assertEqual(
+            (pos, line, column), (result.pos, result.line, result.column))
+        self.assertIn("TEXT", result.expected)
+
+    @parameterized.expand([
+        (GrammarType.CONTAINER_LALR,),
+        (GrammarType.CONTAINER,),
+    ])
+    def test_error_at_end_of_input(self, grammar):
+        text = "First paragraph.\n\nSecond (paragraph"
+        sut = Parser(grammar)
+
+        result = sut.validate(text)
+
+        self.assertEqual(
+            (len(text), 3, len("Second (paragraph") + 1),
+            (result.pos, result.line, result.column))
+        self.assertIn("PAREN_CLOSE", result.expected)
+
+    @parameterized.expand([
+        ("valid", "-42", True),
+        ("invalid", "4 2", False),
+    ])
+    def test_other_grammar(self, _, text, expected):
+        sut = Parser(GrammarType.NUMBER)
+
+        result = sut.validate(text)
+
+        self.assertEqual(expected, result.valid)
+
+    def test_lalr_does_not_build_a_tree(self):
+        sut = Parser(GrammarType.CONTAINER_LALR)
+
+        with mock.patch.object(
+                sut._lark, "parse", side_effect=AssertionError):
+            result = sut.validate(_TEXT)
+
+        self.assertTrue(result.valid)
+
+    @parameterized.expand([
+        ("empty", ""),
+        ("whitespace", " \n"),
+        ("not_a_string", None),
+    ])
+    def test_is_valid_returns_false(self, _, text):
+        sut = Parser(GrammarType.CONTAINER_LALR)
+
+        result = sut.is_valid(text)
+
+        self.assertFalse(result)
@@ -0,0 +1,126 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# pylint: disable=C0115
+# pylint: disable=C0116
+# type: ignore
+
+"""test_pipeline"""
+
+from parameterized import parameterized
+
+from biz.dfch.ste100parser import GrammarType, Parser, Pipeline
+from biz.dfch.ste100parser.transformer import ContainerTransformer
+from biz.dfch.ste100parser.transformer import PipelineTransformer
+from biz.dfch.ste100parser.transformer import TextTransformer
+
+from tests.test_case_base import TestCaseBase
+from tests.test_data.test_data import TestData
+
+
+class TestPipeline(TestCaseBase):
+    """
+    Pipeline must create the same tree as Parser, ContainerTransformer and
+    TextTransformer.
+    """
+
+    _grammars = (GrammarType.CONTAINER, GrammarType.CONTAINER_LALR)
+
+    _parsers = {}
+    _pipelines = {}
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        for grammar in cls._grammars:
+            if grammar not in cls._parsers:
+                cls._parsers[grammar] = Parser(grammar)
+                cls._pipelines[grammar] = Pipeline(grammar)
+
+    def get_positions(self, tree):
+        return [
+            (
+                node.data,
+                getattr(node.meta, "line", None),
+                getattr(node.meta, "column", None),
+                getattr(node.meta, "start_pos", None),
+                getattr(node.meta, "end_pos", None),
+            )
+            for node in tree.iter_subtrees_topdown()
+        ]
+
+    def assert_equivalent(self, value: str):
+        for grammar in self._grammars:
+            initial = self._parsers[grammar].invoke(value)
+            pass1 = ContainerTransformer().transform(initial)
+            expected = TextTransformer().transform(pass1)
+
+            result = PipelineTransformer().transform(initial)
+
+            self.assertEqual(
+                self.get_token_tree(expected),
+                self.get_token_tree(result),
+                grammar)
+            self.assertEqual(
+                self.get_positions(expected),
+                self.get_positions(result),
+                grammar)
+
+    @parameterized.expand([(item.name, item.value) for item in TestData])
+    def test_test_data(self, _, filename):
+
+        value = self.load_test_data(filename)
+
+        self.assert_equivalent(value)
+
+    @parameterized.expand([
+        ("This is a paragraph.",),
+        ("First paragraph.\n\nSecond paragraph.\n",),
+        ("This is text,\nand more text.\nThis is the end.",),
+        ("This is a paragraph.\nNOTE: This is a note.\n\n",),
+        ("\n1. This is work step 1.\n\nThis is a paragraph.\n\n",),
+        ("Para-start:\n 1A First\n1B Second\n 1C Last.\nPara-end.",),
+        ('"Quoted (text in paren)." and *bold* text.',),
+    ])
+    def test_snippet(self, value):
+
+        self.assert_equivalent(value)
+
+    @parameterized.expand([(grammar.name, grammar) for grammar in _grammars])
+    def test_invoke(self, _, grammar):
+
+        value = "First paragraph.\n\nSecond paragraph.\n"
+
+        initial = self._parsers[grammar].invoke(value)
+        pass1 = ContainerTransformer().transform(initial)
+        expected = TextTransformer().transform(pass1)
+
+        result = self._pipelines[grammar].invoke(value)
+
+        self.assertEqual(expected, result)
+
+    def test_pipeline_is_reusable(self):
+
+        sut = self._pipelines[GrammarType.CONTAINER_LALR]
+
+        expected = sut.invoke("First paragraph.\n\nSecond paragraph.\n")
+        sut.invoke("Other text.")
+        result = sut.invoke("First paragraph.\n\nSecond paragraph.\n")
+
+        self.assertEqual(expected, result)
+
+    def test_invalid_grammar_throws(self):
+
+        with self.assertRaises(AssertionError):
+            Pipeline(GrammarType.WORD)
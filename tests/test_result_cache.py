@@ -0,0 +1,269 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# pylint: disable=C0115
+# pylint: disable=C0116
+# type: ignore
+
+"""test_result_cache"""
+
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from lark import Tree
+from lark.tree import Meta
+from parameterized import parameterized
+
+from biz.dfch.ste100parser import (
+    BatchParser,
+    Dictionary,
+    GrammarType,
+    Pipeline,
+    PipelineStats,
+    ResultCache,
+)
+from biz.dfch.ste100parser.binary_tree import dumps
+from biz.dfch.ste100parser.grammar.grammar_cache import GrammarCache
+from biz.dfch.ste100parser.line_index import LineIndex
+from biz.dfch.ste100parser.transformer import TextTransformer
+
+_TEXT = "First paragraph.\n\nSecond paragraph, with 2 words.\n"
+
+
+def _get_tree(value: str) -> Tree:
+    return Tree("start", [Tree("WORD", [value])])
+
+
+class TestResultCache(unittest.TestCase):
+
+    def test_get_returns_none_and_counts_miss(self):
+        sut = ResultCache()
+
+        result = sut.get("missing")
+
+        self.assertIsNone(result)
+        info = sut.info()
+        self.assertEqual((0, 1), (info.hits, info.misses))
+        self.assertEqual(0.0, info.hit_rate)
+
+    def test_get_returns_new_equal_tree(self):
+        sut = ResultCache()
+        tree = _get_tree("valve")
+        sut.put("key", tree)
+
+        first = sut.get("key")
+        second = sut.get("key")
+
+        self.assertEqual(tree, first)
+        self.assertEqual(tree, second)
+        self.assertIsNot(first, second)
+        info = sut.info()
+        self.assertEqual((2, 0, 0, 1), (
+            info.hits, info.disk_hits, info.misses, info.size))
+        self.assertEqual(1.0, info.hit_rate)
+
+    def test_lru_evicts_least_recently_used(self):
+        size = len(dumps(_get_tree("a")))
+        sut = ResultCache(max_bytes=2 * size)
+        sut.put("a", _get_tree("a"))
+        sut.put("b", _get_tree("b"))
+        sut.get("a")
+
+        sut.put("c", _get_tree("c"))
+
+        self.assertIsNotNone(sut.get("a"))
+        self.assertIsNone(sut.get("b"))
+        self.assertIsNotNone(sut.get("c"))
+        self.assertEqual(2 * size, sut.info().memory_bytes)
+
+    def test_entry_larger_than_memory_is_not_stored(self):
+        sut = ResultCache(max_bytes=10)
+
+        sut.put("a", _get_tree("a"))
+
+        self.assertEqual(0, sut.info().size)
+        self.assertIsNone(sut.get("a"))
+
+    def test_disk_tier_is_shared_between_instances(self):
+        with tempfile.TemporaryDirectory() as folder:
+            ResultCache(cache_dir=folder).put("key", _get_tree("valve"))
+            sut = ResultCache(cache_dir=folder)
+
+            result = sut.get("key")
+
+            self.assertEqual(_get_tree("valve"), result)
+            self.assertEqual(1, sut.info().disk_hits)
+            # The entry is in memory now.
+            sut.get("key")
+            self.assertEqual((2, 1), (sut.info().hits, sut.info().disk_hits))
+
+    def test_damaged_file_is_miss(self):
+        with tempfile.TemporaryDirectory() as folder:
+            Path(folder, f"key{ResultCache.SUFFIX}").write_bytes(b"invalid")
+            sut = ResultCache(cache_dir=folder)
+
+            self.assertIsNone(sut.get("key"))
+            self.assertEqual(1, sut.info().misses)
+
+    @parameterized.expand([
+        ("text", "Other text.\n", GrammarType.CONTAINER_LALR, ""),
+        ("grammar", _TEXT, GrammarType.CONTAINER, ""),
+        ("options", _TEXT, GrammarType.CONTAINER_LALR, "other"),
+    ])
+    def test_key_changes(self, _, text, grammar, options):
+        expected = ResultCache.get_key(_TEXT, GrammarType.CONTAINER_LALR)
+
+        result = ResultCache.get_key(text, grammar, options)
+
+        self.assertNotEqual(expected, result)
+        self.assertEqual(
+            expected, ResultCache.get_key(_TEXT, GrammarType.CONTAINER_LALR))
+
+    def test_grammar_files_are_read_once(self):
+        with mock.patch.dict(
+                ResultCache._grammar_keys,  # pylint: disable=W0212
+                clear=True), \
+                mock.patch.object(
+                    GrammarCache, "get_grammar_key",
+                    wraps=GrammarCache.get_grammar_key) as get_grammar_key:
+            for index in range(3):
+                ResultCache.get_key(
+                    f"Text {index}.", GrammarType.CONTAINER_LALR)
+
+        self.assertEqual(1, get_grammar_key.call_count)
+
+    def test_prune_by_age_removes_old_files(self):
+        with tempfile.TemporaryDirectory() as folder:
+            sut = ResultCache(cache_dir=folder)
+            sut.put("old", _get_tree("old"))
+            sut.put("new", _get_tree("new"))
+            old = Path(folder, f"old{ResultCache.SUFFIX}")
+            past = time.time() - 3600
+            os.utime(old, (past, past))
+
+            result = sut.prune(max_age=60)
+
+            self.assertEqual(1, result)
+            self.assertFalse(old.exists())
+            self.assertTrue(Path(folder, f"new{ResultCache.SUFFIX}").exists())
+
+    def test_prune_by_size_removes_least_recently_used_files(self):
+        with tempfile.TemporaryDirectory() as folder:
+            sut = ResultCache(cache_dir=folder)
+            now = time.time()
+            for index, name in enumerate(("a", "b", "c")):
+                sut.put(name, _get_tree(name))
+                path = Path(folder, f"{name}{ResultCache.SUFFIX}")
+                os.utime(path, (now - 10 + index, now - 10 + index))
+            size = path.stat().st_size
+
+            result = sut.prune(max_bytes=2 * size)
+
+            self.assertEqual(1, result)
+            self.assertEqual(
+                ["b.tree", "c.tree"],
+                sorted(item.name for item in Path(folder).iterdir()))
+            self.assertLessEqual(sut.info().memory_bytes, 2 * size)
+
+    def test_clear_resets_memory_and_statistics(self):
+        sut = ResultCache()
+        sut.put("key", _get_tree("valve"))
+        sut.get("key")
+
+        sut.clear()
+
+        self.assertEqual((0, 0, 0, 0), (
+            sut.info().hits, sut.info().misses, sut.info().size,
+            sut.info().memory_bytes))
+
+
+class TestPipelineCache(unittest.TestCase):
+
+    def test_invoke_returns_same_tree_with_positions(self):
+        expected = Pipeline(GrammarType.CONTAINER_LALR).invoke(_TEXT)
+        cache = ResultCache()
+        sut = Pipeline(GrammarType.CONTAINER_LALR, cache=cache)
+
+        sut.invoke(_TEXT)
+        result = sut.invoke(_TEXT)
+
+        self.assertEqual(expected, result)
+        self.assertEqual((1, 1), (cache.info().hits, cache.info().misses))
+        for expected_node, node in zip(
+                expected.iter_subtrees(), result.iter_subtrees()):
+            self.assertEqual(
+                getattr(expected_node.meta, "start_pos", None),
+                getattr(node.meta, "start_pos", None))
+
+    def test_invoke_without_lazy_positions_has_metas(self):
+        sut = Pipeline(
+            GrammarType.CONTAINER_LALR, lazy_positions=False,
+            cache=ResultCache())
+
+        expected = sut.invoke(_TEXT)
+        result = sut.invoke(_TEXT)
+
+        self.assertEqual(expected, result)
+        self.assertEqual(1, sut.cache.info().hits)
+        line_index = LineIndex(_TEXT)
+        for tree in (expected, result):
+            for node in tree.iter_subtrees():
+                self.assertIs(Meta, type(node.meta))
+        for node in result.iter_subtrees():
+            if not hasattr(node.meta, "start_pos"):
+                continue
+            self.assertEqual(
+                line_index.get_line_column(node.meta.start_pos),
+                (node.meta.line, node.meta.column))
+            self.assertEqual(
+                line_index.get_line_column(node.meta.end_pos),
+                (node.meta.end_line, node.meta.end_column))
+
+    def test_invoke_with_stats_measures_cache(self):
+        sut = Pipeline(GrammarType.CONTAINER_LALR, cache=ResultCache())
+        sut.invoke(_TEXT)
+        stats = PipelineStats()
+
+        sut.invoke(_TEXT, stats)
+
+        self.assertEqual(["cache"], list(stats.phases))
+        self.assertEqual(len(_TEXT), stats.characters)
+        self.assertLess(0, sum(stats.nodes.values()))
+
+    def test_other_dictionary_is_miss(self):
+        cache = ResultCache()
+        Pipeline(GrammarType.CONTAINER_LALR, cache=cache).invoke(_TEXT)
+        text = TextTransformer(dictionary=Dictionary(["first", "second"]))
+        sut = Pipeline(GrammarType.CONTAINER_LALR, text=text, cache=cache)
+
+        sut.invoke(_TEXT)
+
+        self.assertEqual((0, 2), (cache.info().hits, cache.info().misses))
+
+    def test_batch_parser_reuses_disk_tier(self):
+        with tempfile.TemporaryDirectory() as folder:
+            sut = BatchParser(
+                GrammarType.CONTAINER_LALR, max_workers=1, cache_dir=folder)
+
+            expected = sut.invoke([_TEXT])
+            result = sut.invoke([_TEXT])
+
+            self.assertEqual(expected[0].tree, result[0].tree)
+            self.assertEqual(
+                1, len(list(Path(folder).glob(f"*{ResultCache.SUFFIX}"))))
@@ -0,0 +1,166 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# pylint: disable=C0115
+# pylint: disable=C0116
+# type: ignore
+
+"""test_stats"""
+
+import contextlib
+import io
+import tempfile
+import unittest
+from collections import Counter
+from pathlib import Path
+
+from parameterized import parameterized
+
+from biz.dfch.ste100parser import (
+    BatchParser,
+    GrammarType,
+    Pipeline,
+    PipelineStats,
+    Token,
+)
+from biz.dfch.ste100parser.__main__ import main
+from biz.dfch.ste100parser.stats import PhaseTime
+
+_TEXT = "First paragraph.\n\nSecond paragraph, with 2 words.\n"
+
+
+class TestStats(unittest.TestCase):
+
+    @parameterized.expand([
+        ("lazy", True),
+        ("eager", False),
+    ])
+    def test_invoke_with_stats_returns_same_tree(self, _, lazy_positions):
+        sut = Pipeline(
+            GrammarType.CONTAINER_LALR, lazy_positions=lazy_positions)
+
+        expected = sut.invoke(_TEXT)
+        result = sut.invoke(_TEXT, PipelineStats())
+
+        self.assertEqual(expected, result)
+
+    def test_invoke_records_phases_and_counters(self):
+        stats = PipelineStats()
+        sut = Pipeline(GrammarType.CONTAINER_LALR)
+
+        result = sut.invoke(_TEXT, stats)
+
+        self.assertEqual(["parse", "container", "text"], list(stats.phases))
+        self.assertEqual(len(_TEXT), stats.characters)
+        self.assertEqual(3, stats.lines)
+        self.assertEqual(1, stats.documents)
+        self.assertEqual(
+            len(list(result.iter_subtrees())), sum(stats.nodes.values()))
+        self.assertEqual(2, stats.nodes[Token.paragraph.name])
+        self.assertTrue(stats.rule_hits)
+        self.assertLessEqual(0, stats.total.wall)
+
+    def test_invoke_restores_transformers(self):
+        sut = Pipeline(GrammarType.CONTAINER_LALR)
+
+        sut.invoke(_TEXT, PipelineStats())
+
+        # pylint: disable=W0212
+        self.assertIsNone(sut._transformer.container.rule_hits)
+        self.assertIsNone(sut._transformer.text.rule_hits)
+        self.assertIsNone(sut._transformer.container.line_index)
+
+    def test_runs_add_up(self):
+        stats = PipelineStats()
+        sut = Pipeline(GrammarType.CONTAINER_LALR)
+
+        sut.invoke(_TEXT, stats)
+        hits = Counter(stats.rule_hits)
+        sut.invoke(_TEXT, stats)
+
+        self.assertEqual(2, stats.documents)
+        self.assertEqual(2 * len(_TEXT), stats.characters)
+        self.assertEqual(
+            Counter({key: 2 * value for key, value in hits.items()}),
+            stats.rule_hits)
+
+    @parameterized.expand([
+        ("empty", "", 0),
+        ("no_newline", "a", 1),
+        ("newline", "a\n", 1),
+        ("two_lines", "a\nb", 2),
+    ])
+    def test_add_input_lines(self, _, text, expected):
+        sut = PipelineStats()
+
+        sut.add_input(text)
+
+        self.assertEqual(expected, sut.lines)
+
+    def test_merge(self):
+        sut = PipelineStats(characters=1, phases={"parse": PhaseTime(1, 2)})
+        other = PipelineStats(
+            characters=2,
+            phases={"parse": PhaseTime(3, 4), "text": PhaseTime(5, 6)},
+            nodes=Counter(sentence=1),
+        )
+
+        sut.merge(other)
+
+        self.assertEqual(3, sut.characters)
+        self.assertEqual(PhaseTime(4, 6), sut.phases["parse"])
+        self.assertEqual(PhaseTime(5, 6), sut.phases["text"])
+        self.assertEqual(PhaseTime(9, 12), sut.total)
+        self.assertEqual(1, sut.nodes["sentence"])
+        self.assertEqual(
+            {"wall": 4, "cpu": 6}, sut.to_dict()["phases"]["parse"])
+
+    def test_batch_stats(self):
+        sut = BatchParser(
+            GrammarType.CONTAINER_LALR, max_workers=1, stats=True)
+
+        result = sut.invoke([_TEXT, ""])
+
+        self.assertEqual(len(_TEXT), result[0].stats.characters)
+        self.assertIsNone(result[1].stats)
+        self.assertIsNone(
+            BatchParser(GrammarType.CONTAINER_LALR, max_workers=1)
+            .invoke([_TEXT])[0].stats)
+
+    def test_main_batch_stats(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "valid.md"
+            path.write_text(_TEXT, encoding="utf-8")
+
+            stdout = io.StringIO()
+            stderr = io.StringIO()
+            with (
+                contextlib.redirect_stdout(stdout),
+                contextlib.redirect_stderr(stderr),
+            ):
+                result = main([
+                    "batch", "-j", "1", "--grammar", "CONTAINER_LALR",
+                    "--stats", str(path)])
+
+        self.assertEqual(0, result)
+        lines = stdout.getvalue().splitlines()
+        self.assertEqual(f"{path}: OK", lines[0])
+        self.assertTrue(lines[1].startswith("1 documents"))
+        self.assertIn("  read ", stdout.getvalue())
+        self.assertIn("  parse ", stderr.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
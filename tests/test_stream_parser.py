@@ -0,0 +1,200 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# pylint: disable=C0115
+# pylint: disable=C0116
+# type: ignore
+
+"""test_stream_parser"""
+
+import asyncio
+import io
+
+from lark import Token as LarkToken
+from lark.exceptions import UnexpectedInput
+from parameterized import parameterized
+
+from biz.dfch.ste100parser import GrammarType, Parser, Pipeline
+from biz.dfch.ste100parser.stream_parser import StreamParser
+
+from tests.test_case_base import TestCaseBase
+from tests.test_data.test_data import TestData
+
+
+class TestStreamParser(TestCaseBase):
+    """
+    StreamParser must yield the children of the `start` tree of Pipeline,
+    with the same positions.
+    """
+
+    _grammar = GrammarType.CONTAINER_LALR
+    _pipeline = None
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        if cls._pipeline is None:
+            cls._pipeline = Pipeline(cls._grammar)
+
+    def setUp(self) -> None:
+        self.sut = StreamParser(self._grammar)
+
+    def get_expected(self, text: str) -> list:
+        return self._pipeline.invoke(text).children
+
+    def get_positions(self, items: list):
+        result = []
+        for item in items:
+            for node in item.iter_subtrees_topdown():
+                result.append((node.data,) + tuple(
+                    getattr(node.meta, name, None)
+                    for name in ("line", "column", "start_pos", "end_pos")
+                ))
+                result.extend(
+                    (child.type, child.line, child.column, child.start_pos)
+                    for child in node.children
+                    if isinstance(child, LarkToken)
+                )
+        return result
+
+    def assert_same_items(self, text: str, result: list):
+        expected = self.get_expected(text)
+
+        self.assertEqual(expected, result)
+        self.assertEqual(
+            self.get_positions(expected), self.get_positions(result))
+
+    def get_document(self) -> str:
+        return "\n\n".join(
+            self.load_test_data(item.value).strip("\n") for item in TestData)
+
+    @parameterized.expand([(item.name, item.value) for item in TestData])
+    def test_file_object(self, _, filename):
+
+        text = self.load_test_data(filename)
+
+        result = list(self.sut.iter_items(io.StringIO(text)))
+
+        self.assert_same_items(text, result)
+
+    @parameterized.expand([
+        ("lines", 0),
+        ("one_char", 1),
+        ("seven_chars", 7),
+    ])
+    def test_document(self, _, size):
+
+        text = self.get_document()
+        if 0 == size:
+            stream = text.splitlines(keepends=True)
+        else:
+            stream = [text[i:i + size] for i in range(0, len(text), size)]
+
+        result = list(self.sut.iter_items(stream))
+
+        self.assert_same_items(text, result)
+
+    def test_crlf(self):
+
+        text = "# H\r\n\r\nA.\r\n\r\n> C\r\n\r\nThe end."
+
+        result = list(self.sut.iter_items(text.splitlines(keepends=True)))
+
+        self.assert_same_items(text, result)
+
+    @parameterized.expand([
+        ("A.\n",),
+        ("A.\n\nB.\n",),
+        ("A.\n\n\n",),
+        ("# H\n\nA.\n",),
+        ("That *a*.\nB.\n\nC.\n",),
+    ])
+    def test_earley(self, value):
+
+        expected = Pipeline(GrammarType.CONTAINER).invoke(value).children
+
+        sut = StreamParser(GrammarType.CONTAINER)
+        result = list(sut.iter_items(value.splitlines(keepends=True)))
+
+        self.assertEqual(expected, result)
+        self.assertEqual(
+            self.get_positions(expected), self.get_positions(result))
+
+    def test_items_are_yielded_before_end_of_stream(self):
+
+        lines = self.get_document().splitlines(keepends=True)
+        read = []
+
+        def stream():
+            for line in lines:
+                read.append(line)
+                yield line
+
+        items = self.sut.iter_items(stream())
+        next(items)
+
+        self.assertLess(len(read), len(lines) // 10)
+
+        list(items)
+        self.assertEqual(len(lines), len(read))
+
+    def test_async_iterator(self):
+
+        text = self.get_document()
+
+        async def stream():
+            for line in text.splitlines(keepends=True):
+                await asyncio.sleep(0)
+                yield line
+
+        async def collect():
+            return [item async for item in self.sut.aiter_items(stream())]
+
+        result = asyncio.run(collect())
+
+        self.assert_same_items(text, result)
+
+    def test_feed_and_close(self):
+
+        text = "# Heading\n\nA.\n\nB.\n"
+
+        first = self.sut.feed("# Heading\n\nA.")
+        second = self.sut.feed("\n\nB.\n")
+        third = self.sut.close()
+
+        self.assertEqual([], first)
+        self.assertEqual(["heading"], [item.data for item in second])
+        self.assert_same_items(text, second + third)
+
+    def test_empty_stream(self):
+
+        result = list(self.sut.iter_items(["", "\n"]))
+
+        self.assertEqual([], result)
+
+    def test_error_has_positions_of_stream(self):
+
+        text = "A.\n\nB.\n\nC *D.\n"
+
+        with self.assertRaises(UnexpectedInput) as expected:
+            Parser(self._grammar).invoke(text)
+        with self.assertRaises(UnexpectedInput) as result:
+            list(self.sut.iter_items(io.StringIO(text)))
+
+        self.assertEqual(expected.exception.line, result.exception.line)
+        self.assertEqual(expected.exception.column, result.exception.column)
+
+        # The parser can be used again.
+        result = list(self.sut.iter_items(["A.\n"]))
+        self.assert_same_items("A.\n", result)
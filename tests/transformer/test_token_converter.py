@@ -0,0 +1,128 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# pylint: disable=C0115
+# pylint: disable=C0116
+# type: ignore
+
+"""test_token_converter"""
+
+import sys
+import unittest
+from pathlib import Path
+
+from lark import Tree
+from parameterized import parameterized
+
+from biz.dfch.ste100parser import GrammarType, Pipeline, Token
+from biz.dfch.ste100parser.transformer import TokenConverter
+
+_TEST_DATA = Path(__file__).parent.parent / "test_data"
+
+
+def _convert(node):
+    """The recursive conversion as a reference."""
+
+    if not isinstance(node, Tree):
+        return str(node)
+
+    return (Token[node.data], [_convert(child) for child in node.children])
+
+
+def _format(skeleton, indent=0):
+    """The recursive formatting as a reference."""
+
+    padding = "." * indent
+    if isinstance(skeleton, str):
+        return skeleton
+
+    token, children = skeleton
+    if 1 == len(children) and isinstance(children[0], str):
+        return f"{padding}{token.name} {children[0]}"
+
+    result = [f"{padding}{token.name}"]
+    for child in children:
+        formatted_child = _format(child, indent + 1)
+        if isinstance(child, str):
+            result.append(f"{padding}  {formatted_child}")
+        else:
+            result.append(formatted_child)
+
+    return "\n".join(result)
+
+
+def _get_deep_tree(depth: int) -> Tree:
+    result = Tree(Token.WORD.name, ["valve"])
+    for _ in range(depth):
+        result = Tree(Token.paren.name, [result, "text"])
+
+    return Tree(Token.paragraph.name, [result])
+
+
+class TestTokenConverter(unittest.TestCase):
+
+    @parameterized.expand([
+        ("complex_heading_proc_cite_para_list.md",),
+        ("complex_headings_para_proc_list.md",),
+        ("list_in_paragraph.md",),
+        ("list_in_proc.md",),
+    ])
+    def test_same_as_recursive_conversion(self, name):
+        text = (_TEST_DATA / name).read_text(encoding="utf-8")
+        tree = Pipeline(GrammarType.CONTAINER_LALR).invoke(text)
+        sut = TokenConverter()
+
+        result = sut.invoke(tree)
+
+        expected = _convert(tree)
+        self.assertEqual(expected, result)
+        self.assertEqual(_format(expected), sut.format(result))
+
+    @parameterized.expand([
+        ("string", "text", "text"),
+        ("leaf", Tree("WORD", ["valve"]), (Token.WORD, ["valve"])),
+        ("empty", Tree("paragraph", []), (Token.paragraph, [])),
+    ])
+    def test_invoke(self, _, node, expected):
+        self.assertEqual(expected, TokenConverter().invoke(node))
+
+    @parameterized.expand([
+        ("string", "text"),
+        ("leaf", (Token.WORD, ["valve"])),
+        ("strings", (Token.paragraph, ["a", "b"])),
+        ("mixed", (Token.paragraph, [
+            "a", (Token.WORD, ["b"]), (Token.paren, ["c", "d"])])),
+    ])
+    def test_format(self, _, skeleton):
+        self.assertEqual(_format(skeleton), TokenConverter().format(skeleton))
+
+    def test_deep_tree_does_not_recurse(self):
+        depth = 10 * sys.getrecursionlimit()
+        tree = _get_deep_tree(depth)
+        sut = TokenConverter()
+
+        result = sut.invoke(tree)
+        lines = sut.format(result).splitlines()
+
+        self.assertEqual(2 * depth + 2, len(lines))
+        self.assertEqual(f"{'.' * (depth + 1)}WORD valve", lines[depth + 1])
+
+    def test_unknown_name_throws(self):
+        with self.assertRaises(KeyError):
+            TokenConverter().invoke(Tree("unknown", []))
+
+
+if __name__ == "__main__":
+    unittest.main()
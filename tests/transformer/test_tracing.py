@@ -0,0 +1,117 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# pylint: disable=C0115
+# pylint: disable=C0116
+# type: ignore
+
+"""test_tracing"""
+
+import io
+import logging
+import unittest
+from contextlib import redirect_stdout
+
+from biz.dfch.ste100parser import GrammarType, Parser, Pipeline
+from biz.dfch.ste100parser.transformer import (
+    ContainerTransformer,
+    LoggingTracer,
+    TextTransformer,
+    TraceEvent,
+    TraceEventType,
+)
+from biz.dfch.ste100parser.transformer.transformer_base import (
+    TransformerConfiguration,
+)
+
+_TEXT = "This is a test.\n"
+
+
+class TestTracing(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.tree = Parser(GrammarType.CONTAINER_LALR).invoke(_TEXT)
+
+    def test_without_tracer_callbacks_are_not_wrapped(self):
+        sut = ContainerTransformer()
+
+        self.assertIsNone(sut.tracer)
+        self.assertNotIn("_call_userfunc", vars(sut))
+        self.assertNotIn("_call_userfunc_token", vars(sut))
+
+    def test_tracer_receives_events(self):
+        events: list[TraceEvent] = []
+        sut = ContainerTransformer(tracer=events.append)
+
+        result = sut.transform(self.tree)
+
+        self.assertEqual(ContainerTransformer().transform(self.tree), result)
+        self.assertTrue(events)
+        self.assertEqual(
+            len([e for e in events if TraceEventType.ENTER == e.type]),
+            len([e for e in events if TraceEventType.EXIT == e.type]),
+        )
+
+        texts = [e for e in events if "TEXT" == e.rule]
+        self.assertEqual(TraceEventType.ENTER, texts[0].type)
+        self.assertEqual(0, texts[0].start_pos)
+        self.assertEqual(4, texts[0].end_pos)
+        self.assertEqual("ContainerTransformer", texts[0].transformer)
+
+        last = events[-1]
+        self.assertEqual(TraceEventType.EXIT, last.type)
+        self.assertEqual(self.tree.data, last.rule)
+        self.assertEqual(len(result.children), last.children)
+
+    def test_log_does_not_change_default_configuration(self):
+        with redirect_stdout(io.StringIO()) as out:
+            ContainerTransformer(log=True).transform(self.tree)
+            self.assertTrue(out.getvalue())
+
+        with redirect_stdout(io.StringIO()) as out:
+            sut = ContainerTransformer()
+            sut.transform(self.tree)
+
+        self.assertEqual("", out.getvalue())
+        self.assertIsNone(sut.tracer)
+        self.assertFalse(TransformerConfiguration().log)
+
+    def test_configuration_tracer(self):
+        events = []
+        cfg = TransformerConfiguration(tracer=events.append)
+
+        TextTransformer(cfg).transform(
+            ContainerTransformer().transform(self.tree))
+
+        self.assertTrue(events)
+        self.assertTrue(all(
+            "TextTransformer" == event.transformer for event in events))
+
+    def test_logging_tracer(self):
+        logger = logging.getLogger("test_tracing")
+        sut = LoggingTracer(logger)
+
+        with self.assertLogs(logger, logging.DEBUG) as logs:
+            Pipeline(
+                GrammarType.CONTAINER_LALR,
+                container=ContainerTransformer(tracer=sut),
+            ).invoke(_TEXT)
+
+        self.assertTrue(logs.records)
+        self.assertIsInstance(logs.records[0].trace, TraceEvent)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,178 @@
+# Copyright (C) 2026 Ronald Rink, d-fens GmbH, http://d-fens.ch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# pylint: disable=C0115
+# pylint: disable=C0116
+# type: ignore
+
+"""test_tree_rewriter"""
+
+import random
+import unittest
+
+from lark import Token as LarkToken, Tree
+from lark.tree import Meta
+from parameterized import parameterized
+
+from biz.dfch.ste100parser.token import Token
+from biz.dfch.ste100parser.transformer.container_transformer_rules import (
+    ContainerTransformerRules,
+)
+from biz.dfch.ste100parser.transformer.tree_rewriter import (
+    CompiledRules,
+    TreeRewriter,
+)
+
+
+def _rewrite_naive(children: list, rules: list, margin: int = 0) -> int:
+    """The rewriter that tries every rule at every position."""
+
+    i = 0
+    while i < len(children) - margin:
+        for pattern, replacer, do_again in rules:
+            segment = children[i:i + len(pattern)]
+            if len(segment) == len(pattern) and all(
+                isinstance(node, Tree) and token.name == node.data
+                for node, token in zip(segment, pattern)
+            ):
+                new_segment = replacer(*segment)
+                if not isinstance(new_segment, list):
+                    new_segment = [new_segment]
+                children[i:i + len(pattern)] = new_segment
+                if not do_again:
+                    i += 1
+                break
+        else:
+            i += 1
+
+    return i
+
+
+def _get_children(names: list[str]) -> list:
+    result = []
+    for i, name in enumerate(names):
+        meta = Meta()
+        meta.line = i + 1
+        meta.column = 1
+        meta.start_pos = i
+        meta.end_pos = i + 1
+        result.append(Tree(name, [str(i)], meta=meta))
+
+    return result
+
+
+def _dump(children: list) -> list:
+    return [
+        (node.data, tuple(node.children)) if isinstance(node, Tree) else node
+        for node in children
+    ]
+
+
+class TestTreeRewriter(unittest.TestCase):
+
+    def _assert_same(self, children: list, rules: list) -> None:
+        expected = list(children)
+        _rewrite_naive(expected, rules)
+
+        result = TreeRewriter().invoke(list(children), rules)
+
+        self.assertEqual(_dump(expected), _dump(result))
+
+    @parameterized.expand([
+        ("NEWLINE", "NEWLINE", "heading"),
+        ("NEWLINE", "cite", "NEWLINE", "NEWLINE", "paragraph"),
+        ("heading", "NEWLINE", "NEWLINE", "paragraph", "NEWLINE"),
+        ("proc_item", "NEWLINE", "NEWLINE", "paragraph", "NEWLINE"),
+        ("paragraph",),
+        (),
+    ])
+    def test_start_rules(self, *names):
+        rules = ContainerTransformerRules().get_rules_start()
+
+        self._assert_same(_get_children(list(names)), rules)
+
+    def test_random_start_rules(self):
+        rules = ContainerTransformerRules().get_rules_start()
+        names = sorted({
+            token.name for pattern, _, _ in rules for token in pattern
+        })
+
+        rnd = random.Random(42)
+        for _ in range(200):
+            children = _get_children(
+                [rnd.choice(names) for _ in range(rnd.randint(0, 30))])
+            children.insert(
+                rnd.randint(0, len(children)), LarkToken("WS", " "))
+
+            self._assert_same(children, rules)
+
+    @parameterized.expand([
+        (True,),
+        (False,),
+    ])
+    def test_replacements(self, do_again):
+        # Grows, shrinks and removes nodes; the first rule wins.
+        rules = [
+            ([Token.sentence, Token.sentence],
+             lambda a, b: Tree("WORD", [a, b]), do_again),
+            ([Token.sentence], lambda a: [], do_again),
+            ([Token.WORD, Token.WORD],
+             lambda a, b: [Tree("x", []), Tree("x", []), b], do_again),
+            ([Token.WORD], lambda a: a, False),
+        ]
+
+        rnd = random.Random(7)
+        for _ in range(200):
+            children = _get_children(
+                [rnd.choice(["sentence", "WORD", "x"])
+                 for _ in range(rnd.randint(0, 20))])
+
+            self._assert_same(children, rules)
+
+    def test_invoke_prefix(self):
+        rules = ContainerTransformerRules().get_rules_start()
+        margin = max(len(pattern) for pattern, _, _ in rules)
+        children = _get_children(
+            ["heading", "NEWLINE", "NEWLINE", "paragraph", "NEWLINE",
+             "NEWLINE", "heading", "NEWLINE", "NEWLINE"])
+
+        expected = list(children)
+        expected_count = _rewrite_naive(expected, rules, margin - 1)
+
+        result = list(children)
+        count = TreeRewriter().invoke_prefix(result, rules)
+
+        self.assertEqual(expected_count, count)
+        self.assertEqual(_dump(expected), _dump(result))
+
+    def test_compiled_rules_are_cached(self):
+        first = CompiledRules.get(
+            ContainerTransformerRules().get_rules_start())
+        second = CompiledRules.get(
+            ContainerTransformerRules().get_rules_start())
+        other = CompiledRules.get(
+            ContainerTransformerRules().get_rules_paragraph())
+
+        self.assertIs(first, second)
+        self.assertIsNot(first, other)
+        self.assertEqual(4, first.longest)
+
+    def test_empty_pattern_throws(self):
+        with self.assertRaises(AssertionError):
+            CompiledRules.get([([], lambda: [], False)])
+
+
+if __name__ == "__main__":
+    unittest.main()